@@ -0,0 +1,69 @@
+"""Add solve_jobs and solve_job_results tables
+
+Revision ID: 3e7a91c4b2d8
+Revises: 2024_01_08_create_scheduling_tables
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '3e7a91c4b2d8'
+down_revision = '2024_01_08_create_scheduling_tables'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the durable records of asynchronous solve jobs."""
+
+    op.create_table(
+        'solve_jobs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('kind', sqlmodel.sql.sqltypes.AutoString(length=50), nullable=False),
+        sa.Column(
+            'status',
+            sa.Enum('QUEUED', 'RUNNING', 'SUCCEEDED', 'FAILED', 'CANCELLED', name='solvejobstatus'),
+            nullable=False,
+        ),
+        sa.Column('parameters', sa.JSON(), nullable=False),
+        sa.Column('best_objective', sa.Float(), nullable=True),
+        sa.Column('best_bound', sa.Float(), nullable=True),
+        sa.Column('gap', sa.Float(), nullable=True),
+        sa.Column('solutions_found', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('progress_message', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=True),
+        sa.Column('result_location', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=True),
+        sa.Column('error', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column('worker_task_id', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=True),
+        sa.Column('cancel_requested', sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('created_by', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_solve_jobs_kind', 'solve_jobs', ['kind'])
+    op.create_index('ix_solve_jobs_status', 'solve_jobs', ['status'])
+
+    op.create_table(
+        'solve_job_results',
+        sa.Column('solve_job_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('solution', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['solve_job_id'], ['solve_jobs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('solve_job_id'),
+    )
+
+
+def downgrade():
+    """Drop the solve job tables."""
+    op.drop_table('solve_job_results')
+    op.drop_index('ix_solve_jobs_status', table_name='solve_jobs')
+    op.drop_index('ix_solve_jobs_kind', table_name='solve_jobs')
+    op.drop_table('solve_jobs')
+    op.execute('DROP TYPE IF EXISTS solvejobstatus')
@@ -0,0 +1,31 @@
+"""Add solve_jobs.parameters_digest
+
+Revision ID: 8b4f2d6e1a37
+Revises: 3e7a91c4b2d8
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+# revision identifiers, used by Alembic.
+revision = '8b4f2d6e1a37'
+down_revision = '3e7a91c4b2d8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Index solve jobs by parameter digest so identical submissions join in SQL."""
+    op.add_column(
+        'solve_jobs',
+        sa.Column('parameters_digest', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True),
+    )
+    op.create_index('ix_solve_jobs_parameters_digest', 'solve_jobs', ['parameters_digest'])
+
+
+def downgrade():
+    """Drop the parameter digest."""
+    op.drop_index('ix_solve_jobs_parameters_digest', table_name='solve_jobs')
+    op.drop_column('solve_jobs', 'parameters_digest')
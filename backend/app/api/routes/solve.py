@@ -5,14 +5,16 @@ This module provides the main /solve endpoint that accepts scheduling problems
 and returns optimized schedules using OR-Tools CP-SAT solver integration.
 """
 
+import math
 import time
 from datetime import datetime
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import uuid4
 
-from fastapi import APIRouter, BackgroundTasks
+from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 
+from app.core.single_flight import ProgressCallback, RemoteSolveError, get_single_flight
 from app.domain.scheduling.entities.job import Job
 from app.domain.scheduling.entities.task import Task
 from app.domain.scheduling.repositories.job_repository import (
@@ -32,12 +34,14 @@ from app.domain.shared.exceptions import (
     OptimizationError,
     OptimizationTimeoutError,
     RetryExhaustedError,
+    SolverCapacityExceededError,
     SolverCrashError,
     SolverError,
     SolverMemoryError,
     SystemResourceError,
 )
 from app.infrastructure.adapters import create_domain_repositories
+from app.infrastructure.cache.problem_fingerprint import digest_value
 from app.infrastructure.database.dependencies import (
     JobRepositoryDep,
     MachineRepositoryDep,
@@ -46,6 +50,7 @@ from app.infrastructure.database.dependencies import (
 )
 from app.infrastructure.database.repositories import DatabaseError
 from app.models.scheduling import (
+    PriorityLevel,
     SolutionMetrics,
     SolveErrorResponse,
     SolveRequest,
@@ -54,6 +59,16 @@ from app.models.scheduling import (
 
 router = APIRouter()
 
+SOLVE_RETRY_ATTEMPTS = 3
+
+# Admission priority of each request priority level
+_PRIORITY_RANK = {
+    PriorityLevel.LOW: 0,
+    PriorityLevel.NORMAL: 1,
+    PriorityLevel.HIGH: 2,
+    PriorityLevel.CRITICAL: 3,
+}
+
 
 @router.post(
     "/solve",
@@ -77,6 +92,7 @@ router = APIRouter()
     - **408**: Solver timeout (no solution within time limit)
     - **422**: No feasible solution exists
     - **500**: Solver or system error
+    - **503**: Solver capacity exhausted; retry after the ``Retry-After`` header
     """,
     response_model=SolveResponse,
     responses={
@@ -85,11 +101,11 @@ router = APIRouter()
         408: {"model": SolveErrorResponse, "description": "Solver timeout"},
         422: {"model": SolveErrorResponse, "description": "No feasible solution"},
         500: {"model": SolveErrorResponse, "description": "Server error"},
+        503: {"model": SolveErrorResponse, "description": "Solver capacity exhausted"},
     },
 )
 async def solve_scheduling_problem(
     request: SolveRequest,
-    background_tasks: BackgroundTasks,
     job_repo: JobRepositoryDep,
     task_repo: TaskRepositoryDep,
     machine_repo: MachineRepositoryDep,
@@ -99,11 +115,13 @@ async def solve_scheduling_problem(
     Solve scheduling optimization problem using OR-Tools CP-SAT solver.
 
     This endpoint integrates the domain optimization service with the repository layer
-    to provide complete scheduling optimization functionality.
+    to provide complete scheduling optimization functionality. The jobs and tasks of
+    the request are solved in memory; they are only written to the database when
+    ``request.persist`` is set.
     """
     start_time = time.time()
 
-    try:
+    async def run_solve(report: ProgressCallback) -> SolveResponse:
         # Create domain repository adapters
         domain_job_repo, domain_task_repo, domain_machine_repo, domain_operator_repo = (
             create_domain_repositories(job_repo, task_repo, machine_repo, operator_repo)
@@ -128,23 +146,32 @@ async def solve_scheduling_problem(
             # Enhanced resilience parameters
             enable_fallback_strategies=True,
             preferred_fallback_strategy=None,
-            max_retry_attempts=3,
+            max_retry_attempts=SOLVE_RETRY_ATTEMPTS,
             memory_limit_mb=4096,
             enable_circuit_breaker=True,
             enable_partial_solutions=True,
+            # Admission under contended solver capacity
+            priority=_PRIORITY_RANK[request.optimization_parameters.priority],
+            deadline_seconds=request.optimization_parameters.deadline_seconds,
+            # Concurrent per-zone solves for plant-wide problems
+            use_decomposition=request.optimization_parameters.use_decomposition,
+            decomposition_min_tasks=request.optimization_parameters.decomposition_min_tasks,
         )
 
         # Business constraints are now handled within the resilient optimization service
         # They can be passed as additional parameters to the optimization request
 
-        # Create jobs and tasks from request
-        job_ids = await _create_jobs_and_tasks_from_request(
-            request, domain_job_repo, domain_task_repo
-        )
+        # Build jobs and tasks from request
+        await report({"stage": "loading"})
+        jobs, tasks = _build_jobs_and_tasks_from_request(request)
+        if request.persist:
+            await _persist_jobs_and_tasks(jobs, tasks, domain_job_repo, domain_task_repo)
 
         # Run optimization
-        result = await optimization_service.optimize_schedule(
-            job_ids=job_ids,
+        await report({"stage": "solving"})
+        result = await optimization_service.optimize_problem(
+            jobs=jobs,
+            tasks=tasks,
             start_time=request.schedule_start_time,
             parameters=opt_params,
         )
@@ -154,13 +181,38 @@ async def solve_scheduling_problem(
             result, request, start_time
         )
 
-        # Schedule cleanup task
-        background_tasks.add_task(
-            _cleanup_temporary_jobs, job_ids, domain_job_repo, domain_task_repo
-        )
-
         return response
 
+    try:
+        # Identical concurrent submissions (double clicks, UI retries, several
+        # planners) share one solver run instead of starting their own
+        return await get_single_flight("solve").run(
+            digest_value(request),
+            run_solve,
+            encode=lambda response: response.model_dump_json(),
+            decode=SolveResponse.model_validate_json,
+            lock_ttl_seconds=(
+                request.optimization_parameters.max_time_seconds
+                * (SOLVE_RETRY_ATTEMPTS + 1)
+                + 60
+            ),
+        )
+
+    except RemoteSolveError as e:
+        # The identical solve another worker ran failed; answer as it did
+        error_code, status_code = _REMOTE_ERRORS.get(
+            e.error_type, ("UNEXPECTED_ERROR", 500)
+        )
+        error_response = _create_error_response(
+            request, start_time, error_code, str(e), status_code, e.details
+        )
+        if "retry_after_seconds" in e.details:
+            return JSONResponse(
+                status_code=status_code,
+                content=error_response.model_dump(mode="json"),
+                headers={"Retry-After": str(math.ceil(e.details["retry_after_seconds"]))},
+            )
+        return error_response
     except NoFeasibleSolutionError as e:
         return _create_error_response(
             request, start_time, "NO_FEASIBLE_SOLUTION", str(e), 422, e.details
@@ -177,6 +229,15 @@ async def solve_scheduling_problem(
         return _create_error_response(
             request, start_time, "SOLVER_CRASH", str(e), 500, e.details
         )
+    except SolverCapacityExceededError as e:
+        error_response = _create_error_response(
+            request, start_time, "SOLVER_CAPACITY_EXCEEDED", str(e), 503, e.details
+        )
+        return JSONResponse(
+            status_code=503,
+            content=error_response.model_dump(mode="json"),
+            headers={"Retry-After": str(math.ceil(e.retry_after_seconds))},
+        )
     except CircuitBreakerOpenError as e:
         return _create_error_response(
             request, start_time, "SERVICE_UNAVAILABLE", str(e), 503, e.details
@@ -207,43 +268,69 @@ async def solve_scheduling_problem(
         )
 
 
-async def _create_jobs_and_tasks_from_request(
+# Error code and status of each failure a remote solve can report
+_REMOTE_ERRORS = {
+    "NoFeasibleSolutionError": ("NO_FEASIBLE_SOLUTION", 422),
+    "OptimizationTimeoutError": ("SOLVER_TIMEOUT", 408),
+    "SolverMemoryError": ("MEMORY_EXHAUSTION", 507),
+    "SolverCrashError": ("SOLVER_CRASH", 500),
+    "SolverCapacityExceededError": ("SOLVER_CAPACITY_EXCEEDED", 503),
+    "CircuitBreakerOpenError": ("SERVICE_UNAVAILABLE", 503),
+    "RetryExhaustedError": ("RETRY_EXHAUSTED", 500),
+    "SystemResourceError": ("RESOURCE_ERROR", 507),
+    "SolverError": ("SOLVER_ERROR", 500),
+    "OptimizationError": ("OPTIMIZATION_ERROR", 400),
+    "DatabaseError": ("DATABASE_ERROR", 500),
+}
+
+
+def _build_jobs_and_tasks_from_request(
     request: SolveRequest,
-    job_repo: DomainJobRepository,
-    task_repo: DomainTaskRepository,
-) -> list[UUID]:
-    """Create temporary jobs and tasks from the solve request."""
+) -> tuple[list[Job], list[Task]]:
+    """Build the job and task entities of the solve request in memory."""
 
-    created_job_ids = []
+    jobs = []
+    tasks = []
 
     for job_request in request.jobs:
         # Create job entity from request
         job = Job.create(
-            job_number=f"TEMP_{uuid4().hex[:8]}_{job_request.job_number}",
+            job_number=job_request.job_number,
             priority=job_request.priority,
             due_date=job_request.due_date,
             quantity=job_request.quantity,
-            customer_name=job_request.customer_name or "Temporary",
+            customer_name=job_request.customer_name or "Ad hoc",
             part_number=job_request.part_number,
         )
-
-        # Save job to database
-        saved_job = await job_repo.save(job)
-        created_job_ids.append(saved_job.id)
+        jobs.append(job)
 
         # Create tasks for this job
         for sequence, _operation_seq in enumerate(job_request.task_sequences, 1):
-            task = Task.create(
-                job_id=saved_job.id,
-                operation_id=uuid4(),  # Simplified - would lookup from operations catalog
-                sequence_in_job=sequence,
-                planned_duration_minutes=60,  # Default duration
-                setup_duration_minutes=10,
+            tasks.append(
+                Task.create(
+                    job_id=job.id,
+                    operation_id=uuid4(),  # Simplified - would lookup from operations catalog
+                    sequence_in_job=sequence,
+                    planned_duration_minutes=60,  # Default duration
+                    setup_duration_minutes=10,
+                )
             )
 
-            await task_repo.save(task)
+    return jobs, tasks
 
-    return created_job_ids
+
+async def _persist_jobs_and_tasks(
+    jobs: list[Job],
+    tasks: list[Task],
+    job_repo: DomainJobRepository,
+    task_repo: DomainTaskRepository,
+) -> None:
+    """Save the jobs and tasks of a solve request that asked to persist them."""
+
+    for job in jobs:
+        await job_repo.save(job)
+    for task in tasks:
+        await task_repo.save(task)
 
 
 async def _convert_optimization_result_to_response(
@@ -362,29 +449,6 @@ def _create_error_response(
     return error_response
 
 
-async def _cleanup_temporary_jobs(
-    job_ids: list[UUID],
-    job_repo: DomainJobRepository,
-    task_repo: DomainTaskRepository,
-) -> None:
-    """Background task to clean up temporary jobs and tasks created for solving."""
-
-    try:
-        # Delete tasks first (foreign key constraints)
-        for job_id in job_ids:
-            tasks = await task_repo.get_by_job_id(job_id)
-            for task in tasks:
-                await task_repo.delete(task.id)
-
-        # Delete jobs
-        for job_id in job_ids:
-            await job_repo.delete(job_id)
-
-    except Exception as e:
-        # Log error but don't fail - this is background cleanup
-        print(f"Warning: Failed to cleanup temporary jobs: {str(e)}")
-
-
 @router.get(
     "/solve/status",
     summary="Get solver status and capabilities",
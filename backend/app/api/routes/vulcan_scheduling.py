@@ -6,12 +6,12 @@ Production-ready scheduling endpoints with OR-Tools optimization.
 
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
-from uuid import uuid4
+from uuid import UUID, uuid4
 import asyncio
 import json
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks, WebSocket, WebSocketDisconnect, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, Depends, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 import redis
@@ -23,9 +23,23 @@ from app.services.vulcan_scheduling_service import (
     ScheduleStatus,
     TaskSchedule
 )
+from app.core.celery_app import revoke_task
 from app.core.config import settings
+from app.core.single_flight import RemoteSolveError, SingleFlight
+from app.core.tasks.optimization import run_solve_job
+from app.domain.scheduling.value_objects.enums import SolveJobStatus
+from app.infrastructure.cache.problem_fingerprint import digest_value
 from app.infrastructure.database.dependencies import get_db
+from app.infrastructure.database.models import SolveJob, SolveJobPublic
 from app.core.observability import get_logger
+from app.services.solve_jobs import (
+    CANCEL_FLAG_TTL_SECONDS,
+    QUEUED_JOIN_MAX_AGE_SECONDS,
+    SolveJobStore,
+    solve_job_cancel_key,
+    solve_job_channel,
+    solve_job_event,
+)
 
 logger = get_logger(__name__)
 
@@ -46,6 +60,26 @@ async def get_redis():
     return redis_client
 
 
+schedule_flight = None
+
+async def get_schedule_flight() -> SingleFlight:
+    """Single-flight group coalescing identical schedule solves across workers."""
+    global schedule_flight
+    if not schedule_flight:
+        schedule_flight = SingleFlight(await get_redis(), namespace="vulcan_schedule")
+    return schedule_flight
+
+
+# Durable records of solves running in the optimization workers
+solve_job_store = SolveJobStore()
+
+# Seconds between keep-alive comments on an idle solve job event stream
+SOLVE_JOB_STREAM_KEEPALIVE_SECONDS = 15.0
+
+# Relays of schedules submitted as solve jobs, referenced until they finish
+schedule_relays: set[asyncio.Task] = set()
+
+
 class ScheduleRequest(BaseModel):
     """Request model for creating a schedule."""
     job_ids: Optional[List[int]] = Field(None, description="Specific job IDs to schedule")
@@ -115,7 +149,6 @@ manager = ConnectionManager()
 @router.post("/schedule", response_model=ScheduleResponse)
 async def create_schedule(
     request: ScheduleRequest,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -123,6 +156,10 @@ async def create_schedule(
     
     This endpoint triggers the OR-Tools optimization solver to create
     a production schedule based on current jobs, resources, and constraints.
+    Solves with a time limit above 30 seconds are submitted as solve jobs
+    (see ``/solve-jobs``); the returned schedule id is the job id, and the
+    finished job is cached and announced to WebSocket clients as
+    ``optimization_complete``.
     """
     try:
         schedule_id = str(uuid4())
@@ -138,49 +175,26 @@ async def create_schedule(
                 logger.info(f"Returning cached schedule for {cache_key}")
                 return JSONResponse(json.loads(cached))
         
-        # Create scheduling service
-        db_config = {
-            'host': settings.POSTGRES_SERVER,
-            'database': settings.POSTGRES_DB,
-            'user': settings.POSTGRES_USER,
-            'password': settings.POSTGRES_PASSWORD
-        }
-        
-        service = VulcanSchedulingService(db_config)
-        
-        # Fetch data and create model
-        data = service.fetch_scheduling_data(request.job_ids)
-        
-        if not data['tasks']:
-            raise HTTPException(status_code=404, detail="No tasks found to schedule")
-        
-        service.create_scheduling_model(data, request.horizon_days)
-        
-        # Add background task for long-running optimization
+        # Long-running optimizations run in the optimization workers
         if request.time_limit_seconds > 30:
-            background_tasks.add_task(
-                run_optimization_async,
-                schedule_id,
-                service,
-                request,
-                cache_key
-            )
+            job = await submit_solve_job(request)
+            _start_schedule_relay(job.id, cache_key, request.time_limit_seconds)
             
             return ScheduleResponse(
-                schedule_id=schedule_id,
+                schedule_id=str(job.id),
                 status=ScheduleStatus.PENDING,
-                created_at=datetime.now(),
+                created_at=job.created_at,
                 makespan_minutes=0,
                 makespan_hours=0,
                 scheduled_tasks_count=0,
-                unscheduled_tasks_count=len(data['tasks']),
+                unscheduled_tasks_count=0,
                 solve_time_seconds=0,
                 machine_utilization_avg=0,
                 operator_utilization_avg=0
             )
         
         # Solve synchronously for short time limits
-        solution = service.solve(request.time_limit_seconds)
+        solution = await solve_single_flight(request)
         
         # Calculate averages
         machine_util_avg = sum(solution.machine_utilization.values()) / len(solution.machine_utilization) if solution.machine_utilization else 0
@@ -216,6 +230,8 @@ async def create_schedule(
         
         return response
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error creating schedule: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -229,7 +245,11 @@ async def get_schedule(schedule_id: str):
         schedule_data = await redis.get(f"schedule:result:{schedule_id}")
         
         if not schedule_data:
-            raise HTTPException(status_code=404, detail="Schedule not found")
+            # Schedules created as solve jobs are kept on the job record
+            job = await _find_solve_job(schedule_id)
+            if job is None:
+                raise HTTPException(status_code=404, detail="Schedule not found")
+            return job
         
         return JSONResponse(json.loads(schedule_data))
         
@@ -279,6 +299,115 @@ async def delete_schedule(schedule_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/solve-jobs", response_model=SolveJobPublic, status_code=202)
+async def create_solve_job(request: ScheduleRequest):
+    """
+    Submit a scheduling solve to run in the optimization workers.
+    
+    Returns the queued job immediately. Poll ``/solve-jobs/{job_id}``, stream
+    ``/solve-jobs/{job_id}/events``, cancel with
+    ``/solve-jobs/{job_id}/cancel`` and fetch ``/solve-jobs/{job_id}/result``.
+    """
+    try:
+        return await submit_solve_job(request)
+    except Exception as e:
+        logger.error(f"Error submitting solve job: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/solve-jobs/{job_id}", response_model=SolveJobPublic)
+async def get_solve_job(job_id: UUID):
+    """Get a solve job's status, best objective and gap."""
+    return await load_solve_job(job_id)
+
+
+@router.get("/solve-jobs/{job_id}/result")
+async def get_solve_job_result(job_id: UUID):
+    """Get the solution of a finished (or cancelled) solve job."""
+    job = await load_solve_job(job_id)
+    if not job.status.is_terminal:
+        raise HTTPException(status_code=409, detail=f"Solve job is {job.status.value}")
+    
+    solution = await asyncio.to_thread(solve_job_store.get_result, job_id)
+    if solution is None:
+        raise HTTPException(
+            status_code=404,
+            detail=job.error or "Solve job finished without a result"
+        )
+    
+    return {"job": job, "solution": solution}
+
+
+@router.post("/solve-jobs/{job_id}/cancel", response_model=SolveJobPublic)
+async def cancel_solve_job(job_id: UUID):
+    """
+    Cancel a solve job.
+    
+    A queued job is cancelled at once. A running job stops at its next stop
+    check and keeps the best solution found so far as its result.
+    """
+    job = await asyncio.to_thread(solve_job_store.request_cancel, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Solve job not found")
+    
+    redis = await get_redis()
+    if job.status == SolveJobStatus.RUNNING:
+        await redis.set(solve_job_cancel_key(job_id), 1, ex=CANCEL_FLAG_TTL_SECONDS)
+    elif job.status == SolveJobStatus.CANCELLED and job.started_at is None:
+        await asyncio.to_thread(revoke_task, str(job_id))
+        await redis.publish(
+            solve_job_channel(job_id),
+            json.dumps(solve_job_event(job, "cancelled"), default=str)
+        )
+    
+    return job
+
+
+@router.get("/solve-jobs/{job_id}/events")
+async def stream_solve_job_events(job_id: UUID):
+    """
+    Stream a solve job's progress as server-sent events.
+    
+    Starts with the job's current state and ends after its final status.
+    """
+    await load_solve_job(job_id)
+    redis = await get_redis()
+    
+    async def events():
+        pubsub = redis.pubsub()
+        # Subscribed before the snapshot is read, so no later event is missed
+        await pubsub.subscribe(solve_job_channel(job_id))
+        try:
+            snapshot = await load_solve_job(job_id)
+            yield _server_sent_event(solve_job_event(snapshot, "snapshot"))
+            if snapshot.status.is_terminal:
+                return
+            
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=SOLVE_JOB_STREAM_KEEPALIVE_SECONDS
+                )
+                if message is None:
+                    # Idle: re-check the record in case the worker died
+                    current = await asyncio.to_thread(solve_job_store.get, job_id)
+                    if current is not None and current.status.is_terminal:
+                        yield _server_sent_event(solve_job_event(current, "snapshot"))
+                        return
+                    yield ": keep-alive\n\n"
+                    continue
+                
+                event = json.loads(message["data"])
+                yield _server_sent_event(event)
+                if SolveJobStatus(event["status"]).is_terminal:
+                    return
+        finally:
+            await pubsub.unsubscribe(solve_job_channel(job_id))
+            await pubsub.aclose()
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.websocket("/ws/{client_id}")
 async def websocket_endpoint(websocket: WebSocket, client_id: str):
     """
@@ -325,61 +454,173 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
         manager.disconnect(client_id)
 
 
-async def run_optimization_async(
-    schedule_id: str,
-    service: VulcanSchedulingService,
-    request: ScheduleRequest,
-    cache_key: str
-):
-    """Run optimization in background and update via WebSocket."""
+async def submit_solve_job(request: ScheduleRequest) -> SolveJob:
+    """
+    Record a queued solve job and hand it to the optimization workers.
+    
+    While a job with the same parameters is queued or running, that job is
+    returned instead and nothing new is enqueued.
+    """
+    job, created = await asyncio.to_thread(
+        solve_job_store.create_or_join,
+        "vulcan_schedule",
+        request.dict(exclude={"use_cache"})
+    )
+    if not created:
+        logger.info(f"Joined in-flight solve job {job.id}")
+        return job
+    
     try:
-        logger.info(f"Starting async optimization for schedule {schedule_id}")
-        
-        # Solve the problem
-        solution = service.solve(request.time_limit_seconds)
-        
-        # Store result in Redis
-        redis = await get_redis()
-        result_data = {
-            "schedule_id": schedule_id,
-            "status": solution.status.value,
-            "makespan_minutes": solution.makespan_minutes,
-            "scheduled_tasks": len(solution.scheduled_tasks),
-            "solve_time": solution.solve_time_seconds
-        }
-        
-        await redis.setex(
-            f"schedule:result:{schedule_id}",
-            86400,  # 24 hours
-            json.dumps(result_data, default=str)
+        await asyncio.to_thread(
+            run_solve_job.apply_async, args=[str(job.id)], task_id=str(job.id)
         )
+    except Exception as e:
+        # A job no worker will ever pick up must not be joined by later submits
+        await asyncio.to_thread(
+            solve_job_store.fail, job.id, f"Could not enqueue solve job: {e}"
+        )
+        raise
+    logger.info(f"Submitted solve job {job.id}")
+    return job
+
+
+def _start_schedule_relay(job_id: UUID, cache_key: str, time_limit_seconds: int):
+    relay = asyncio.create_task(
+        relay_schedule_job(
+            job_id, cache_key, QUEUED_JOIN_MAX_AGE_SECONDS + time_limit_seconds
+        )
+    )
+    schedule_relays.add(relay)
+    relay.add_done_callback(schedule_relays.discard)
+
+
+async def relay_schedule_job(job_id: UUID, cache_key: str, timeout_seconds: float):
+    """
+    Cache and broadcast the outcome of a schedule submitted as a solve job.
+    
+    The worker stores the result summary under ``schedule:result:{id}``;
+    this copies it to the request's cache key and notifies WebSocket
+    clients, as in-process solves do. Gives up after ``timeout_seconds``.
+    """
+    redis = await get_redis()
+    
+    async def wait_for_final_status() -> Optional[SolveJob]:
+        pubsub = redis.pubsub()
+        # Subscribed before the record is read, so the final event is not missed
+        await pubsub.subscribe(solve_job_channel(job_id))
+        try:
+            job = await asyncio.to_thread(solve_job_store.get, job_id)
+            while job is not None and not job.status.is_terminal:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=SOLVE_JOB_STREAM_KEEPALIVE_SECONDS
+                )
+                # Idle or final: re-read the record (the worker may have died)
+                if message is None or SolveJobStatus(
+                    json.loads(message["data"])["status"]
+                ).is_terminal:
+                    job = await asyncio.to_thread(solve_job_store.get, job_id)
+            return job
+        finally:
+            await pubsub.unsubscribe(solve_job_channel(job_id))
+            await pubsub.aclose()
+    
+    try:
+        job = await asyncio.wait_for(wait_for_final_status(), timeout_seconds)
+        if job is None:
+            return
+        
+        result = await redis.get(f"schedule:result:{job_id}")
+        if job.status == SolveJobStatus.SUCCEEDED and result:
+            await redis.setex(cache_key, 3600, result)
+            summary = json.loads(result)
+            await manager.broadcast(json.dumps({
+                "event": "optimization_complete",
+                "schedule_id": str(job_id),
+                "status": summary["status"],
+                "makespan_hours": summary["makespan_minutes"] / 60,
+                "scheduled_tasks": summary["scheduled_tasks"]
+            }))
+        else:
+            await manager.broadcast(json.dumps({
+                "event": "optimization_error",
+                "schedule_id": str(job_id),
+                "error": job.error or f"Solve job {job.status.value}"
+            }))
+    except asyncio.TimeoutError:
+        logger.warning(f"Stopped waiting for solve job {job_id} after {timeout_seconds}s")
+    except Exception as e:
+        logger.error(f"Error relaying solve job {job_id}: {str(e)}", exc_info=True)
+
+
+async def load_solve_job(job_id: UUID) -> SolveJob:
+    """Solve job record, or 404."""
+    job = await asyncio.to_thread(solve_job_store.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Solve job not found")
+    return job
+
+
+async def _find_solve_job(schedule_id: str) -> Optional[SolveJob]:
+    try:
+        job_id = UUID(schedule_id)
+    except ValueError:
+        return None
+    return await asyncio.to_thread(solve_job_store.get, job_id)
+
+
+def _server_sent_event(event: Dict[str, Any]) -> str:
+    return f"event: {event['event']}\ndata: {json.dumps(event, default=str)}\n\n"
+
+
+async def solve_single_flight(
+    request: ScheduleRequest,
+    on_progress=None
+) -> SchedulingSolution:
+    """
+    Load, model and solve once per identical request in flight.
+    
+    Concurrent requests with the same parameters (repeated clicks, retries,
+    several planners) receive the first request's solution and progress;
+    only that first request reads the database and builds the model.
+    """
+    async def run_solve(report):
+        db_config = {
+            'host': settings.POSTGRES_SERVER,
+            'database': settings.POSTGRES_DB,
+            'user': settings.POSTGRES_USER,
+            'password': settings.POSTGRES_PASSWORD
+        }
+        service = VulcanSchedulingService(db_config)
         
-        # Cache the result
-        await redis.setex(cache_key, 3600, json.dumps(result_data, default=str))
-        
-        # Persist to database
-        await persist_schedule(schedule_id, solution, request.dict())
-        
-        # Notify via WebSocket
-        await manager.broadcast(json.dumps({
-            "event": "optimization_complete",
-            "schedule_id": schedule_id,
-            "status": solution.status.value,
-            "makespan_hours": solution.makespan_minutes / 60,
-            "scheduled_tasks": len(solution.scheduled_tasks)
-        }))
-        
-        logger.info(f"Completed async optimization for schedule {schedule_id}")
+        # Off the event loop, so joining requests are served meanwhile
+        await report({"stage": "loading"})
+        data = await asyncio.to_thread(service.fetch_scheduling_data, request.job_ids)
+        if not data['tasks']:
+            raise HTTPException(status_code=404, detail="No tasks found to schedule")
         
-    except Exception as e:
-        logger.error(f"Error in async optimization: {str(e)}", exc_info=True)
+        await report({"stage": "modeling", "task_count": len(data['tasks'])})
+        await asyncio.to_thread(service.create_scheduling_model, data, request.horizon_days)
         
-        # Notify error via WebSocket
-        await manager.broadcast(json.dumps({
-            "event": "optimization_error",
-            "schedule_id": schedule_id,
-            "error": str(e)
-        }))
+        await report({"stage": "solving", "time_limit_seconds": request.time_limit_seconds})
+        return await asyncio.to_thread(service.solve, request.time_limit_seconds)
+    
+    flight = await get_schedule_flight()
+    try:
+        return await flight.run(
+            digest_value(request.dict(exclude={"use_cache"})),
+            run_solve,
+            encode=lambda solution: solution.json(),
+            decode=SchedulingSolution.parse_raw,
+            on_progress=on_progress,
+            # The leader also loads data and builds the model under the lock
+            lock_ttl_seconds=request.time_limit_seconds + 120
+        )
+    except RemoteSolveError as e:
+        # Answer as the worker that ran the identical solve did
+        if e.status_code is not None:
+            raise HTTPException(status_code=e.status_code, detail=e.detail) from e
+        raise
 
 
 async def persist_schedule(schedule_id: str, solution: SchedulingSolution, parameters: Dict):
@@ -233,6 +233,19 @@ class Settings(BaseSettings):
         """Get Celery result backend URL (defaults to Redis)."""
         return self.CELERY_RESULT_BACKEND or self.REDIS_URL
 
+    # Solver Process Pool Configuration
+    SOLVER_POOL_MAX_WORKERS: int | None = None  # Defaults to half the CPU cores
+    SOLVER_POOL_MAX_MEMORY_MB: int = 4096  # Address-space ceiling per worker
+    SOLVER_POOL_MAX_SOLVES_PER_WORKER: int = 25
+    SOLVER_POOL_HARD_KILL_GRACE_SECONDS: float = 5.0
+
+    # Solver Admission Control
+    SOLVER_ADMISSION_CPU_CORES: int | None = None  # Defaults to all CPU cores
+    SOLVER_ADMISSION_MEMORY_MB: int | None = None  # Defaults to 75% of RAM
+    SOLVER_ADMISSION_MAX_QUEUE: int = 32
+    SOLVER_ADMISSION_MIN_SOLVE_SECONDS: float = 5.0  # Shortest solve worth starting
+    SOLVER_MAX_WORKERS_PER_SOLVE: int = 8
+
     # Database Read Replica Configuration
     DATABASE_READ_REPLICA_URL: str | None = None
     DATABASE_MAX_CONNECTIONS: int = 100
@@ -5,8 +5,11 @@ Implements graceful degradation patterns with simplified algorithms, partial sol
 and heuristic approaches when the primary OR-Tools solver fails or times out.
 """
 
+import heapq
 import time
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
@@ -20,6 +23,7 @@ from ..domain.scheduling.entities.schedule import Schedule
 from ..domain.scheduling.entities.task import Task
 from ..domain.scheduling.value_objects.duration import Duration
 from ..domain.scheduling.value_objects.enums import PriorityLevel
+from ..domain.scheduling.value_objects.role_requirement import RoleRequirement
 from .observability import get_logger, monitor_performance
 from .solver_management import SolverMetrics
 
@@ -126,7 +130,24 @@ class BaseFallbackStrategy(ABC):
 
 
 class GreedySchedulingStrategy(BaseFallbackStrategy):
-    """Greedy scheduling: assign tasks to first available resource."""
+    """
+    Greedy list scheduling over ready tasks.
+
+    A task becomes ready once its predecessors are placed: its explicit
+    ``predecessor_ids`` plus the tasks at the previous sequence step of its
+    job. Ready tasks are taken from a priority queue (job priority, ready
+    time, sequence) and placed on the eligible machine that finishes them
+    earliest, with the earliest-free operators that satisfy their skill
+    requirements. Machines and operator skill pools keep next-free heaps with
+    lazy invalidation, so each placement costs O(log n) rather than a scan of
+    every resource.
+
+    The resulting schedule respects precedence, machine and operator
+    capacity and skills, so it can also seed the CP-SAT solvers as a warm
+    start.
+    """
+
+    DEFAULT_TASK_MINUTES = 60
 
     async def execute(
         self,
@@ -136,78 +157,137 @@ class GreedySchedulingStrategy(BaseFallbackStrategy):
         machines: list[Machine],
         start_time: datetime,
     ) -> FallbackResult:
-        """Execute greedy scheduling strategy."""
+        """Execute greedy list scheduling."""
         start_exec_time = time.time()
         schedule = Schedule(name=f"Greedy Schedule {start_time.isoformat()}")
         warnings = []
 
-        # Sort tasks by job priority and sequence
-        sorted_tasks = sorted(
-            tasks,
-            key=lambda t: (
-                self._get_job_priority_value(t, jobs),
-                t.position_in_job or 0,
-            ),
-        )
-
-        # Track resource availability
-        operator_availability = {op.id: start_time for op in operators}
-        machine_availability = {m.id: start_time for m in machines}
+        job_by_id = {job.id: job for job in jobs}
+        job_priority = {job.id: self._get_job_priority_value(job) for job in jobs}
+        successors, pending = self._build_precedence(tasks)
+
+        # Machine next-free times; the heap serves tasks without machine options
+        machine_free = {machine.id: 0 for machine in machines}
+        machine_index = {machine.id: index for index, machine in enumerate(machines)}
+        machine_heap = [(0, index, machine.id) for index, machine in enumerate(machines)]
+
+        # Operator next-free times and skill pools, built on first use
+        operator_free = {operator.id: 0 for operator in operators}
+        operator_index = {operator.id: index for index, operator in enumerate(operators)}
+        operator_pools: dict[tuple, list[tuple[int, int, UUID]]] = {}
+        pools_by_operator: dict[UUID, list[tuple]] = {op.id: [] for op in operators}
+
+        def pool_for(key: tuple) -> list[tuple[int, int, UUID]]:
+            pool = operator_pools.get(key)
+            if pool is None:
+                pool = [
+                    (operator_free[op.id], operator_index[op.id], op.id)
+                    for op in operators
+                    if self._operator_qualifies(op, key)
+                ]
+                heapq.heapify(pool)
+                operator_pools[key] = pool
+                for _, _, operator_id in pool:
+                    pools_by_operator[operator_id].append(key)
+            return pool
+
+        # Tasks are addressed by position in the hot loop
+        ready_at = [0] * len(tasks)
+        blocked = [False] * len(tasks)
+        ready_queue = [
+            (job_priority.get(task.job_id, 999), 0, task.sequence_in_job, index)
+            for index, task in enumerate(tasks)
+            if pending[index] == 0
+        ]
+        heapq.heapify(ready_queue)
 
+        job_completion: dict[UUID, int] = {}
         scheduled_tasks = 0
-        total_makespan = 0.0
-        total_tardiness = 0.0
-
-        for task in sorted_tasks:
-            try:
-                # Find job for this task
-                job = next((j for j in jobs if j.id == task.job_id), None)
-                if not job:
-                    warnings.append(f"Job not found for task {task.id}")
-                    continue
-
-                # Find available operator
-                available_operator = self._find_earliest_available_operator(
-                    operators, operator_availability
-                )
-
-                # Find available machine
-                available_machine = self._find_earliest_available_machine(
-                    machines, machine_availability
+        visited = 0
+
+        while ready_queue:
+            _, ready, _, index = heapq.heappop(ready_queue)
+            task = tasks[index]
+            visited += 1
+
+            placement = None
+            if blocked[index]:
+                warnings.append(f"Task {task.id} blocked by an unscheduled predecessor")
+            elif task.job_id not in job_by_id:
+                warnings.append(f"Job not found for task {task.id}")
+            else:
+                placement = self._place_task(
+                    task,
+                    ready,
+                    machine_free,
+                    machine_heap,
+                    operator_free,
+                    pool_for,
                 )
+                if placement is None:
+                    warnings.append(f"No eligible resources for task {task.id}")
 
-                if not available_operator or not available_machine:
-                    warnings.append(f"No resources available for task {task.id}")
-                    continue
-
-                # Calculate task timing
-                task_start = max(
-                    operator_availability[available_operator.id],
-                    machine_availability[available_machine.id],
+            if placement is None:
+                for succ in successors[index]:
+                    blocked[succ] = True
+            else:
+                machine_id, operator_ids, start, setup, processing, operator_ends = placement
+                end = start + setup + processing
+
+                machine_free[machine_id] = end
+                heapq.heappush(machine_heap, (end, machine_index[machine_id], machine_id))
+                for operator_id, operator_end in zip(operator_ids, operator_ends):
+                    operator_free[operator_id] = operator_end
+                    for key in pools_by_operator[operator_id]:
+                        heapq.heappush(
+                            operator_pools[key],
+                            (operator_end, operator_index[operator_id], operator_id),
+                        )
+
+                schedule.assign_task(
+                    task_id=task.id,
+                    machine_id=machine_id,
+                    operator_ids=operator_ids,
+                    start_time=start_time + timedelta(minutes=start),
+                    end_time=start_time + timedelta(minutes=end),
+                    setup_duration=Duration.from_minutes(setup),
+                    processing_duration=Duration.from_minutes(processing),
                 )
-
-                task_duration = Duration.from_minutes(60)  # Default duration
-                task_end = task_start + timedelta(minutes=task_duration.total_minutes)
-
-                # Create task assignment
-                # Note: This is simplified - full implementation would create proper assignment
                 scheduled_tasks += 1
+                if end > job_completion.get(task.job_id, -1):
+                    job_completion[task.job_id] = end
+
+                for succ in successors[index]:
+                    if end > ready_at[succ]:
+                        ready_at[succ] = end
+
+            for succ in successors[index]:
+                pending[succ] -= 1
+                if pending[succ] == 0:
+                    succ_task = tasks[succ]
+                    heapq.heappush(
+                        ready_queue,
+                        (
+                            job_priority.get(succ_task.job_id, 999),
+                            ready_at[succ],
+                            succ_task.sequence_in_job,
+                            succ,
+                        ),
+                    )
+
+        if visited < len(tasks):
+            warnings.append(
+                f"{len(tasks) - visited} tasks not scheduled due to a precedence cycle"
+            )
 
-                # Update resource availability
-                operator_availability[available_operator.id] = task_end
-                machine_availability[available_machine.id] = task_end
-
-                # Update metrics
-                makespan_minutes = (task_end - start_time).total_seconds() / 60
-                total_makespan = max(total_makespan, makespan_minutes)
-
-                # Calculate tardiness
-                if job.due_date and task_end > job.due_date:
-                    tardiness = (task_end - job.due_date).total_seconds() / 60
-                    total_tardiness += tardiness
-
-            except Exception as e:
-                warnings.append(f"Failed to schedule task {task.id}: {str(e)}")
+        total_makespan = float(max(job_completion.values(), default=0))
+        total_tardiness = 0.0
+        for job_id, completion in job_completion.items():
+            due_date = job_by_id[job_id].due_date
+            if due_date:
+                finish = start_time + timedelta(minutes=completion)
+                if finish > due_date:
+                    total_tardiness += (finish - due_date).total_seconds() / 60
 
         execution_time = time.time() - start_exec_time
         quality_score = self._calculate_quality_score(
@@ -230,48 +310,176 @@ class GreedySchedulingStrategy(BaseFallbackStrategy):
             quality_score=quality_score,
             makespan_minutes=total_makespan,
             total_tardiness_minutes=total_tardiness,
-            jobs_scheduled=len({t.job_id for t in sorted_tasks[:scheduled_tasks]}),
+            jobs_scheduled=len(job_completion),
             tasks_scheduled=scheduled_tasks,
             warnings=warnings,
             metrics={
                 "resource_utilization": scheduled_tasks
-                / (len(operators) + len(machines)),
-                "completion_rate": scheduled_tasks / len(tasks),
+                / max(len(operators) + len(machines), 1),
+                "completion_rate": scheduled_tasks / max(len(tasks), 1),
             },
         )
 
-    def _get_job_priority_value(self, task: Task, jobs: list[Job]) -> int:
-        """Get priority value for sorting (lower = higher priority)."""
-        job = next((j for j in jobs if j.id == task.job_id), None)
-        if not job:
-            return 999
+    def _build_precedence(self, tasks: list[Task]) -> tuple[list[list[int]], list[int]]:
+        """
+        Build successor lists and unplaced-predecessor counts by task position.
 
+        Tasks at one sequence step of a job precede every task at the next
+        step; explicit ``predecessor_ids`` outside the task set are ignored.
+        """
+        position = {task.id: index for index, task in enumerate(tasks)}
+        successors: list[set[int]] = [set() for _ in tasks]
+
+        by_job: dict[UUID, list[int]] = defaultdict(list)
+        for index, task in enumerate(tasks):
+            by_job[task.job_id].append(index)
+            for pred_id in task.predecessor_ids:
+                pred = position.get(pred_id)
+                if pred is not None and pred != index:
+                    successors[pred].add(index)
+
+        for job_tasks in by_job.values():
+            job_tasks.sort(key=lambda i: tasks[i].sequence_in_job)
+            previous_step: list[int] = []
+            current_step: list[int] = []
+            for index in job_tasks:
+                sequence = tasks[index].sequence_in_job
+                if current_step and sequence != tasks[current_step[0]].sequence_in_job:
+                    previous_step, current_step = current_step, []
+                current_step.append(index)
+                for pred in previous_step:
+                    successors[pred].add(index)
+
+        pending = [0] * len(tasks)
+        for succs in successors:
+            for succ in succs:
+                pending[succ] += 1
+        return [list(succs) for succs in successors], pending
+
+    def _place_task(
+        self,
+        task: Task,
+        ready: int,
+        machine_free: dict[UUID, int],
+        machine_heap: list[tuple[int, int, UUID]],
+        operator_free: dict[UUID, int],
+        pool_for: Callable[[tuple], list[tuple[int, int, UUID]]],
+    ) -> tuple[UUID, list[UUID], int, int, int, list[int]] | None:
+        """
+        Choose machine, operators and start time for one task.
+
+        Returns ``(machine_id, operator_ids, start, setup, processing,
+        operator_ends)`` in minutes from the schedule start, or None when no
+        eligible machine or not enough qualified operators exist.
+        """
+        options = [
+            option for option in task.machine_options if option.machine_id in machine_free
+        ]
+        if (task.machine_options and not options) or not machine_free:
+            return None
+
+        # Operator groups: (skill key, count, role or None for full attendance)
+        if task.role_requirements:
+            groups = [
+                (((role.skill_type.upper(), role.minimum_level),), role.count, role)
+                for role in task.role_requirements
+            ]
+        elif task.skill_requirements:
+            key = tuple(
+                sorted(
+                    (str(req.skill_type.value).upper(), req.minimum_level)
+                    for req in task.skill_requirements
+                )
+            )
+            groups = [(key, 1, None)]
+        else:
+            groups = []
+
+        chosen: list[UUID] = []
+        chosen_roles: list[RoleRequirement | None] = []
+        taken = []
+        operator_ready = 0
+        for key, count, role in groups:
+            pool = pool_for(key)
+            skipped = []
+            picked = 0
+            while pool and picked < count:
+                entry = heapq.heappop(pool)
+                free_at, _, operator_id = entry
+                if operator_free[operator_id] != free_at:
+                    continue  # Stale entry
+                if operator_id in chosen:
+                    skipped.append(entry)
+                    continue
+                taken.append((pool, entry))
+                chosen.append(operator_id)
+                chosen_roles.append(role)
+                operator_ready = max(operator_ready, free_at)
+                picked += 1
+            for entry in skipped:
+                heapq.heappush(pool, entry)
+            if picked < count:
+                # Chosen operators get fresh entries only when the task is placed
+                for taken_pool, entry in taken:
+                    heapq.heappush(taken_pool, entry)
+                return None
+
+        earliest = max(ready, operator_ready)
+        option = None
+        machine_id = None
+        if options:
+            best_end = None
+            for candidate in options:
+                start = max(earliest, machine_free[candidate.machine_id])
+                end = start + int(
+                    candidate.setup_duration.minutes + candidate.processing_duration.minutes
+                )
+                if best_end is None or end < best_end:
+                    best_end, option, machine_id = end, candidate, candidate.machine_id
+            start = max(earliest, machine_free[machine_id])
+            setup = int(option.setup_duration.minutes)
+            processing = int(option.processing_duration.minutes)
+        else:
+            while machine_heap[0][0] != machine_free[machine_heap[0][2]]:
+                heapq.heappop(machine_heap)  # Stale entries
+            machine_id = heapq.heappop(machine_heap)[2]
+            start = max(earliest, machine_free[machine_id])
+            setup = int(task.planned_setup_duration.minutes) if task.planned_setup_duration else 0
+            processing = (
+                int(task.planned_duration.minutes)
+                if task.planned_duration
+                else self.DEFAULT_TASK_MINUTES
+            )
+
+        end = start + setup + processing
+        operator_ends = [
+            start + task.operator_required_duration_minutes(option, role)
+            if option is not None and role is not None
+            else end
+            for role in chosen_roles
+        ]
+        return machine_id, chosen, start, setup, processing, operator_ends
+
+    def _operator_qualifies(self, operator: Operator, key: tuple) -> bool:
+        """Check an operator against every (skill code, minimum level) in key."""
+        for skill_code, minimum_level in key:
+            skill = operator.skills.get(skill_code)
+            if skill is None or not skill.is_valid:
+                return False
+            if skill.proficiency_level.numeric_value < minimum_level:
+                return False
+        return True
+
+    def _get_job_priority_value(self, job: Job) -> int:
+        """Get priority value for sorting (lower = higher priority)."""
         priority_map = {
-            PriorityLevel.URGENT: 1,
+            PriorityLevel.CRITICAL: 1,
             PriorityLevel.HIGH: 2,
             PriorityLevel.NORMAL: 3,
             PriorityLevel.LOW: 4,
         }
         return priority_map.get(job.priority, 3)
 
-    def _find_earliest_available_operator(
-        self, operators: list[Operator], availability: dict[UUID, datetime]
-    ) -> Operator | None:
-        """Find the operator available earliest."""
-        if not operators:
-            return None
-
-        return min(operators, key=lambda op: availability.get(op.id, datetime.min))
-
-    def _find_earliest_available_machine(
-        self, machines: list[Machine], availability: dict[UUID, datetime]
-    ) -> Machine | None:
-        """Find the machine available earliest."""
-        if not machines:
-            return None
-
-        return min(machines, key=lambda m: availability.get(m.id, datetime.min))
-
 
 class PriorityBasedStrategy(BaseFallbackStrategy):
     """Priority-based scheduling: strict priority order."""
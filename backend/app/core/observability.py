@@ -128,6 +128,52 @@ ERROR_RECOVERY_TIME = Histogram(
     ["error_type", "recovery_method"],
 )
 
+# Solver process pool metrics
+SOLVER_POOL_QUEUE_DEPTH = Gauge(
+    "vulcan_solver_pool_queue_depth",
+    "Solve requests waiting for a free solver worker",
+)
+
+SOLVER_POOL_RUNNING = Gauge(
+    "vulcan_solver_pool_running_solves",
+    "Solves currently executing in solver worker processes",
+)
+
+SOLVER_POOL_WORKERS = Gauge(
+    "vulcan_solver_pool_workers",
+    "Live solver worker processes",
+)
+
+SOLVER_POOL_WORKER_EVENTS = Counter(
+    "vulcan_solver_pool_worker_events_total",
+    "Solver worker lifecycle events",
+    ["event"],
+)
+
+# Single-flight coalescing of identical solve requests
+SOLVE_SINGLE_FLIGHT = Counter(
+    "vulcan_solve_single_flight_total",
+    "Solve requests by how they were served: leader ran the solve, "
+    "local or remote joined an identical in-flight solve",
+    ["role"],
+)
+
+SOLVER_ADMISSION_DECISIONS = Counter(
+    "vulcan_solver_admission_decisions_total",
+    "Solver admission outcomes: admitted at once, queued, or rejected",
+    ["decision"],
+)
+
+SOLVER_ADMISSION_QUEUE_DEPTH = Gauge(
+    "vulcan_solver_admission_queue_depth",
+    "Solves waiting for CPU cores or memory",
+)
+
+SOLVER_ADMISSION_CORES_IN_USE = Gauge(
+    "vulcan_solver_admission_cores_in_use",
+    "Search worker threads granted to running solves",
+)
+
 
 class CorrelationIdProcessor:
     """Structlog processor to add correlation ID to all log entries."""
@@ -0,0 +1,326 @@
+"""
+Single-Flight Solve Coalescing
+
+Collapses concurrent identical solve requests into one solver run. Within a
+process, callers with the same key await one shared task. Across API workers,
+a Redis lock elects one leader per key; the other workers subscribe to the
+key's channel and receive the leader's progress messages and its encoded
+result. If the leader fails, its error is raised in the waiting workers as a
+RemoteSolveError; only when its lock expires or is released without a
+message does a waiting worker take over the lock and solve itself.
+
+Without Redis (or when Redis errors) requests are still coalesced within the
+process.
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import uuid4
+
+from redis.exceptions import RedisError
+
+from .config import settings
+from .observability import SOLVE_SINGLE_FLIGHT, get_logger
+
+ProgressCallback = Callable[[dict[str, Any]], Awaitable[None]]
+
+# Deletes the lock only while it is still held by this leader
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class RemoteSolveError(Exception):
+    """Failure of a solve that another worker ran for the same key."""
+
+    def __init__(
+        self,
+        error_type: str,
+        detail: Any,
+        status_code: int | None = None,
+        details: dict[str, Any] | None = None,
+    ):
+        super().__init__(str(detail))
+        self.error_type = error_type  # Class name of the leader's exception
+        self.detail = detail
+        self.status_code = status_code  # Set for HTTP errors
+        self.details = details or {}
+
+
+@dataclass
+class _Flight:
+    """One in-process run shared by every local caller with the same key."""
+
+    task: "asyncio.Task[Any] | None" = None
+    listeners: list[ProgressCallback] = field(default_factory=list)
+    callers: int = 0
+
+
+class SingleFlight:
+    """
+    Runs at most one solve per key at a time, sharing the result.
+
+    ``run`` calls ``solve(report)`` only on the leader; ``report(progress)``
+    forwards a JSON-compatible progress dict to every caller attached to the
+    key, in this process and in other workers.
+    """
+
+    def __init__(
+        self,
+        redis_client: Any = None,
+        namespace: str = "solve",
+        lock_ttl_seconds: float = 900.0,
+        result_ttl_seconds: float = 60.0,
+        poll_interval_seconds: float = 0.5,
+    ):
+        self.redis = redis_client
+        self.namespace = namespace
+        self.lock_ttl_seconds = lock_ttl_seconds
+        self.result_ttl_seconds = result_ttl_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self.logger = get_logger("single_flight")
+        self._flights: dict[str, _Flight] = {}
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._flights
+
+    async def run(
+        self,
+        key: str,
+        solve: Callable[[ProgressCallback], Awaitable[Any]],
+        encode: Callable[[Any], str] = json.dumps,
+        decode: Callable[[str], Any] = json.loads,
+        on_progress: ProgressCallback | None = None,
+        lock_ttl_seconds: float | None = None,
+    ) -> Any:
+        """
+        Result of ``solve`` for ``key``, shared with identical requests.
+
+        The shared run is not cancelled when one caller goes away, so callers
+        that joined it still get the result. ``lock_ttl_seconds`` should
+        exceed the solve's time limit; a waiting worker takes over once the
+        lock expires.
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight()
+            self._flights[key] = flight
+            flight.task = asyncio.create_task(
+                self._execute(
+                    key, flight, solve, encode, decode,
+                    lock_ttl_seconds or self.lock_ttl_seconds,
+                )
+            )
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            SOLVE_SINGLE_FLIGHT.labels(role="local").inc()
+            self.logger.info("Joined in-flight solve", key=key, callers=flight.callers + 1)
+
+        flight.callers += 1
+        if on_progress is not None:
+            flight.listeners.append(on_progress)
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.callers -= 1
+            if on_progress is not None:
+                flight.listeners.remove(on_progress)
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if flight.task is not None and not flight.task.cancelled():
+            # Retrieved by the callers; marks it handled if they all left
+            flight.task.exception()
+
+    async def _execute(
+        self,
+        key: str,
+        flight: _Flight,
+        solve: Callable[[ProgressCallback], Awaitable[Any]],
+        encode: Callable[[Any], str],
+        decode: Callable[[str], Any],
+        lock_ttl_seconds: float,
+    ) -> Any:
+        async def report(progress: dict[str, Any]) -> None:
+            await self._notify(flight, progress)
+            if self.redis is not None:
+                try:
+                    await self.redis.publish(
+                        self._channel(key),
+                        json.dumps({"type": "progress", "progress": progress}, default=str),
+                    )
+                except RedisError as e:
+                    self.logger.warning("Progress publish failed", key=key, error=str(e))
+
+        if self.redis is None:
+            SOLVE_SINGLE_FLIGHT.labels(role="leader").inc()
+            return await solve(report)
+
+        owner = uuid4().hex
+        while True:
+            try:
+                acquired = await self.redis.set(
+                    self._lock_key(key), owner, nx=True, px=int(lock_ttl_seconds * 1000)
+                )
+            except RedisError as e:
+                self.logger.warning("Single-flight lock unavailable", key=key, error=str(e))
+                SOLVE_SINGLE_FLIGHT.labels(role="leader").inc()
+                return await solve(report)
+
+            if acquired:
+                SOLVE_SINGLE_FLIGHT.labels(role="leader").inc()
+                return await self._lead(key, owner, solve, encode, report)
+
+            payload = await self._follow(key, flight)
+            if payload is not None:
+                SOLVE_SINGLE_FLIGHT.labels(role="remote").inc()
+                return decode(payload)
+            # The leader vanished without a result; try to take over
+
+    async def _lead(
+        self,
+        key: str,
+        owner: str,
+        solve: Callable[[ProgressCallback], Awaitable[Any]],
+        encode: Callable[[Any], str],
+        report: ProgressCallback,
+    ) -> Any:
+        try:
+            value = await solve(report)
+        except Exception as e:
+            await self._release(key, owner, self._error_message(e))
+            raise
+        except BaseException:
+            # Cancelled, not failed: a waiting worker takes over
+            await self._release(key, owner, None)
+            raise
+
+        payload = encode(value)
+        try:
+            await self.redis.set(
+                self._result_key(key), payload, px=int(self.result_ttl_seconds * 1000)
+            )
+        except RedisError as e:
+            self.logger.warning("Single-flight result not stored", key=key, error=str(e))
+        await self._release(key, owner, {"type": "result", "payload": payload})
+        return value
+
+    async def _release(
+        self, key: str, owner: str, message: dict[str, Any] | None
+    ) -> None:
+        try:
+            if message is not None:
+                await self.redis.publish(self._channel(key), json.dumps(message, default=str))
+            await self.redis.eval(_RELEASE_SCRIPT, 1, self._lock_key(key), owner)
+        except RedisError as e:
+            self.logger.warning("Single-flight release failed", key=key, error=str(e))
+
+    @staticmethod
+    def _error_message(error: Exception) -> dict[str, Any]:
+        """Leader failure as followers re-raise it, keeping any HTTP status."""
+        if isinstance(error, RemoteSolveError):
+            return {
+                "type": "error",
+                "error_type": error.error_type,
+                "status_code": error.status_code,
+                "detail": error.detail,
+                "details": error.details,
+            }
+        details = getattr(error, "details", None)
+        return {
+            "type": "error",
+            "error_type": type(error).__name__,
+            "status_code": getattr(error, "status_code", None),
+            "detail": getattr(error, "detail", None) or str(error),
+            "details": details if isinstance(details, dict) else None,
+        }
+
+    async def _follow(self, key: str, flight: _Flight) -> str | None:
+        """
+        Wait for another worker's result; None when it vanished without one.
+
+        Raises RemoteSolveError when the other worker's solve failed.
+        """
+        self.logger.info("Waiting for solve running in another worker", key=key)
+        try:
+            pubsub = self.redis.pubsub()
+            await pubsub.subscribe(self._channel(key))
+        except RedisError as e:
+            self.logger.warning("Single-flight subscribe failed", key=key, error=str(e))
+            await asyncio.sleep(self.poll_interval_seconds)
+            return None
+
+        try:
+            # Subscribed first, so a result published from here on is not missed
+            payload = await self.redis.get(self._result_key(key))
+            if payload is not None:
+                return payload
+
+            next_check = time.monotonic() + self.poll_interval_seconds
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=self.poll_interval_seconds
+                )
+                if message is not None:
+                    data = json.loads(message["data"])
+                    if data["type"] == "progress":
+                        await self._notify(flight, data["progress"])
+                    elif data["type"] == "result":
+                        return data["payload"]
+                    elif data["type"] == "error":
+                        raise RemoteSolveError(
+                            data["error_type"],
+                            data["detail"],
+                            data.get("status_code"),
+                            data.get("details"),
+                        )
+                if time.monotonic() >= next_check:
+                    next_check = time.monotonic() + self.poll_interval_seconds
+                    if not await self.redis.exists(self._lock_key(key)):
+                        return await self.redis.get(self._result_key(key))
+        except RedisError as e:
+            self.logger.warning("Single-flight wait failed", key=key, error=str(e))
+            return None
+        finally:
+            try:
+                await pubsub.unsubscribe(self._channel(key))
+                await pubsub.aclose()
+            except RedisError:
+                pass
+
+    async def _notify(self, flight: _Flight, progress: dict[str, Any]) -> None:
+        for listener in list(flight.listeners):
+            try:
+                await listener(progress)
+            except Exception as e:
+                self.logger.warning("Progress listener failed", error=str(e))
+
+    def _lock_key(self, key: str) -> str:
+        return f"singleflight:{self.namespace}:{key}:lock"
+
+    def _result_key(self, key: str) -> str:
+        return f"singleflight:{self.namespace}:{key}:result"
+
+    def _channel(self, key: str) -> str:
+        return f"singleflight:{self.namespace}:{key}:events"
+
+
+_single_flights: dict[str, SingleFlight] = {}
+
+
+def get_single_flight(namespace: str = "solve") -> SingleFlight:
+    """Process-wide single-flight group for ``namespace``, shared via Redis."""
+    if namespace not in _single_flights:
+        from redis import asyncio as aioredis
+
+        client = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+        _single_flights[namespace] = SingleFlight(client, namespace)
+    return _single_flights[namespace]
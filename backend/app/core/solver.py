@@ -7,12 +7,20 @@ This implementation follows verified OR-Tools patterns from official documentati
 and examples, particularly flexible_job_shop_sat.py and shift_scheduling_sat.py
 """
 
+import bisect
 import collections
+import heapq
+import math
+import os
 import time
 from typing import Any
 
 from ortools.sat.python import cp_model  # type: ignore[import-not-found]
 
+from .solver_bounds import ResourceLoad, TimeBounds, compute_time_bounds
+from .solver_redundancy import add_resource_group
+from .solver_termination import TerminationPolicy, solve_with_policy
+
 
 class HFFSScheduler:
     def __init__(self) -> None:
@@ -25,6 +33,12 @@ class HFFSScheduler:
         self.horizon_days: int = 30
         self.horizon: int = self.horizon_days * 24 * 60  # Total minutes
 
+        # Size the horizon per solve from a constructive schedule's makespan
+        # plus horizon_slack, doubling it while Phase 1 proves it too short
+        self.auto_horizon: bool = True
+        self.horizon_slack: float = 0.25
+        self.max_horizon_days: int = 365
+
         # Time constants
         self.minutes_per_day: int = 24 * 60
         self.work_start: int = 7 * 60  # 7am in minutes from midnight
@@ -32,6 +46,19 @@ class HFFSScheduler:
         self.lunch_start: int = 12 * 60  # Noon
         self.lunch_duration: int = 45  # 45 minutes
 
+        # Model time unit in minutes. Durations round up to whole quanta and
+        # working windows shrink to quantum boundaries, so a coarse quantum
+        # shrinks the domains without admitting schedules that are infeasible
+        # in exact minutes
+        self.time_quantum: int = 1
+
+        # CP-SAT search threads per solve; lower it when solves share the host
+        self.num_search_workers: int = min(8, os.cpu_count() or 1)
+
+        # Time limit of each optimization phase, and when to stop earlier
+        self.time_limit_seconds: float = 300
+        self.termination: TerminationPolicy = TerminationPolicy()
+
         # Holidays (days 5, 12, 26)
         self.holidays: set[int] = {5, 12, 26}
 
@@ -142,6 +169,18 @@ class HFFSScheduler:
         # Tasks requiring 2 operators (every 15th task)
         self.two_operator_tasks: set[int] = {14, 29, 44, 59, 74, 89}
 
+        # Model operators as one cumulative resource per class of
+        # interchangeable operators and name people after solving, instead
+        # of one assignment literal per eligible operator and task
+        self.pool_operators: bool = True
+
+        # Also post a redundant cumulative and energy bound per group of
+        # routing machines and per pool of operators meeting a skill
+        # requirement, for CP-SAT to reason about each group's load. Off by
+        # default: it helps small plants but slowed the full plant with
+        # per-operator literals; see the redundant groups benchmark
+        self.redundant_resource_groups: bool = False
+
         # Critical sequences (tasks within these ranges maintain strict job priority)
         self.critical_sequences: list[tuple[int, int]] = [
             (20, 28),  # Critical welding
@@ -150,6 +189,9 @@ class HFFSScheduler:
             (85, 92),  # Critical inspection
         ]
 
+        # Time bounds of the last model built, in model time units
+        self.last_time_bounds: TimeBounds | None = None
+
         # WIP limits by zone
         self.wip_zones: list[tuple[int, int, int]] = [
             (0, 30, 3),  # Tasks 0-30: max 3 jobs
@@ -184,6 +226,344 @@ class HFFSScheduler:
                 eligible.append(op_id)
         return eligible
 
+    def qualified_operator_count(self, requirement: tuple[str, int]) -> int:
+        """Number of operators meeting a (skill, minimum level) requirement"""
+        skill_type, min_level = requirement
+        return sum(
+            1 for skills in self.operator_skills.values() if skills[skill_type] >= min_level
+        )
+
+    def operator_classes(self) -> list[list[int]]:
+        """
+        Operators grouped into classes of interchangeable people.
+
+        Two operators are interchangeable when they qualify for the same task
+        requirements at the same cost rate; every operator works the plant
+        calendar, so calendars never split a class.
+        """
+        requirements = sorted(set(self.task_requirements.values()))
+        classes: dict[tuple[Any, ...], list[int]] = {}
+        for op_id, skills in sorted(self.operator_skills.items()):
+            signature = (
+                tuple(skills[skill] >= level for skill, level in requirements),
+                self.operator_costs[op_id],
+            )
+            classes.setdefault(signature, []).append(op_id)
+        return list(classes.values())
+
+    def assign_operators(
+        self,
+        solver: cp_model.CpSolver,
+        task_starts: dict[tuple[int, int, int], cp_model.IntVar],
+        task_presences: dict[tuple[int, int, int], cp_model.IntVar],
+        task_operators: dict[tuple[int, int, int], cp_model.IntVar],
+    ) -> dict[tuple[int, int], list[int]]:
+        """
+        Concrete operators of every task in a solution, keyed by (job, task).
+
+        With ``pool_operators`` the model only fixes how many operators of
+        each class a task uses. Members are then named by a sweep over start
+        times per class: the class cumulative keeps concurrent demand within
+        the class size, so a free member is always available.
+        """
+        if not self.pool_operators:
+            assigned: dict[tuple[int, int], list[int]] = collections.defaultdict(list)
+            for (job_id, task_id, op_id), op_assigned in task_operators.items():
+                if solver.Value(op_assigned) == 1:
+                    assigned[(job_id, task_id)].append(op_id)
+            return dict(assigned)
+
+        classes = self.operator_classes()
+        demands = collections.defaultdict(list)  # Class -> (start, end, demand, task)
+        for (job_id, task_id, class_id), count in task_operators.items():
+            demand = solver.Value(count)
+            if demand == 0:
+                continue
+            start, end = self.task_times(
+                solver, task_starts, task_presences, job_id, task_id
+            )
+            if not self.is_attended_machine(task_id):
+                # Operator only needed for setup
+                task_options = self.get_task_duration_and_setup(task_id)
+                setup = next(
+                    setup
+                    for option_id, (_, setup) in enumerate(task_options)
+                    if solver.Value(task_presences[(job_id, task_id, option_id)]) == 1
+                )
+                end = start + setup
+            # Busy time in model units, as the class cumulative saw it
+            start //= self.time_quantum
+            end = start + self.to_quanta(end - start * self.time_quantum)
+            demands[class_id].append((start, end, demand, (job_id, task_id)))
+
+        assignments: dict[tuple[int, int], list[int]] = collections.defaultdict(list)
+        for class_id, class_demands in demands.items():
+            free = list(classes[class_id])
+            heapq.heapify(free)
+            busy: list[tuple[int, int]] = []
+            for start, end, demand, key in sorted(class_demands):
+                while busy and busy[0][0] <= start:
+                    heapq.heappush(free, heapq.heappop(busy)[1])
+                for _ in range(demand):
+                    op_id = heapq.heappop(free)
+                    assignments[key].append(op_id)
+                    heapq.heappush(busy, (end, op_id))
+        return {key: sorted(ops) for key, ops in assignments.items()}
+
+    def _option_linked_value(
+        self,
+        model: cp_model.CpModel,
+        values: list[int],
+        presences: list[Any],
+        name: str,
+    ) -> Any:
+        """Constant if every routing option agrees, else a variable tied to the chosen option"""
+        if len(set(values)) == 1:
+            return values[0]
+        value_var = model.NewIntVarFromDomain(cp_model.Domain.FromValues(values), name)
+        for value, presence in zip(values, presences):
+            model.Add(value_var == value).OnlyEnforceIf(presence)
+        return value_var
+
+    def set_horizon_days(self, days: int) -> None:
+        """Set the horizon in days, keeping ``horizon`` minutes in step"""
+        self.horizon_days = days
+        self.horizon = days * self.minutes_per_day
+
+    def working_windows(self, days: int | None = None) -> list[tuple[int, int]]:
+        """Half-open [start, end) windows in which attended work may run, over ``days`` (default the horizon)"""
+        lunch_end = self.lunch_start + self.lunch_duration
+        windows = []
+        for day in range(self.horizon_days if days is None else days):
+            if day in self.holidays:
+                continue
+            day_start = day * self.minutes_per_day
+            for start, end in (
+                (self.work_start, self.lunch_start),
+                (lunch_end, self.work_end),
+            ):
+                if start < end:
+                    windows.append((day_start + start, day_start + end))
+        return windows
+
+    def to_quanta(self, minutes: int) -> int:
+        """Minutes to model time units, rounded up"""
+        return -(-minutes // self.time_quantum)
+
+    def model_working_windows(self, days: int | None = None) -> list[tuple[int, int]]:
+        """Working windows in model time units, shrunk to whole quanta"""
+        windows = []
+        for start, end in self.working_windows(days):
+            start, end = self.to_quanta(start), end // self.time_quantum
+            if start < end:
+                windows.append((start, end))
+        return windows
+
+    def calendar_blocked_periods(self) -> list[tuple[int, int]]:
+        """Half-open [start, end) periods outside the working windows, in model time units"""
+        horizon = self.horizon // self.time_quantum
+        blocked = []
+        cursor = 0
+        for start, end in self.model_working_windows():
+            if start > cursor:
+                blocked.append((cursor, start))
+            cursor = end
+        if cursor < horizon:
+            blocked.append((cursor, horizon))
+        return blocked
+
+    def task_times(
+        self,
+        solver: cp_model.CpSolver,
+        task_starts: dict[tuple[int, int, int], cp_model.IntVar],
+        task_presences: dict[tuple[int, int, int], cp_model.IntVar],
+        job_id: int,
+        task_id: int,
+    ) -> tuple[int, int]:
+        """Exact (start, end) minutes of a solved task on its selected routing option"""
+        task_options = self.get_task_duration_and_setup(task_id)
+        for option_id, (processing, setup) in enumerate(task_options):
+            if solver.Value(task_presences[(job_id, task_id, option_id)]) == 1:
+                start = solver.Value(task_starts[(job_id, task_id, option_id)])
+                start *= self.time_quantum
+                return start, start + processing + setup
+        raise ValueError(f"No routing option selected for job {job_id} task {task_id}")
+
+    def makespan_lower_bound_minutes(self) -> int:
+        """Makespan lower bound of the last model built, in minutes"""
+        if self.last_time_bounds is None:
+            return 0
+        return self.last_time_bounds.makespan_lower_bound * self.time_quantum
+
+    def job_completions_minutes(
+        self,
+        solver: cp_model.CpSolver,
+        task_starts: dict[tuple[int, int, int], cp_model.IntVar],
+        task_presences: dict[tuple[int, int, int], cp_model.IntVar],
+    ) -> dict[int, int]:
+        """Exact completion minute of every job in a solution"""
+        return {
+            job_id: self.task_times(
+                solver, task_starts, task_presences, job_id, self.num_tasks - 1
+            )[1]
+            for job_id in range(self.num_jobs)
+        }
+
+    def time_bounds(self) -> TimeBounds:
+        """
+        Earliest start, latest end and makespan lower bound per (job, task).
+
+        Uses each task's shortest routing option, job chains and critical
+        sequences, the load on every machine and on the operators qualified
+        for each skill requirement. The calendar only delays work, so ignoring
+        it keeps the bounds valid. In model time units.
+        """
+        durations = {}
+        precedences = []
+        machine_loads = collections.defaultdict(list)  # Task -> demands
+        operator_loads = collections.defaultdict(list)  # Requirement -> demands
+        for job_id in range(self.num_jobs):
+            for task_id in range(self.num_tasks):
+                key = (job_id, task_id)
+                task_options = self.get_task_duration_and_setup(task_id)
+                durations[key] = min(self.to_quanta(p + s) for p, s in task_options)
+                if task_id > 0:
+                    precedences.append(((job_id, task_id - 1), key))
+                machine_loads[task_id].append((key, durations[key], 1))
+
+                operator_time = durations[key]
+                if not self.is_attended_machine(task_id):
+                    operator_time = min(self.to_quanta(s) for _, s in task_options)
+                num_ops_needed = 2 if task_id in self.two_operator_tasks else 1
+                operator_loads[self.task_requirements[task_id]].append(
+                    (key, operator_time, num_ops_needed)
+                )
+
+        for start_task, end_task in self.critical_sequences:
+            for job_id in range(self.num_jobs - 1):
+                precedences.append(((job_id, end_task), (job_id + 1, start_task)))
+
+        # Every job of a task shares its machines, one per routing option
+        resources = [
+            ResourceLoad(len(self.get_task_duration_and_setup(task_id)), demands)
+            for task_id, demands in machine_loads.items()
+        ]
+        for requirement, demands in operator_loads.items():
+            resources.append(ResourceLoad(self.qualified_operator_count(requirement), demands))
+
+        return compute_time_bounds(
+            durations, precedences, self.horizon // self.time_quantum, resources=resources
+        )
+
+    def constructive_makespan(self) -> int | None:
+        """
+        Makespan in minutes of a greedy schedule, or None if one does not fit
+        in ``max_horizon_days``.
+
+        Jobs are placed one after another, each task on the routing option
+        that ends first, after its job predecessor, its machine, the previous
+        job's critical sequence and the zone's WIP limit, at the first time
+        its machine and enough qualified operators are free. Attended tasks run inside one
+        working window. Works in model time units over the model's calendar.
+        """
+        windows = self.model_working_windows(self.max_horizon_days)
+        window_ends = [end for _, end in windows]
+
+        def fit_window(ready: int, duration: int) -> int | None:
+            """Earliest start from ``ready`` that fits in one working window"""
+            for start, end in windows[bisect.bisect_right(window_ends, ready):]:
+                start = max(start, ready)
+                if start + duration <= end:
+                    return start
+            return None
+
+        zone_of_entry = {zone[0]: zone for zone in self.wip_zones}
+        zone_exits: dict[tuple[int, int, int], list[int]] = collections.defaultdict(list)
+        # Busy intervals of every machine and operator
+        machine_busy: dict[int, list[tuple[int, int]]] = collections.defaultdict(list)
+        operator_busy: dict[int, list[tuple[int, int]]] = collections.defaultdict(list)
+
+        def blocking(
+            busy: dict[int, list[tuple[int, int]]], resources: list[int], start: int, end: int
+        ) -> list[tuple[int, int]]:
+            """(resource, busy end) of every resource busy during [start, end)"""
+            return [
+                (resource, busy_end)
+                for resource in resources
+                for busy_start, busy_end in busy[resource]
+                if busy_start < end and busy_end > start
+            ]
+
+        ends: dict[tuple[int, int], int] = {}
+        for job_id in range(self.num_jobs):
+            for task_id in range(self.num_tasks):
+                ready = ends.get((job_id, task_id - 1), 0)
+                for start_task, end_task in self.critical_sequences:
+                    if task_id == start_task and job_id > 0:
+                        ready = max(ready, ends[(job_id - 1, end_task)])
+                zone = zone_of_entry.get(task_id)
+                if zone and len(zone_exits[zone]) >= zone[2]:
+                    ready = max(ready, sorted(zone_exits[zone])[-zone[2]])
+
+                num_ops_needed = 2 if task_id in self.two_operator_tasks else 1
+                eligible = self.get_eligible_operators(task_id)
+                if len(eligible) < num_ops_needed:
+                    return None
+
+                task_options = self.get_task_duration_and_setup(task_id)
+                attended = self.is_attended_machine(task_id)
+                best = None  # (end, start, machine, operators, operator busy end)
+                for option_id, (processing, setup) in enumerate(task_options):
+                    machine = task_id if len(task_options) == 1 else task_id * 10 + option_id
+                    duration = self.to_quanta(processing + setup)
+                    busy = duration if attended else self.to_quanta(setup)
+                    start = ready
+                    while start is not None:
+                        if attended:
+                            start = fit_window(start, duration)
+                            if start is None:
+                                break
+                        conflicts = blocking(machine_busy, [machine], start, start + duration)
+                        busy_ops = blocking(operator_busy, eligible, start, start + busy)
+                        free = [op for op in eligible if op not in dict(busy_ops)]
+                        if len(free) < num_ops_needed:
+                            conflicts += busy_ops
+                        elif not conflicts:
+                            break
+                        # Wait for the first blocking machine or operator to finish
+                        start = min(busy_end for _, busy_end in conflicts)
+                    if start is not None and (best is None or start + duration < best[0]):
+                        best = (start + duration, start, machine, free[:num_ops_needed], start + busy)
+                if best is None:
+                    return None
+
+                end, start, machine, operators, busy_end = best
+                ends[(job_id, task_id)] = end
+                machine_busy[machine].append((start, end))
+                for op in operators:
+                    operator_busy[op].append((start, busy_end))
+                for zone in self.wip_zones:
+                    if task_id == zone[1]:
+                        zone_exits[zone].append(end)
+
+        makespan = max(ends.values(), default=0) * self.time_quantum
+        if makespan > self.max_horizon_days * self.minutes_per_day:
+            return None
+        return makespan
+
+    def size_horizon(self) -> int:
+        """
+        Set ``horizon_days`` to the constructive makespan plus ``horizon_slack``.
+
+        Keeps the configured horizon when no constructive schedule fits in
+        ``max_horizon_days``; returns the horizon in days.
+        """
+        makespan = self.constructive_makespan()
+        if makespan is not None:
+            days = math.ceil(makespan * (1 + self.horizon_slack) / self.minutes_per_day)
+            self.set_horizon_days(min(self.max_horizon_days, max(1, days)))
+        return self.horizon_days
+
     def create_model(
         self,
     ) -> tuple[
@@ -192,22 +572,63 @@ class HFFSScheduler:
         dict[tuple[int, int, int], cp_model.IntVar],
         dict[tuple[int, int, int], cp_model.IntVar],
         dict[tuple[int, int, int], cp_model.IntVar],
-        dict[tuple[int, int, int, int], cp_model.IntVar],
+        dict[tuple[int, int, int], cp_model.IntVar],
         dict[int, cp_model.IntVar],
         dict[int, cp_model.IntVar],
         cp_model.IntVar,
     ]:
-        """Create the CP-SAT model with all constraints"""
+        """
+        Create the CP-SAT model with all constraints.
+
+        Every task owns a single master start/end. Routing options are optional
+        machine intervals anchored on the master start, so precedence, calendar,
+        critical-sequence and WIP constraints are posted once per task or edge
+        regardless of how many options a task has. ``task_starts``/``task_ends``
+        keep their per-option keys but all options of a task share the master
+        variables. ``task_operators`` maps ``(job, task, operator)`` to the
+        boolean that assigns that operator to the task; with
+        ``pool_operators`` it maps ``(job, task, class)`` to the number of
+        operators of that ``operator_classes()`` entry the task uses. Use
+        ``assign_operators`` to name the operators of a solution.
+
+        Times are in model units of ``time_quantum`` minutes; use ``task_times``
+        to map a solution back to exact minutes. Start and end domains are
+        narrowed to ``time_bounds()``, kept in ``last_time_bounds``. With
+        ``redundant_resource_groups`` the routing machines of each flexible
+        task and the operators meeting each skill requirement also get a
+        redundant cumulative and energy bound.
+        """
         model = cp_model.CpModel()
+        horizon = self.horizon // self.time_quantum
+        bounds = self.last_time_bounds = self.time_bounds()
 
         # Storage for variables
         task_starts = {}
         task_ends = {}
-        task_presences = {}  # For optional intervals (flexible routing)
-        task_intervals = {}
-        task_operators = {}  # Which operator(s) assigned to each task
+        task_presences = {}  # Selected routing option per task
+        task_operators = {}  # (job, task, operator) -> assigned
+        master_starts = {}  # (job, task) -> start
+        master_ends = {}  # (job, task) -> end
+        task_durations = {}  # (job, task) -> duration (constant or variable)
+        operator_durations = {}  # (job, task) -> operator busy time
         operator_intervals = collections.defaultdict(list)  # Intervals per operator
         machine_intervals = collections.defaultdict(list)  # Intervals per machine
+        attended_machines = set()
+        routing_groups = collections.defaultdict(list)  # Task -> intervals on any routing machine
+        skill_pools = collections.defaultdict(list)  # Requirement -> (operator interval, demand)
+
+        print("Compiling business calendar...")
+
+        # Work hours, lunch and holidays become fixed blocked intervals shared
+        # by every attended machine's NoOverlap, and attended tasks may only
+        # start inside a working window
+        blocked_intervals = [
+            model.NewFixedSizeIntervalVar(start, end - start, f"blocked_{start}")
+            for start, end in self.calendar_blocked_periods()
+        ]
+        working_start_domain = cp_model.Domain.FromIntervals(
+            [[start, end - 1] for start, end in self.model_working_windows()]
+        )
 
         print("Creating variables for jobs and tasks...")
 
@@ -215,59 +636,52 @@ class HFFSScheduler:
         for job_id in range(self.num_jobs):
             for task_id in range(self.num_tasks):
                 task_options = self.get_task_duration_and_setup(task_id)
-                num_options = len(task_options)
-
-                if num_options == 1:
-                    # Single machine option (90% of tasks)
-                    processing_time, setup_time = task_options[0]
-                    total_duration = processing_time + setup_time
-
-                    # Create start and end variables
-                    start_var = model.NewIntVar(
-                        0, self.horizon, f"start_j{job_id}_t{task_id}"
-                    )
-                    end_var = model.NewIntVar(
-                        0, self.horizon, f"end_j{job_id}_t{task_id}"
-                    )
+                option_durations = [self.to_quanta(p + s) for p, s in task_options]
+
+                # Conflicting bounds keep the full domain; the constraints
+                # then prove the model infeasible
+                earliest = bounds.earliest_start[(job_id, task_id)]
+                latest_end = bounds.latest_end[(job_id, task_id)]
+                shortest = bounds.durations[(job_id, task_id)]
+                if earliest + shortest > latest_end:
+                    earliest, latest_end = 0, horizon
+                start_domain = cp_model.Domain(earliest, latest_end - shortest)
+
+                attended = self.is_attended_machine(task_id)
+                if attended:
+                    start_domain = start_domain.intersection_with(working_start_domain)
+                    if start_domain.is_empty():
+                        start_domain = working_start_domain
+                start_var = model.NewIntVarFromDomain(
+                    start_domain, f"start_j{job_id}_t{task_id}"
+                )
+                end_var = model.NewIntVar(
+                    earliest + shortest, latest_end, f"end_j{job_id}_t{task_id}"
+                )
+                master_starts[(job_id, task_id)] = start_var
+                master_ends[(job_id, task_id)] = end_var
 
-                    # Create interval
+                if len(task_options) == 1:
+                    # Single machine option (90% of tasks): the master interval
+                    # is the machine interval
                     interval_var = model.NewIntervalVar(
                         start_var,
-                        total_duration,
+                        option_durations[0],
                         end_var,
                         f"interval_j{job_id}_t{task_id}",
                     )
-
-                    task_starts[(job_id, task_id, 0)] = start_var
-                    task_ends[(job_id, task_id, 0)] = end_var
-                    task_intervals[(job_id, task_id, 0)] = interval_var
-                    task_presences[(job_id, task_id, 0)] = model.NewConstant(1)
-
-                    # Add to machine list (single machine for this task)
-                    machine_id = task_id  # Simple mapping for non-flexible tasks
-                    machine_intervals[machine_id].append(interval_var)
-
+                    presences = [model.NewConstant(1)]
+                    machine_intervals[task_id].append(interval_var)
+                    if attended:
+                        attended_machines.add(task_id)
                 else:
-                    # Flexible routing (every 10th task)
-                    option_presences = []
-
-                    for option_id, (processing_time, setup_time) in enumerate(
-                        task_options
-                    ):
-                        total_duration = processing_time + setup_time
-
-                        # Create variables for this option
-                        start_var = model.NewIntVar(
-                            0, self.horizon, f"start_j{job_id}_t{task_id}_o{option_id}"
-                        )
-                        end_var = model.NewIntVar(
-                            0, self.horizon, f"end_j{job_id}_t{task_id}_o{option_id}"
-                        )
+                    # Flexible routing (every 10th task): one optional interval
+                    # per machine, all anchored on the master start/end
+                    presences = []
+                    for option_id, total_duration in enumerate(option_durations):
                         presence_var = model.NewBoolVar(
                             f"presence_j{job_id}_t{task_id}_o{option_id}"
                         )
-
-                        # Create optional interval (OR-Tools pattern from flexible_job_shop_sat.py)
                         interval_var = model.NewOptionalIntervalVar(
                             start_var,
                             total_duration,
@@ -275,205 +689,185 @@ class HFFSScheduler:
                             presence_var,
                             f"interval_j{job_id}_t{task_id}_o{option_id}",
                         )
+                        presences.append(presence_var)
 
-                        task_starts[(job_id, task_id, option_id)] = start_var
-                        task_ends[(job_id, task_id, option_id)] = end_var
-                        task_presences[(job_id, task_id, option_id)] = presence_var
-                        task_intervals[(job_id, task_id, option_id)] = interval_var
-                        option_presences.append(presence_var)
-
-                        # Add to appropriate machine list
-                        machine_id = (
-                            task_id * 10 + option_id
-                        )  # Unique machine ID for flexible tasks
-                        machine_intervals[machine_id].append(interval_var)
+                        # Unique machine ID for flexible tasks
+                        machine_intervals[task_id * 10 + option_id].append(
+                            interval_var
+                        )
+                        if attended:
+                            attended_machines.add(task_id * 10 + option_id)
 
                     # Exactly one option must be selected (OR-Tools pattern)
-                    model.AddExactlyOne(option_presences)
+                    model.AddExactlyOne(presences)
+
+                for option_id, presence in enumerate(presences):
+                    task_starts[(job_id, task_id, option_id)] = start_var
+                    task_ends[(job_id, task_id, option_id)] = end_var
+                    task_presences[(job_id, task_id, option_id)] = presence
+
+                task_durations[(job_id, task_id)] = self._option_linked_value(
+                    model,
+                    option_durations,
+                    presences,
+                    f"duration_j{job_id}_t{task_id}",
+                )
+                if attended:
+                    operator_durations[(job_id, task_id)] = task_durations[
+                        (job_id, task_id)
+                    ]
+                else:
+                    # Operator only needed for setup
+                    operator_durations[(job_id, task_id)] = (
+                        self._option_linked_value(
+                            model,
+                            [self.to_quanta(setup) for _, setup in task_options],
+                            presences,
+                            f"setup_j{job_id}_t{task_id}",
+                        )
+                    )
+
+                if self.redundant_resource_groups and len(task_options) > 1:
+                    # Whatever the option, the task holds one routing machine
+                    routing_groups[task_id].append(
+                        model.NewIntervalVar(
+                            start_var,
+                            task_durations[(job_id, task_id)],
+                            end_var,
+                            f"routing_interval_j{job_id}_t{task_id}",
+                        )
+                    )
 
         print("Adding precedence constraints within jobs...")
 
-        # Precedence constraints between consecutive tasks in each job
+        # One precedence constraint per consecutive task pair
         for job_id in range(self.num_jobs):
             for task_id in range(self.num_tasks - 1):
-                current_options = len(self.get_task_duration_and_setup(task_id))
-                next_options = len(self.get_task_duration_and_setup(task_id + 1))
-
-                # For all combinations of current and next task options
-                for curr_opt in range(current_options):
-                    for next_opt in range(next_options):
-                        # Next task starts after current task ends
-                        model.Add(
-                            task_starts[(job_id, task_id + 1, next_opt)]
-                            >= task_ends[(job_id, task_id, curr_opt)]
-                        ).OnlyEnforceIf(
-                            [
-                                task_presences[(job_id, task_id, curr_opt)],
-                                task_presences[(job_id, task_id + 1, next_opt)],
-                            ]
-                        )
+                model.Add(
+                    master_starts[(job_id, task_id + 1)]
+                    >= master_ends[(job_id, task_id)]
+                )
 
         print("Adding NoOverlap constraints for machines...")
 
-        # NoOverlap constraint for each machine (OR-Tools pattern)
+        # NoOverlap constraint for each machine (OR-Tools pattern); attended
+        # machines also carry the calendar's blocked intervals
         for machine_id, intervals in machine_intervals.items():
-            if len(intervals) > 1:
+            if machine_id in attended_machines:
+                model.AddNoOverlap(intervals + blocked_intervals)
+            elif len(intervals) > 1:
                 model.AddNoOverlap(intervals)
 
         print("Adding operator assignment variables and constraints...")
 
-        # Create operator assignment variables
-        for job_id in range(self.num_jobs):
-            for task_id in range(self.num_tasks):
-                eligible_ops = self.get_eligible_operators(task_id)
-                num_ops_needed = 2 if task_id in self.two_operator_tasks else 1
-
-                # For each machine option
-                for option_id in range(len(self.get_task_duration_and_setup(task_id))):
-                    if num_ops_needed == 1:
-                        # Single operator assignment
-                        op_var = model.NewIntVarFromDomain(
-                            cp_model.Domain.FromValues(eligible_ops),
-                            f"op_j{job_id}_t{task_id}_o{option_id}",
-                        )
-                        task_operators[(job_id, task_id, option_id, 0)] = op_var
-                    else:
-                        # Two operators needed
-                        for op_num in range(2):
-                            op_var = model.NewIntVarFromDomain(
-                                cp_model.Domain.FromValues(eligible_ops),
-                                f"op{op_num}_j{job_id}_t{task_id}_o{option_id}",
-                            )
-                            task_operators[(job_id, task_id, option_id, op_num)] = (
-                                op_var
-                            )
-
-                        # Ensure different operators
-                        model.Add(
-                            task_operators[(job_id, task_id, option_id, 0)]
-                            != task_operators[(job_id, task_id, option_id, 1)]
-                        ).OnlyEnforceIf(task_presences[(job_id, task_id, option_id)])
-
-        print("Adding operator availability constraints...")
+        operator_classes = self.operator_classes()
+        class_of = {
+            op_id: class_id
+            for class_id, members in enumerate(operator_classes)
+            for op_id in members
+        }
+        class_intervals = collections.defaultdict(list)  # Class -> (interval, demand)
 
-        # Create operator intervals for NoOverlap
         for job_id in range(self.num_jobs):
             for task_id in range(self.num_tasks):
-                is_attended = self.is_attended_machine(task_id)
-
-                for option_id in range(len(self.get_task_duration_and_setup(task_id))):
-                    if (job_id, task_id, option_id) not in task_presences:
-                        continue
+                num_ops_needed = 2 if task_id in self.two_operator_tasks else 1
+                start = master_starts[(job_id, task_id)]
+                duration = operator_durations[(job_id, task_id)]
+                if isinstance(duration, int):
+                    end = start + duration
+                else:
+                    end = model.NewIntVar(
+                        0, horizon, f"op_end_j{job_id}_t{task_id}"
+                    )
+                    model.Add(end == start + duration)
 
-                    presence = task_presences[(job_id, task_id, option_id)]
-                    start = task_starts[(job_id, task_id, option_id)]
+                if self.pool_operators or self.redundant_resource_groups:
+                    # One operator interval per task, for the class
+                    # cumulatives and the task's skill pool
+                    op_interval = model.NewIntervalVar(
+                        start, duration, end, f"op_interval_j{job_id}_t{task_id}"
+                    )
+                    skill_pools[self.task_requirements[task_id]].append(
+                        (op_interval, num_ops_needed)
+                    )
 
-                    if is_attended:
-                        # Operator needed for entire duration
-                        duration = sum(
-                            self.get_task_duration_and_setup(task_id)[option_id]
-                        )
-                    else:
-                        # Operator only needed for setup
-                        _, setup_time = self.get_task_duration_and_setup(task_id)[
-                            option_id
-                        ]
-                        duration = setup_time
-
-                    # For each operator that could be assigned
-                    num_ops_needed = 2 if task_id in self.two_operator_tasks else 1
-                    for op_num in range(num_ops_needed):
-                        for op_id in self.get_eligible_operators(task_id):
-                            # Create conditional interval for this operator
-                            op_assigned = model.NewBoolVar(
-                                f"op{op_id}_assigned_j{job_id}_t{task_id}_o{option_id}_n{op_num}"
+                if self.pool_operators:
+                    # Each eligible class contributes a share of the operators
+                    # it needs
+                    eligible_classes = sorted(
+                        {class_of[op_id] for op_id in self.get_eligible_operators(task_id)}
+                    )
+                    shares = []
+                    for class_id in eligible_classes:
+                        most = min(num_ops_needed, len(operator_classes[class_id]))
+                        if len(eligible_classes) == 1:
+                            share = most
+                        else:
+                            share = model.NewIntVar(
+                                0, most, f"class{class_id}_ops_j{job_id}_t{task_id}"
                             )
+                        task_operators[(job_id, task_id, class_id)] = share
+                        shares.append(share)
+                        class_intervals[class_id].append((op_interval, share))
+                    model.Add(sum(shares) == num_ops_needed)
+                    continue
+
+                # One assignment literal and one optional interval per eligible
+                # operator, shared by all routing options and operator slots
+                assigned = []
+                for op_id in self.get_eligible_operators(task_id):
+                    op_assigned = model.NewBoolVar(
+                        f"op{op_id}_assigned_j{job_id}_t{task_id}"
+                    )
+                    task_operators[(job_id, task_id, op_id)] = op_assigned
+                    assigned.append(op_assigned)
+
+                    op_interval = model.NewOptionalIntervalVar(
+                        start,
+                        duration,
+                        end,
+                        op_assigned,
+                        f"op{op_id}_interval_j{job_id}_t{task_id}",
+                    )
+                    operator_intervals[op_id].append(op_interval)
 
-                            # Link assignment variable to boolean
-                            model.Add(
-                                task_operators[(job_id, task_id, option_id, op_num)]
-                                == op_id
-                            ).OnlyEnforceIf(op_assigned)
-
-                            # Create interval only if operator assigned and option selected
-                            op_interval = model.NewOptionalIntervalVar(
-                                start,
-                                duration,
-                                start + duration,
-                                op_assigned,
-                                f"op{op_id}_interval_j{job_id}_t{task_id}_o{option_id}_n{op_num}",
-                            )
-                            operator_intervals[op_id].append(op_interval)
+                model.Add(sum(assigned) == num_ops_needed)
 
-                            # Link to task presence
-                            model.AddImplication(op_assigned, presence)
+        print("Adding operator availability constraints...")
 
-        # NoOverlap for each operator
+        # NoOverlap for each operator, or one cumulative per operator class
+        # with the class size as capacity
         for op_id, intervals in operator_intervals.items():
             if len(intervals) > 1:
                 model.AddNoOverlap(intervals)
+        for class_id, entries in class_intervals.items():
+            model.AddCumulative(
+                [interval for interval, _ in entries],
+                [share for _, share in entries],
+                len(operator_classes[class_id]),
+            )
 
-        print("Adding business hours constraints for attended operations...")
-
-        # Business hours constraints for attended operations
-        for job_id in range(self.num_jobs):
-            for task_id in range(self.num_tasks):
-                if self.is_attended_machine(task_id):
-                    for option_id in range(
-                        len(self.get_task_duration_and_setup(task_id))
-                    ):
-                        if (job_id, task_id, option_id) not in task_starts:
-                            continue
-
-                        start = task_starts[(job_id, task_id, option_id)]
-                        task_ends[(job_id, task_id, option_id)]
-                        presence = task_presences[(job_id, task_id, option_id)]
-
-                        # Calculate day and time within day
-                        start_day = model.NewIntVar(
-                            0,
-                            self.horizon_days,
-                            f"start_day_j{job_id}_t{task_id}_o{option_id}",
-                        )
-                        start_time = model.NewIntVar(
-                            0,
-                            self.minutes_per_day - 1,
-                            f"start_time_j{job_id}_t{task_id}_o{option_id}",
-                        )
-
-                        model.AddDivisionEquality(
-                            start_day, start, self.minutes_per_day
-                        )
-                        model.AddModuloEquality(start_time, start, self.minutes_per_day)
-
-                        # Must start and end within work hours (not on holidays)
-                        for day in self.holidays:
-                            model.Add(start_day != day).OnlyEnforceIf(presence)
-
-                        # Must be within work hours
-                        model.Add(start_time >= self.work_start).OnlyEnforceIf(presence)
-                        model.Add(
-                            start_time
-                            + sum(self.get_task_duration_and_setup(task_id)[option_id])
-                            <= self.work_end
-                        ).OnlyEnforceIf(presence)
-
-                        # Cannot overlap lunch break
-                        # Either finish before lunch or start after lunch
-                        before_lunch = model.NewBoolVar(
-                            f"before_lunch_j{job_id}_t{task_id}_o{option_id}"
-                        )
-                        model.Add(
-                            start_time
-                            + sum(self.get_task_duration_and_setup(task_id)[option_id])
-                            <= self.lunch_start
-                        ).OnlyEnforceIf(before_lunch)
-                        model.Add(
-                            start_time >= self.lunch_start + self.lunch_duration
-                        ).OnlyEnforceIf(before_lunch.Not())
-                        model.AddBoolOr(
-                            [before_lunch, before_lunch.Not()]
-                        ).OnlyEnforceIf(presence)
+        if self.redundant_resource_groups:
+            print("Adding redundant resource group constraints...")
+
+            for task_id, intervals in routing_groups.items():
+                add_resource_group(
+                    model,
+                    intervals,
+                    [1] * len(intervals),
+                    len(self.get_task_duration_and_setup(task_id)),
+                    horizon,
+                    f"routing_t{task_id}",
+                )
+            for requirement, entries in skill_pools.items():
+                add_resource_group(
+                    model,
+                    [interval for interval, _ in entries],
+                    [demand for _, demand in entries],
+                    self.qualified_operator_count(requirement),
+                    horizon,
+                    f"{requirement[0]}{requirement[1]}_pool",
+                )
 
         print("Adding critical sequence constraints...")
 
@@ -481,53 +875,31 @@ class HFFSScheduler:
         for start_task, end_task in self.critical_sequences:
             for job_id in range(self.num_jobs - 1):
                 # Job j+1 cannot enter critical sequence until job j exits
-                for j_opt in range(len(self.get_task_duration_and_setup(end_task))):
-                    for j1_opt in range(
-                        len(self.get_task_duration_and_setup(start_task))
-                    ):
-                        model.Add(
-                            task_starts[(job_id + 1, start_task, j1_opt)]
-                            >= task_ends[(job_id, end_task, j_opt)]
-                        ).OnlyEnforceIf(
-                            [
-                                task_presences[(job_id, end_task, j_opt)],
-                                task_presences[(job_id + 1, start_task, j1_opt)],
-                            ]
-                        )
+                model.Add(
+                    master_starts[(job_id + 1, start_task)]
+                    >= master_ends[(job_id, end_task)]
+                )
 
         print("Adding WIP constraints by zone...")
 
         # WIP constraints by zone
         for zone_start, zone_end, max_wip in self.wip_zones:
-            # For each time point, count active jobs in zone
             # Simplified approach: ensure no more than max_wip jobs can be in zone simultaneously
             zone_jobs = []
             for job_id in range(self.num_jobs):
-                # Job is in zone if any task in zone range is active
-                in_zone = model.NewBoolVar(
-                    f"job{job_id}_in_zone_{zone_start}_{zone_end}"
-                )
-
                 # Job enters zone at start of first task in range
                 zone_entry = model.NewIntVar(
-                    0, self.horizon, f"job{job_id}_enter_zone_{zone_start}"
+                    0, horizon, f"job{job_id}_enter_zone_{zone_start}"
                 )
                 zone_exit = model.NewIntVar(
-                    0, self.horizon, f"job{job_id}_exit_zone_{zone_end}"
+                    0, horizon, f"job{job_id}_exit_zone_{zone_end}"
                 )
 
                 # Link to actual task times
-                for opt in range(len(self.get_task_duration_and_setup(zone_start))):
-                    model.Add(
-                        zone_entry <= task_starts[(job_id, zone_start, opt)]
-                    ).OnlyEnforceIf(task_presences[(job_id, zone_start, opt)])
+                model.Add(zone_entry <= master_starts[(job_id, zone_start)])
+                model.Add(zone_exit >= master_ends[(job_id, zone_end)])
 
-                for opt in range(len(self.get_task_duration_and_setup(zone_end))):
-                    model.Add(
-                        zone_exit >= task_ends[(job_id, zone_end, opt)]
-                    ).OnlyEnforceIf(task_presences[(job_id, zone_end, opt)])
-
-                zone_jobs.append((zone_entry, zone_exit, in_zone))
+                zone_jobs.append((zone_entry, zone_exit))
 
             # Ensure at most max_wip jobs overlap in zone
             # This is a simplified constraint - full implementation would check all time points
@@ -581,38 +953,32 @@ class HFFSScheduler:
 
         for job_id in range(self.num_jobs):
             # Job completion is end of last task
-            last_task_ends = []
-            for opt in range(len(self.get_task_duration_and_setup(self.num_tasks - 1))):
-                last_task_ends.append(task_ends[(job_id, self.num_tasks - 1, opt)])
-
-            completion = model.NewIntVar(0, self.horizon, f"completion_j{job_id}")
-
-            # Set completion based on which option is selected
-            for opt in range(len(self.get_task_duration_and_setup(self.num_tasks - 1))):
-                model.Add(
-                    completion == task_ends[(job_id, self.num_tasks - 1, opt)]
-                ).OnlyEnforceIf(task_presences[(job_id, self.num_tasks - 1, opt)])
-
+            completion = master_ends[(job_id, self.num_tasks - 1)]
             job_completions[job_id] = completion
 
             # Calculate tardiness
-            tardiness = model.NewIntVar(0, self.horizon, f"tardiness_j{job_id}")
-            model.AddMaxEquality(tardiness, [completion - self.due_dates[job_id], 0])
+            tardiness = model.NewIntVar(0, horizon, f"tardiness_j{job_id}")
+            # Due dates round down, so a job on time in the model is on time
+            # in exact minutes
+            due = self.due_dates[job_id] // self.time_quantum
+            model.AddMaxEquality(tardiness, [completion - due, 0])
             tardiness_vars[job_id] = tardiness
 
         # Makespan
-        makespan = model.NewIntVar(0, self.horizon, "makespan")
+        makespan = model.NewIntVar(
+            min(bounds.makespan_lower_bound, horizon), horizon, "makespan"
+        )
         model.AddMaxEquality(makespan, list(job_completions.values()))
 
         # Total tardiness
         total_tardiness = model.NewIntVar(
-            0, self.horizon * self.num_jobs, "total_tardiness"
+            0, horizon * self.num_jobs, "total_tardiness"
         )
         model.Add(total_tardiness == sum(tardiness_vars.values()))
 
         # Primary objective: minimize (2 * total_tardiness + makespan)
         primary_objective = model.NewIntVar(
-            0, self.horizon * (2 * self.num_jobs + 1), "primary_objective"
+            0, horizon * (2 * self.num_jobs + 1), "primary_objective"
         )
         model.Add(primary_objective == 2 * total_tardiness + makespan)
 
@@ -628,6 +994,53 @@ class HFFSScheduler:
             makespan,
         )
 
+    def add_operator_cost(
+        self,
+        model: cp_model.CpModel,
+        task_presences: dict[tuple[int, int, int], cp_model.IntVar],
+        task_operators: dict[tuple[int, int, int], cp_model.IntVar],
+    ) -> cp_model.IntVar:
+        """Add the total operator cost of a model built by create_model"""
+        operator_cost = model.NewIntVar(
+            0,
+            self.horizon * max(self.operator_costs.values()) * self.num_operators,
+            "operator_cost",
+        )
+        # Members of a class share one rate, so pooled shares cost the same
+        operator_classes = self.operator_classes() if self.pool_operators else []
+
+        cost_terms = []
+        for (job_id, task_id, op_id), op_assigned in task_operators.items():
+            if self.pool_operators:
+                rate = self.operator_costs[operator_classes[op_id][0]]
+                most = 2 if task_id in self.two_operator_tasks else 1
+            else:
+                rate = self.operator_costs[op_id]
+                most = 1
+            task_options = self.get_task_duration_and_setup(task_id)
+            if self.is_attended_machine(task_id):
+                busy = [processing + setup for processing, setup in task_options]
+            else:
+                busy = [setup for _, setup in task_options]
+
+            if len(set(busy)) == 1:
+                cost_terms.append(busy[0] * rate * op_assigned)
+                continue
+
+            # Busy time depends on the routing option; the cost term is pushed
+            # down to the selected option's cost by the minimization
+            actual_cost = model.NewIntVar(
+                0, max(busy) * rate * most, f"cost_j{job_id}_t{task_id}_op{op_id}"
+            )
+            for option_id, duration in enumerate(busy):
+                model.Add(actual_cost >= duration * rate * op_assigned).OnlyEnforceIf(
+                    task_presences[(job_id, task_id, option_id)]
+                )
+            cost_terms.append(actual_cost)
+
+        model.Add(operator_cost == sum(cost_terms))
+        return operator_cost
+
     def solve(self) -> dict[str, Any] | None:
         """Solve the scheduling problem with hierarchical optimization"""
 
@@ -639,27 +1052,49 @@ class HFFSScheduler:
         print("\nPhase 1: Optimizing makespan and tardiness...")
         print("-" * 40)
 
-        (
-            model,
-            primary_obj,
-            starts,
-            ends,
-            presences,
-            operators,
-            completions,
-            tardiness,
-            makespan,
-        ) = self.create_model()
-        model.Minimize(primary_obj)
-
-        solver = cp_model.CpSolver()
-        solver.parameters.max_time_in_seconds = 300  # 5 minute time limit
-        solver.parameters.num_search_workers = 8  # Parallel search
-        solver.parameters.log_search_progress = True
-
-        start_time = time.time()
-        status = solver.Solve(model)
-        phase1_time = time.time() - start_time
+        if self.auto_horizon:
+            self.size_horizon()
+            print(f"Horizon sized to {self.horizon_days} days")
+
+        build_time = phase1_time = 0.0
+        while True:
+            start_time = time.time()
+            (
+                model,
+                primary_obj,
+                starts,
+                ends,
+                presences,
+                operators,
+                completions,
+                tardiness,
+                makespan,
+            ) = self.create_model()
+            build_time += time.time() - start_time
+            print(f"Model built in {build_time:.2f} seconds")
+            model.Minimize(primary_obj)
+
+            # Retries share the Phase 1 time limit
+            solver = cp_model.CpSolver()
+            solver.parameters.max_time_in_seconds = max(
+                1.0, self.time_limit_seconds - phase1_time
+            )
+            solver.parameters.num_search_workers = self.num_search_workers
+            solver.parameters.log_search_progress = True
+
+            start_time = time.time()
+            status, phase1_stop = solve_with_policy(solver, model, self.termination)
+            phase1_time += time.time() - start_time
+
+            # An infeasible horizon may only be too short; retry on a wider one
+            if (
+                status != cp_model.INFEASIBLE
+                or not self.auto_horizon
+                or self.horizon_days >= self.max_horizon_days
+            ):
+                break
+            self.set_horizon_days(min(self.max_horizon_days, 2 * self.horizon_days))
+            print(f"Infeasible; widening horizon to {self.horizon_days} days")
 
         if status not in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
             print(
@@ -668,118 +1103,79 @@ class HFFSScheduler:
             return None
 
         primary_value = solver.Value(primary_obj)
-        makespan_value = solver.Value(makespan)
+
+        # Report in exact minutes rather than model time units
+        phase1_completions = self.job_completions_minutes(solver, starts, presences)
+        phase1_tardiness = {
+            j: max(0, completion - self.due_dates[j])
+            for j, completion in phase1_completions.items()
+        }
+        makespan_value = max(phase1_completions.values())
 
         print("\nPhase 1 Results:")
         print(f"  Primary objective value: {primary_value}")
         print(
             f"  Makespan: {makespan_value:.0f} minutes ({makespan_value/60/24:.1f} days)"
         )
+        print(f"  Total tardiness: {sum(phase1_tardiness.values()):.0f} minutes")
         print(
-            f"  Total tardiness: {sum(solver.Value(tardiness[j]) for j in range(self.num_jobs)):.0f} minutes"
+            f"  Makespan lower bound: {self.makespan_lower_bound_minutes():.0f} minutes"
         )
         print(f"  Solution time: {phase1_time:.2f} seconds")
+        print(f"  Stopped on: {phase1_stop.value}")
 
         # Store Phase 1 solution
         phase1_solution = {
             "makespan": makespan_value,
-            "tardiness": {j: solver.Value(tardiness[j]) for j in range(self.num_jobs)},
-            "completions": {
-                j: solver.Value(completions[j]) for j in range(self.num_jobs)
-            },
+            "tardiness": phase1_tardiness,
+            "completions": phase1_completions,
+            "time_quantum": self.time_quantum,
             "objective": primary_value,
+            "makespan_lower_bound": self.makespan_lower_bound_minutes(),
+            "horizon_days": self.horizon_days,
             "status": solver.StatusName(status),
+            "phase_times": {"build": build_time, "phase1": phase1_time},
+            "stop_reasons": {"phase1": phase1_stop.value},
         }
 
         # Phase 2: Minimize operator cost while maintaining solution quality
         print("\nPhase 2: Optimizing operator costs...")
         print("-" * 40)
 
-        # Create new model with primary objective constraint
-        (
-            model2,
-            primary_obj2,
-            starts2,
-            ends2,
-            presences2,
-            operators2,
-            completions2,
-            tardiness2,
-            makespan2,
-        ) = self.create_model()
-
-        # Constrain primary objective to be within 10% of Phase 1 solution
-        model2.Add(primary_obj2 <= int(primary_value * 1.1))
+        # Reuse the Phase 1 model: keep the primary objective within 10% of
+        # the Phase 1 value, swap in the cost objective and seed the search
+        # with the Phase 1 assignment
+        model.Add(primary_obj <= int(primary_value * 1.1))
+        phase1_values = list(solver.ResponseProto().solution)
+        model.ClearHints()
+        for index, value in enumerate(phase1_values):
+            model.AddHint(model.GetIntVarFromProtoIndex(index), value)
 
         # Calculate operator cost
-        operator_cost = model2.NewIntVar(
-            0,
-            self.horizon * max(self.operator_costs.values()) * self.num_operators,
-            "operator_cost",
-        )
-
-        # Sum costs for all operator assignments
-        cost_terms = []
-        for key in operators2:
-            job_id, task_id, option_id, op_num = key
-            is_attended = self.is_attended_machine(task_id)
-
-            if is_attended:
-                duration = sum(self.get_task_duration_and_setup(task_id)[option_id])
-            else:
-                _, setup_time = self.get_task_duration_and_setup(task_id)[option_id]
-                duration = setup_time
-
-            for op_id in self.get_eligible_operators(task_id):
-                cost_if_assigned = model2.NewIntVar(
-                    0,
-                    duration * self.operator_costs[op_id],
-                    f"cost_j{job_id}_t{task_id}_o{option_id}_op{op_id}_n{op_num}",
-                )
-                is_assigned = model2.NewBoolVar(
-                    f"assigned_j{job_id}_t{task_id}_o{option_id}_op{op_id}_n{op_num}"
-                )
-
-                model2.Add(operators2[key] == op_id).OnlyEnforceIf(is_assigned)
-                model2.Add(
-                    cost_if_assigned == duration * self.operator_costs[op_id]
-                ).OnlyEnforceIf(is_assigned)
-                model2.Add(cost_if_assigned == 0).OnlyEnforceIf(is_assigned.Not())
-
-                # Only count cost if task option is selected
-                actual_cost = model2.NewIntVar(
-                    0,
-                    duration * self.operator_costs[op_id],
-                    f"actual_cost_j{job_id}_t{task_id}_o{option_id}_op{op_id}_n{op_num}",
-                )
-                model2.Add(actual_cost == cost_if_assigned).OnlyEnforceIf(
-                    presences2[(job_id, task_id, option_id)]
-                )
-                model2.Add(actual_cost == 0).OnlyEnforceIf(
-                    presences2[(job_id, task_id, option_id)].Not()
-                )
-
-                cost_terms.append(actual_cost)
-
-        model2.Add(operator_cost == sum(cost_terms))
-        model2.Minimize(operator_cost)
+        operator_cost = self.add_operator_cost(model, presences, operators)
+        model.Minimize(operator_cost)
 
         solver2 = cp_model.CpSolver()
-        solver2.parameters.max_time_in_seconds = 300
-        solver2.parameters.num_search_workers = 8
+        solver2.parameters.max_time_in_seconds = self.time_limit_seconds
+        solver2.parameters.num_search_workers = self.num_search_workers
 
         start_time = time.time()
-        status2 = solver2.Solve(model2)
+        status2, phase2_stop = solve_with_policy(solver2, model, self.termination)
         phase2_time = time.time() - start_time
 
         if status2 not in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
             print("No feasible solution found in Phase 2. Using Phase 1 solution.")
+            phase1_solution["phase_times"]["phase2"] = phase2_time
+            phase1_solution["stop_reasons"]["phase2"] = phase2_stop.value
             return phase1_solution
 
+        final_completions = self.job_completions_minutes(solver2, starts, presences)
+        final_makespan = max(final_completions.values())
+
         print("\nPhase 2 Results:")
         print(f"  Operator cost: ${solver2.Value(operator_cost):.2f}")
         print(
-            f"  Makespan: {solver2.Value(makespan2):.0f} minutes ({solver2.Value(makespan2)/60/24:.1f} days)"
+            f"  Makespan: {final_makespan:.0f} minutes ({final_makespan/60/24:.1f} days)"
         )
         print(f"  Solution time: {phase2_time:.2f} seconds")
 
@@ -792,7 +1188,7 @@ class HFFSScheduler:
         print("-" * 40)
         total_tardiness = 0
         for job_id in range(self.num_jobs):
-            completion = solver2.Value(completions2[job_id])
+            completion = final_completions[job_id]
             due = self.due_dates[job_id]
             tardiness_val = max(0, completion - due)
             total_tardiness += tardiness_val
@@ -812,41 +1208,27 @@ class HFFSScheduler:
 
         print("\nSample Task Assignments (first 10 tasks of Job 0):")
         print("-" * 40)
+        operator_assignments = self.assign_operators(
+            solver2, starts, presences, operators
+        )
         for task_id in range(min(10, self.num_tasks)):
-            for option_id in range(len(self.get_task_duration_and_setup(task_id))):
-                if solver2.Value(presences2[(0, task_id, option_id)]) == 1:
-                    start = solver2.Value(starts2[(0, task_id, option_id)])
-                    end = solver2.Value(ends2[(0, task_id, option_id)])
-
-                    # Get operator assignment
-                    if task_id in self.two_operator_tasks:
-                        op1 = solver2.Value(operators2[(0, task_id, option_id, 0)])
-                        op2 = solver2.Value(operators2[(0, task_id, option_id, 1)])
-                        op_str = f"Operators {op1}, {op2}"
-                    else:
-                        op = solver2.Value(operators2[(0, task_id, option_id, 0)])
-                        op_str = f"Operator {op}"
-
-                    machine_type = (
-                        "Attended"
-                        if self.is_attended_machine(task_id)
-                        else "Unattended"
-                    )
-                    print(
-                        f"  Task {task_id}: Start={start:.0f}, End={end:.0f}, {op_str}, {machine_type}"
-                    )
+            start, end = self.task_times(solver2, starts, presences, 0, task_id)
+            assigned_ops = operator_assignments.get((0, task_id), [])
+            label = "Operators" if len(assigned_ops) > 1 else "Operator"
+            op_str = f"{label} {', '.join(map(str, assigned_ops))}"
+
+            machine_type = (
+                "Attended" if self.is_attended_machine(task_id) else "Unattended"
+            )
+            print(
+                f"  Task {task_id}: Start={start:.0f}, End={end:.0f}, {op_str}, {machine_type}"
+            )
 
         print("\nCritical Sequence Timing (Job 0):")
         print("-" * 40)
         for seq_start, seq_end in self.critical_sequences:
-            for opt in range(len(self.get_task_duration_and_setup(seq_start))):
-                if solver2.Value(presences2[(0, seq_start, opt)]) == 1:
-                    start = solver2.Value(starts2[(0, seq_start, opt)])
-                    break
-            for opt in range(len(self.get_task_duration_and_setup(seq_end))):
-                if solver2.Value(presences2[(0, seq_end, opt)]) == 1:
-                    end = solver2.Value(ends2[(0, seq_end, opt)])
-                    break
+            start = self.task_times(solver2, starts, presences, 0, seq_start)[0]
+            end = self.task_times(solver2, starts, presences, 0, seq_end)[1]
 
             print(
                 f"  Tasks {seq_start}-{seq_end}: Start={start:.0f}, End={end:.0f}, Duration={(end-start):.0f} min"
@@ -860,13 +1242,13 @@ class HFFSScheduler:
         for job_id in range(self.num_jobs):
             for task_id in range(self.num_tasks):
                 for option_id in range(len(self.get_task_duration_and_setup(task_id))):
-                    if (job_id, task_id, option_id) in presences2:
-                        if solver2.Value(presences2[(job_id, task_id, option_id)]) == 1:
+                    if (job_id, task_id, option_id) in presences:
+                        if solver2.Value(presences[(job_id, task_id, option_id)]) == 1:
                             total_machine_time += sum(
                                 self.get_task_duration_and_setup(task_id)[option_id]
                             )
 
-        available_machine_time = self.num_tasks * solver2.Value(makespan2)  # Simplified
+        available_machine_time = self.num_tasks * final_makespan  # Simplified
         machine_utilization = (
             (total_machine_time / available_machine_time) * 100
             if available_machine_time > 0
@@ -875,21 +1257,36 @@ class HFFSScheduler:
 
         print(f"  Average Machine Utilization: {machine_utilization:.1f}%")
         print(f"  Total Operator Cost: ${solver2.Value(operator_cost):.2f}")
-        print(f"  Total Solution Time: {phase1_time + phase2_time:.2f} seconds")
+        print(f"  Model Build Time: {build_time:.2f} seconds")
+        print(f"  Phase 1 Solve Time: {phase1_time:.2f} seconds")
+        print(f"  Phase 2 Solve Time: {phase2_time:.2f} seconds")
+        print(
+            f"  Total Solution Time: {build_time + phase1_time + phase2_time:.2f} seconds"
+        )
 
         print("\nSolver Statistics:")
         print("-" * 40)
-        print(f"  Phase 1: {solver.StatusName(status)}")
-        print(f"  Phase 2: {solver2.StatusName(status2)}")
+        print(f"  Phase 1: {solver.StatusName(status)} ({phase1_stop.value})")
+        print(f"  Phase 2: {solver2.StatusName(status2)} ({phase2_stop.value})")
 
         return {
-            "makespan": solver2.Value(makespan2),
+            "makespan": final_makespan,
             "total_tardiness": total_tardiness,
             "operator_cost": solver2.Value(operator_cost),
-            "job_completions": {
-                j: solver2.Value(completions2[j]) for j in range(self.num_jobs)
-            },
+            "job_completions": final_completions,
+            "time_quantum": self.time_quantum,
+            "makespan_lower_bound": self.makespan_lower_bound_minutes(),
+            "horizon_days": self.horizon_days,
             "status": solver2.StatusName(status2),
+            "phase_times": {
+                "build": build_time,
+                "phase1": phase1_time,
+                "phase2": phase2_time,
+            },
+            "stop_reasons": {
+                "phase1": phase1_stop.value,
+                "phase2": phase2_stop.value,
+            },
         }
 
 
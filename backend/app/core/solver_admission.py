@@ -0,0 +1,366 @@
+"""
+Solver Admission Control
+
+Budgets CPU cores and memory across the CP-SAT solves of a process. Every
+solve asks for a number of search workers and a memory ceiling before it
+starts. While capacity is free the solve is admitted at once, with its workers
+cut to a fair share of the cores when other solves are running or waiting.
+Otherwise it waits in a queue ordered by priority, then deadline, then arrival.
+
+A request whose deadline cannot leave a useful solve time once its estimated
+queue wait has passed, or that finds the queue full, is rejected at once with
+SolverCapacityExceededError carrying a retry-after hint, instead of holding a
+client connection until it times out.
+
+Worker counts are fixed when a solve starts; running solves are not resized.
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import os
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+import psutil
+
+from ..domain.shared.exceptions import SolverCapacityExceededError
+from .config import settings
+from .observability import (
+    SOLVER_ADMISSION_CORES_IN_USE,
+    SOLVER_ADMISSION_DECISIONS,
+    SOLVER_ADMISSION_QUEUE_DEPTH,
+    get_logger,
+)
+
+
+def _default_memory_mb() -> int:
+    return int(psutil.virtual_memory().total * 0.75 / (1024 * 1024))
+
+
+@dataclass
+class AdmissionConfig:
+    """Capacity budget shared by the solves of a process."""
+
+    cpu_cores: int = field(default_factory=lambda: os.cpu_count() or 1)
+    memory_mb: int = field(default_factory=_default_memory_mb)
+    max_concurrent_solves: int = field(
+        default_factory=lambda: max(1, (os.cpu_count() or 2) // 2)
+    )
+    max_workers_per_solve: int = 8
+    min_workers_per_solve: int = 1
+    max_queue_length: int = 32
+    min_solve_seconds: float = 5.0
+    # Expected duration of a solve that has no time limit, for wait estimates
+    default_solve_seconds: float = 300.0
+
+
+@dataclass(eq=False)
+class SolveGrant:
+    """Capacity granted to one admitted solve."""
+
+    workers: int
+    memory_mb: int
+    time_limit_seconds: float | None
+    queued_seconds: float
+    expected_end: float
+
+
+@dataclass(order=True)
+class _Waiter:
+    sort_key: tuple[int, float, int]
+    workers: int = field(compare=False)
+    memory_mb: int = field(compare=False)
+    time_limit_seconds: float | None = field(compare=False)
+    deadline: float | None = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    future: "asyncio.Future[SolveGrant]" = field(compare=False)
+
+
+class SolverAdmissionController:
+    """
+    Admits solves against the core and memory budget.
+
+    ``admit`` is an async context manager yielding the SolveGrant; solve
+    with ``grant.workers`` search workers and at most
+    ``grant.time_limit_seconds``, which is shortened to fit the deadline.
+    """
+
+    def __init__(self, config: AdmissionConfig | None = None):
+        self.config = config or AdmissionConfig()
+        self.logger = get_logger("solver_admission")
+        self._active: set[SolveGrant] = set()
+        self._queue: list[_Waiter] = []
+        self._sequence = itertools.count()
+        self._cores_in_use = 0
+        self._memory_in_use = 0
+
+    @property
+    def active_solves(self) -> int:
+        return len(self._active)
+
+    @property
+    def queue_length(self) -> int:
+        return len(self._queue)
+
+    @property
+    def cores_in_use(self) -> int:
+        return self._cores_in_use
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        workers: int,
+        memory_mb: int,
+        time_limit_seconds: float | None = None,
+        priority: int = 0,
+        deadline_seconds: float | None = None,
+    ) -> AsyncIterator[SolveGrant]:
+        """Hold capacity for one solve; higher ``priority`` is served first."""
+        grant = await self.acquire(
+            workers, memory_mb, time_limit_seconds, priority, deadline_seconds
+        )
+        try:
+            yield grant
+        finally:
+            self.release(grant)
+
+    async def acquire(
+        self,
+        workers: int,
+        memory_mb: int,
+        time_limit_seconds: float | None = None,
+        priority: int = 0,
+        deadline_seconds: float | None = None,
+    ) -> SolveGrant:
+        """Wait for capacity; pair every grant with ``release``."""
+        now = time.monotonic()
+        deadline = now + deadline_seconds if deadline_seconds is not None else None
+        # A single solve never waits for more memory than the whole budget
+        memory_mb = min(memory_mb, self.config.memory_mb)
+
+        if deadline_seconds is not None and deadline_seconds < self.config.min_solve_seconds:
+            raise self._rejection("deadline", "deadline leaves no time to solve", 0.0)
+        if not self._queue and self._fits(memory_mb):
+            SOLVER_ADMISSION_DECISIONS.labels(decision="admitted").inc()
+            return self._grant(workers, memory_mb, time_limit_seconds, deadline, now)
+
+        waiter = _Waiter(
+            (-priority, deadline if deadline is not None else math.inf, next(self._sequence)),
+            workers,
+            memory_mb,
+            time_limit_seconds,
+            deadline,
+            now,
+            asyncio.get_running_loop().create_future(),
+        )
+        ahead = sorted(w for w in self._queue if w < waiter)
+        wait_seconds = self.estimated_wait(ahead, now)
+        if len(self._queue) >= self.config.max_queue_length:
+            raise self._rejection("queue_full", "solve queue is full", wait_seconds)
+        if deadline is not None and now + wait_seconds + self.config.min_solve_seconds > deadline:
+            raise self._rejection(
+                "deadline",
+                f"estimated queue wait of {wait_seconds:.0f}s leaves no time to solve",
+                wait_seconds,
+            )
+
+        heapq.heappush(self._queue, waiter)
+        SOLVER_ADMISSION_DECISIONS.labels(decision="queued").inc()
+        self._update_gauges()
+        timeout = (
+            deadline - self.config.min_solve_seconds - now if deadline is not None else None
+        )
+        try:
+            return await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except asyncio.TimeoutError:
+            if waiter.future.done():
+                return waiter.future.result()
+            self._leave_queue(waiter)
+            raise self._rejection(
+                "expired",
+                "deadline passed while queued",
+                self.estimated_wait(sorted(self._queue), time.monotonic()),
+            )
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                self.release(waiter.future.result())
+            else:
+                self._leave_queue(waiter)
+            raise
+
+    def release(self, grant: SolveGrant) -> None:
+        """Return a grant's capacity and start the queued solves it frees."""
+        if grant not in self._active:
+            return
+        self._active.remove(grant)
+        self._cores_in_use -= grant.workers
+        self._memory_in_use -= grant.memory_mb
+        self._dispatch()
+        self._update_gauges()
+
+    def estimated_wait(self, ahead: list[_Waiter], now: float | None = None) -> float:
+        """
+        Seconds until a solve queued behind ``ahead`` can start.
+
+        Replays the queue over the solve slots, each running solve holding its
+        slot until its time limit; memory is not modelled.
+        """
+        now = time.monotonic() if now is None else now
+        free_slots = max(0, self._slots() - len(self._active))
+        slot_free_at = [now] * free_slots + [grant.expected_end for grant in self._active]
+        heapq.heapify(slot_free_at)
+        if not slot_free_at:
+            return self.config.default_solve_seconds
+        for waiter in ahead:
+            start = max(now, heapq.heappop(slot_free_at))
+            heapq.heappush(
+                slot_free_at, start + self._expected_duration(waiter.time_limit_seconds)
+            )
+        return max(0.0, slot_free_at[0] - now)
+
+    def _slots(self) -> int:
+        """Most solves that can run at once."""
+        return min(
+            self.config.max_concurrent_solves,
+            self.config.cpu_cores // self.config.min_workers_per_solve,
+        )
+
+    def _fits(self, memory_mb: int) -> bool:
+        return (
+            len(self._active) < self._slots()
+            and self.config.cpu_cores - self._cores_in_use >= self.config.min_workers_per_solve
+            and self.config.memory_mb - self._memory_in_use >= memory_mb
+        )
+
+    def _grant(
+        self,
+        workers: int,
+        memory_mb: int,
+        time_limit_seconds: float | None,
+        deadline: float | None,
+        enqueued_at: float,
+    ) -> SolveGrant:
+        now = time.monotonic()
+        # Share the cores between everything running or waiting to run
+        contenders = min(len(self._active) + len(self._queue) + 1, self._slots())
+        granted = max(
+            self.config.min_workers_per_solve,
+            min(
+                workers,
+                self.config.max_workers_per_solve,
+                self.config.cpu_cores // contenders,
+                self.config.cpu_cores - self._cores_in_use,
+            ),
+        )
+        if deadline is not None:
+            remaining = deadline - now
+            time_limit_seconds = (
+                remaining if time_limit_seconds is None else min(time_limit_seconds, remaining)
+            )
+
+        grant = SolveGrant(
+            workers=granted,
+            memory_mb=memory_mb,
+            time_limit_seconds=time_limit_seconds,
+            queued_seconds=now - enqueued_at,
+            expected_end=now + self._expected_duration(time_limit_seconds),
+        )
+        self._active.add(grant)
+        self._cores_in_use += granted
+        self._memory_in_use += memory_mb
+        self._update_gauges()
+        if granted < workers:
+            self.logger.info(
+                "Solve admitted with fewer search workers",
+                requested=workers,
+                granted=granted,
+                active_solves=len(self._active),
+                queued=len(self._queue),
+            )
+        return grant
+
+    def _dispatch(self) -> None:
+        """Admit queued solves in order while the head of the queue fits."""
+        while self._queue and self._fits(self._queue[0].memory_mb):
+            waiter = heapq.heappop(self._queue)
+            waiter.future.set_result(
+                self._grant(
+                    waiter.workers,
+                    waiter.memory_mb,
+                    waiter.time_limit_seconds,
+                    waiter.deadline,
+                    waiter.enqueued_at,
+                )
+            )
+
+    def _leave_queue(self, waiter: _Waiter) -> None:
+        if waiter in self._queue:
+            self._queue.remove(waiter)
+            heapq.heapify(self._queue)
+        waiter.future.cancel()
+        # The head may have been blocking solves that fit now
+        self._dispatch()
+        self._update_gauges()
+
+    def _rejection(
+        self, decision: str, reason: str, retry_after_seconds: float
+    ) -> SolverCapacityExceededError:
+        SOLVER_ADMISSION_DECISIONS.labels(decision=f"rejected_{decision}").inc()
+        retry_after_seconds = max(1.0, math.ceil(retry_after_seconds))
+        self.logger.warning(
+            "Solve rejected by admission control",
+            reason=reason,
+            retry_after_seconds=retry_after_seconds,
+            active_solves=len(self._active),
+            queued=len(self._queue),
+        )
+        return SolverCapacityExceededError(reason, retry_after_seconds)
+
+    def _expected_duration(self, time_limit_seconds: float | None) -> float:
+        if time_limit_seconds is None:
+            return self.config.default_solve_seconds
+        return time_limit_seconds
+
+    def _update_gauges(self) -> None:
+        SOLVER_ADMISSION_QUEUE_DEPTH.set(len(self._queue))
+        SOLVER_ADMISSION_CORES_IN_USE.set(self._cores_in_use)
+
+
+def default_search_workers(concurrent_solves: int = 1) -> int:
+    """
+    Search workers for a solve run outside the admission controller.
+
+    Splits the admission core budget between ``concurrent_solves`` solves
+    that may run at once, e.g. the concurrency of a Celery worker.
+    """
+    cores = settings.SOLVER_ADMISSION_CPU_CORES or os.cpu_count() or 1
+    return max(
+        1, min(settings.SOLVER_MAX_WORKERS_PER_SOLVE, cores // max(1, concurrent_solves))
+    )
+
+
+_admission_controller: SolverAdmissionController | None = None
+
+
+def get_admission_controller() -> SolverAdmissionController:
+    """Get the process-wide admission controller, creating it on first use."""
+    global _admission_controller
+    if _admission_controller is None:
+        config = AdmissionConfig(
+            max_workers_per_solve=settings.SOLVER_MAX_WORKERS_PER_SOLVE,
+            max_queue_length=settings.SOLVER_ADMISSION_MAX_QUEUE,
+            min_solve_seconds=settings.SOLVER_ADMISSION_MIN_SOLVE_SECONDS,
+        )
+        if settings.SOLVER_ADMISSION_CPU_CORES:
+            config.cpu_cores = settings.SOLVER_ADMISSION_CPU_CORES
+        if settings.SOLVER_ADMISSION_MEMORY_MB:
+            config.memory_mb = settings.SOLVER_ADMISSION_MEMORY_MB
+        # Admitted solves never wait for a process of the solver pool
+        if settings.SOLVER_POOL_MAX_WORKERS:
+            config.max_concurrent_solves = settings.SOLVER_POOL_MAX_WORKERS
+        _admission_controller = SolverAdmissionController(config)
+    return _admission_controller
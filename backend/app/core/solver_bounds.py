@@ -0,0 +1,133 @@
+"""
+Solver Time Bounds
+
+Preprocessing that narrows CP-SAT time domains before a model is built. A
+forward pass over the precedence graph gives every task's earliest start from
+release dates and predecessor chains; a backward pass gives its latest end
+from hard deadlines, the horizon and successor chains. The critical path and
+the load on each resource also give a lower bound on the makespan.
+
+The bounds hold for every feasible schedule, so domains tightened with them
+never lose a solution. Soft due dates, which only cost tardiness, are not
+deadlines. All values are in the caller's model time units.
+
+Like the solver worker, this module depends only on the standard library.
+"""
+
+import collections
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ResourceLoad:
+    """
+    Tasks that must each occupy ``units`` of a resource pool for ``duration``.
+
+    ``capacity`` is the number of units the pool runs at once, e.g. one for a
+    machine or the size of a group of interchangeable operators.
+    """
+
+    capacity: int
+    demands: list[tuple[Hashable, int, int]] = field(default_factory=list)  # (task, duration, units)
+
+
+@dataclass
+class TimeBounds:
+    """Earliest starts, latest ends and makespan lower bounds of a problem."""
+
+    durations: dict[Hashable, int]
+    earliest_start: dict[Hashable, int]
+    latest_end: dict[Hashable, int]
+    critical_path: int  # Longest release-plus-chain of durations
+    resource_bound: int  # Most load any resource pool must carry
+
+    @property
+    def makespan_lower_bound(self) -> int:
+        return max(self.critical_path, self.resource_bound)
+
+    def latest_start(self, task: Hashable) -> int:
+        return self.latest_end[task] - self.durations[task]
+
+    @property
+    def infeasible_tasks(self) -> list[Hashable]:
+        """Tasks that cannot meet their deadline even when started as early as possible."""
+        return [
+            task for task in self.durations
+            if self.earliest_start[task] > self.latest_start(task)
+        ]
+
+
+def compute_time_bounds(
+    durations: dict[Hashable, int],
+    precedences: Iterable[tuple[Hashable, Hashable]],
+    horizon: int,
+    release_dates: dict[Hashable, int] | None = None,
+    deadlines: dict[Hashable, int] | None = None,
+    resources: Iterable[ResourceLoad] = (),
+) -> TimeBounds:
+    """
+    CPM passes over ``precedences`` (predecessor, successor) plus resource bounds.
+
+    ``durations`` are the shortest durations a task can take. Tasks on a
+    precedence cycle keep only their own release date and deadline.
+    """
+    release_dates = release_dates or {}
+    deadlines = deadlines or {}
+    successors: dict[Hashable, list[Hashable]] = collections.defaultdict(list)
+    in_degree = {task: 0 for task in durations}
+    for predecessor, successor in precedences:
+        if predecessor in durations and successor in durations:
+            successors[predecessor].append(successor)
+            in_degree[successor] += 1
+
+    # Topological order of the acyclic part of the graph
+    order = [task for task, degree in in_degree.items() if degree == 0]
+    for task in order:
+        for successor in successors[task]:
+            in_degree[successor] -= 1
+            if in_degree[successor] == 0:
+                order.append(successor)
+
+    earliest_start = {task: max(0, release_dates.get(task, 0)) for task in durations}
+    for task in order:
+        end = earliest_start[task] + durations[task]
+        for successor in successors[task]:
+            if end > earliest_start[successor]:
+                earliest_start[successor] = end
+
+    latest_end = {task: min(horizon, deadlines.get(task, horizon)) for task in durations}
+    tail = dict.fromkeys(durations, 0)  # Least time that must follow a task's end
+    for task in reversed(order):
+        for successor in successors[task]:
+            latest_end[task] = min(
+                latest_end[task], latest_end[successor] - durations[successor]
+            )
+            tail[task] = max(tail[task], durations[successor] + tail[successor])
+
+    critical_path = max(
+        (earliest_start[task] + durations[task] + tail[task] for task in durations),
+        default=0,
+    )
+
+    # A pool is busy for its load over capacity, after the earliest of its
+    # tasks can start and before the shortest tail of its tasks
+    resource_bound = 0
+    for resource in resources:
+        demands = [d for d in resource.demands if d[0] in durations]
+        if not demands or resource.capacity <= 0:
+            continue
+        load = sum(duration * units for _, duration, units in demands)
+        head = min(earliest_start[task] for task, _, _ in demands)
+        shortest_tail = min(tail[task] for task, _, _ in demands)
+        resource_bound = max(
+            resource_bound, head - (-load // resource.capacity) + shortest_tail
+        )
+
+    return TimeBounds(
+        durations=dict(durations),
+        earliest_start=earliest_start,
+        latest_end=latest_end,
+        critical_path=critical_path,
+        resource_bound=resource_bound,
+    )
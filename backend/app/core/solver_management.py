@@ -8,7 +8,6 @@ resource cleanup, and graceful degradation patterns for OR-Tools operations.
 import asyncio
 import gc
 import os
-import resource
 import tempfile
 import time
 from collections.abc import AsyncGenerator
@@ -39,6 +38,13 @@ from ..domain.shared.exceptions import (
 )
 from .circuit_breaker import CircuitBreakerConfig, with_resilience
 from .observability import SOLVER_METRICS, get_logger
+from .solver_termination import TerminationPolicy
+from .solver_pool import (
+    PooledSolveResult,
+    SolveCancelledError,
+    SolverProcessPool,
+    get_solver_pool,
+)
 
 
 class SolverStatus(Enum):
@@ -79,6 +85,7 @@ class SolverConfiguration:
     cp_model_presolve: bool = True
     cp_model_probing_level: int = 2
     symmetry_level: int = 1
+    termination: TerminationPolicy | None = None  # Early stop, default 1% gap
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for OR-Tools parameters."""
@@ -119,6 +126,11 @@ class SolverMetrics:
     solver_version: str = ""
     error_message: str | None = None
     partial_solution: bool = False
+    worker_pid: int | None = None
+    queue_wait_seconds: float = 0.0
+    stop_reason: str | None = None
+    # Variable values indexed by proto variable index; not part of to_dict().
+    solution_values: list[int] = field(default_factory=list, repr=False)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert metrics to dictionary."""
@@ -144,6 +156,9 @@ class SolverMetrics:
             "solver_version": self.solver_version,
             "error_message": self.error_message,
             "partial_solution": self.partial_solution,
+            "worker_pid": self.worker_pid,
+            "queue_wait_seconds": self.queue_wait_seconds,
+            "stop_reason": self.stop_reason,
         }
 
 
@@ -240,10 +255,12 @@ class ResilientSolverManager:
         self,
         limits: SolverLimits | None = None,
         config: SolverConfiguration | None = None,
+        pool: SolverProcessPool | None = None,
     ):
         """Initialize the resilient solver manager."""
         self.limits = limits or SolverLimits()
         self.config = config or SolverConfiguration()
+        self._pool = pool
         self.logger = get_logger(__name__)
         self._temp_files: list[Path] = []
         self._active_processes: dict[str, psutil.Process] = {}
@@ -335,7 +352,13 @@ class ResilientSolverManager:
         finally:
             # Stop monitoring and collect final metrics
             if monitor:
-                metrics = await monitor.stop_monitoring()
+                monitor_metrics = await monitor.stop_monitoring()
+                metrics.end_time = monitor_metrics.end_time
+                metrics.duration_seconds = monitor_metrics.duration_seconds
+                metrics.peak_memory_mb = max(
+                    metrics.peak_memory_mb, monitor_metrics.peak_memory_mb
+                )
+                metrics.cpu_usage_percent = monitor_metrics.cpu_usage_percent
 
             # Perform cleanup
             await self._cleanup_solver_resources(execution_id)
@@ -352,10 +375,9 @@ class ResilientSolverManager:
             )
 
             # Update Prometheus metrics
-            SOLVER_METRICS.labels(
-                status=metrics.status.value,
-                execution_id=execution_id,
-            ).observe(metrics.duration_seconds)
+            SOLVER_METRICS.labels(status=metrics.status.value).observe(
+                metrics.duration_seconds
+            )
 
     async def solve_with_timeout(
         self, model: cp_model.CpModel, timeout_seconds: int | None = None
@@ -363,62 +385,66 @@ class ResilientSolverManager:
         """
         Solve model with comprehensive timeout and resource management.
 
-        Returns solver status and detailed metrics.
+        The solve runs in a worker of the solver process pool. On timeout or
+        cancellation the worker process is killed, so no search threads outlive
+        the request. Returns solver status and detailed metrics; variable values
+        are available in ``metrics.solution_values``.
         """
         timeout_seconds = timeout_seconds or self.limits.max_time_seconds
 
         async with self.managed_solve(model) as (solver, metrics):
-            try:
-                # Configure solver timeout
-                solver.parameters.max_time_in_seconds = timeout_seconds
-
-                # Extract model statistics
-                model_proto = model.Proto()
-                metrics.num_variables = len(model_proto.variables)
-                metrics.num_constraints = len(model_proto.constraints)
+            # Configure solver timeout
+            solver.parameters.max_time_in_seconds = timeout_seconds
 
-                # Run solver with timeout
-                solve_task = asyncio.create_task(
-                    self._run_solver_async(solver, model, metrics)
-                )
+            # Extract model statistics
+            model_proto = model.Proto()
+            metrics.num_variables = len(model_proto.variables)
+            metrics.num_constraints = len(model_proto.constraints)
 
-                status = await asyncio.wait_for(
-                    solve_task, timeout=timeout_seconds + 10
-                )
-
-                # Collect final solver statistics
-                await self._collect_solver_statistics(solver, metrics)
-
-                return status, metrics
-
-            except asyncio.TimeoutError:
-                # Cancel the solve task
-                solve_task.cancel()
-
-                # Try to get partial solution
-                try:
-                    await asyncio.wait_for(solve_task, timeout=5.0)
-                except:
-                    pass
-
-                metrics.partial_solution = self._has_partial_solution(solver)
+            try:
+                result = await self._run_solver_async(model, timeout_seconds)
+            except SolveCancelledError:
+                # The worker overran the solver's own time limit and was killed
                 raise OptimizationTimeoutError(
                     timeout_seconds=timeout_seconds,
-                    partial_solution=metrics.partial_solution,
+                    partial_solution=False,
                     solver_stats=metrics.to_dict(),
                 )
+            except asyncio.CancelledError:
+                metrics.status = SolverStatus.CANCELLED
+                metrics.error_message = "Solve cancelled by caller"
+                raise
 
-    async def _run_solver_async(
-        self, solver: cp_model.CpSolver, model: cp_model.CpModel, metrics: SolverMetrics
-    ) -> int:
-        """Run solver asynchronously."""
+            # Collect final solver statistics
+            self._collect_pool_statistics(result, metrics)
 
-        def solve_in_thread():
-            return solver.Solve(model)
+            return result.status, metrics
 
-        # Run solver in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, solve_in_thread)
+    async def _run_solver_async(
+        self, model: cp_model.CpModel, timeout_seconds: int
+    ) -> PooledSolveResult:
+        """Run solver in the process pool without blocking the event loop."""
+        pool = self._pool or get_solver_pool()
+        parameters = self._solver_parameters()
+        parameters["max_memory_mb"] = self.limits.max_memory_mb
+        return await pool.solve(
+            model,
+            parameters,
+            timeout_seconds,
+            termination=self.config.termination or TerminationPolicy(),
+        )
+
+    def _solver_parameters(self) -> dict[str, Any]:
+        """CP-SAT parameters applied in the worker process."""
+        return {
+            "num_search_workers": self.config.num_search_workers,
+            "log_search_progress": self.config.log_search_progress,
+            "use_fixed_search": self.config.use_fixed_search,
+            "linearization_level": self.config.linearization_level,
+            "cp_model_presolve": self.config.cp_model_presolve,
+            "cp_model_probing_level": self.config.cp_model_probing_level,
+            "symmetry_level": self.config.symmetry_level,
+        }
 
     async def _validate_system_resources(self) -> None:
         """Validate system has sufficient resources."""
@@ -454,19 +480,8 @@ class ResilientSolverManager:
 
     async def _setup_solver_environment(self) -> None:
         """Setup solver execution environment."""
-        # Set memory limits using resource module
-        try:
-            # Convert MB to bytes
-            memory_limit_bytes = self.limits.max_memory_mb * 1024 * 1024
-            resource.setrlimit(
-                resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes)
-            )
-
-            self.logger.info(
-                "Memory limits configured", limit_mb=self.limits.max_memory_mb
-            )
-        except (OSError, ValueError) as e:
-            self.logger.warning("Failed to set memory limits", error=str(e))
+        # Memory ceilings are enforced inside the solver worker processes
+        # (see solver_worker), never on the API process itself.
 
         # Configure garbage collection
         gc.set_threshold(700, 10, 10)  # More aggressive GC
@@ -557,6 +572,37 @@ class ResilientSolverManager:
         except Exception as e:
             self.logger.warning("Failed to collect solver statistics", error=str(e))
 
+    def _collect_pool_statistics(
+        self, result: PooledSolveResult, metrics: SolverMetrics
+    ) -> None:
+        """Copy statistics reported by the worker process into metrics."""
+        metrics.objective_value = result.objective_value
+        metrics.best_bound = result.best_bound
+        if metrics.objective_value and metrics.best_bound is not None:
+            metrics.gap_percent = abs(
+                (metrics.objective_value - metrics.best_bound)
+                / metrics.objective_value
+                * 100
+            )
+        metrics.num_branches = result.num_branches
+        metrics.num_conflicts = result.num_conflicts
+        metrics.wall_time = result.wall_time
+        metrics.user_time = result.user_time
+        metrics.peak_memory_mb = max(metrics.peak_memory_mb, result.peak_memory_mb)
+        metrics.worker_pid = result.worker_pid
+        metrics.queue_wait_seconds = result.queue_wait_seconds
+        metrics.stop_reason = result.stop_reason
+        metrics.solution_values = result.solution
+
+        self.logger.info(
+            "Solver statistics collected",
+            objective=metrics.objective_value,
+            gap_percent=metrics.gap_percent,
+            branches=metrics.num_branches,
+            conflicts=metrics.num_conflicts,
+            worker_pid=metrics.worker_pid,
+        )
+
     def _has_partial_solution(self, solver: cp_model.CpSolver) -> bool:
         """Check if solver has a partial solution available."""
         try:
@@ -0,0 +1,367 @@
+"""
+Solver Process Pool
+
+Bounded pool of OS processes that execute CP-SAT solves out of the API process.
+Running solves in processes (rather than the default thread executor) makes
+cancellation real: when a solve times out or the caller goes away, the worker
+process is killed and its CPU and memory are returned to the system.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any
+
+import psutil
+
+from ..domain.shared.exceptions import SolverCrashError, SolverError, SolverMemoryError
+from .config import settings
+from .observability import (
+    SOLVER_POOL_QUEUE_DEPTH,
+    SOLVER_POOL_RUNNING,
+    SOLVER_POOL_WORKER_EVENTS,
+    SOLVER_POOL_WORKERS,
+    get_logger,
+)
+from .solver_termination import TerminationPolicy
+from .solver_worker import serialize_model, worker_main
+
+
+class SolveCancelledError(SolverError):
+    """Raised when a pooled solve is killed before it produced a result."""
+
+    def __init__(self, reason: str = "cancelled") -> None:
+        super().__init__(f"Solve was terminated ({reason})", "CANCELLED")
+        self.reason = reason
+
+
+@dataclass
+class SolverPoolConfig:
+    """Configuration for the solver process pool."""
+
+    max_workers: int = field(default_factory=lambda: max(1, (os.cpu_count() or 2) // 2))
+    max_memory_mb: int = 4096
+    max_solves_per_worker: int = 25
+    hard_kill_grace_seconds: float = 5.0
+    start_method: str = "spawn"
+
+
+@dataclass
+class PooledSolveResult:
+    """Outcome of a solve executed in a worker process."""
+
+    status: int
+    status_name: str
+    solution: list[int]
+    objective_value: float | None
+    best_bound: float | None
+    num_branches: int
+    num_conflicts: int
+    wall_time: float
+    user_time: float
+    peak_memory_mb: float
+    worker_pid: int
+    queue_wait_seconds: float
+    stop_reason: str | None = None
+
+    def value(self, var: Any) -> int:
+        """Value of a model variable in the returned solution."""
+        index = var.Index()
+        if index < 0:
+            return 1 - self.solution[-index - 1]
+        return self.solution[index]
+
+
+class _PoolWorker:
+    """Parent-side handle for one worker process."""
+
+    def __init__(self, context: Any, max_memory_mb: int):
+        parent_conn, child_conn = context.Pipe(duplex=True)
+        self.conn: Connection = parent_conn
+        self.process: BaseProcess = context.Process(
+            target=worker_main,
+            args=(child_conn, max_memory_mb),
+            daemon=True,
+            name="vulcan-solver-worker",
+        )
+        self.process.start()
+        child_conn.close()
+        self.solves_completed = 0
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid or -1
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def rss_mb(self) -> float:
+        try:
+            return psutil.Process(self.pid).memory_info().rss / (1024 * 1024)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return 0.0
+
+    def retire(self) -> None:
+        """Ask the worker to exit after its current request."""
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self) -> None:
+        """Terminate the worker immediately, escalating to SIGKILL."""
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout=1.0)
+        self.conn.close()
+
+
+class SolverProcessPool:
+    """
+    Bounded pool of solver worker processes.
+
+    At most ``max_workers`` solves run concurrently; further requests wait in
+    FIFO order. Each worker runs under an address-space ceiling and is recycled
+    after ``max_solves_per_worker`` solves or when its resident memory exceeds
+    the ceiling. Timeouts and cancellations kill the worker outright.
+    """
+
+    def __init__(self, config: SolverPoolConfig | None = None):
+        self.config = config or SolverPoolConfig()
+        self.logger = get_logger("solver_pool")
+        self._context = multiprocessing.get_context(self.config.start_method)
+        self._slots = asyncio.Semaphore(self.config.max_workers)
+        self._idle: list[_PoolWorker] = []
+        self._busy: set[_PoolWorker] = set()
+        self._queued = 0
+        self._closed = False
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queued
+
+    @property
+    def running(self) -> int:
+        return len(self._busy)
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of pool state for health and monitoring endpoints."""
+        return {
+            "max_workers": self.config.max_workers,
+            "queue_depth": self._queued,
+            "running_solves": len(self._busy),
+            "idle_workers": len(self._idle),
+            "worker_pids": [w.pid for w in (*self._idle, *self._busy)],
+        }
+
+    async def solve(
+        self,
+        model: Any,
+        parameters: dict[str, Any] | None = None,
+        timeout_seconds: float | None = None,
+        termination: TerminationPolicy | None = None,
+    ) -> PooledSolveResult:
+        """
+        Solve a CP-SAT model in a worker process.
+
+        ``timeout_seconds`` is passed to CP-SAT as ``max_time_in_seconds`` so the
+        solver normally returns its incumbent on time; if the worker has not
+        answered ``hard_kill_grace_seconds`` later it is killed and
+        SolveCancelledError is raised. Cancelling the awaiting task also kills
+        the worker. ``termination`` stops the search early in the worker.
+        """
+        if self._closed:
+            raise SolverError("Solver pool is shut down", "POOL_CLOSED")
+
+        parameters = dict(parameters or {})
+        if timeout_seconds is not None:
+            parameters["max_time_in_seconds"] = float(timeout_seconds)
+        kind, payload = serialize_model(model)
+        request = {"kind": kind, "payload": payload, "parameters": parameters}
+        if termination is not None:
+            request["termination"] = termination.to_dict()
+
+        enqueued_at = time.time()
+        self._set_queued(self._queued + 1)
+        try:
+            await self._slots.acquire()
+        finally:
+            self._set_queued(self._queued - 1)
+
+        try:
+            worker = self._checkout_worker()
+            queue_wait = time.time() - enqueued_at
+            deadline = (
+                timeout_seconds + self.config.hard_kill_grace_seconds
+                if timeout_seconds is not None
+                else None
+            )
+            try:
+                raw = await asyncio.wait_for(
+                    self._roundtrip(worker, request), timeout=deadline
+                )
+            except asyncio.TimeoutError:
+                self._discard_worker(worker, "killed_timeout")
+                raise SolveCancelledError("hard timeout")
+            except asyncio.CancelledError:
+                self._discard_worker(worker, "killed_cancelled")
+                raise
+            except (EOFError, BrokenPipeError, ConnectionResetError):
+                worker.process.join(timeout=1.0)
+                exit_code = worker.process.exitcode
+                self._discard_worker(worker, "crashed")
+                raise SolverCrashError(
+                    exit_code=exit_code if exit_code is not None else -1
+                )
+
+            if raw.get("error_type") == "memory":
+                # Heap state after a MemoryError is not trustworthy; replace it
+                self._discard_worker(worker, "killed_memory")
+            else:
+                self._checkin_worker(worker)
+            return self._to_result(raw, worker.pid, queue_wait)
+        finally:
+            self._slots.release()
+
+    async def _roundtrip(self, worker: _PoolWorker, request: dict[str, Any]) -> Any:
+        """Send a request and wait for the reply without blocking the loop."""
+        loop = asyncio.get_running_loop()
+        readable: asyncio.Future[None] = loop.create_future()
+        fd = worker.conn.fileno()
+
+        def _on_readable() -> None:
+            if not readable.done():
+                readable.set_result(None)
+
+        # Pickling and writing a large model can take a while; keep it off the loop
+        await asyncio.to_thread(worker.conn.send, request)
+        loop.add_reader(fd, _on_readable)
+        try:
+            await readable
+        finally:
+            loop.remove_reader(fd)
+        return worker.conn.recv()
+
+    def _to_result(
+        self, raw: dict[str, Any], worker_pid: int, queue_wait: float
+    ) -> PooledSolveResult:
+        if not raw.get("ok"):
+            if raw.get("error_type") == "memory":
+                raise SolverMemoryError(memory_limit_mb=self.config.max_memory_mb)
+            raise SolverError(
+                f"Solver worker failed: {raw.get('error')}",
+                raw.get("error_type", "ERROR"),
+            )
+        return PooledSolveResult(
+            status=raw["status"],
+            status_name=raw["status_name"],
+            solution=raw["solution"],
+            objective_value=raw["objective_value"],
+            best_bound=raw["best_bound"],
+            num_branches=raw["num_branches"],
+            num_conflicts=raw["num_conflicts"],
+            wall_time=raw["wall_time"],
+            user_time=raw["user_time"],
+            peak_memory_mb=raw["peak_memory_mb"],
+            worker_pid=worker_pid,
+            queue_wait_seconds=queue_wait,
+            stop_reason=raw.get("stop_reason"),
+        )
+
+    def _checkout_worker(self) -> _PoolWorker:
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.is_alive():
+                break
+            self._discard_worker(worker, "crashed")
+        else:
+            worker = _PoolWorker(self._context, self.config.max_memory_mb)
+            SOLVER_POOL_WORKER_EVENTS.labels(event="spawned").inc()
+        self._busy.add(worker)
+        self._update_gauges()
+        return worker
+
+    def _checkin_worker(self, worker: _PoolWorker) -> None:
+        self._busy.discard(worker)
+        worker.solves_completed += 1
+
+        if worker.solves_completed >= self.config.max_solves_per_worker:
+            worker.retire()
+            SOLVER_POOL_WORKER_EVENTS.labels(event="recycled").inc()
+        elif worker.rss_mb() > self.config.max_memory_mb * 0.8:
+            self.logger.info(
+                "Recycling solver worker over memory budget",
+                pid=worker.pid,
+                rss_mb=worker.rss_mb(),
+            )
+            worker.retire()
+            SOLVER_POOL_WORKER_EVENTS.labels(event="recycled").inc()
+        elif not self._closed:
+            self._idle.append(worker)
+        else:
+            worker.retire()
+        self._update_gauges()
+
+    def _discard_worker(self, worker: _PoolWorker, event: str) -> None:
+        self._busy.discard(worker)
+        if worker in self._idle:
+            self._idle.remove(worker)
+        worker.kill()
+        SOLVER_POOL_WORKER_EVENTS.labels(event=event).inc()
+        self.logger.warning("Solver worker discarded", pid=worker.pid, reason=event)
+        self._update_gauges()
+
+    def _set_queued(self, value: int) -> None:
+        self._queued = value
+        SOLVER_POOL_QUEUE_DEPTH.set(value)
+
+    def _update_gauges(self) -> None:
+        SOLVER_POOL_RUNNING.set(len(self._busy))
+        SOLVER_POOL_WORKERS.set(len(self._busy) + len(self._idle))
+
+    def shutdown(self) -> None:
+        """Retire idle workers and kill any running solves."""
+        self._closed = True
+        for worker in self._idle:
+            worker.retire()
+        for worker in list(self._busy):
+            self._discard_worker(worker, "killed_shutdown")
+        self._idle.clear()
+        self._update_gauges()
+
+
+_solver_pool: SolverProcessPool | None = None
+
+
+def get_solver_pool() -> SolverProcessPool:
+    """Get the process-wide solver pool, creating it on first use."""
+    global _solver_pool
+    if _solver_pool is None or _solver_pool._closed:
+        config = SolverPoolConfig(
+            max_memory_mb=settings.SOLVER_POOL_MAX_MEMORY_MB,
+            max_solves_per_worker=settings.SOLVER_POOL_MAX_SOLVES_PER_WORKER,
+            hard_kill_grace_seconds=settings.SOLVER_POOL_HARD_KILL_GRACE_SECONDS,
+        )
+        if settings.SOLVER_POOL_MAX_WORKERS:
+            config.max_workers = settings.SOLVER_POOL_MAX_WORKERS
+        _solver_pool = SolverProcessPool(config)
+    return _solver_pool
+
+
+def shutdown_solver_pool() -> None:
+    """Shut down the process-wide solver pool, if it was started."""
+    global _solver_pool
+    if _solver_pool is not None:
+        _solver_pool.shutdown()
+        _solver_pool = None
@@ -0,0 +1,51 @@
+"""
+Solver Redundant Constraints
+
+Optional model strengthening for groups of interchangeable resources. Per
+resource NoOverlap constraints say nothing about a group as a whole: that
+three parallel machines can run at most three tasks at once, or that ten
+welding tasks need a welder for their combined length. A redundant
+cumulative per group and an energy bound on its busy span give CP-SAT that
+aggregate view.
+
+Both constraints are implied by the per-resource ones, so they never remove
+a solution; they only prune the search and tighten the linear relaxation.
+"""
+
+from typing import Any
+
+from ortools.sat.python import cp_model  # type: ignore[import-not-found]
+
+
+def add_resource_group(
+    model: cp_model.CpModel,
+    intervals: list[cp_model.IntervalVar],
+    demands: list[int],
+    capacity: int,
+    horizon: int,
+    name: str,
+) -> bool:
+    """
+    Post a redundant cumulative and an energy bound for one resource group.
+
+    ``intervals`` are the tasks that must run on the group, each using
+    ``demands`` units of its ``capacity``. The energy bound makes the span
+    from the group's first start to its last end at least its total
+    demand-weighted duration over the capacity. Groups whose capacity covers
+    every task at once add nothing and are skipped; returns whether the
+    group was posted.
+    """
+    if capacity <= 0 or sum(demands) <= capacity:
+        return False
+
+    model.AddCumulative(intervals, demands, capacity)
+
+    first_start = model.NewIntVar(0, horizon, f"{name}_first_start")
+    last_end = model.NewIntVar(0, horizon, f"{name}_last_end")
+    model.AddMinEquality(first_start, [interval.StartExpr() for interval in intervals])
+    model.AddMaxEquality(last_end, [interval.EndExpr() for interval in intervals])
+    energy: Any = sum(
+        demand * interval.SizeExpr() for interval, demand in zip(intervals, demands)
+    )
+    model.Add(capacity * (last_end - first_start) >= energy)
+    return True
@@ -0,0 +1,220 @@
+"""
+Solver Termination Policy
+
+Early-stop rules shared by the CP-SAT entry points. A search stops once the
+incumbent is within a relative or absolute gap of the best bound, when no
+improving solution was found for a while, or when the incumbent improves more
+slowly than a minimum rate. The reason the search ended is reported with the
+result.
+
+Gap limits are passed to CP-SAT itself, which also checks them when only the
+bound moves; stagnation and improvement rate are watched from a helper thread
+because CP-SAT reports nothing between improving solutions.
+
+Like the solver worker, this module depends only on the standard library and
+OR-Tools so pooled worker processes can import it.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from enum import Enum
+from typing import Any
+
+from ortools.sat.python import cp_model  # type: ignore[import-not-found]
+
+
+class StopReason(str, Enum):
+    """Why a search ended."""
+
+    OPTIMAL = "optimal"  # Proven optimal
+    INFEASIBLE = "infeasible"  # Proven infeasible
+    MODEL_INVALID = "model_invalid"
+    RELATIVE_GAP = "relative_gap"  # Incumbent within the relative gap of the bound
+    ABSOLUTE_GAP = "absolute_gap"  # Incumbent within the absolute gap of the bound
+    STAGNATION = "stagnation"  # No improving solution for stagnation_seconds
+    SLOW_IMPROVEMENT = "slow_improvement"  # Improvement rate under the minimum
+    TIME_LIMIT = "time_limit"
+    STOPPED = "stopped"  # Stopped from outside, e.g. cancelled
+    UNKNOWN = "unknown"
+
+
+def relative_gap(objective: float, bound: float) -> float:
+    """Gap between incumbent and bound, relative to the incumbent as CP-SAT does."""
+    return abs(objective - bound) / max(1.0, abs(objective))
+
+
+@dataclass
+class TerminationPolicy:
+    """
+    When to stop a search before its time limit.
+
+    ``min_improvement_rate`` is the relative objective improvement per second
+    over the last ``improvement_window_seconds``. Stagnation and rate rules
+    only apply after ``min_search_seconds`` and once a solution exists.
+    """
+
+    relative_gap: float | None = 0.01
+    absolute_gap: float | None = None
+    stagnation_seconds: float | None = None
+    min_improvement_rate: float | None = None
+    improvement_window_seconds: float = 30.0
+    min_search_seconds: float = 0.0
+    poll_seconds: float = 0.5
+
+    @property
+    def watches_progress(self) -> bool:
+        return self.stagnation_seconds is not None or self.min_improvement_rate is not None
+
+    def apply(self, parameters: Any) -> None:
+        """Set the gap limits on ``CpSolver.parameters``."""
+        if self.relative_gap is not None:
+            parameters.relative_gap_limit = self.relative_gap
+        if self.absolute_gap is not None:
+            parameters.absolute_gap_limit = self.absolute_gap
+
+    def gap_reason(self, objective: float, bound: float) -> StopReason | None:
+        if self.absolute_gap is not None and abs(objective - bound) <= self.absolute_gap:
+            return StopReason.ABSOLUTE_GAP
+        if self.relative_gap is not None and relative_gap(objective, bound) <= self.relative_gap:
+            return StopReason.RELATIVE_GAP
+        return None
+
+    def progress_reason(
+        self, history: list[tuple[float, float]], elapsed: float
+    ) -> StopReason | None:
+        """
+        Stagnation or slow improvement over ``history``.
+
+        ``history`` holds (seconds since search start, objective) of every
+        improving solution, oldest first.
+        """
+        if not history or elapsed < self.min_search_seconds:
+            return None
+        last_time, last_objective = history[-1]
+        if self.stagnation_seconds is not None and elapsed - last_time >= self.stagnation_seconds:
+            return StopReason.STAGNATION
+        if self.min_improvement_rate is not None:
+            window_start = elapsed - self.improvement_window_seconds
+            if window_start < history[0][0]:
+                return None  # Not searched long enough to measure the rate
+            reference = next(
+                (objective for at, objective in reversed(history) if at <= window_start),
+                history[0][1],
+            )
+            improvement = abs(reference - last_objective) / max(1.0, abs(reference))
+            if improvement / self.improvement_window_seconds < self.min_improvement_rate:
+                return StopReason.SLOW_IMPROVEMENT
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TerminationPolicy":
+        return cls(**data)
+
+
+class TerminationMonitor(cp_model.CpSolverSolutionCallback):
+    """
+    Solution callback enforcing a TerminationPolicy during one solve.
+
+    Use ``solve`` rather than ``CpSolver.Solve`` so the progress watcher runs,
+    then ``stop_reason`` to explain the returned status.
+    """
+
+    def __init__(
+        self,
+        policy: TerminationPolicy,
+        on_solution: Callable[[float, float, float], None] | None = None,
+    ):
+        super().__init__()
+        self.policy = policy
+        self.on_solution = on_solution
+        self.reason: StopReason | None = None
+        self.history: list[tuple[float, float]] = []
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+
+    def on_solution_callback(self) -> None:
+        objective = self.ObjectiveValue()
+        bound = self.BestObjectiveBound()
+        with self._lock:
+            self.history.append((time.monotonic() - self._started_at, objective))
+        if self.on_solution is not None:
+            self.on_solution(objective, bound, self.WallTime())
+        # A proven optimum ends the search by itself
+        reason = self.policy.gap_reason(objective, bound) if objective != bound else None
+        if reason is not None:
+            self._stop(reason)
+
+    def solve(self, solver: cp_model.CpSolver, model: cp_model.CpModel) -> int:
+        self.policy.apply(solver.parameters)
+        self._started_at = time.monotonic()
+        finished = threading.Event()
+        watcher = None
+        if self.policy.watches_progress:
+            watcher = threading.Thread(
+                target=self._watch, args=(finished,), daemon=True, name="solver-termination"
+            )
+            watcher.start()
+        try:
+            return solver.Solve(model, self)
+        finally:
+            finished.set()
+            if watcher is not None:
+                watcher.join()
+
+    def stop_reason(self, solver: cp_model.CpSolver, status: int) -> StopReason:
+        """Why the solve that returned ``status`` ended."""
+        if self.reason is not None:
+            return self.reason
+        return solver_stop_reason(solver, status, self.policy)
+
+    def _watch(self, finished: threading.Event) -> None:
+        while not finished.wait(self.policy.poll_seconds):
+            with self._lock:
+                history = list(self.history)
+            reason = self.policy.progress_reason(history, time.monotonic() - self._started_at)
+            if reason is not None:
+                self._stop(reason)
+                return
+
+    def _stop(self, reason: StopReason) -> None:
+        if self.reason is None:
+            self.reason = reason
+            self.StopSearch()
+
+
+def solver_stop_reason(
+    solver: cp_model.CpSolver, status: int, policy: TerminationPolicy | None = None
+) -> StopReason:
+    """Stop reason read from a finished CpSolver and its status."""
+    if status == cp_model.INFEASIBLE:
+        return StopReason.INFEASIBLE
+    if status == cp_model.MODEL_INVALID:
+        return StopReason.MODEL_INVALID
+    if status == cp_model.OPTIMAL:
+        # CP-SAT reports OPTIMAL when it stops on a gap limit
+        objective = solver.ObjectiveValue()
+        bound = solver.BestObjectiveBound()
+        if abs(objective - bound) > 1e-9 and policy is not None:
+            return policy.gap_reason(objective, bound) or StopReason.RELATIVE_GAP
+        return StopReason.OPTIMAL
+    time_limit = solver.parameters.max_time_in_seconds
+    if solver.WallTime() >= time_limit * 0.99:
+        return StopReason.TIME_LIMIT
+    return StopReason.STOPPED if status == cp_model.FEASIBLE else StopReason.UNKNOWN
+
+
+def solve_with_policy(
+    solver: cp_model.CpSolver,
+    model: cp_model.CpModel,
+    policy: TerminationPolicy | None,
+    on_solution: Callable[[float, float, float], None] | None = None,
+) -> tuple[int, StopReason]:
+    """Solve ``model`` under ``policy``; returns the status and stop reason."""
+    monitor = TerminationMonitor(policy or TerminationPolicy(), on_solution)
+    status = monitor.solve(solver, model)
+    return status, monitor.stop_reason(solver, status)
@@ -0,0 +1,157 @@
+"""
+Solver Worker Process
+
+Worker-side half of the solver process pool. This module is imported by freshly
+spawned worker processes, so it deliberately depends only on the standard library
+and OR-Tools: no settings, logging or metrics infrastructure is loaded per worker.
+"""
+
+import resource
+import time
+from multiprocessing.connection import Connection
+from typing import Any
+
+from ortools.sat.python import cp_model  # type: ignore[import-not-found]
+
+from .solver_termination import TerminationMonitor, TerminationPolicy, solver_stop_reason
+
+# Wire formats for CP-SAT model protos. Older OR-Tools releases expose protobuf
+# messages (binary serialization); newer ones expose C++ wrappers that only
+# round-trip through the text format.
+PAYLOAD_BINARY = "binary"
+PAYLOAD_TEXT = "text"
+
+_STATUS_NAMES = {
+    int(cp_model.UNKNOWN): "UNKNOWN",
+    int(cp_model.MODEL_INVALID): "MODEL_INVALID",
+    int(cp_model.FEASIBLE): "FEASIBLE",
+    int(cp_model.INFEASIBLE): "INFEASIBLE",
+    int(cp_model.OPTIMAL): "OPTIMAL",
+}
+
+
+def serialize_model(model: cp_model.CpModel) -> tuple[str, bytes | str]:
+    """Serialize a CP-SAT model so it can be shipped to a worker process."""
+    proto = model.Proto()
+    if hasattr(proto, "SerializeToString"):
+        return PAYLOAD_BINARY, proto.SerializeToString()
+    return PAYLOAD_TEXT, str(proto)
+
+
+def deserialize_model(kind: str, payload: bytes | str) -> cp_model.CpModel:
+    """Rebuild a CP-SAT model from a payload produced by serialize_model."""
+    model = cp_model.CpModel()
+    proto = model.Proto()
+    if kind == PAYLOAD_BINARY:
+        proto.ParseFromString(payload)
+    elif hasattr(proto, "parse_text_format"):
+        proto.parse_text_format(payload)
+    else:
+        from google.protobuf import text_format  # type: ignore[import-untyped]
+
+        text_format.Parse(payload, proto)
+    return model
+
+
+def _apply_memory_ceiling(max_memory_mb: int, soft_only: bool = False) -> None:
+    """
+    Cap the address space of the current (worker) process.
+
+    The worker's hard limit is set once at start-up; individual requests may
+    only lower the soft limit below it.
+    """
+    if max_memory_mb <= 0:
+        return
+    limit_bytes = max_memory_mb * 1024 * 1024
+    try:
+        if soft_only:
+            _, hard = resource.getrlimit(resource.RLIMIT_AS)
+            if hard != resource.RLIM_INFINITY:
+                limit_bytes = min(limit_bytes, hard)
+            resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, hard))
+        else:
+            resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, limit_bytes))
+    except (OSError, ValueError):
+        # Not permitted on this platform; the parent still enforces RSS limits.
+        pass
+
+
+def _peak_memory_mb() -> float:
+    """Peak resident set size of this process in MB (ru_maxrss is KB on Linux)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def solve_request(request: dict[str, Any]) -> dict[str, Any]:
+    """Solve a single serialized model and return a picklable result."""
+    started = time.time()
+    model = deserialize_model(request["kind"], request["payload"])
+
+    parameters = dict(request.get("parameters", {}))
+    _apply_memory_ceiling(parameters.pop("max_memory_mb", 0), soft_only=True)
+
+    solver = cp_model.CpSolver()
+    for name, value in parameters.items():
+        setattr(solver.parameters, name, value)
+
+    termination = request.get("termination")
+    if termination is not None:
+        monitor = TerminationMonitor(TerminationPolicy.from_dict(termination))
+        status = int(monitor.solve(solver, model))
+        stop_reason = monitor.stop_reason(solver, status)
+    else:
+        status = int(solver.Solve(model))
+        stop_reason = solver_stop_reason(solver, status)
+    response = solver.ResponseProto()
+    has_solution = status in (int(cp_model.OPTIMAL), int(cp_model.FEASIBLE))
+
+    return {
+        "ok": True,
+        "status": status,
+        "status_name": _STATUS_NAMES.get(status, "UNKNOWN"),
+        "solution": list(response.solution) if has_solution else [],
+        "objective_value": solver.ObjectiveValue() if has_solution else None,
+        "best_bound": solver.BestObjectiveBound() if has_solution else None,
+        "num_branches": solver.NumBranches(),
+        "num_conflicts": solver.NumConflicts(),
+        "wall_time": solver.WallTime(),
+        "user_time": solver.UserTime(),
+        "elapsed_seconds": time.time() - started,
+        "peak_memory_mb": _peak_memory_mb(),
+        "stop_reason": stop_reason.value,
+    }
+
+
+def worker_main(conn: Connection, max_memory_mb: int) -> None:
+    """
+    Entry point of a pooled solver process.
+
+    Receives solve requests over the pipe until it gets ``None`` or the pipe is
+    closed. A request that exhausts memory is reported back rather than crashing
+    the worker; the parent recycles the worker afterwards.
+    """
+    _apply_memory_ceiling(max_memory_mb)
+
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            break
+        if request is None:
+            break
+
+        try:
+            result = solve_request(request)
+        except MemoryError:
+            result = {"ok": False, "error_type": "memory", "error": "MemoryError"}
+        except Exception as e:
+            result = {"ok": False, "error_type": type(e).__name__, "error": str(e)}
+        finally:
+            # Restore the worker-wide ceiling for the next request
+            _apply_memory_ceiling(max_memory_mb, soft_only=True)
+
+        try:
+            conn.send(result)
+        except (BrokenPipeError, OSError):
+            break
+
+    conn.close()
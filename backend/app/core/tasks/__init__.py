@@ -14,6 +14,7 @@ __all__ = [
     "optimize_schedule",
     "optimize_pending_schedules",
     "optimize_resource_allocation",
+    "run_solve_job",
     # Maintenance tasks
     "cleanup_expired_cache",
     "cleanup_old_schedules",
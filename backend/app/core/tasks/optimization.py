@@ -1,14 +1,18 @@
 """Optimization background tasks."""
 
+import json
 import logging
 from datetime import datetime
 from typing import Any
+from uuid import UUID
 
 from celery import current_task, group
 
 from app.core.cache import CacheManager
 from app.core.celery_app import BaseTask, celery_app
+from app.core.config import settings
 from app.core.solver import HFFSScheduler
+from app.core.solver_admission import default_search_workers
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +82,10 @@ def optimize_schedule(
 
         # Initialize optimizer
         scheduler = HFFSScheduler()
+        # Every process of the worker may be solving at once
+        scheduler.num_search_workers = default_search_workers(
+            settings.CELERY_WORKER_CONCURRENCY
+        )
 
         # Store baseline metrics
         baseline_metrics = {
@@ -537,3 +545,99 @@ def optimize_bottlenecks(
     except Exception as e:
         logger.error(f"Failed to optimize bottlenecks: {e}")
         raise
+
+
+@celery_app.task(
+    bind=True,
+    base=BaseTask,
+    name="app.core.tasks.optimization.run_solve_job",
+    queue="optimization",
+    autoretry_for=(),  # A failed solve is recorded on the job, not retried
+    acks_late=True,
+)
+def run_solve_job(self: BaseTask, job_id: str) -> dict[str, Any]:
+    """
+    Solve a submitted Vulcan scheduling job.
+
+    Records progress, the final result or the failure on the durable solve
+    job, publishes events on the job's channel, and stops early when the job
+    is cancelled.
+
+    Args:
+        job_id: Solve job identifier
+
+    Returns:
+        Job id and final status
+    """
+    import redis
+
+    from app.services.solve_jobs import SolveJobProgress, SolveJobStore, solve_job_event
+    from app.services.vulcan_scheduling_service import VulcanSchedulingService
+
+    store = SolveJobStore()
+    job = store.start(UUID(job_id), worker_task_id=self.request.id)
+    if job is None:
+        logger.info(f"Solve job {job_id} is not queued any more, skipping")
+        return {"job_id": job_id, "status": "skipped"}
+
+    redis_client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    progress = SolveJobProgress(store, job.id, redis_client)
+    progress.publish(solve_job_event(job, "started"))
+    params = job.parameters
+
+    try:
+        service = VulcanSchedulingService(
+            {
+                "host": settings.POSTGRES_SERVER,
+                "database": settings.POSTGRES_DB,
+                "user": settings.POSTGRES_USER,
+                "password": settings.POSTGRES_PASSWORD,
+            }
+        )
+        service.num_search_workers = default_search_workers(
+            settings.CELERY_WORKER_CONCURRENCY
+        )
+        data = service.fetch_scheduling_data(params.get("job_ids"))
+        if not data["tasks"]:
+            raise ValueError("No tasks found to schedule")
+        service.create_scheduling_model(data, params.get("horizon_days", 14))
+
+        solution = service.solve(
+            params.get("time_limit_seconds", 60),
+            on_solution=progress,
+            should_stop=progress.cancel_requested,
+        )
+        progress.flush()
+        if not solution.scheduled_tasks:
+            raise ValueError(f"No schedule found (solver status {solution.status.value})")
+
+        job = store.finish(
+            job.id,
+            json.loads(solution.json()),
+            objective=solution.objective_value,
+            bound=service.solver.BestObjectiveBound(),
+            message=f"Solver status {solution.status.value}",
+        )
+        # Summary served by GET /schedule/{id}, like in-process solves
+        redis_client.setex(
+            f"schedule:result:{job_id}",
+            86400,  # 24 hours
+            json.dumps(
+                {
+                    "schedule_id": job_id,
+                    "status": solution.status.value,
+                    "makespan_minutes": solution.makespan_minutes,
+                    "scheduled_tasks": len(solution.scheduled_tasks),
+                    "solve_time": solution.solve_time_seconds,
+                },
+                default=str,
+            ),
+        )
+        progress.publish(solve_job_event(job, "finished"))
+
+    except Exception as e:
+        logger.error(f"Solve job {job_id} failed: {e}")
+        job = store.fail(job.id, str(e))
+        progress.publish(solve_job_event(job, "failed"))
+
+    return {"job_id": job_id, "status": job.status.value}
@@ -7,7 +7,9 @@ from celery import current_task
 
 from app.core.cache import CacheManager
 from app.core.celery_app import BaseTask, celery_app
+from app.core.config import settings
 from app.core.solver import HFFSScheduler
+from app.core.solver_admission import default_search_workers
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +49,10 @@ def schedule_job(
 
         # Initialize scheduler
         scheduler = HFFSScheduler()
+        # Every process of the worker may be solving at once
+        scheduler.num_search_workers = default_search_workers(
+            settings.CELERY_WORKER_CONCURRENCY
+        )
 
         # Update progress
         current_task.update_state(
@@ -8,18 +8,17 @@ incremental updates, and caching for large-scale scheduling.
 import asyncio
 import heapq
 import time
-from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Set, Tuple
 from uuid import UUID
 
-import numpy as np
-from numba import jit, prange
-
 from app.core.observability import get_logger, monitor_performance
 from app.infrastructure.cache.scheduling_cache import scheduling_cache
 
+from .incremental_cpm import CriticalSetChange, IncrementalCPM
+from .sparse_cpm import SparseTaskGraph
+
 # Initialize logger
 logger = get_logger(__name__)
 
@@ -59,7 +58,7 @@ class OptimizedCPMCalculator:
     Optimized Critical Path Method calculator with performance enhancements.
     
     Features:
-    - Parallel forward/backward pass using NumPy
+    - Vectorized forward/backward pass over a sparse (CSR) precedence graph
     - Incremental updates for schedule changes
     - Caching of intermediate results
     - Resource-constrained CPM variant
@@ -68,10 +67,8 @@ class OptimizedCPMCalculator:
     def __init__(self, enable_caching: bool = True, enable_parallel: bool = True):
         self.enable_caching = enable_caching
         self.enable_parallel = enable_parallel
-        self.task_index_map: Dict[UUID, int] = {}
-        self.index_task_map: Dict[int, UUID] = {}
-        self.adjacency_matrix: Optional[np.ndarray] = None
-        self.duration_vector: Optional[np.ndarray] = None
+        self.sparse_graph: Optional[SparseTaskGraph] = None
+        self.incremental: Optional[IncrementalCPM] = None
         self.cached_results: Dict[str, CriticalPathResult] = {}
     
     @monitor_performance("critical_path_calculation")
@@ -110,10 +107,8 @@ class OptimizedCPMCalculator:
         num_tasks = len(tasks)
         if num_tasks < 100:
             result = await self._calculate_small_graph(task_graph)
-        elif num_tasks < 1000 and self.enable_parallel:
-            result = await self._calculate_medium_graph_parallel(task_graph)
         else:
-            result = await self._calculate_large_graph_optimized(task_graph)
+            result = await self._calculate_sparse_graph(task_graph, dependencies)
         
         # Apply resource constraints if provided
         if resource_constraints:
@@ -186,88 +181,37 @@ class OptimizedCPMCalculator:
         # Build result
         return self._build_result(task_graph, critical_path, makespan, "standard_cpm")
     
-    async def _calculate_medium_graph_parallel(
+    async def _calculate_sparse_graph(
         self,
-        task_graph: Dict[UUID, TaskNode]
+        task_graph: Dict[UUID, TaskNode],
+        dependencies: Dict[UUID, Set[UUID]]
     ) -> CriticalPathResult:
-        """Parallel CPM for medium graphs (100-1000 tasks)."""
-        # Convert to matrix representation for parallel processing
-        self._build_matrix_representation(task_graph)
-        
-        # Parallel forward pass using NumPy
-        earliest_times = await self._parallel_forward_pass()
-        
-        # Get makespan
-        makespan = np.max(earliest_times)
-        
-        # Parallel backward pass
-        latest_times = await self._parallel_backward_pass(makespan)
+        """Vectorized CPM over a CSR precedence graph (>=100 tasks)."""
+        task_ids = list(task_graph.keys())
+        self.sparse_graph = SparseTaskGraph.from_dependencies(
+            task_ids,
+            [task_graph[task_id].duration for task_id in task_ids],
+            dependencies
+        )
+        cpm = self.sparse_graph.compute()
         
         # Update task graph with results
-        for i, task_id in self.index_task_map.items():
+        for i, task_id in enumerate(task_ids):
             task = task_graph[task_id]
-            task.earliest_finish = earliest_times[i]
-            task.earliest_start = earliest_times[i] - task.duration
-            task.latest_finish = latest_times[i]
-            task.latest_start = latest_times[i] - task.duration
-            task.total_float = task.latest_start - task.earliest_start
+            task.earliest_start = float(cpm.earliest_start[i])
+            task.earliest_finish = float(cpm.earliest_finish[i])
+            task.latest_start = float(cpm.latest_start[i])
+            task.latest_finish = float(cpm.latest_finish[i])
+            task.total_float = float(cpm.total_float[i])
+            task.is_critical = bool(cpm.critical_mask[i])
         
-        # Identify critical path
-        critical_path = self._identify_critical_path(task_graph)
-        
-        return self._build_result(task_graph, critical_path, makespan, "parallel_cpm")
-    
-    async def _calculate_large_graph_optimized(
-        self,
-        task_graph: Dict[UUID, TaskNode]
-    ) -> CriticalPathResult:
-        """Optimized CPM for large graphs (>1000 tasks)."""
-        # Use topological sort for efficient processing
-        sorted_tasks = self._topological_sort(task_graph)
-        
-        # Optimized forward pass with early termination
-        for task_id in sorted_tasks:
-            task = task_graph[task_id]
-            if task.predecessors:
-                max_pred_finish = max(
-                    task_graph[pred_id].earliest_finish
-                    for pred_id in task.predecessors
-                    if pred_id in task_graph
-                )
-                task.earliest_start = max_pred_finish
-            else:
-                task.earliest_start = 0
-            
-            task.earliest_finish = task.earliest_start + task.duration
-        
-        # Get makespan
-        makespan = max(task.earliest_finish for task in task_graph.values())
-        
-        # Optimized backward pass
-        for task_id in reversed(sorted_tasks):
-            task = task_graph[task_id]
-            if task.successors:
-                min_succ_start = min(
-                    task_graph[succ_id].latest_start
-                    for succ_id in task.successors
-                    if succ_id in task_graph
-                )
-                task.latest_finish = min_succ_start
-            else:
-                task.latest_finish = makespan
-            
-            task.latest_start = task.latest_finish - task.duration
-            task.total_float = task.latest_start - task.earliest_start
-            task.is_critical = abs(task.total_float) < 0.001  # Float tolerance
-        
-        # Extract critical path
-        critical_path = self._extract_critical_path_optimized(task_graph, sorted_tasks)
+        critical_path = [task_ids[i] for i in cpm.critical_path]
         
         return self._build_result(
             task_graph,
             critical_path,
-            makespan,
-            "optimized_topological_cpm"
+            cpm.makespan,
+            "sparse_cpm"
         )
     
     def _forward_pass(self, task_graph: Dict[UUID, TaskNode]):
@@ -374,178 +318,6 @@ class OptimizedCPMCalculator:
         
         return critical_path
     
-    def _topological_sort(self, task_graph: Dict[UUID, TaskNode]) -> List[UUID]:
-        """Perform topological sort for efficient processing."""
-        in_degree = defaultdict(int)
-        for task in task_graph.values():
-            for succ_id in task.successors:
-                in_degree[succ_id] += 1
-        
-        # Find all tasks with no predecessors
-        queue = deque([
-            task_id for task_id, task in task_graph.items()
-            if not task.predecessors
-        ])
-        
-        sorted_order = []
-        while queue:
-            task_id = queue.popleft()
-            sorted_order.append(task_id)
-            
-            # Reduce in-degree for successors
-            if task_id in task_graph:
-                for succ_id in task_graph[task_id].successors:
-                    in_degree[succ_id] -= 1
-                    if in_degree[succ_id] == 0:
-                        queue.append(succ_id)
-        
-        return sorted_order
-    
-    def _extract_critical_path_optimized(
-        self,
-        task_graph: Dict[UUID, TaskNode],
-        sorted_tasks: List[UUID]
-    ) -> List[UUID]:
-        """Extract critical path from sorted tasks efficiently."""
-        critical_path = []
-        
-        # Find first critical task
-        for task_id in sorted_tasks:
-            if task_graph[task_id].is_critical:
-                current_id = task_id
-                break
-        else:
-            return []
-        
-        # Build path forward
-        visited = set()
-        while current_id:
-            if current_id in visited:
-                break
-            
-            critical_path.append(current_id)
-            visited.add(current_id)
-            
-            # Find critical successor
-            current_task = task_graph[current_id]
-            next_id = None
-            
-            for succ_id in current_task.successors:
-                if succ_id in task_graph and task_graph[succ_id].is_critical:
-                    if succ_id not in visited:
-                        next_id = succ_id
-                        break
-            
-            current_id = next_id
-        
-        return critical_path
-    
-    def _build_matrix_representation(self, task_graph: Dict[UUID, TaskNode]):
-        """Build matrix representation for parallel processing."""
-        n = len(task_graph)
-        
-        # Create index mappings
-        self.task_index_map = {
-            task_id: i for i, task_id in enumerate(task_graph.keys())
-        }
-        self.index_task_map = {
-            i: task_id for task_id, i in self.task_index_map.items()
-        }
-        
-        # Create adjacency matrix
-        self.adjacency_matrix = np.zeros((n, n), dtype=np.int8)
-        
-        for task_id, task in task_graph.items():
-            i = self.task_index_map[task_id]
-            for pred_id in task.predecessors:
-                if pred_id in self.task_index_map:
-                    j = self.task_index_map[pred_id]
-                    self.adjacency_matrix[i, j] = 1
-        
-        # Create duration vector
-        self.duration_vector = np.array([
-            task_graph[self.index_task_map[i]].duration
-            for i in range(n)
-        ])
-    
-    async def _parallel_forward_pass(self) -> np.ndarray:
-        """Parallel forward pass using NumPy."""
-        n = len(self.duration_vector)
-        earliest_finish = np.zeros(n)
-        
-        # Process in levels (tasks with same dependency depth)
-        processed = np.zeros(n, dtype=bool)
-        
-        while not np.all(processed):
-            # Find tasks ready to process
-            ready = []
-            for i in range(n):
-                if not processed[i]:
-                    # Check if all predecessors are processed
-                    if np.all(processed[self.adjacency_matrix[i] == 1]):
-                        ready.append(i)
-            
-            if not ready:
-                break
-            
-            # Process ready tasks in parallel
-            ready_array = np.array(ready)
-            
-            # Calculate earliest start for each ready task
-            for i in ready_array:
-                pred_indices = np.where(self.adjacency_matrix[i] == 1)[0]
-                if len(pred_indices) > 0:
-                    earliest_finish[i] = (
-                        np.max(earliest_finish[pred_indices]) +
-                        self.duration_vector[i]
-                    )
-                else:
-                    earliest_finish[i] = self.duration_vector[i]
-            
-            processed[ready_array] = True
-        
-        return earliest_finish
-    
-    async def _parallel_backward_pass(self, makespan: float) -> np.ndarray:
-        """Parallel backward pass using NumPy."""
-        n = len(self.duration_vector)
-        latest_finish = np.full(n, makespan)
-        
-        # Process in reverse levels
-        processed = np.zeros(n, dtype=bool)
-        
-        # Transpose adjacency matrix for successor lookup
-        adj_transpose = self.adjacency_matrix.T
-        
-        while not np.all(processed):
-            # Find tasks ready to process
-            ready = []
-            for i in range(n):
-                if not processed[i]:
-                    # Check if all successors are processed
-                    if np.all(processed[adj_transpose[i] == 1]):
-                        ready.append(i)
-            
-            if not ready:
-                break
-            
-            # Process ready tasks in parallel
-            ready_array = np.array(ready)
-            
-            # Calculate latest finish for each ready task
-            for i in ready_array:
-                succ_indices = np.where(adj_transpose[i] == 1)[0]
-                if len(succ_indices) > 0:
-                    latest_finish[i] = np.min(
-                        latest_finish[succ_indices] - self.duration_vector[succ_indices]
-                    )
-                else:
-                    latest_finish[i] = makespan
-            
-            processed[ready_array] = True
-        
-        return latest_finish
-    
     async def _apply_resource_constraints(
         self,
         result: CriticalPathResult,
@@ -654,6 +426,49 @@ class OptimizedCPMCalculator:
         key_string = f"{task_data}:{dep_data}"
         return hashlib.md5(key_string.encode()).hexdigest()
     
+    def load_incremental(
+        self,
+        tasks: List[TaskNode],
+        dependencies: Dict[UUID, Set[UUID]]
+    ) -> IncrementalCPM:
+        """
+        Load a graph for incremental mode.
+        
+        Subsequent duration and dependency updates re-propagate only the
+        affected forward and backward cones instead of recomputing the graph.
+        """
+        self.incremental = IncrementalCPM.from_dependencies(
+            [task.task_id for task in tasks],
+            [task.duration for task in tasks],
+            dependencies
+        )
+        return self.incremental
+    
+    def update_task_duration(
+        self,
+        task_id: UUID,
+        duration: float
+    ) -> CriticalSetChange:
+        """Incrementally apply a task duration change."""
+        return self._require_incremental().update_duration(task_id, duration)
+    
+    def add_dependency(self, predecessor_id: UUID, task_id: UUID) -> CriticalSetChange:
+        """Incrementally add a precedence edge (raises ValueError on a cycle)."""
+        return self._require_incremental().add_edge(predecessor_id, task_id)
+    
+    def remove_dependency(
+        self,
+        predecessor_id: UUID,
+        task_id: UUID
+    ) -> CriticalSetChange:
+        """Incrementally remove a precedence edge."""
+        return self._require_incremental().remove_edge(predecessor_id, task_id)
+    
+    def _require_incremental(self) -> IncrementalCPM:
+        if self.incremental is None:
+            raise RuntimeError("No graph loaded; call load_incremental() first")
+        return self.incremental
+    
     def invalidate_cache(self, pattern: Optional[str] = None):
         """Invalidate cached results."""
         if pattern:
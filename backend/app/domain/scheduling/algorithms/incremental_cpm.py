@@ -0,0 +1,253 @@
+"""
+Incremental Critical Path Method
+
+Keeps CPM values for a loaded precedence graph and repairs them after a single
+duration change or edge insertion/removal by re-propagating only the affected
+forward and backward cones.
+
+Each task carries a *head* (earliest start) and a *tail* (longest path from its
+start to the project end, its own duration included). A change to task ``t``
+only alters heads in the forward cone of ``t`` and tails in its backward cone.
+Latest times follow from ``latest_start = makespan - tail``, so a makespan shift
+never forces a full backward pass.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from uuid import UUID
+
+import numpy as np
+
+from .sparse_cpm import FLOAT_TOLERANCE, SparseTaskGraph
+
+
+@dataclass
+class CriticalSetChange:
+    """Outcome of one incremental update."""
+
+    added: list[UUID | int] = field(default_factory=list)
+    removed: list[UUID | int] = field(default_factory=list)
+    makespan_before: float = 0.0
+    makespan_after: float = 0.0
+    tasks_repropagated: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed) or (
+            abs(self.makespan_after - self.makespan_before) > FLOAT_TOLERANCE
+        )
+
+
+class IncrementalCPM:
+    """
+    Mutable CPM state over a task graph.
+
+    Topological positions are maintained dynamically (Pearce-Kelly) so cone
+    propagation can process tasks in a valid order after edges are added.
+    """
+
+    def __init__(
+        self, graph: SparseTaskGraph, release_times: np.ndarray | None = None
+    ):
+        n = graph.num_tasks
+        self.task_ids = graph.task_ids
+        self.index_of = graph.index_of
+        self.durations = graph.durations.copy()
+        self.release = (
+            np.zeros(n)
+            if release_times is None
+            else np.asarray(release_times, dtype=np.float64).copy()
+        )
+        self.successors: list[set[int]] = [set() for _ in range(n)]
+        self.predecessors: list[set[int]] = [set() for _ in range(n)]
+        for u, v in zip(graph.edge_src.tolist(), graph.edge_dst.tolist()):
+            self.successors[u].add(v)
+            self.predecessors[v].add(u)
+        self.position = graph.position.copy()
+
+        self.head, _ = graph.forward_pass(self.release)
+        self.makespan = float((self.head + self.durations).max()) if n else 0.0
+        latest_start, _ = graph.backward_pass(self.makespan)
+        self.tail = self.makespan - latest_start
+        self.critical_mask = self._critical_mask()
+
+    @classmethod
+    def from_dependencies(
+        cls,
+        task_ids: list[UUID],
+        durations: list[float],
+        dependencies: dict[UUID, set[UUID]],
+    ) -> "IncrementalCPM":
+        return cls(SparseTaskGraph.from_dependencies(task_ids, durations, dependencies))
+
+    # ------------------------------------------------------------------
+    # Derived values
+    # ------------------------------------------------------------------
+
+    @property
+    def earliest_start(self) -> np.ndarray:
+        return self.head
+
+    @property
+    def earliest_finish(self) -> np.ndarray:
+        return self.head + self.durations
+
+    @property
+    def latest_start(self) -> np.ndarray:
+        return self.makespan - self.tail
+
+    @property
+    def latest_finish(self) -> np.ndarray:
+        return self.makespan - self.tail + self.durations
+
+    @property
+    def total_float(self) -> np.ndarray:
+        return self.makespan - self.tail - self.head
+
+    def critical_tasks(self) -> list[UUID | int]:
+        return self._labels(np.flatnonzero(self.critical_mask))
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def update_duration(self, task: UUID | int, duration: float) -> CriticalSetChange:
+        """Change one task's duration and repair the affected cones."""
+        t = self._index(task)
+        self.durations[t] = float(duration)
+        touched = self._propagate_heads(self.successors[t])
+        touched += self._propagate_tails([t])
+        return self._finish_update(touched)
+
+    def add_edge(self, pred: UUID | int, succ: UUID | int) -> CriticalSetChange:
+        """Insert precedence ``pred -> succ``; raises ValueError on a cycle."""
+        u, v = self._index(pred), self._index(succ)
+        if v in self.successors[u]:
+            return self._finish_update(0)
+        if self.position[u] > self.position[v]:
+            self._reorder(u, v)
+        self.successors[u].add(v)
+        self.predecessors[v].add(u)
+        touched = self._propagate_heads([v]) + self._propagate_tails([u])
+        return self._finish_update(touched)
+
+    def remove_edge(self, pred: UUID | int, succ: UUID | int) -> CriticalSetChange:
+        """Remove precedence ``pred -> succ`` if present."""
+        u, v = self._index(pred), self._index(succ)
+        if v not in self.successors[u]:
+            return self._finish_update(0)
+        self.successors[u].discard(v)
+        self.predecessors[v].discard(u)
+        touched = self._propagate_heads([v]) + self._propagate_tails([u])
+        return self._finish_update(touched)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _propagate_heads(self, seeds: "list[int] | set[int]") -> int:
+        """Recompute heads over the forward cone of ``seeds`` in topological order."""
+        heap = [(self.position[s], s) for s in seeds]
+        heapq.heapify(heap)
+        queued = set(seeds)
+        touched = 0
+
+        while heap:
+            _, node = heapq.heappop(heap)
+            queued.discard(node)
+            touched += 1
+            head = max(
+                (self.head[p] + self.durations[p] for p in self.predecessors[node]),
+                default=self.release[node],
+            )
+            head = max(head, self.release[node])
+            if abs(head - self.head[node]) <= FLOAT_TOLERANCE:
+                continue
+            self.head[node] = head
+            for succ in self.successors[node]:
+                if succ not in queued:
+                    queued.add(succ)
+                    heapq.heappush(heap, (self.position[succ], succ))
+        return touched
+
+    def _propagate_tails(self, seeds: "list[int] | set[int]") -> int:
+        """Recompute tails over the backward cone of ``seeds`` in reverse order."""
+        heap = [(-self.position[s], s) for s in seeds]
+        heapq.heapify(heap)
+        queued = set(seeds)
+        touched = 0
+
+        while heap:
+            _, node = heapq.heappop(heap)
+            queued.discard(node)
+            touched += 1
+            tail = self.durations[node] + max(
+                (self.tail[s] for s in self.successors[node]), default=0.0
+            )
+            if abs(tail - self.tail[node]) <= FLOAT_TOLERANCE:
+                continue
+            self.tail[node] = tail
+            for pred in self.predecessors[node]:
+                if pred not in queued:
+                    queued.add(pred)
+                    heapq.heappush(heap, (-self.position[pred], pred))
+        return touched
+
+    def _reorder(self, u: int, v: int) -> None:
+        """Pearce-Kelly repair of topological positions before adding u -> v."""
+        lower, upper = self.position[v], self.position[u]
+
+        forward: list[int] = []
+        stack, seen = [v], {v}
+        while stack:
+            node = stack.pop()
+            if node == u:
+                raise ValueError("Adding this dependency would create a cycle")
+            forward.append(node)
+            for succ in self.successors[node]:
+                if succ not in seen and self.position[succ] <= upper:
+                    seen.add(succ)
+                    stack.append(succ)
+
+        backward: list[int] = []
+        stack, seen = [u], {u}
+        while stack:
+            node = stack.pop()
+            backward.append(node)
+            for pred in self.predecessors[node]:
+                if pred not in seen and self.position[pred] >= lower:
+                    seen.add(pred)
+                    stack.append(pred)
+
+        backward.sort(key=lambda node: self.position[node])
+        forward.sort(key=lambda node: self.position[node])
+        slots = sorted(self.position[node] for node in backward + forward)
+        for node, slot in zip(backward + forward, slots):
+            self.position[node] = slot
+
+    def _critical_mask(self) -> np.ndarray:
+        return np.abs(self.makespan - self.tail - self.head) <= FLOAT_TOLERANCE
+
+    def _finish_update(self, touched: int) -> CriticalSetChange:
+        makespan_before = self.makespan
+        self.makespan = float((self.head + self.tail).max()) if len(self.head) else 0.0
+        previous = self.critical_mask
+        self.critical_mask = self._critical_mask()
+
+        return CriticalSetChange(
+            added=self._labels(np.flatnonzero(self.critical_mask & ~previous)),
+            removed=self._labels(np.flatnonzero(previous & ~self.critical_mask)),
+            makespan_before=makespan_before,
+            makespan_after=self.makespan,
+            tasks_repropagated=touched,
+        )
+
+    def _index(self, task: UUID | int) -> int:
+        if isinstance(task, UUID):
+            return self.index_of[task]
+        return int(task)
+
+    def _labels(self, indices: np.ndarray) -> list[UUID | int]:
+        if self.task_ids:
+            return [self.task_ids[i] for i in indices]
+        return [int(i) for i in indices]
@@ -0,0 +1,269 @@
+"""
+Sparse Critical Path Method Engine
+
+Compressed sparse row (CSR) precedence graph with a level-synchronous Kahn sweep.
+All passes are vectorized with NumPy: memory is linear in the number of edges and
+each pass does O(tasks + edges) work plus a constant number of array operations
+per topological level.
+"""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+import numpy as np
+
+# Tolerance used when comparing floating point schedule times
+FLOAT_TOLERANCE = 1e-6
+
+
+def _expand_segments(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Concatenate ranges [starts[i], starts[i] + counts[i]) into one index array."""
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.cumsum(counts) - counts
+    return np.repeat(starts - offsets, counts) + np.arange(total, dtype=np.int64)
+
+
+def _build_csr(
+    num_nodes: int, keys: np.ndarray, values: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Group ``values`` by ``keys`` into CSR (pointer, index) arrays."""
+    ptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=num_nodes), out=ptr[1:])
+    return ptr, values[np.argsort(keys, kind="stable")]
+
+
+@dataclass
+class SparseCPMResult:
+    """Per-task CPM times, indexed like the graph's task arrays."""
+
+    earliest_start: np.ndarray
+    earliest_finish: np.ndarray
+    latest_start: np.ndarray
+    latest_finish: np.ndarray
+    total_float: np.ndarray
+    critical_mask: np.ndarray
+    critical_path: list[int]
+    makespan: float
+
+
+class SparseTaskGraph:
+    """
+    Precedence graph stored as CSR successor and predecessor lists.
+
+    Tasks are addressed by dense integer index; ``task_ids`` optionally maps
+    indices back to domain identifiers. The topological level structure is
+    computed once on construction and reused by every forward/backward pass.
+    """
+
+    def __init__(
+        self,
+        durations: np.ndarray,
+        edge_src: np.ndarray,
+        edge_dst: np.ndarray,
+        task_ids: list[UUID] | None = None,
+    ):
+        self.durations = np.asarray(durations, dtype=np.float64)
+        self.num_tasks = len(self.durations)
+        self.edge_src = np.asarray(edge_src, dtype=np.int64)
+        self.edge_dst = np.asarray(edge_dst, dtype=np.int64)
+        self.task_ids = task_ids
+        self.index_of: dict[UUID, int] = (
+            {task_id: i for i, task_id in enumerate(task_ids)} if task_ids else {}
+        )
+
+        n = self.num_tasks
+        self.succ_ptr, self.succ_idx = _build_csr(n, self.edge_src, self.edge_dst)
+        self.pred_ptr, self.pred_idx = _build_csr(n, self.edge_dst, self.edge_src)
+        self._build_levels()
+
+    @classmethod
+    def from_dependencies(
+        cls,
+        task_ids: list[UUID],
+        durations: list[float],
+        dependencies: dict[UUID, set[UUID]],
+    ) -> "SparseTaskGraph":
+        """
+        Build a graph from ``task_id -> predecessor ids`` mappings.
+
+        Predecessors that are not among ``task_ids`` are ignored.
+        """
+        index_of = {task_id: i for i, task_id in enumerate(task_ids)}
+        src: list[int] = []
+        dst: list[int] = []
+        for task_id, predecessors in dependencies.items():
+            target = index_of.get(task_id)
+            if target is None:
+                continue
+            for pred_id in predecessors:
+                source = index_of.get(pred_id)
+                if source is not None:
+                    src.append(source)
+                    dst.append(target)
+        return cls(
+            np.asarray(durations, dtype=np.float64),
+            np.asarray(src, dtype=np.int64),
+            np.asarray(dst, dtype=np.int64),
+            task_ids=list(task_ids),
+        )
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.edge_src)
+
+    @property
+    def num_levels(self) -> int:
+        return len(self.level_ptr) - 1
+
+    def _build_levels(self) -> None:
+        """Kahn sweep that peels one whole frontier (topological level) at a time."""
+        n = self.num_tasks
+        in_degree = np.diff(self.pred_ptr).copy()
+        frontier = np.flatnonzero(in_degree == 0)
+        chunks: list[np.ndarray] = []
+        level_ptr = [0]
+
+        while frontier.size:
+            chunks.append(frontier)
+            level_ptr.append(level_ptr[-1] + frontier.size)
+
+            starts = self.succ_ptr[frontier]
+            targets = self.succ_idx[
+                _expand_segments(starts, self.succ_ptr[frontier + 1] - starts)
+            ]
+            if targets.size == 0:
+                break
+            touched, counts = np.unique(targets, return_counts=True)
+            in_degree[touched] -= counts
+            frontier = touched[in_degree[touched] == 0]
+
+        if level_ptr[-1] != n:
+            raise ValueError("Precedence graph contains a cycle")
+
+        self.order = np.concatenate(chunks) if chunks else np.empty(0, np.int64)
+        self.level_ptr = np.asarray(level_ptr, dtype=np.int64)
+        self.position = np.empty(n, dtype=np.int64)
+        self.position[self.order] = np.arange(n, dtype=np.int64)
+
+        # Edge lists re-grouped so each level owns a contiguous slice
+        pred_counts = np.diff(self.pred_ptr)[self.order]
+        self._pred_by_order = self.pred_idx[
+            _expand_segments(self.pred_ptr[self.order], pred_counts)
+        ]
+        self._pred_order_ptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(pred_counts, out=self._pred_order_ptr[1:])
+
+        succ_counts = np.diff(self.succ_ptr)[self.order]
+        self._succ_by_order = self.succ_idx[
+            _expand_segments(self.succ_ptr[self.order], succ_counts)
+        ]
+        self._succ_order_ptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(succ_counts, out=self._succ_order_ptr[1:])
+
+    def forward_pass(
+        self, release_times: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Earliest start/finish for every task."""
+        earliest_start = (
+            np.zeros(self.num_tasks)
+            if release_times is None
+            else np.asarray(release_times, dtype=np.float64).copy()
+        )
+        earliest_finish = np.empty(self.num_tasks)
+        ptr = self._pred_order_ptr
+
+        for level in range(self.num_levels):
+            lo, hi = self.level_ptr[level], self.level_ptr[level + 1]
+            nodes = self.order[lo:hi]
+            edge_lo, edge_hi = ptr[lo], ptr[hi]
+            if edge_hi > edge_lo:
+                has_preds = ptr[lo + 1 : hi + 1] > ptr[lo:hi]
+                targets = nodes[has_preds]
+                finishes = earliest_finish[self._pred_by_order[edge_lo:edge_hi]]
+                segments = ptr[lo:hi][has_preds] - edge_lo
+                earliest_start[targets] = np.maximum(
+                    earliest_start[targets], np.maximum.reduceat(finishes, segments)
+                )
+            earliest_finish[nodes] = earliest_start[nodes] + self.durations[nodes]
+
+        return earliest_start, earliest_finish
+
+    def backward_pass(
+        self, makespan: float, deadlines: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Latest start/finish for every task given a project finish time."""
+        latest_finish = np.full(self.num_tasks, float(makespan))
+        if deadlines is not None:
+            latest_finish = np.minimum(latest_finish, deadlines)
+        latest_start = np.empty(self.num_tasks)
+        ptr = self._succ_order_ptr
+
+        for level in range(self.num_levels - 1, -1, -1):
+            lo, hi = self.level_ptr[level], self.level_ptr[level + 1]
+            nodes = self.order[lo:hi]
+            edge_lo, edge_hi = ptr[lo], ptr[hi]
+            if edge_hi > edge_lo:
+                has_succs = ptr[lo + 1 : hi + 1] > ptr[lo:hi]
+                sources = nodes[has_succs]
+                starts = latest_start[self._succ_by_order[edge_lo:edge_hi]]
+                segments = ptr[lo:hi][has_succs] - edge_lo
+                latest_finish[sources] = np.minimum(
+                    latest_finish[sources], np.minimum.reduceat(starts, segments)
+                )
+            latest_start[nodes] = latest_finish[nodes] - self.durations[nodes]
+
+        return latest_start, latest_finish
+
+    def compute(self, release_times: np.ndarray | None = None) -> SparseCPMResult:
+        """Run forward and backward passes and classify critical tasks."""
+        earliest_start, earliest_finish = self.forward_pass(release_times)
+        makespan = float(earliest_finish.max()) if self.num_tasks else 0.0
+        latest_start, latest_finish = self.backward_pass(makespan)
+        total_float = latest_start - earliest_start
+        critical_mask = np.abs(total_float) <= FLOAT_TOLERANCE
+
+        return SparseCPMResult(
+            earliest_start=earliest_start,
+            earliest_finish=earliest_finish,
+            latest_start=latest_start,
+            latest_finish=latest_finish,
+            total_float=total_float,
+            critical_mask=critical_mask,
+            critical_path=self.critical_path(
+                earliest_start, earliest_finish, critical_mask
+            ),
+            makespan=makespan,
+        )
+
+    def critical_path(
+        self,
+        earliest_start: np.ndarray,
+        earliest_finish: np.ndarray,
+        critical_mask: np.ndarray,
+    ) -> list[int]:
+        """Walk one chain of tight critical edges from a critical source task."""
+        if not critical_mask.any():
+            return []
+
+        # Prefer the earliest critical task in topological order
+        critical_in_order = self.order[critical_mask[self.order]]
+        current = int(critical_in_order[0])
+        path = [current]
+
+        while True:
+            successors = self.succ_idx[
+                self.succ_ptr[current] : self.succ_ptr[current + 1]
+            ]
+            tight = successors[
+                critical_mask[successors]
+                & (
+                    np.abs(earliest_start[successors] - earliest_finish[current])
+                    <= FLOAT_TOLERANCE
+                )
+            ]
+            if tight.size == 0:
+                return path
+            current = int(tight[0])
+            path.append(current)
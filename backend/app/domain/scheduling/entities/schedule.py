@@ -5,7 +5,8 @@ Represents a production schedule that assigns tasks to machines and operators
 over time. Acts as the aggregate root for scheduling operations.
 """
 
-from datetime import datetime
+from bisect import bisect_left
+from datetime import datetime, timedelta
 from enum import Enum
 from uuid import UUID, uuid4
 
@@ -62,6 +63,59 @@ class ScheduleAssignment:
         )
 
 
+class ResourceTimeline:
+    """
+    Assignments kept ordered by start time for one resource (or the whole
+    schedule).
+
+    Lookups bisect on start time. Overlap queries start from
+    ``window_start - longest_assignment`` so they cost O(log n) plus the
+    number of candidate assignments.
+    """
+
+    def __init__(self) -> None:
+        self._keys: list[tuple[datetime, UUID]] = []
+        self._assignments: list[ScheduleAssignment] = []
+        self._longest = timedelta(0)
+
+    def __len__(self) -> int:
+        return len(self._assignments)
+
+    def add(self, assignment: ScheduleAssignment) -> None:
+        """Insert an assignment at its start-time position."""
+        key = (assignment.start_time, assignment.task_id)
+        index = bisect_left(self._keys, key)
+        self._keys.insert(index, key)
+        self._assignments.insert(index, assignment)
+        self._longest = max(self._longest, assignment.end_time - assignment.start_time)
+
+    def remove(self, assignment: ScheduleAssignment) -> None:
+        """Remove an assignment if present."""
+        key = (assignment.start_time, assignment.task_id)
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            del self._keys[index]
+            del self._assignments[index]
+
+    def all(self) -> list[ScheduleAssignment]:
+        """All assignments sorted by start time."""
+        return self._assignments.copy()
+
+    def overlapping(self, start: datetime, end: datetime) -> list[ScheduleAssignment]:
+        """Assignments with start_time < end and end_time > start."""
+        lo = bisect_left(self._keys, (start - self._longest,))
+        hi = bisect_left(self._keys, (end,))
+        return [a for a in self._assignments[lo:hi] if a.end_time > start]
+
+    def adjacent_overlaps(self) -> list[tuple[ScheduleAssignment, ScheduleAssignment]]:
+        """Consecutive assignment pairs that overlap in time."""
+        return [
+            (current, following)
+            for current, following in zip(self._assignments, self._assignments[1:])
+            if current.end_time > following.start_time
+        ]
+
+
 class Schedule:
     """
     A production schedule that assigns tasks to resources over time.
@@ -97,6 +151,11 @@ class Schedule:
         self._assignments: dict[UUID, ScheduleAssignment] = {}  # task_id -> assignment
         self._job_ids: set[UUID] = set()  # Jobs included in this schedule
 
+        # Time-ordered indexes, maintained by assign_task/unassign_task
+        self._machine_timeline: dict[UUID, ResourceTimeline] = {}
+        self._operator_timeline: dict[UUID, ResourceTimeline] = {}
+        self._timeline = ResourceTimeline()
+
         # Schedule properties
         self._status = ScheduleStatus.DRAFT
         self._start_date: datetime | None = None
@@ -266,7 +325,12 @@ class Schedule:
             processing_duration=processing_duration,
         )
 
+        previous = self._assignments.get(task_id)
+        if previous is not None:
+            self._unindex_assignment(previous)
+
         self._assignments[task_id] = assignment
+        self._index_assignment(assignment)
         self._update_schedule_bounds(start_time, end_time)
         self._mark_updated()
 
@@ -280,9 +344,33 @@ class Schedule:
         if self._status not in [ScheduleStatus.DRAFT]:
             raise ValueError("Cannot modify published schedule")
 
-        self._assignments.pop(task_id, None)
+        assignment = self._assignments.pop(task_id, None)
+        if assignment is not None:
+            self._unindex_assignment(assignment)
         self._mark_updated()
 
+    def _index_assignment(self, assignment: ScheduleAssignment) -> None:
+        """Add an assignment to the machine, operator and global timelines."""
+        self._machine_timeline.setdefault(
+            assignment.machine_id, ResourceTimeline()
+        ).add(assignment)
+        for operator_id in assignment.operator_ids:
+            self._operator_timeline.setdefault(operator_id, ResourceTimeline()).add(
+                assignment
+            )
+        self._timeline.add(assignment)
+
+    def _unindex_assignment(self, assignment: ScheduleAssignment) -> None:
+        """Remove an assignment from all timelines."""
+        timeline = self._machine_timeline.get(assignment.machine_id)
+        if timeline is not None:
+            timeline.remove(assignment)
+        for operator_id in assignment.operator_ids:
+            timeline = self._operator_timeline.get(operator_id)
+            if timeline is not None:
+                timeline.remove(assignment)
+        self._timeline.remove(assignment)
+
     def get_assignment(self, task_id: UUID) -> ScheduleAssignment | None:
         """
         Get assignment for a specific task.
@@ -305,12 +393,8 @@ class Schedule:
         Returns:
             List of assignments for this machine, sorted by start time
         """
-        machine_assignments = [
-            assignment
-            for assignment in self._assignments.values()
-            if assignment.machine_id == machine_id
-        ]
-        return sorted(machine_assignments, key=lambda a: a.start_time)
+        timeline = self._machine_timeline.get(machine_id)
+        return timeline.all() if timeline else []
 
     def get_assignments_for_operator(
         self, operator_id: UUID
@@ -324,12 +408,8 @@ class Schedule:
         Returns:
             List of assignments for this operator, sorted by start time
         """
-        operator_assignments = [
-            assignment
-            for assignment in self._assignments.values()
-            if operator_id in assignment.operator_ids
-        ]
-        return sorted(operator_assignments, key=lambda a: a.start_time)
+        timeline = self._operator_timeline.get(operator_id)
+        return timeline.all() if timeline else []
 
     def get_assignments_in_time_window(
         self, start: datetime, end: datetime
@@ -342,13 +422,43 @@ class Schedule:
             end: Window end time
 
         Returns:
-            List of assignments in the time window
+            List of assignments in the time window, sorted by start time
         """
-        return [
-            assignment
-            for assignment in self._assignments.values()
-            if (assignment.start_time < end and assignment.end_time > start)
-        ]
+        return self._timeline.overlapping(start, end)
+
+    def get_machine_assignments_in_time_window(
+        self, machine_id: UUID, start: datetime, end: datetime
+    ) -> list[ScheduleAssignment]:
+        """
+        Get assignments on one machine that overlap a time window.
+
+        Args:
+            machine_id: Machine to query
+            start: Window start time
+            end: Window end time
+
+        Returns:
+            List of overlapping assignments, sorted by start time
+        """
+        timeline = self._machine_timeline.get(machine_id)
+        return timeline.overlapping(start, end) if timeline else []
+
+    def get_operator_assignments_in_time_window(
+        self, operator_id: UUID, start: datetime, end: datetime
+    ) -> list[ScheduleAssignment]:
+        """
+        Get assignments for one operator that overlap a time window.
+
+        Args:
+            operator_id: Operator to query
+            start: Window start time
+            end: Window end time
+
+        Returns:
+            List of overlapping assignments, sorted by start time
+        """
+        timeline = self._operator_timeline.get(operator_id)
+        return timeline.overlapping(start, end) if timeline else []
 
     def validate_constraints(self) -> list[str]:
         """
@@ -375,56 +485,27 @@ class Schedule:
     def _check_machine_conflicts(self) -> list[str]:
         """Check for machine double-booking."""
         violations = []
-        machine_assignments = {}
-
-        # Group assignments by machine
-        for assignment in self._assignments.values():
-            machine_id = assignment.machine_id
-            if machine_id not in machine_assignments:
-                machine_assignments[machine_id] = []
-            machine_assignments[machine_id].append(assignment)
-
-        # Check for overlaps on each machine
-        for machine_id, assignments in machine_assignments.items():
-            sorted_assignments = sorted(assignments, key=lambda a: a.start_time)
 
-            for i in range(len(sorted_assignments) - 1):
-                current = sorted_assignments[i]
-                next_assignment = sorted_assignments[i + 1]
-
-                if current.end_time > next_assignment.start_time:
-                    violations.append(
-                        f"Machine {machine_id} double-booked: tasks {current.task_id} "
-                        f"and {next_assignment.task_id} overlap"
-                    )
+        # Timelines are already sorted, so only neighbours need comparing
+        for machine_id, timeline in self._machine_timeline.items():
+            for current, next_assignment in timeline.adjacent_overlaps():
+                violations.append(
+                    f"Machine {machine_id} double-booked: tasks {current.task_id} "
+                    f"and {next_assignment.task_id} overlap"
+                )
 
         return violations
 
     def _check_operator_conflicts(self) -> list[str]:
         """Check for operator double-booking."""
         violations = []
-        operator_assignments = {}
 
-        # Group assignments by operator
-        for assignment in self._assignments.values():
-            for operator_id in assignment.operator_ids:
-                if operator_id not in operator_assignments:
-                    operator_assignments[operator_id] = []
-                operator_assignments[operator_id].append(assignment)
-
-        # Check for overlaps for each operator
-        for operator_id, assignments in operator_assignments.items():
-            sorted_assignments = sorted(assignments, key=lambda a: a.start_time)
-
-            for i in range(len(sorted_assignments) - 1):
-                current = sorted_assignments[i]
-                next_assignment = sorted_assignments[i + 1]
-
-                if current.end_time > next_assignment.start_time:
-                    violations.append(
-                        f"Operator {operator_id} double-booked: tasks {current.task_id} "
-                        f"and {next_assignment.task_id} overlap"
-                    )
+        for operator_id, timeline in self._operator_timeline.items():
+            for current, next_assignment in timeline.adjacent_overlaps():
+                violations.append(
+                    f"Operator {operator_id} double-booked: tasks {current.task_id} "
+                    f"and {next_assignment.task_id} overlap"
+                )
 
         return violations
 
@@ -5,22 +5,37 @@ Provides constraint programming models using CP-SAT solver for optimal
 task scheduling, resource allocation, and production planning.
 """
 
-from .cp_sat_scheduler import CPSATScheduler, SchedulingProblem, OptimizationResult
+from .cp_sat_scheduler import (
+    CPSATScheduler,
+    SchedulingProblem,
+    ScheduleHint,
+    OptimizationResult,
+)
 from .constraint_models import (
     ResourceConstraints,
     TemporalConstraints, 
     SkillConstraints,
     OptimizationObjective
 )
+from .decomposition import DecomposedScheduler, DecompositionConfig
+from .lns import LargeNeighborhoodSearch, LNSConfig
 from .optimization_service import SchedulingOptimizationService
+from .rolling_horizon import RollingHorizonConfig, RollingHorizonScheduler
 
 __all__ = [
     "CPSATScheduler",
     "SchedulingProblem",
+    "ScheduleHint",
     "OptimizationResult",
     "ResourceConstraints",
     "TemporalConstraints",
     "SkillConstraints", 
     "OptimizationObjective",
     "SchedulingOptimizationService",
+    "LargeNeighborhoodSearch",
+    "LNSConfig",
+    "DecomposedScheduler",
+    "DecompositionConfig",
+    "RollingHorizonConfig",
+    "RollingHorizonScheduler",
 ]
\ No newline at end of file
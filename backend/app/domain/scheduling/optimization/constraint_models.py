@@ -13,6 +13,9 @@ from enum import Enum
 from pydantic import BaseModel, Field
 from ortools.sat.python import cp_model
 
+from ....core.solver_bounds import TimeBounds
+from ....core.solver_redundancy import add_resource_group
+
 
 class ConstraintType(str, Enum):
     """Types of constraints in the scheduling problem."""
@@ -381,47 +384,136 @@ class CPSATConstraintBuilder:
     def __init__(self, model: cp_model.CpModel):
         self.model = model
         self.variables = {}  # Store created variables
+        self.horizon = 0  # Upper bound of task time variables
+        self.makespan_lower_bound = 0
     
     def create_task_variables(
         self,
         task_ids: List[UUID],
         horizon: int,
-        durations: Dict[UUID, int]
+        durations: Dict[UUID, int],
+        bounds: Optional[TimeBounds] = None
     ) -> Dict[UUID, Tuple[cp_model.IntVar, cp_model.IntVar, cp_model.IntervalVar]]:
-        """Create start, end, and interval variables for tasks."""
+        """
+        Create start, end, and interval variables for tasks.
+        
+        With ``bounds`` start and end domains are narrowed to each task's
+        earliest start and latest end, and the makespan to its lower bound.
+        """
         task_vars = {}
+        self.horizon = horizon
+        if bounds is not None:
+            self.makespan_lower_bound = min(bounds.makespan_lower_bound, horizon)
         
         for task_id in task_ids:
             duration = durations.get(task_id, 60)  # Default 1 hour
+            start_domain, end_domain = (0, horizon), (0, horizon)
+            if bounds is not None and task_id in bounds.durations:
+                earliest, latest = bounds.earliest_start[task_id], bounds.latest_start(task_id)
+                # Conflicting bounds keep the full domain; the constraints
+                # then prove the problem infeasible
+                if 0 <= earliest <= latest and latest + duration <= horizon:
+                    start_domain = (earliest, latest)
+                    end_domain = (earliest + duration, latest + duration)
             
-            start_var = self.model.NewIntVar(0, horizon, f'start_{task_id}')
-            end_var = self.model.NewIntVar(0, horizon, f'end_{task_id}')
+            start_var = self.model.NewIntVar(*start_domain, f'start_{task_id}')
+            end_var = self.model.NewIntVar(*end_domain, f'end_{task_id}')
             interval_var = self.model.NewIntervalVar(start_var, duration, end_var, f'interval_{task_id}')
             
             task_vars[task_id] = (start_var, end_var, interval_var)
         
         return task_vars
     
-    def add_resource_constraints(
+    def add_resource_choices(
         self,
         task_vars: Dict[UUID, Tuple[cp_model.IntVar, cp_model.IntVar, cp_model.IntervalVar]],
-        resource_constraints: ResourceConstraints,
-        task_assignments: Dict[UUID, UUID]  # task_id -> resource_id
-    ) -> None:
-        """Add resource capacity constraints to the model."""
-        
-        # Group tasks by assigned resource
-        resource_tasks = {}
-        for task_id, resource_id in task_assignments.items():
-            if resource_id not in resource_tasks:
-                resource_tasks[resource_id] = []
-            resource_tasks[resource_id].append(task_id)
-        
-        # Add no-overlap constraints for each resource
-        for resource_id, assigned_tasks in resource_tasks.items():
-            if len(assigned_tasks) > 1:
-                intervals = [task_vars[task_id][2] for task_id in assigned_tasks]
+        durations: Dict[UUID, int],
+        candidates: Dict[UUID, List[UUID]],  # task_id -> eligible resource_ids
+        capacities: Dict[UUID, int],  # resource_id -> concurrent tasks
+        prefix: str
+    ) -> Dict[UUID, List[Tuple[UUID, cp_model.IntVar]]]:
+        """
+        Let the solver pick one resource per task among its candidates.
+        
+        Every candidate gets an optional copy of the task interval, exactly one
+        of which is present, and each resource runs at most its capacity of
+        present intervals at a time. Returns task_id -> [(resource_id, presence)].
+        """
+        choices = {}
+        resource_intervals: Dict[UUID, List[cp_model.IntervalVar]] = {}
+        
+        for task_id, resource_ids in candidates.items():
+            if not resource_ids or task_id not in task_vars:
+                continue
+            start_var, end_var, interval_var = task_vars[task_id]
+            
+            if len(resource_ids) == 1:
+                # A single candidate uses the task interval itself
+                resource_id = resource_ids[0]
+                choices[task_id] = [(resource_id, self.model.NewConstant(1))]
+                resource_intervals.setdefault(resource_id, []).append(interval_var)
+                continue
+            
+            options = []
+            for resource_id in resource_ids:
+                presence = self.model.NewBoolVar(f'{prefix}_{task_id}_{resource_id}')
+                optional_interval = self.model.NewOptionalIntervalVar(
+                    start_var,
+                    durations.get(task_id, 60),
+                    end_var,
+                    presence,
+                    f'{prefix}_interval_{task_id}_{resource_id}'
+                )
+                options.append((resource_id, presence))
+                resource_intervals.setdefault(resource_id, []).append(optional_interval)
+            self.model.AddExactlyOne(presence for _, presence in options)
+            choices[task_id] = options
+        
+        # Capacity of each resource over the intervals that may run on it
+        for resource_id, intervals in resource_intervals.items():
+            if len(intervals) < 2:
+                continue
+            capacity = capacities.get(resource_id, 1)
+            if capacity <= 1:
                 self.model.AddNoOverlap(intervals)
+            elif capacity < len(intervals):
+                self.model.AddCumulative(intervals, [1] * len(intervals), capacity)
+        
+        return choices
+    
+    def add_resource_groups(
+        self,
+        task_vars: Dict[UUID, Tuple[cp_model.IntVar, cp_model.IntVar, cp_model.IntervalVar]],
+        candidates: Dict[UUID, List[UUID]],  # task_id -> eligible resource_ids
+        capacities: Dict[UUID, int],  # resource_id -> concurrent tasks
+        prefix: str
+    ) -> int:
+        """
+        Redundant cumulative and energy bound per group of interchangeable resources.
+        
+        Every distinct candidate set of two or more resources is a group
+        holding each task restricted to it, at the group's total capacity.
+        Returns the number of groups posted.
+        """
+        candidate_sets = {
+            task_id: frozenset(resource_ids)
+            for task_id, resource_ids in candidates.items()
+            if resource_ids and task_id in task_vars
+        }
+        groups = dict.fromkeys(c for c in candidate_sets.values() if len(c) > 1)
+        
+        posted = 0
+        for index, group in enumerate(groups):
+            tasks = [t for t, c in candidate_sets.items() if c <= group]
+            posted += add_resource_group(
+                self.model,
+                [task_vars[task_id][2] for task_id in tasks],
+                [1] * len(tasks),
+                sum(capacities.get(resource_id, 1) for resource_id in group),
+                self.horizon,
+                f'{prefix}_group{index}'
+            )
+        return posted
     
     def add_temporal_constraints(
         self,
@@ -448,26 +540,6 @@ class CPSATConstraintBuilder:
             if latest_end is not None:
                 self.model.Add(end_var <= latest_end)
     
-    def add_skill_constraints(
-        self,
-        task_vars: Dict[UUID, Tuple[cp_model.IntVar, cp_model.IntVar, cp_model.IntervalVar]],
-        skill_constraints: SkillConstraints,
-        task_operator_assignments: Dict[UUID, UUID]  # task_id -> operator_id
-    ) -> List[ConstraintViolation]:
-        """Add skill-based assignment constraints and return violations."""
-        violations = []
-        
-        for task_id, operator_id in task_operator_assignments.items():
-            if not skill_constraints.can_operator_perform_task(operator_id, task_id):
-                violations.append(ConstraintViolation(
-                    constraint_type=ConstraintType.SKILL_REQUIREMENT,
-                    description=f"Operator {operator_id} cannot perform task {task_id}",
-                    affected_entities=[task_id, operator_id],
-                    impact_score=5.0
-                ))
-        
-        return violations
-    
     def create_optimization_objective(
         self,
         task_vars: Dict[UUID, Tuple[cp_model.IntVar, cp_model.IntVar, cp_model.IntervalVar]],
@@ -479,19 +551,21 @@ class CPSATConstraintBuilder:
         
         if objective_type == OptimizationObjective.MINIMIZE_MAKESPAN:
             # Minimize maximum end time
-            makespan = self.model.NewIntVar(0, 10000, 'makespan')
+            makespan = self.model.NewIntVar(self.makespan_lower_bound, self.horizon, 'makespan')
             for task_id, (_, end_var, _) in task_vars.items():
                 self.model.Add(makespan >= end_var)
             return makespan
         
         elif objective_type == OptimizationObjective.MINIMIZE_TOTAL_DELAY:
             # Minimize sum of delays from planned times
-            total_delay = self.model.NewIntVar(0, 100000, 'total_delay')
+            total_delay = self.model.NewIntVar(
+                0, self.horizon * max(1, len(task_vars)), 'total_delay'
+            )
             delay_vars = []
             
             for task_id, (start_var, _, _) in task_vars.items():
                 planned_start = weights.get(f'planned_start_{task_id}', 0)
-                delay = self.model.NewIntVar(0, 10000, f'delay_{task_id}')
+                delay = self.model.NewIntVar(0, self.horizon, f'delay_{task_id}')
                 self.model.Add(delay >= start_var - planned_start)
                 delay_vars.append(delay)
             
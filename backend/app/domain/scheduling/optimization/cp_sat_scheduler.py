@@ -6,24 +6,33 @@ resource allocation, temporal constraints, and skill-based assignments.
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Any, Dict, List, Optional, Tuple, Set
 from uuid import UUID
+from collections import defaultdict
 from enum import Enum
+import math
 import time
 
 from pydantic import BaseModel, Field
 from ortools.sat.python import cp_model
 
+from ....core.solver_admission import get_admission_controller
+from ....core.solver_bounds import ResourceLoad, TimeBounds, compute_time_bounds
+from ....core.solver_termination import TerminationPolicy, solve_with_policy
 from .constraint_models import (
     ResourceConstraints,
     TemporalConstraints,
     SkillConstraints,
     OptimizationObjective,
+    ConstraintType,
     ConstraintViolation,
     ConstraintValidator,
     CPSATConstraintBuilder
 )
 
+# task_id -> [(resource_id, presence literal)] among the task's candidates
+ResourceChoices = Dict[UUID, List[Tuple[UUID, cp_model.IntVar]]]
+
 
 class SolutionStatus(str, Enum):
     """Status of the optimization solution."""
@@ -78,6 +87,7 @@ class OptimizationResult(BaseModel):
     solver_iterations: int = Field(ge=0, default=0)
     variables_count: int = Field(ge=0, default=0)
     constraints_count: int = Field(ge=0, default=0)
+    stop_reason: Optional[str] = None  # StopReason value
     
     @property
     def is_feasible(self) -> bool:
@@ -99,6 +109,28 @@ class OptimizationResult(BaseModel):
         return None
 
 
+class ScheduleHint(BaseModel):
+    """
+    Previous solution used to warm-start a repair solve.
+    
+    Start times are minutes from the planning horizon start. Hinted values
+    guide the search; tasks listed in ``frozen_task_ids`` are pinned to their
+    hinted start, rounded up to the slot grid, and resources. A frozen task
+    with a negative start is already running and only blocks its resources
+    for the rest of its duration.
+    """
+    
+    start_minutes: Dict[UUID, int] = Field(default_factory=dict)
+    machine_assignments: Dict[UUID, UUID] = Field(default_factory=dict)
+    operator_assignments: Dict[UUID, List[UUID]] = Field(default_factory=dict)
+    frozen_task_ids: Set[UUID] = Field(default_factory=set)
+    
+    @property
+    def free_task_ids(self) -> Set[UUID]:
+        """Hinted tasks the solver may move."""
+        return set(self.start_minutes) - self.frozen_task_ids
+
+
 class SchedulingProblem(BaseModel):
     """Defines a complete scheduling problem for optimization."""
     
@@ -109,7 +141,8 @@ class SchedulingProblem(BaseModel):
     # Time horizon
     planning_horizon_start: datetime
     planning_horizon_end: datetime
-    time_granularity_minutes: int = Field(default=15, ge=1)
+    time_granularity_minutes: int = Field(default=15, ge=1)  # Model slot size; inputs stay in minutes
+    horizon_slack: Optional[float] = Field(default=0.25, ge=0.0)  # Model horizon = constructive makespan * (1 + slack); None models the whole planning horizon
     
     # Tasks to schedule
     task_ids: List[UUID] = Field(default_factory=list)
@@ -122,8 +155,18 @@ class SchedulingProblem(BaseModel):
     
     # Pre-assignments (optional constraints)
     fixed_task_assignments: Dict[UUID, UUID] = Field(default_factory=dict)  # task_id -> resource_id
+    task_eligible_machines: Dict[UUID, List[UUID]] = Field(default_factory=dict)  # task_id -> [machine_ids]; any machine if absent
     preferred_assignments: Dict[UUID, List[UUID]] = Field(default_factory=dict)  # task_id -> [resource_ids]
     
+    # Redundant cumulative and energy bound per group of interchangeable
+    # machines and per pool of operators sharing a skill. Off by default like
+    # HFFS: an optional strengthening layer, to enable where the redundant
+    # groups benchmark shows it pays off
+    redundant_resource_groups: bool = False
+    
+    # Warm start from a previously published schedule
+    schedule_hint: Optional[ScheduleHint] = None
+    
     # Constraint models
     resource_constraints: ResourceConstraints = Field(default_factory=ResourceConstraints)
     temporal_constraints: TemporalConstraints = Field(default_factory=TemporalConstraints)
@@ -136,6 +179,14 @@ class SchedulingProblem(BaseModel):
     # Solution constraints
     max_solution_time_seconds: float = Field(default=300.0, ge=1.0)  # 5 minutes default
     solution_quality_tolerance: float = Field(default=0.01, ge=0.001, le=0.1)
+    termination_policy: Optional[TerminationPolicy] = None  # Defaults to the quality tolerance gap
+    
+    @property
+    def effective_termination_policy(self) -> TerminationPolicy:
+        """Early-stop policy of the solve."""
+        return self.termination_policy or TerminationPolicy(
+            relative_gap=self.solution_quality_tolerance
+        )
     
     @property
     def horizon_minutes(self) -> int:
@@ -147,6 +198,49 @@ class SchedulingProblem(BaseModel):
         """Calculate number of time slots in the horizon."""
         return self.horizon_minutes // self.time_granularity_minutes
     
+    def eligible_machines(self, task_id: UUID) -> List[UUID]:
+        """
+        Machines the solver may choose for a task.
+        
+        A fixed machine, or the hinted machine of a frozen task, pins the
+        task; otherwise the task's eligible machines, or every machine.
+        """
+        machine_ids = set(self.machine_ids)
+        pinned = self.fixed_task_assignments.get(task_id)
+        if pinned is None and self.schedule_hint and task_id in self.schedule_hint.frozen_task_ids:
+            pinned = self.schedule_hint.machine_assignments.get(task_id)
+        if pinned in machine_ids:
+            return [pinned]
+        if task_id in self.task_eligible_machines:
+            return [m for m in self.task_eligible_machines[task_id] if m in machine_ids]
+        return list(self.machine_ids)
+    
+    def eligible_operators(self, task_id: UUID) -> List[UUID]:
+        """
+        Skill-qualified operators the solver may choose for a task.
+        
+        A frozen task keeps its hinted operator while still qualified.
+        Operators are ordered best skill match first.
+        """
+        qualified = [
+            operator_id for operator_id in self.operator_ids
+            if self.skill_constraints.can_operator_perform_task(operator_id, task_id)
+        ]
+        if self.schedule_hint and task_id in self.schedule_hint.frozen_task_ids:
+            hinted = [
+                operator_id
+                for operator_id in self.schedule_hint.operator_assignments.get(task_id, [])
+                if operator_id in qualified
+            ]
+            if hinted:
+                return hinted[:1]
+        return sorted(
+            qualified,
+            key=lambda operator_id: -self.skill_constraints.get_skill_match_score(
+                operator_id, task_id
+            )
+        )
+    
     def validate_problem(self) -> List[ConstraintViolation]:
         """Validate the problem definition."""
         violations = []
@@ -186,9 +280,51 @@ class SchedulingProblem(BaseModel):
             self.operator_ids
         ))
         
+        if self.machine_ids:
+            for task_id in self.task_ids:
+                if not self.eligible_machines(task_id):
+                    violations.append(ConstraintViolation(
+                        constraint_type=ConstraintType.MACHINE_AVAILABILITY,
+                        description=f"Task {task_id} has no eligible machine",
+                        affected_entities=[task_id],
+                        suggested_fix="Add an eligible machine to the problem",
+                        impact_score=4.0
+                    ))
+        
         return violations
 
 
+class _PooledSolution:
+    """CpSolver-style view of a solve returned by the solver process pool."""
+    
+    def __init__(self, result: Any):
+        self.result = result
+    
+    def Value(self, var: Any) -> int:
+        return self.result.value(var)
+    
+    def NumBranches(self) -> int:
+        return self.result.num_branches
+    
+    def NumConflicts(self) -> int:
+        return self.result.num_conflicts
+    
+    def WallTime(self) -> float:
+        return self.result.wall_time
+    
+    def ObjectiveValue(self) -> float:
+        return self.result.objective_value or 0.0
+    
+    def BestObjectiveBound(self) -> float:
+        return self.result.best_bound or 0.0
+    
+    def NumBinaryPropagations(self) -> int:
+        return 0
+    
+    def NumIntegerPropagations(self) -> int:
+        return 0
+
+
 class CPSATScheduler:
     """
     CP-SAT scheduler for optimal task scheduling.
@@ -202,6 +338,8 @@ class CPSATScheduler:
         self.model = None
         self.solver = None
         self.last_solution = None
+        self.time_bounds: Optional[TimeBounds] = None  # Of the last model built, in slots
+        self.model_horizon: Optional[int] = None  # Of the last model built, in slots
     
     def solve(self, problem: SchedulingProblem) -> OptimizationResult:
         """
@@ -225,134 +363,558 @@ class CPSATScheduler:
             )
         
         try:
-            # Create CP model
-            self.model = cp_model.CpModel()
-            constraint_builder = CPSATConstraintBuilder(self.model)
-            
-            # Create variables for tasks
-            task_vars = constraint_builder.create_task_variables(
-                problem.task_ids,
-                problem.time_slots,
-                problem.task_durations
-            )
-            
-            # Build resource assignments
-            task_resource_assignments = self._build_resource_assignments(problem)
-            
-            # Add constraints
-            constraint_builder.add_resource_constraints(
-                task_vars,
-                problem.resource_constraints,
-                task_resource_assignments
-            )
-            
-            constraint_builder.add_temporal_constraints(
-                task_vars,
-                problem.temporal_constraints
-            )
-            
-            skill_violations = constraint_builder.add_skill_constraints(
-                task_vars,
-                problem.skill_constraints,
-                self._get_task_operator_assignments(problem, task_resource_assignments)
-            )
-            violations.extend(skill_violations)
-            
-            # Set optimization objective
-            objective_var = constraint_builder.create_optimization_objective(
-                task_vars,
-                problem.optimization_objective,
-                problem.objective_weights
-            )
-            
-            if problem.optimization_objective == OptimizationObjective.MINIMIZE_MAKESPAN:
-                self.model.Minimize(objective_var)
-            elif problem.optimization_objective == OptimizationObjective.MINIMIZE_TOTAL_DELAY:
-                self.model.Minimize(objective_var)
-            else:
-                self.model.Minimize(objective_var)  # Default
-            
-            # Configure solver
-            self.solver = cp_model.CpSolver()
-            self.solver.parameters.max_time_in_seconds = problem.max_solution_time_seconds
-            self.solver.parameters.relative_gap_limit = problem.solution_quality_tolerance
-            
-            # Solve the model
-            solve_status = self.solver.Solve(self.model)
+            horizons = self._model_horizons(problem)
+            while True:
+                task_vars, resource_choices, objective_var = self._build_next_model(
+                    problem, horizons
+                )
+                infeasible = self._bounds_infeasible_result(violations, start_time)
+                if infeasible:
+                    return infeasible
+                
+                # Configure solver with the time left of the solve
+                self.solver = cp_model.CpSolver()
+                self.solver.parameters.max_time_in_seconds = max(
+                    1.0, problem.max_solution_time_seconds - (time.time() - start_time)
+                )
+                
+                # Solve the model
+                solve_status, stop_reason = solve_with_policy(
+                    self.solver, self.model, problem.effective_termination_policy
+                )
+                # A narrowed horizon may be too short; retry on a wider one
+                if solve_status != cp_model.INFEASIBLE or not horizons:
+                    break
             solution_time = time.time() - start_time
             
             # Convert solution
-            return self._convert_solution(
+            result = self._convert_solution(
                 solve_status,
                 problem,
                 task_vars,
-                task_resource_assignments,
+                resource_choices,
                 violations,
                 solution_time,
                 objective_var
             )
+            result.stop_reason = stop_reason.value
+            return result
             
         except Exception as e:
+            return self._solver_error_result(e, start_time)
+    
+    async def solve_in_pool(
+        self,
+        problem: SchedulingProblem,
+        pool: Any,
+        parameters: Optional[Dict[str, Any]] = None,
+        admission: Any = None,
+        priority: int = 0,
+        deadline_seconds: Optional[float] = None
+    ) -> OptimizationResult:
+        """
+        Solve the problem in a worker of a solver process pool.
+        
+        The model is built here and shipped to the worker, so concurrent
+        solves use separate processes under the pool's memory ceiling. Use
+        one scheduler instance per concurrent solve.
+        
+        The solve first waits for admission, which may cut its search workers
+        and time limit; SolverCapacityExceededError is raised when it cannot
+        be admitted before ``deadline_seconds``.
+        """
+        start_time = time.time()
+        
+        violations = problem.validate_problem()
+        if any(v.severity == "error" for v in violations):
             return OptimizationResult(
                 status=SolutionStatus.MODEL_INVALID,
-                constraint_violations=[ConstraintViolation(
-                    constraint_type="solver_error",
-                    description=f"Solver error: {str(e)}",
-                    severity="error"
-                )],
+                constraint_violations=violations,
                 solution_time_seconds=time.time() - start_time
             )
+        
+        try:
+            horizons = self._model_horizons(problem)
+            task_vars, resource_choices, objective_var = self._build_next_model(
+                problem, horizons
+            )
+        except Exception as e:
+            return self._solver_error_result(e, start_time)
+        infeasible = self._bounds_infeasible_result(violations, start_time)
+        if infeasible:
+            return infeasible
+        
+        solver_parameters = dict(parameters or {})
+        admission = admission or get_admission_controller()
+        async with admission.admit(
+            workers=solver_parameters.get(
+                "num_search_workers", admission.config.max_workers_per_solve
+            ),
+            memory_mb=pool.config.max_memory_mb,
+            time_limit_seconds=problem.max_solution_time_seconds,
+            priority=priority,
+            deadline_seconds=deadline_seconds
+        ) as grant:
+            solver_parameters["num_search_workers"] = grant.workers
+            granted_at = time.time()
+            try:
+                while True:
+                    timeout_seconds = grant.time_limit_seconds
+                    if timeout_seconds is not None:
+                        timeout_seconds = max(1.0, timeout_seconds - (time.time() - granted_at))
+                    pooled = await pool.solve(
+                        self.model,
+                        solver_parameters,
+                        timeout_seconds=timeout_seconds,
+                        termination=problem.effective_termination_policy
+                    )
+                    # A narrowed horizon may be too short; retry on a wider one
+                    if pooled.status != cp_model.INFEASIBLE or not horizons:
+                        break
+                    task_vars, resource_choices, objective_var = self._build_next_model(
+                        problem, horizons
+                    )
+                    infeasible = self._bounds_infeasible_result(violations, start_time)
+                    if infeasible:
+                        return infeasible
+                self.solver = _PooledSolution(pooled)
+                
+                result = self._convert_solution(
+                    pooled.status,
+                    problem,
+                    task_vars,
+                    resource_choices,
+                    violations,
+                    time.time() - start_time,
+                    objective_var
+                )
+                result.stop_reason = pooled.stop_reason
+                return result
+                
+            except Exception as e:
+                return self._solver_error_result(e, start_time)
     
-    def _build_resource_assignments(self, problem: SchedulingProblem) -> Dict[UUID, UUID]:
-        """Build initial resource assignments for tasks."""
-        assignments = {}
+    def _model_horizons(self, problem: SchedulingProblem) -> List[int]:
+        """
+        Model horizons to try, in slots, narrowest first.
         
-        # Use fixed assignments first
-        assignments.update(problem.fixed_task_assignments)
+        The first covers a constructive schedule's makespan plus
+        ``problem.horizon_slack``; each next one doubles it, up to the whole
+        planning horizon, which is always last.
+        """
+        full = problem.time_slots
+        if problem.horizon_slack is None:
+            return [full]
+        makespan = self._constructive_makespan(problem)
+        if makespan is None:
+            return [full]
+        
+        horizons = []
+        horizon = max(1, math.ceil(makespan * (1 + problem.horizon_slack)))
+        while horizon < full:
+            horizons.append(horizon)
+            horizon *= 2
+        return horizons + [full]
+    
+    def _constructive_makespan(self, problem: SchedulingProblem) -> Optional[int]:
+        """
+        Makespan in slots of a greedy list schedule, or None if it misses a
+        latest end or precedence has a cycle.
         
-        # Assign remaining tasks using simple heuristic
-        unassigned_tasks = [t for t in problem.task_ids if t not in assignments]
-        available_machines = problem.machine_ids.copy()
+        Tasks are taken in precedence order, each starting as soon as its
+        release date, its predecessors, a unit of an eligible machine and,
+        when operators are modelled, of a qualified operator allow. Frozen
+        tasks keep their hinted start.
+        """
+        durations, temporal = self.to_slot_units(problem)
+        predecessors: Dict[UUID, List[UUID]] = defaultdict(list)
+        successors: Dict[UUID, List[UUID]] = defaultdict(list)
+        in_degree = {task_id: 0 for task_id in problem.task_ids}
+        for predecessor, successor in temporal.precedence_constraints:
+            if predecessor in in_degree and successor in in_degree:
+                predecessors[successor].append(predecessor)
+                successors[predecessor].append(successor)
+                in_degree[successor] += 1
+        order = [task_id for task_id, degree in in_degree.items() if degree == 0]
+        for task_id in order:
+            for successor in successors[task_id]:
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    order.append(successor)
+        if len(order) < len(in_degree):
+            return None
         
-        for task_id in unassigned_tasks:
-            # Simple round-robin assignment to machines
-            if available_machines:
-                machine_id = available_machines[len(assignments) % len(available_machines)]
-                assignments[task_id] = machine_id
+        frozen_starts = self._frozen_start_slots(problem)
         
-        return assignments
+        # Time at which each unit of every resource is next free
+        resources = problem.resource_constraints
+        machine_free = {
+            m: [0] * resources.machine_capacities.get(m, 1) for m in problem.machine_ids
+        }
+        operator_free = {
+            o: [0] * resources.operator_capacities.get(o, 1) for o in problem.operator_ids
+        }
+        
+        def earliest_unit(free: Dict[UUID, List[int]], candidates: List[UUID]):
+            units = [
+                (times[unit], resource_id, unit)
+                for resource_id in candidates
+                for times in [free.get(resource_id, [])]
+                for unit in range(len(times))
+            ]
+            return min(units, key=lambda u: u[0], default=None)
+        
+        end: Dict[UUID, int] = {}
+        for task_id in order:
+            start = max(
+                [temporal.task_earliest_start.get(task_id, 0)]
+                + [end[p] for p in predecessors[task_id]]
+            )
+            units = [earliest_unit(machine_free, problem.eligible_machines(task_id))]
+            if problem.operator_ids:
+                units.append(earliest_unit(operator_free, problem.eligible_operators(task_id)))
+            units = [u for u in units if u is not None]
+            start = frozen_starts.get(task_id, max([start] + [u[0] for u in units]))
+            end[task_id] = start + durations[task_id]
+            
+            if end[task_id] > temporal.task_latest_end.get(task_id, end[task_id]):
+                return None
+            for free, (_, resource_id, unit) in zip((machine_free, operator_free), units):
+                free[resource_id][unit] = max(free[resource_id][unit], end[task_id])
+        
+        return max(end.values(), default=0)
     
-    def _get_task_operator_assignments(
+    def _build_next_model(
         self,
         problem: SchedulingProblem,
-        task_resource_assignments: Dict[UUID, UUID]
-    ) -> Dict[UUID, UUID]:
-        """Generate operator assignments based on skill constraints."""
-        operator_assignments = {}
+        horizons: List[int]
+    ) -> Tuple[
+        Dict[UUID, Tuple[cp_model.IntVar, cp_model.IntVar, cp_model.IntervalVar]],
+        Tuple[ResourceChoices, ResourceChoices],
+        cp_model.IntVar
+    ]:
+        """
+        Build the model on the next of ``horizons``, consuming it.
         
-        for task_id in problem.task_ids:
-            # Find best operator for this task
-            best_operator = None
-            best_score = 0.0
-            
-            for operator_id in problem.operator_ids:
-                if problem.skill_constraints.can_operator_perform_task(operator_id, task_id):
-                    score = problem.skill_constraints.get_skill_match_score(operator_id, task_id)
-                    if score > best_score:
-                        best_score = score
-                        best_operator = operator_id
+        Horizons whose time bounds already leave some task no room are
+        skipped, except the last.
+        """
+        while True:
+            built = self._build_model(problem, horizons.pop(0))
+            if not horizons or not self.time_bounds.infeasible_tasks:
+                return built
+    
+    def _build_model(
+        self,
+        problem: SchedulingProblem,
+        horizon: Optional[int] = None
+    ) -> Tuple[
+        Dict[UUID, Tuple[cp_model.IntVar, cp_model.IntVar, cp_model.IntervalVar]],
+        Tuple[ResourceChoices, ResourceChoices],
+        cp_model.IntVar
+    ]:
+        """
+        Build the CP model into ``self.model``, ``horizon`` slots long
+        (the whole planning horizon by default).
+        
+        Machines and operators are chosen by the solver among each task's
+        eligible machines and skill-qualified operators, filtered here before
+        any variable is created; returns the machine and operator choices.
+        """
+        self.model = cp_model.CpModel()
+        self.model_horizon = horizon = horizon or problem.time_slots
+        constraint_builder = CPSATConstraintBuilder(self.model)
+        
+        # Model time runs in slots of time_granularity_minutes
+        slot_durations, slot_temporal = self.to_slot_units(problem)
+        eligible_machines = {t: problem.eligible_machines(t) for t in problem.task_ids}
+        eligible_operators = (
+            {t: problem.eligible_operators(t) for t in problem.task_ids}
+            if problem.operator_ids else {}
+        )
+        
+        # Narrow time domains to what precedence, time windows and resource
+        # load allow
+        self.time_bounds = compute_time_bounds(
+            slot_durations,
+            slot_temporal.precedence_constraints,
+            horizon,
+            release_dates=slot_temporal.task_earliest_start,
+            deadlines=slot_temporal.task_latest_end,
+            resources=self._resource_loads(
+                slot_durations, eligible_machines, problem.resource_constraints.machine_capacities
+            ) + self._resource_loads(
+                slot_durations, eligible_operators, problem.resource_constraints.operator_capacities
+            )
+        )
+        
+        # Create variables for tasks
+        task_vars = constraint_builder.create_task_variables(
+            problem.task_ids,
+            horizon,
+            slot_durations,
+            self.time_bounds
+        )
+        
+        # Resource choices, restricted to eligible resources
+        resources = problem.resource_constraints
+        machine_choices = constraint_builder.add_resource_choices(
+            task_vars,
+            slot_durations,
+            eligible_machines,
+            resources.machine_capacities,
+            "machine"
+        )
+        operator_choices = {}
+        if problem.operator_ids:
+            operator_choices = constraint_builder.add_resource_choices(
+                task_vars,
+                slot_durations,
+                eligible_operators,
+                resources.operator_capacities,
+                "operator"
+            )
+        
+        if problem.redundant_resource_groups:
+            constraint_builder.add_resource_groups(
+                task_vars, eligible_machines, resources.machine_capacities, "machines"
+            )
+            constraint_builder.add_resource_groups(
+                task_vars, eligible_operators, resources.operator_capacities, "operators"
+            )
+        
+        # Seed the search with the previous schedule
+        if problem.schedule_hint:
+            self._apply_schedule_hint(problem, task_vars, machine_choices, operator_choices)
+        
+        constraint_builder.add_temporal_constraints(
+            task_vars,
+            slot_temporal
+        )
+        
+        # Set optimization objective
+        objective_var = constraint_builder.create_optimization_objective(
+            task_vars,
+            problem.optimization_objective,
+            problem.objective_weights
+        )
+        self.model.Minimize(objective_var)
+        
+        return task_vars, (machine_choices, operator_choices), objective_var
+    
+    def _resource_loads(
+        self,
+        durations: Dict[UUID, int],
+        candidates: Dict[UUID, List[UUID]],
+        capacities: Dict[UUID, int]
+    ) -> List[ResourceLoad]:
+        """
+        One load per distinct candidate set, holding every task that must
+        run within that set of resources.
+        """
+        candidate_sets = {t: frozenset(c) for t, c in candidates.items() if c}
+        loads = []
+        for resources in set(candidate_sets.values()):
+            loads.append(ResourceLoad(
+                capacity=sum(capacities.get(r, 1) for r in resources),
+                demands=[
+                    (task_id, durations.get(task_id, 60), 1)
+                    for task_id, task_resources in candidate_sets.items()
+                    if task_resources <= resources
+                ]
+            ))
+        return loads
+    
+    def _bounds_infeasible_result(
+        self,
+        violations: List[ConstraintViolation],
+        start_time: float
+    ) -> Optional[OptimizationResult]:
+        """INFEASIBLE result when some task cannot meet its latest end at all."""
+        late = self.time_bounds.infeasible_tasks
+        if not late:
+            return None
+        return OptimizationResult(
+            status=SolutionStatus.INFEASIBLE,
+            constraint_violations=violations + [ConstraintViolation(
+                constraint_type=ConstraintType.TEMPORAL_PRECEDENCE,
+                description=(
+                    f"{len(late)} tasks cannot finish by their latest end "
+                    "given their release dates and predecessors"
+                ),
+                affected_entities=late
+            )],
+            solution_time_seconds=time.time() - start_time
+        )
+    
+    def _solver_error_result(self, error: Exception, start_time: float) -> OptimizationResult:
+        return OptimizationResult(
+            status=SolutionStatus.MODEL_INVALID,
+            constraint_violations=[ConstraintViolation(
+                constraint_type="solver_error",
+                description=f"Solver error: {str(error)}",
+                severity="error"
+            )],
+            solution_time_seconds=time.time() - start_time
+        )
+    
+    def to_slot_units(
+        self,
+        problem: SchedulingProblem
+    ) -> Tuple[Dict[UUID, int], TemporalConstraints]:
+        """
+        Convert minute durations and time windows to model slots.
+        
+        Durations and earliest starts round up and latest ends round down, so
+        any slot schedule is still feasible once mapped back to exact minutes.
+        A frozen task already running at the horizon start lasts only its
+        remaining part, from slot 0.
+        """
+        granularity = problem.time_granularity_minutes
+        
+        def round_up(minutes: int) -> int:
+            return -(-minutes // granularity)
+        
+        source = problem.temporal_constraints
+        durations = {
+            task_id: round_up(problem.task_durations.get(task_id, 60))
+            for task_id in problem.task_ids
+        }
+        for task_id, start_minutes in self._started_before_horizon(problem).items():
+            if task_id in durations:
+                durations[task_id] = round_up(
+                    max(0, start_minutes + problem.task_durations.get(task_id, 60))
+                )
+        temporal = source.model_copy(update={
+            "task_earliest_start": {
+                task_id: round_up(minutes)
+                for task_id, minutes in source.task_earliest_start.items()
+            },
+            "task_latest_end": {
+                task_id: minutes // granularity
+                for task_id, minutes in source.task_latest_end.items()
+            },
+            "task_durations": durations
+        })
+        return durations, temporal
+    
+    def _apply_schedule_hint(
+        self,
+        problem: SchedulingProblem,
+        task_vars: Dict[UUID, Tuple[cp_model.IntVar, cp_model.IntVar, cp_model.IntervalVar]],
+        machine_choices: ResourceChoices,
+        operator_choices: ResourceChoices
+    ) -> None:
+        """Hint previous start times and resources, and pin frozen tasks to them."""
+        hint = problem.schedule_hint
+        
+        hinted_resources = [
+            (machine_choices, {t: [m] for t, m in hint.machine_assignments.items()}),
+            (operator_choices, hint.operator_assignments)
+        ]
+        for choices, previous in hinted_resources:
+            for task_id, resource_ids in previous.items():
+                options = choices.get(task_id, [])
+                if len(options) < 2 or not any(r in resource_ids for r, _ in options):
+                    continue
+                # Hint the first previous resource that is still a candidate
+                chosen = next(r for r in resource_ids if r in dict(options))
+                for resource_id, presence in options:
+                    self.model.AddHint(presence, int(resource_id == chosen))
+        
+        frozen_slots = self._frozen_start_slots(problem)
+        for task_id, start_minutes in hint.start_minutes.items():
+            if task_id not in task_vars:
+                continue
+            start_var = task_vars[task_id][0]
             
-            if best_operator:
-                operator_assignments[task_id] = best_operator
+            if task_id in frozen_slots:
+                slot = frozen_slots[task_id]
+                self.model.Add(start_var == slot)
+            else:
+                slot = min(
+                    max(0, -(-start_minutes // problem.time_granularity_minutes)),
+                    problem.time_slots
+                )
+            self.model.AddHint(start_var, slot)
+    
+    def _frozen_start_slots(self, problem: SchedulingProblem) -> Dict[UUID, int]:
+        """
+        Slot each frozen task is pinned to: its hinted start rounded up to
+        the slot grid, so it never runs earlier than published. Tasks already
+        running at the horizon start are pinned to slot 0 with their
+        remaining duration (see ``to_slot_units``).
+        """
+        hint = problem.schedule_hint
+        if not hint:
+            return {}
+        granularity = problem.time_granularity_minutes
+        return {
+            task_id: max(0, -(-hint.start_minutes[task_id] // granularity))
+            for task_id in hint.frozen_task_ids
+            if task_id in hint.start_minutes
+        }
+    
+    def _started_before_horizon(self, problem: SchedulingProblem) -> Dict[UUID, int]:
+        """Hinted start, in minutes, of frozen tasks starting before the horizon."""
+        hint = problem.schedule_hint
+        if not hint:
+            return {}
+        return {
+            task_id: start_minutes
+            for task_id, start_minutes in hint.start_minutes.items()
+            if task_id in hint.frozen_task_ids and start_minutes < 0
+        }
+    
+    def build_resource_assignments(self, problem: SchedulingProblem) -> Dict[UUID, UUID]:
+        """
+        Heuristic machine per task, for search paths that fix machines up front.
+        
+        Keeps fixed and previously scheduled machines, then puts each task on
+        the least loaded of its eligible machines. CP-SAT solves choose
+        machines themselves.
+        """
+        assignments = {}
+        
+        # Use fixed assignments first, then the previous schedule's machines
+        assignments.update(problem.fixed_task_assignments)
+        if problem.schedule_hint:
+            for task_id, machine_id in problem.schedule_hint.machine_assignments.items():
+                if task_id not in assignments and machine_id in problem.eligible_machines(task_id):
+                    assignments[task_id] = machine_id
         
-        return operator_assignments
+        load = {machine_id: 0 for machine_id in problem.machine_ids}
+        for task_id, machine_id in assignments.items():
+            if machine_id in load:
+                load[machine_id] += problem.task_durations.get(task_id, 60)
+        
+        for task_id in problem.task_ids:
+            if task_id in assignments:
+                continue
+            eligible = problem.eligible_machines(task_id)
+            if eligible:
+                machine_id = min(eligible, key=lambda m: load[m])
+                assignments[task_id] = machine_id
+                load[machine_id] += problem.task_durations.get(task_id, 60)
+        
+        return assignments
+    
+    def _chosen_resources(self, choices: ResourceChoices) -> Dict[UUID, UUID]:
+        """Resource whose presence literal is set in the solution, per task."""
+        return {
+            task_id: next(
+                (resource_id for resource_id, presence in options if self.solver.Value(presence)),
+                options[0][0]
+            )
+            for task_id, options in choices.items()
+        }
     
     def _convert_solution(
         self,
         solve_status: int,
         problem: SchedulingProblem,
         task_vars: Dict[UUID, Tuple[cp_model.IntVar, cp_model.IntVar, cp_model.IntervalVar]],
-        task_resource_assignments: Dict[UUID, UUID],
+        resource_choices: Tuple[ResourceChoices, ResourceChoices],
         violations: List[ConstraintViolation],
         solution_time: float,
         objective_var: cp_model.IntVar
@@ -369,13 +931,18 @@ class CPSATScheduler:
         }
         
         status = status_mapping.get(solve_status, SolutionStatus.UNKNOWN)
+        machine_choices, operator_choices = resource_choices
+        variables_count = len(task_vars) * 3 + sum(
+            len(options) for choices in resource_choices for options in choices.values()
+            if len(options) > 1
+        )
         
         if status not in (SolutionStatus.OPTIMAL, SolutionStatus.FEASIBLE):
             return OptimizationResult(
                 status=status,
                 constraint_violations=violations,
                 solution_time_seconds=solution_time,
-                variables_count=len(task_vars) * 3,  # start, end, interval per task
+                variables_count=variables_count,
                 constraints_count=self.model.Proto().constraints.__len__()
             )
         
@@ -383,30 +950,39 @@ class CPSATScheduler:
         task_assignments = []
         makespan = 0
         total_delay = 0
+        task_resource_assignments = self._chosen_resources(machine_choices)
+        operator_assignments = self._chosen_resources(operator_choices)
+        started_before_horizon = self._started_before_horizon(problem)
         
-        for task_id, (start_var, end_var, _) in task_vars.items():
-            start_minutes = self.solver.Value(start_var) * problem.time_granularity_minutes
-            end_minutes = self.solver.Value(end_var) * problem.time_granularity_minutes
+        for task_id, (start_var, _, _) in task_vars.items():
+            # Slot starts map back to minutes; ends use the exact duration.
+            # Tasks already running keep their published start
+            duration = problem.task_durations.get(task_id, 60)
+            start_minutes = started_before_horizon.get(
+                task_id, self.solver.Value(start_var) * problem.time_granularity_minutes
+            )
+            end_minutes = start_minutes + duration
             
             start_time = problem.planning_horizon_start + timedelta(minutes=start_minutes)
             end_time = problem.planning_horizon_start + timedelta(minutes=end_minutes)
-            duration = end_minutes - start_minutes
             
             # Calculate delay
             planned_start = problem.temporal_constraints.task_earliest_start.get(task_id, 0)
-            delay = max(0, start_minutes - planned_start * problem.time_granularity_minutes)
+            delay = max(0, start_minutes - planned_start)
             total_delay += delay
             
             # Get resource assignments
             machine_id = task_resource_assignments.get(task_id)
-            operator_assignments = self._get_task_operator_assignments(problem, task_resource_assignments)
             operator_id = operator_assignments.get(task_id)
             operator_ids = [operator_id] if operator_id else []
             
             # Calculate skill match score
             skill_score = 1.0
             if operator_id:
-                skill_score = problem.skill_constraints.get_skill_match_score(operator_id, task_id)
+                # Over-qualification bonuses cap at a full match
+                skill_score = min(
+                    1.0, problem.skill_constraints.get_skill_match_score(operator_id, task_id)
+                )
             
             task_assignments.append(TaskAssignment(
                 task_id=task_id,
@@ -448,7 +1024,7 @@ class CPSATScheduler:
             constraint_violations=violations,
             feasibility_score=feasibility_score,
             solver_iterations=self.solver.NumBranches(),
-            variables_count=len(task_vars) * 3,
+            variables_count=variables_count,
             constraints_count=self.model.Proto().constraints.__len__()
         )
     
@@ -0,0 +1,437 @@
+"""
+Decomposed CP-SAT solving over weakly coupled resource clusters.
+
+Plant-wide problems usually split into departments or zones whose machines
+share many precedence links internally and only a few with each other. The
+decomposed solve groups machines into such clusters, solves one CP-SAT model
+per cluster concurrently in the solver process pool, and then repairs the
+cross-cluster precedence edges the independent solves violated: the
+successors of violated edges and everything downstream of them are re-solved
+around the fixed rest of the schedule. Machines whose tasks an operator could
+work on share a cluster, so no operator is booked by two cluster solves.
+Each cluster model is a fraction of the monolithic one, so the solves spread
+over all workers and each stays within the pool's per-worker memory ceiling.
+"""
+
+import asyncio
+import heapq
+import os
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from ....core.solver_pool import get_solver_pool
+from .constraint_models import TemporalConstraints
+from .cp_sat_scheduler import (
+    CPSATScheduler,
+    OptimizationResult,
+    ScheduleHint,
+    SchedulingProblem,
+    SolutionStatus,
+    TaskAssignment,
+)
+from .lns import build_subproblem, precedence_maps, schedule_objective
+
+
+class DecompositionConfig(BaseModel):
+    """Cluster detection and budget settings for the decomposed solve."""
+
+    max_clusters: Optional[int] = Field(default=None, ge=1)  # Defaults to the pool's worker count
+    coupling_threshold: float = Field(default=0.25, ge=0.0)  # Links per task that merge two machines
+    min_tasks: int = Field(default=200, ge=1)  # Smaller problems are solved whole
+    repair_time_limit_seconds: float = Field(default=30.0, ge=1.0)
+    search_workers: Optional[int] = Field(default=None, ge=1)  # CP-SAT workers per solve
+
+
+class DecomposedScheduler:
+    """
+    Solves a SchedulingProblem as concurrent per-cluster CP-SAT models.
+
+    Machines are taken as CPSATScheduler.build_resource_assignments resolves
+    them (fixed, hinted, then least loaded), so every task belongs to exactly
+    one machine's cluster.
+    ``partitions`` maps machine or task ids to labels such as a department
+    or production zone; machines sharing a label are always solved together,
+    as are machines sharing a qualified operator.
+    """
+
+    def __init__(self, pool: Optional[Any] = None, config: Optional[DecompositionConfig] = None):
+        self.pool = pool
+        self.config = config or DecompositionConfig()
+        self.clusters: List[List[UUID]] = []
+        self.coupling_edges = 0
+        self.repaired_tasks = 0
+        self.used_fallback = False
+
+    async def solve(
+        self,
+        problem: SchedulingProblem,
+        partitions: Optional[Dict[UUID, Hashable]] = None
+    ) -> OptimizationResult:
+        """Solve ``problem`` cluster by cluster, then repair cross-cluster edges."""
+        start_time = time.time()
+        pool = self.pool or get_solver_pool()
+        self.coupling_edges = 0
+        self.repaired_tasks = 0
+        self.used_fallback = False
+
+        helper = CPSATScheduler()
+        durations, temporal = helper.to_slot_units(problem)
+        machines = helper.build_resource_assignments(problem)
+        max_clusters = self.config.max_clusters or pool.config.max_workers
+
+        if (
+            len(problem.task_ids) < self.config.min_tasks
+            or max_clusters < 2
+            or any(task_id not in machines for task_id in problem.task_ids)
+        ):
+            self.clusters = [list(problem.task_ids)]
+        else:
+            self.clusters = self.find_clusters(
+                problem, machines, temporal, partitions or {}, max_clusters
+            )
+        parameters = {"num_search_workers": self._search_workers(pool)}
+
+        if len(self.clusters) < 2:
+            return await self._solve_whole(problem, pool, parameters, start_time)
+
+        results = await asyncio.gather(*(
+            CPSATScheduler().solve_in_pool(
+                self._cluster_problem(problem, task_ids, machines, temporal, index),
+                pool,
+                parameters
+            )
+            for index, task_ids in enumerate(self.clusters)
+        ))
+        # Cluster models pin tasks to heuristic machines, so an infeasible
+        # cluster does not prove the whole problem infeasible
+        if not all(result.is_feasible for result in results):
+            return await self._solve_whole(problem, pool, parameters, start_time)
+
+        assignments = {a.task_id: a for result in results for a in result.task_assignments}
+        starts = {
+            task_id: self._slot(problem, assignment.start_time)
+            for task_id, assignment in assignments.items()
+        }
+        cluster_of = {
+            task_id: index for index, task_ids in enumerate(self.clusters) for task_id in task_ids
+        }
+        cross_edges = [
+            (pred_id, succ_id) for pred_id, succ_id in temporal.precedence_constraints
+            if pred_id in cluster_of and succ_id in cluster_of
+            and cluster_of[pred_id] != cluster_of[succ_id]
+        ]
+        self.coupling_edges = len(cross_edges)
+        violated = [
+            succ_id for pred_id, succ_id in cross_edges
+            if starts[succ_id] < starts[pred_id] + durations[pred_id]
+        ]
+
+        if violated:
+            predecessors, successors = precedence_maps(problem, temporal)
+            free = self._repair_set(violated, starts, machines, successors)
+            self.repaired_tasks = len(free)
+
+            repair = await CPSATScheduler().solve_in_pool(
+                build_subproblem(
+                    problem, free, starts, durations, machines, predecessors, successors,
+                    time_limit=self.config.repair_time_limit_seconds,
+                    problem_id=f"{problem.problem_id}_repair",
+                    operators=self._operators(assignments)
+                ),
+                pool,
+                parameters
+            )
+            results.append(repair)
+            if not repair.is_feasible:
+                return await self._solve_whole_from(
+                    problem, assignments, starts, machines, pool, parameters, start_time
+                )
+            for assignment in repair.task_assignments:
+                if assignment.task_id in free:
+                    assignments[assignment.task_id] = assignment
+                    starts[assignment.task_id] = self._slot(problem, assignment.start_time)
+                    if assignment.assigned_machine_id:
+                        # The repair may move free tasks to another eligible machine
+                        machines[assignment.task_id] = assignment.assigned_machine_id
+
+        if self._operators_overbooked(problem, assignments):
+            return await self._solve_whole_from(
+                problem, assignments, starts, machines, pool, parameters, start_time
+            )
+
+        return self._build_result(
+            problem, assignments, starts, durations, machines, results,
+            time.time() - start_time
+        )
+
+    def find_clusters(
+        self,
+        problem: SchedulingProblem,
+        machines: Dict[UUID, UUID],
+        temporal: TemporalConstraints,
+        partitions: Dict[UUID, Hashable],
+        max_clusters: int
+    ) -> List[List[UUID]]:
+        """
+        Group tasks into at most ``max_clusters`` weakly coupled clusters.
+
+        Two machines are merged when they share a partition label, when an
+        operator is qualified for tasks on both, or when the precedence edges
+        between them reach ``coupling_threshold`` times the task count of the
+        smaller one. The resulting components are then packed largest first
+        into the least loaded cluster.
+        """
+        parent: Dict[UUID, UUID] = {m: m for m in set(machines.values())}
+
+        def find(machine_id: UUID) -> UUID:
+            while parent[machine_id] != machine_id:
+                parent[machine_id] = parent[parent[machine_id]]
+                machine_id = parent[machine_id]
+            return machine_id
+
+        def union(first: UUID, second: UUID) -> None:
+            first, second = find(first), find(second)
+            if first != second:
+                parent[second] = first
+
+        labelled: Dict[Hashable, UUID] = {}
+        for entity_id, label in partitions.items():
+            machine_id = entity_id if entity_id in parent else machines.get(entity_id)
+            if machine_id is None or label is None:
+                continue
+            if label in labelled:
+                union(labelled[label], machine_id)
+            else:
+                labelled[label] = machine_id
+
+        # Cluster solves run independently, so an operator's tasks must all
+        # fall in one cluster
+        operator_machine: Dict[UUID, UUID] = {}
+        if problem.operator_ids:
+            for task_id in problem.task_ids:
+                for operator_id in problem.eligible_operators(task_id):
+                    if operator_id in operator_machine:
+                        union(operator_machine[operator_id], machines[task_id])
+                    else:
+                        operator_machine[operator_id] = machines[task_id]
+
+        load = Counter(machines[task_id] for task_id in problem.task_ids)
+        links: Counter = Counter()
+        for pred_id, succ_id in temporal.precedence_constraints:
+            first, second = machines.get(pred_id), machines.get(succ_id)
+            if first and second and first != second:
+                links[tuple(sorted((first, second), key=str))] += 1
+        for (first, second), count in links.most_common():
+            if count >= self.config.coupling_threshold * min(load[first], load[second]):
+                union(first, second)
+
+        components: Dict[UUID, List[UUID]] = {}
+        for task_id in problem.task_ids:
+            components.setdefault(find(machines[task_id]), []).append(task_id)
+
+        bins: List[Tuple[int, int]] = [(0, index) for index in range(max_clusters)]
+        packed: List[List[UUID]] = [[] for _ in range(max_clusters)]
+        for component in sorted(components.values(), key=len, reverse=True):
+            size, index = heapq.heappop(bins)
+            packed[index].extend(component)
+            heapq.heappush(bins, (size + len(component), index))
+
+        order = {task_id: position for position, task_id in enumerate(problem.task_ids)}
+        return [sorted(tasks, key=order.__getitem__) for tasks in packed if tasks]
+
+    def _repair_set(
+        self,
+        violated: List[UUID],
+        starts: Dict[UUID, int],
+        machines: Dict[UUID, UUID],
+        successors: Dict[UUID, Set[UUID]]
+    ) -> Set[UUID]:
+        """
+        Successors of violated edges, everything downstream of them, and the
+        tasks queued behind them on their machines, so the repair can shift
+        whole machine sequences right instead of only filling gaps.
+        """
+        by_machine: Dict[UUID, List[UUID]] = {}
+        for task_id in sorted(starts, key=starts.__getitem__):
+            by_machine.setdefault(machines[task_id], []).append(task_id)
+
+        free: Set[UUID] = set()
+        queue = list(violated)
+        while queue:
+            task_id = queue.pop()
+            if task_id in free:
+                continue
+            free.add(task_id)
+            queue.extend(successors[task_id])
+            queue.extend(
+                t for t in by_machine[machines[task_id]] if starts[t] >= starts[task_id]
+            )
+        return free
+
+    def _search_workers(self, pool: Any) -> int:
+        """Split the cores across the solves the pool runs at once."""
+        if self.config.search_workers:
+            return self.config.search_workers
+        concurrent = max(1, min(len(self.clusters), pool.config.max_workers))
+        return max(1, (os.cpu_count() or 1) // concurrent)
+
+    def _cluster_problem(
+        self,
+        problem: SchedulingProblem,
+        task_ids: List[UUID],
+        machines: Dict[UUID, UUID],
+        temporal: TemporalConstraints,
+        index: int
+    ) -> SchedulingProblem:
+        """The tasks of one cluster with their internal precedence only (in minutes)."""
+        members = set(task_ids)
+        source = problem.temporal_constraints
+        cluster_temporal = source.model_copy(update={
+            "precedence_constraints": [
+                (pred_id, succ_id) for pred_id, succ_id in source.precedence_constraints
+                if pred_id in members and succ_id in members
+            ],
+            "task_earliest_start": {
+                t: v for t, v in source.task_earliest_start.items() if t in members
+            },
+            "task_latest_end": {
+                t: v for t, v in source.task_latest_end.items() if t in members
+            },
+        })
+        hint = None
+        if problem.schedule_hint:
+            previous = problem.schedule_hint
+            hint = ScheduleHint(
+                start_minutes={t: v for t, v in previous.start_minutes.items() if t in members},
+                operator_assignments={
+                    t: v for t, v in previous.operator_assignments.items() if t in members
+                },
+                frozen_task_ids=previous.frozen_task_ids & members
+            )
+
+        return problem.model_copy(update={
+            "problem_id": f"{problem.problem_id}_cluster{index}",
+            "task_ids": list(task_ids),
+            "task_durations": {t: problem.task_durations.get(t, 60) for t in task_ids},
+            "task_priorities": {
+                t: problem.task_priorities[t] for t in task_ids if t in problem.task_priorities
+            },
+            "machine_ids": sorted({machines[t] for t in task_ids}, key=str),
+            "operator_ids": sorted(
+                {o for t in task_ids for o in problem.eligible_operators(t)}, key=str
+            ) if problem.operator_ids else [],
+            "fixed_task_assignments": {t: machines[t] for t in task_ids},
+            "schedule_hint": hint,
+            "temporal_constraints": cluster_temporal,
+        })
+
+    async def _solve_whole(
+        self,
+        problem: SchedulingProblem,
+        pool: Any,
+        parameters: Dict[str, Any],
+        start_time: float
+    ) -> OptimizationResult:
+        self.used_fallback = len(self.clusters) > 1
+        result = await CPSATScheduler().solve_in_pool(problem, pool, parameters)
+        result.solution_time_seconds = time.time() - start_time
+        return result
+
+    async def _solve_whole_from(
+        self,
+        problem: SchedulingProblem,
+        assignments: Dict[UUID, TaskAssignment],
+        starts: Dict[UUID, int],
+        machines: Dict[UUID, UUID],
+        pool: Any,
+        parameters: Dict[str, Any],
+        start_time: float
+    ) -> OptimizationResult:
+        """Re-solve whole, starting from the cluster schedules."""
+        hint = (problem.schedule_hint or ScheduleHint()).model_copy(update={
+            "start_minutes": {
+                task_id: slot * problem.time_granularity_minutes
+                for task_id, slot in starts.items()
+            },
+            "machine_assignments": machines,
+            "operator_assignments": {
+                task_id: a.assigned_operator_ids
+                for task_id, a in assignments.items() if a.assigned_operator_ids
+            },
+        })
+        return await self._solve_whole(
+            problem.model_copy(update={"schedule_hint": hint}),
+            pool, parameters, start_time
+        )
+
+    def _operators(self, assignments: Dict[UUID, TaskAssignment]) -> Dict[UUID, UUID]:
+        return {
+            task_id: a.assigned_operator_ids[0]
+            for task_id, a in assignments.items() if a.assigned_operator_ids
+        }
+
+    def _operators_overbooked(
+        self,
+        problem: SchedulingProblem,
+        assignments: Dict[UUID, TaskAssignment]
+    ) -> bool:
+        """True when the merged schedule runs an operator over capacity."""
+        capacities = problem.resource_constraints.operator_capacities
+        events: Dict[UUID, List[Tuple[datetime, int]]] = {}
+        for assignment in assignments.values():
+            for operator_id in assignment.assigned_operator_ids:
+                events.setdefault(operator_id, []).extend(
+                    [(assignment.start_time, 1), (assignment.end_time, -1)]
+                )
+        for operator_id, changes in events.items():
+            load = 0
+            # Ends sort before starts at the same moment
+            for _, change in sorted(changes):
+                load += change
+                if load > capacities.get(operator_id, 1):
+                    return True
+        return False
+
+    def _slot(self, problem: SchedulingProblem, moment: datetime) -> int:
+        minutes = int((moment - problem.planning_horizon_start).total_seconds() // 60)
+        return minutes // problem.time_granularity_minutes
+
+    def _build_result(
+        self,
+        problem: SchedulingProblem,
+        assignments: Dict[UUID, TaskAssignment],
+        starts: Dict[UUID, int],
+        durations: Dict[UUID, int],
+        machines: Dict[UUID, UUID],
+        results: List[OptimizationResult],
+        solution_time: float
+    ) -> OptimizationResult:
+        """Merge cluster and repair assignments into one result."""
+        ordered = [assignments[task_id] for task_id in problem.task_ids]
+        horizon_start = problem.planning_horizon_start
+        makespan_minutes = max(
+            ((a.end_time - horizon_start).total_seconds() / 60 for a in ordered),
+            default=0.0
+        )
+
+        return OptimizationResult(
+            status=SolutionStatus.FEASIBLE,
+            objective_value=schedule_objective(problem, starts, durations)[0],
+            solution_time_seconds=solution_time,
+            task_assignments=ordered,
+            makespan_hours=makespan_minutes / 60.0,
+            total_delay_hours=sum(a.delay_minutes for a in ordered) / 60.0,
+            resource_utilization=CPSATScheduler()._calculate_resource_utilization(
+                problem, ordered, machines
+            ),
+            constraint_violations=[v for r in results for v in r.constraint_violations],
+            feasibility_score=min((r.feasibility_score for r in results), default=1.0),
+            solver_iterations=sum(r.solver_iterations for r in results),
+            variables_count=sum(r.variables_count for r in results),
+            constraints_count=sum(r.constraints_count for r in results)
+        )
@@ -0,0 +1,555 @@
+"""
+Large neighborhood search on top of CPSATScheduler.
+
+Starts from a list-scheduling incumbent and repeatedly frees one
+neighborhood of tasks - a time window, the tasks of a machine group, or the
+precedence chains on the critical path - while every other task stays fixed.
+The freed tasks are re-solved with CP-SAT in a sub-problem that holds only
+them, the fixed tasks holding the machines or operators they could take,
+and time bounds from their fixed neighbours, so each iteration stays small
+however large the full problem is. Neighborhood types are picked adaptively
+from the improvement they have produced, and the search stops on a time or
+stagnation budget.
+"""
+
+import heapq
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from .constraint_models import OptimizationObjective, TemporalConstraints
+from .cp_sat_scheduler import (
+    CPSATScheduler,
+    OptimizationResult,
+    ScheduleHint,
+    SchedulingProblem,
+    SolutionStatus,
+    TaskAssignment,
+)
+
+TIME_WINDOW = "time_window"
+MACHINE_GROUP = "machine_group"
+CRITICAL_PATH = "critical_path"
+NEIGHBORHOODS = (TIME_WINDOW, MACHINE_GROUP, CRITICAL_PATH)
+
+
+class LNSConfig(BaseModel):
+    """Budget and neighborhood settings for large neighborhood search."""
+
+    time_limit_seconds: float = Field(default=60.0, gt=0.0)
+    stagnation_iterations: int = Field(default=30, ge=1)  # Iterations without improvement
+    iteration_time_limit_seconds: float = Field(default=2.0, ge=1.0)
+    max_free_tasks: int = Field(default=150, ge=2)
+    window_minutes: int = Field(default=8 * 60, ge=1)
+    machine_group_size: int = Field(default=2, ge=1)
+    reaction_factor: float = Field(default=0.3, gt=0.0, le=1.0)  # Weight update speed
+    min_weight: float = Field(default=0.1, gt=0.0)
+    seed: int = 0
+
+
+class NeighborhoodStats(BaseModel):
+    """Outcome of the iterations run with one neighborhood type."""
+
+    weight: float = 1.0
+    attempts: int = 0
+    improvements: int = 0
+    total_gain: float = 0.0
+
+
+def precedence_maps(
+    problem: SchedulingProblem,
+    temporal: TemporalConstraints
+) -> Tuple[Dict[UUID, Set[UUID]], Dict[UUID, Set[UUID]]]:
+    """Predecessor and successor sets of every task in ``problem``."""
+    predecessors: Dict[UUID, Set[UUID]] = {task_id: set() for task_id in problem.task_ids}
+    successors: Dict[UUID, Set[UUID]] = {task_id: set() for task_id in problem.task_ids}
+    for pred_id, succ_id in temporal.precedence_constraints:
+        if pred_id in predecessors and succ_id in predecessors:
+            predecessors[succ_id].add(pred_id)
+            successors[pred_id].add(succ_id)
+    return predecessors, successors
+
+
+def build_subproblem(
+    problem: SchedulingProblem,
+    free: Set[UUID],
+    starts: Dict[UUID, int],
+    durations: Dict[UUID, int],
+    machines: Dict[UUID, UUID],
+    predecessors: Dict[UUID, Set[UUID]],
+    successors: Dict[UUID, Set[UUID]],
+    time_limit: float,
+    compact: bool = False,
+    problem_id: Optional[str] = None,
+    operators: Optional[Dict[UUID, UUID]] = None
+) -> SchedulingProblem:
+    """
+    Free tasks plus the fixed tasks they could share machines or operators with.
+
+    ``starts`` and ``durations`` are in model slots. Free tasks may move to
+    any of their eligible machines. Fixed tasks keep their machine and, from
+    ``operators``, their operator, so the free tasks are solved around every
+    commitment they could collide with. Fixed
+    precedence neighbours of free tasks become time bounds, so the
+    sub-problem is feasible whenever the free tasks fit around the fixed
+    ones.
+
+    With ``compact`` the sub-problem minimizes total start time instead of
+    the problem objective, pulling non-critical tasks earlier.
+    """
+    granularity = problem.time_granularity_minutes
+    source = problem.temporal_constraints
+    operators = operators or {}
+    eligible = {t: problem.eligible_machines(t) for t in free}
+    free_machines = {m for machine_ids in eligible.values() for m in machine_ids}
+    # Any qualified operator, as free tasks are not pinned in the sub-problem
+    free_operators = {
+        o for o in set(operators.values())
+        if any(problem.skill_constraints.can_operator_perform_task(o, t) for t in free)
+    }
+    fixed = [
+        t for t in problem.task_ids
+        if t not in free and (
+            machines.get(t) in free_machines or operators.get(t) in free_operators
+        )
+    ]
+    task_ids = [t for t in problem.task_ids if t in free] + fixed
+
+    # Fixed precedence neighbours become time bounds, in minutes
+    temporal = TemporalConstraints()
+    for task_id in free:
+        earliest = source.task_earliest_start.get(task_id)
+        latest = source.task_latest_end.get(task_id)
+        for pred_id in predecessors[task_id]:
+            if pred_id in free:
+                temporal.add_precedence(pred_id, task_id)
+            else:
+                pred_end = (starts[pred_id] + durations[pred_id]) * granularity
+                earliest = pred_end if earliest is None else max(earliest, pred_end)
+        for succ_id in successors[task_id]:
+            if succ_id not in free:
+                succ_start = starts[succ_id] * granularity
+                latest = succ_start if latest is None else min(latest, succ_start)
+        if earliest is not None:
+            temporal.task_earliest_start[task_id] = earliest
+        if latest is not None:
+            temporal.task_latest_end[task_id] = latest
+
+    hint = ScheduleHint(frozen_task_ids=set(fixed))
+    for task_id in task_ids:
+        hint.start_minutes[task_id] = starts[task_id] * granularity
+        if machines.get(task_id):
+            hint.machine_assignments[task_id] = machines[task_id]
+        if operators.get(task_id):
+            hint.operator_assignments[task_id] = [operators[task_id]]
+
+    return SchedulingProblem(
+        problem_id=problem_id or f"{problem.problem_id}_sub",
+        planning_horizon_start=problem.planning_horizon_start,
+        planning_horizon_end=problem.planning_horizon_end,
+        time_granularity_minutes=granularity,
+        task_ids=task_ids,
+        task_durations={t: problem.task_durations.get(t, 60) for t in task_ids},
+        task_priorities={
+            t: problem.task_priorities[t] for t in task_ids if t in problem.task_priorities
+        },
+        machine_ids=problem.machine_ids,
+        operator_ids=problem.operator_ids,
+        fixed_task_assignments={t: machines[t] for t in fixed if machines.get(t)},
+        task_eligible_machines=eligible,
+        schedule_hint=hint,
+        resource_constraints=problem.resource_constraints,
+        temporal_constraints=temporal,
+        skill_constraints=problem.skill_constraints,
+        optimization_objective=(
+            OptimizationObjective.MINIMIZE_TOTAL_DELAY if compact
+            else problem.optimization_objective
+        ),
+        objective_weights={} if compact else problem.objective_weights,
+        max_solution_time_seconds=time_limit,
+        solution_quality_tolerance=problem.solution_quality_tolerance
+    )
+
+
+def schedule_objective(
+    problem: SchedulingProblem,
+    starts: Dict[UUID, int],
+    durations: Dict[UUID, int]
+) -> Tuple[float, int]:
+    """
+    Objective of a full schedule in model slots, as CPSATScheduler scores
+    it, with the sum of task ends as tie-breaker.
+
+    The tie-breaker rewards compacting non-critical tasks, which opens
+    room for later moves on the critical ones.
+    """
+    total_end = sum(start + durations[task_id] for task_id, start in starts.items())
+    if problem.optimization_objective == OptimizationObjective.MINIMIZE_TOTAL_DELAY:
+        weights = problem.objective_weights
+        return float(sum(
+            max(0, start - weights.get(f"planned_start_{task_id}", 0))
+            for task_id, start in starts.items()
+        )), total_end
+    return float(max(
+        (start + durations[task_id] for task_id, start in starts.items()), default=0
+    )), total_end
+
+
+class LargeNeighborhoodSearch:
+    """
+    Improves a SchedulingProblem solution by destroy-and-repair with CP-SAT.
+
+    Times inside the search are in the scheduler's model slots
+    (``time_granularity_minutes`` per slot), matching CPSATScheduler.
+    """
+
+    def __init__(
+        self,
+        scheduler: Optional[CPSATScheduler] = None,
+        config: Optional[LNSConfig] = None
+    ):
+        self.scheduler = scheduler or CPSATScheduler()
+        self.config = config or LNSConfig()
+        self.iterations = 0
+        self.neighborhood_stats: Dict[str, NeighborhoodStats] = {}
+
+    def solve(self, problem: SchedulingProblem) -> OptimizationResult:
+        """Search for an improved schedule of ``problem`` within the budget."""
+        start_time = time.time()
+        rng = random.Random(self.config.seed)
+        self.iterations = 0
+        self.neighborhood_stats = {name: NeighborhoodStats() for name in NEIGHBORHOODS}
+
+        durations, temporal = self.scheduler.to_slot_units(problem)
+        machines = self.scheduler.build_resource_assignments(problem)
+        predecessors, successors = precedence_maps(problem, temporal)
+
+        initial = self._initial_schedule(
+            problem, durations, temporal, machines, predecessors, successors
+        )
+        if initial is not None:
+            starts, operators = initial
+        else:
+            # The heuristic missed a deadline or the horizon; let CP-SAT find
+            # the first incumbent
+            result = self.scheduler.solve(problem.model_copy(update={
+                "max_solution_time_seconds": max(
+                    1.0, min(problem.max_solution_time_seconds, self.config.time_limit_seconds)
+                )
+            }))
+            if not result.is_feasible:
+                return result
+            starts = {
+                a.task_id: self._slot(problem, a.start_time) for a in result.task_assignments
+            }
+            machines.update({
+                a.task_id: a.assigned_machine_id
+                for a in result.task_assignments if a.assigned_machine_id
+            })
+            operators = {
+                a.task_id: a.assigned_operator_ids[0]
+                for a in result.task_assignments if a.assigned_operator_ids
+            }
+
+        current = schedule_objective(problem, starts, durations)
+        stagnation = 0
+        solver_iterations = 0
+        max_variables = 0
+        max_constraints = 0
+
+        while (
+            time.time() - start_time < self.config.time_limit_seconds
+            and stagnation < self.config.stagnation_iterations
+        ):
+            name = self._pick_neighborhood(rng)
+            free = self._neighborhood(
+                name, rng, problem, starts, durations, machines, operators,
+                predecessors, successors
+            )
+            stats = self.neighborhood_stats[name]
+            stats.attempts += 1
+            self.iterations += 1
+            if len(free) < 2:
+                self._reward(stats, 0.0)
+                stagnation += 1
+                continue
+
+            remaining = self.config.time_limit_seconds - (time.time() - start_time)
+            subproblem = build_subproblem(
+                problem, free, starts, durations, machines, predecessors, successors,
+                time_limit=max(1.0, min(self.config.iteration_time_limit_seconds, remaining)),
+                compact=self._is_off_critical(problem, free, starts, durations, current),
+                problem_id=f"{problem.problem_id}_lns{self.iterations}",
+                operators=operators
+            )
+            result = self.scheduler.solve(subproblem)
+            solver_iterations += result.solver_iterations
+            max_variables = max(max_variables, result.variables_count)
+            max_constraints = max(max_constraints, result.constraints_count)
+            if not result.is_feasible:
+                self._reward(stats, 0.0)
+                stagnation += 1
+                continue
+
+            candidate = dict(starts)
+            candidate_machines = dict(machines)
+            candidate_operators = dict(operators)
+            for assignment in result.task_assignments:
+                if assignment.task_id in free:
+                    candidate[assignment.task_id] = self._slot(problem, assignment.start_time)
+                    if assignment.assigned_machine_id:
+                        candidate_machines[assignment.task_id] = assignment.assigned_machine_id
+                    if assignment.assigned_operator_ids:
+                        candidate_operators[assignment.task_id] = (
+                            assignment.assigned_operator_ids[0]
+                        )
+            value = schedule_objective(problem, candidate, durations)
+
+            if value < current:
+                stats.improvements += 1
+                stats.total_gain += current[0] - value[0]
+                self._reward(stats, 2.0 if value[0] < current[0] else 1.0)
+                starts, current = candidate, value
+                machines, operators = candidate_machines, candidate_operators
+                stagnation = 0
+            else:
+                # Equal-cost moves are kept to diversify the next neighborhoods
+                if value == current:
+                    starts = candidate
+                    machines, operators = candidate_machines, candidate_operators
+                self._reward(stats, 0.5 if value == current else 0.0)
+                stagnation += 1
+
+        return self._build_result(
+            problem, starts, machines, operators, current[0], time.time() - start_time,
+            solver_iterations, max_variables, max_constraints
+        )
+
+    def _initial_schedule(
+        self,
+        problem: SchedulingProblem,
+        durations: Dict[UUID, int],
+        temporal: TemporalConstraints,
+        machines: Dict[UUID, UUID],
+        predecessors: Dict[UUID, Set[UUID]],
+        successors: Dict[UUID, Set[UUID]]
+    ) -> Optional[Tuple[Dict[UUID, int], Dict[UUID, UUID]]]:
+        """
+        List-schedule tasks in precedence order, earliest release first.
+
+        Each task takes the unit of a qualified operator that frees up
+        first, best skill match on ties. Returns slot starts and operators,
+        or None when the result misses a deadline or the horizon, or when
+        precedence is cyclic.
+        """
+        pending = {task_id: len(preds) for task_id, preds in predecessors.items()}
+        ready_at = {
+            task_id: temporal.task_earliest_start.get(task_id, 0) for task_id in problem.task_ids
+        }
+        ready = [(ready_at[t], str(t), t) for t, count in pending.items() if count == 0]
+        heapq.heapify(ready)
+        machine_free: Dict[UUID, int] = {}
+        operator_free = {
+            o: [0] * problem.resource_constraints.operator_capacities.get(o, 1)
+            for o in problem.operator_ids
+        }
+        starts: Dict[UUID, int] = {}
+        operators: Dict[UUID, UUID] = {}
+
+        while ready:
+            release, _, task_id = heapq.heappop(ready)
+            machine_id = machines.get(task_id)
+            start = max(release, machine_free.get(machine_id, 0)) if machine_id else release
+            unit = min(
+                (
+                    (operator_free[o][u], o, u)
+                    for o in problem.eligible_operators(task_id)
+                    for u in range(len(operator_free[o]))
+                ),
+                key=lambda option: option[0],
+                default=None
+            ) if problem.operator_ids else None
+            if unit is not None:
+                start = max(start, unit[0])
+            end = start + durations[task_id]
+            latest_end = temporal.task_latest_end.get(task_id)
+            if end > problem.time_slots or (latest_end is not None and end > latest_end):
+                return None
+            starts[task_id] = start
+            if machine_id:
+                machine_free[machine_id] = end
+            if unit is not None:
+                _, operator_id, index = unit
+                operator_free[operator_id][index] = end
+                operators[task_id] = operator_id
+            for succ_id in successors[task_id]:
+                ready_at[succ_id] = max(ready_at[succ_id], end)
+                pending[succ_id] -= 1
+                if pending[succ_id] == 0:
+                    heapq.heappush(ready, (ready_at[succ_id], str(succ_id), succ_id))
+
+        if len(starts) < len(problem.task_ids):
+            return None
+        return starts, operators
+
+    def _pick_neighborhood(self, rng: random.Random) -> str:
+        """Roulette-wheel choice weighted by past improvement."""
+        weights = [self.neighborhood_stats[name].weight for name in NEIGHBORHOODS]
+        return rng.choices(NEIGHBORHOODS, weights=weights)[0]
+
+    def _reward(self, stats: NeighborhoodStats, reward: float) -> None:
+        rate = self.config.reaction_factor
+        stats.weight = max(self.config.min_weight, (1 - rate) * stats.weight + rate * reward)
+
+    def _neighborhood(
+        self,
+        name: str,
+        rng: random.Random,
+        problem: SchedulingProblem,
+        starts: Dict[UUID, int],
+        durations: Dict[UUID, int],
+        machines: Dict[UUID, UUID],
+        operators: Dict[UUID, UUID],
+        predecessors: Dict[UUID, Set[UUID]],
+        successors: Dict[UUID, Set[UUID]]
+    ) -> Set[UUID]:
+        """Tasks to free for one iteration, capped at ``max_free_tasks``."""
+        limit = self.config.max_free_tasks
+        ends = {task_id: start + durations[task_id] for task_id, start in starts.items()}
+
+        if name == TIME_WINDOW:
+            width = max(1, self.config.window_minutes // problem.time_granularity_minutes)
+            horizon_end = max(ends.values(), default=0)
+            window_start = rng.randrange(0, max(1, horizon_end - width + 1))
+            window_end = window_start + width
+            overlapping = [
+                t for t in starts if starts[t] < window_end and ends[t] > window_start
+            ]
+            overlapping.sort(key=lambda t: abs(starts[t] - window_start - width // 2))
+            return set(overlapping[:limit])
+
+        if name == MACHINE_GROUP:
+            used = sorted({m for m in machines.values() if m}, key=str)
+            if not used:
+                return set()
+            group = set(rng.sample(used, min(self.config.machine_group_size, len(used))))
+            on_group = sorted(
+                (t for t in starts if machines.get(t) in group), key=lambda t: starts[t]
+            )
+            offset = rng.randrange(0, max(1, len(on_group) - limit + 1))
+            return set(on_group[offset:offset + limit])
+
+        # Critical path: walk back through tight precedence, machine and
+        # operator links from the last task to finish, then free the chains
+        # it runs through
+        resource_previous: List[Dict[UUID, UUID]] = []
+        for resources in (machines, operators):
+            by_resource: Dict[UUID, List[UUID]] = {}
+            for task_id in sorted(starts, key=lambda t: starts[t]):
+                if resources.get(task_id):
+                    by_resource.setdefault(resources[task_id], []).append(task_id)
+            resource_previous.append({
+                later: earlier
+                for sequence in by_resource.values()
+                for earlier, later in zip(sequence, sequence[1:])
+            })
+
+        path = []
+        task_id = max(starts, key=lambda t: ends[t], default=None)
+        while task_id is not None and task_id not in path:
+            path.append(task_id)
+            tight = [p for p in predecessors[task_id] if ends[p] == starts[task_id]]
+            for previous_on_resource in resource_previous:
+                previous = previous_on_resource.get(task_id)
+                if previous is not None and ends[previous] == starts[task_id]:
+                    tight.append(previous)
+            task_id = tight[0] if tight else None
+
+        free: Set[UUID] = set()
+        queue = list(path)
+        while queue and len(free) < limit:
+            task_id = queue.pop(0)
+            if task_id in free:
+                continue
+            free.add(task_id)
+            queue.extend(predecessors[task_id] | successors[task_id])
+        return free
+
+    def _is_off_critical(
+        self,
+        problem: SchedulingProblem,
+        free: Set[UUID],
+        starts: Dict[UUID, int],
+        durations: Dict[UUID, int],
+        current: Tuple[float, int]
+    ) -> bool:
+        """True for a makespan problem whose neighborhood cannot move the makespan."""
+        if problem.optimization_objective == OptimizationObjective.MINIMIZE_TOTAL_DELAY:
+            return False
+        return all(starts[t] + durations[t] < current[0] for t in free)
+
+    def _slot(self, problem: SchedulingProblem, moment: datetime) -> int:
+        minutes = int((moment - problem.planning_horizon_start).total_seconds() // 60)
+        return minutes // problem.time_granularity_minutes
+
+    def _build_result(
+        self,
+        problem: SchedulingProblem,
+        starts: Dict[UUID, int],
+        machines: Dict[UUID, UUID],
+        operators: Dict[UUID, UUID],
+        objective_value: float,
+        solution_time: float,
+        iterations: int,
+        max_variables: int,
+        max_constraints: int
+    ) -> OptimizationResult:
+        """Map slot starts and the incumbent's resources back to exact-minute assignments."""
+        granularity = problem.time_granularity_minutes
+        horizon_start = problem.planning_horizon_start
+        earliest = problem.temporal_constraints.task_earliest_start
+
+        assignments = []
+        for task_id in problem.task_ids:
+            start_minutes = starts[task_id] * granularity
+            duration = problem.task_durations.get(task_id, 60)
+            operator_id = operators.get(task_id)
+            assignments.append(TaskAssignment(
+                task_id=task_id,
+                start_time=horizon_start + timedelta(minutes=start_minutes),
+                end_time=horizon_start + timedelta(minutes=start_minutes + duration),
+                duration_minutes=duration,
+                assigned_machine_id=machines.get(task_id),
+                assigned_operator_ids=[operator_id] if operator_id else [],
+                skill_match_score=(
+                    min(1.0, problem.skill_constraints.get_skill_match_score(operator_id, task_id))
+                    if operator_id else 1.0
+                ),
+                delay_minutes=max(0, start_minutes - earliest.get(task_id, 0))
+            ))
+
+        makespan_minutes = max(
+            ((a.end_time - horizon_start).total_seconds() / 60 for a in assignments),
+            default=0.0
+        )
+        total_delay = sum(a.delay_minutes for a in assignments)
+
+        return OptimizationResult(
+            status=SolutionStatus.FEASIBLE,
+            objective_value=objective_value,
+            solution_time_seconds=solution_time,
+            task_assignments=assignments,
+            makespan_hours=makespan_minutes / 60.0,
+            total_delay_hours=total_delay / 60.0,
+            resource_utilization=self.scheduler._calculate_resource_utilization(
+                problem, assignments, machines
+            ),
+            feasibility_score=1.0,
+            solver_iterations=iterations,
+            variables_count=max_variables,
+            constraints_count=max_constraints
+        )
@@ -9,18 +9,31 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from ....shared.exceptions import OptimizationError, ValidationError
+from pydantic import BaseModel, Field
+
+from ...shared.exceptions import OptimizationError, ValidationError
 from ..entities.task import Task
 from ..entities.machine import Machine
 from ..entities.operator import Operator
 from ..entities.job import Job
+from ..entities.schedule import Schedule
 from ..repositories.task_repository import TaskRepository
 from ..repositories.machine_repository import MachineRepository
 from ..repositories.operator_repository import OperatorRepository
 from ..repositories.job_repository import JobRepository
+from ..repositories.schedule_repository import ScheduleRepository
 from ..services.resource_allocation_service import ResourceAllocationService
 
-from .cp_sat_scheduler import CPSATScheduler, SchedulingProblem, OptimizationResult, TaskAssignment
+from .cp_sat_scheduler import (
+    CPSATScheduler,
+    SchedulingProblem,
+    ScheduleHint,
+    OptimizationResult,
+    TaskAssignment
+)
+from .decomposition import DecomposedScheduler, DecompositionConfig
+from .lns import LargeNeighborhoodSearch, LNSConfig
+from .rolling_horizon import RollingHorizonConfig, RollingHorizonScheduler
 from .constraint_models import (
     ResourceConstraints,
     TemporalConstraints,
@@ -40,6 +53,7 @@ class SchedulingOptimizationRequest(BaseModel):
     # Time horizon
     optimization_start: datetime
     optimization_end: datetime
+    time_granularity_minutes: int = Field(default=15, ge=1, le=60)  # Model time quantum
     
     # Optimization preferences
     objective: OptimizationObjective = OptimizationObjective.MINIMIZE_MAKESPAN
@@ -55,6 +69,21 @@ class SchedulingOptimizationRequest(BaseModel):
     max_optimization_time_seconds: float = Field(default=300.0, ge=30.0, le=1800.0)
     solution_quality_target: float = Field(default=0.95, ge=0.5, le=1.0)
     
+    # Rolling-horizon decomposition (None solves the whole horizon at once)
+    rolling_window_hours: Optional[float] = Field(default=None, gt=0.0)
+    rolling_overlap_hours: float = Field(default=8.0, ge=0.0)
+    max_tasks_per_window: int = Field(default=500, ge=1)
+    
+    # Large neighborhood search from a heuristic schedule (for big instances)
+    use_large_neighborhood_search: bool = False
+    lns_stagnation_iterations: int = Field(default=30, ge=1)
+    lns_max_free_tasks: int = Field(default=150, ge=2)
+    
+    # Concurrent per-zone cluster solves in the solver pool, then a repair
+    # of the cross-cluster precedence edges (for plant-wide problems)
+    use_decomposition: bool = False
+    decomposition_min_tasks: int = Field(default=200, ge=1)
+    
     # Resource preferences
     preferred_machine_assignments: Dict[UUID, UUID] = Field(default_factory=dict)  # task_id -> machine_id
     preferred_operator_assignments: Dict[UUID, UUID] = Field(default_factory=dict)  # task_id -> operator_id
@@ -78,7 +107,8 @@ class SchedulingOptimizationService:
         machine_repository: MachineRepository,
         operator_repository: OperatorRepository,
         job_repository: JobRepository,
-        resource_allocation_service: ResourceAllocationService
+        resource_allocation_service: ResourceAllocationService,
+        schedule_repository: Optional[ScheduleRepository] = None
     ):
         """Initialize the optimization service."""
         self.task_repo = task_repository
@@ -86,6 +116,7 @@ class SchedulingOptimizationService:
         self.operator_repo = operator_repository
         self.job_repo = job_repository
         self.resource_service = resource_allocation_service
+        self.schedule_repo = schedule_repository
         self.scheduler = CPSATScheduler()
     
     async def optimize_schedule(
@@ -120,7 +151,36 @@ class SchedulingOptimizationService:
         problem = await self._build_scheduling_problem(request, tasks, machines, operators)
         
         # Solve optimization problem
-        result = self.scheduler.solve(problem)
+        if request.rolling_window_hours:
+            rolling = RollingHorizonScheduler(
+                self.scheduler,
+                RollingHorizonConfig(
+                    window_minutes=int(request.rolling_window_hours * 60),
+                    overlap_minutes=int(request.rolling_overlap_hours * 60),
+                    max_tasks_per_window=request.max_tasks_per_window
+                )
+            )
+            result = rolling.solve(problem)
+        elif request.use_large_neighborhood_search:
+            lns = LargeNeighborhoodSearch(
+                self.scheduler,
+                LNSConfig(
+                    time_limit_seconds=request.max_optimization_time_seconds,
+                    stagnation_iterations=request.lns_stagnation_iterations,
+                    max_free_tasks=request.lns_max_free_tasks
+                )
+            )
+            result = lns.solve(problem)
+        elif request.use_decomposition:
+            decomposed = DecomposedScheduler(
+                config=DecompositionConfig(min_tasks=request.decomposition_min_tasks)
+            )
+            # Machines of one production zone are always solved together
+            result = await decomposed.solve(
+                problem, {machine.id: machine.production_zone_id for machine in machines}
+            )
+        else:
+            result = self.scheduler.solve(problem)
         
         # Post-process and validate solution
         if result.is_feasible:
@@ -165,17 +225,32 @@ class SchedulingOptimizationService:
         affected_resource_ids: List[UUID],
         disruption_start: datetime,
         disruption_end: datetime,
-        scope_hours: float = 24.0
+        scope_hours: float = 24.0,
+        warm_start: bool = True,
+        freeze_outside_neighborhood: bool = False,
+        neighborhood_hours: float = 4.0,
+        reference_schedule: Optional[Schedule] = None
     ) -> OptimizationResult:
         """
         Reoptimize schedule after a disruption (machine breakdown, operator absence, etc.).
         
+        With ``warm_start`` the last published schedule (or ``reference_schedule``)
+        seeds the solver with its start times and resource choices. With
+        ``freeze_outside_neighborhood`` only tasks on affected resources, tasks
+        starting within ``neighborhood_hours`` of the disruption window, tasks
+        missing from the reference schedule, and their successors may move;
+        every other task keeps its published slot.
+        
         Args:
             disruption_type: Type of disruption (machine_breakdown, operator_absence, etc.)
             affected_resource_ids: IDs of affected resources
             disruption_start: When disruption starts
             disruption_end: When disruption ends (None for unknown)
             scope_hours: Hours of schedule to reoptimize
+            warm_start: Use the previous schedule as solution hints
+            freeze_outside_neighborhood: Pin tasks outside the disruption neighborhood
+            neighborhood_hours: Padding around the disruption window that stays free
+            reference_schedule: Schedule to repair; defaults to the last published one
             
         Returns:
             Reoptimized schedule avoiding the disruption
@@ -202,6 +277,19 @@ class SchedulingOptimizationService:
             problem, disruption_type, affected_resource_ids, disruption_start, disruption_end
         )
         
+        if warm_start:
+            reference = reference_schedule or await self._load_reference_schedule()
+            if reference:
+                problem.schedule_hint = self._build_schedule_hint(
+                    problem,
+                    reference,
+                    tasks,
+                    affected_resource_ids,
+                    disruption_start,
+                    disruption_end or optimization_end,
+                    neighborhood_hours if freeze_outside_neighborhood else None
+                )
+        
         return self.scheduler.solve(problem)
     
     async def evaluate_what_if_scenario(
@@ -324,6 +412,7 @@ class SchedulingOptimizationService:
             problem_id=f"schedule_opt_{int(datetime.utcnow().timestamp())}",
             planning_horizon_start=request.optimization_start,
             planning_horizon_end=request.optimization_end,
+            time_granularity_minutes=request.time_granularity_minutes,
             optimization_objective=request.objective,
             max_solution_time_seconds=request.max_optimization_time_seconds
         )
@@ -338,6 +427,13 @@ class SchedulingOptimizationService:
         problem.machine_ids = [m.id for m in machines]
         problem.operator_ids = [o.id for o in operators]
         
+        # Machines each task can run on, so the solver only chooses among them
+        for task in tasks:
+            if task.machine_options:
+                problem.task_eligible_machines[task.id] = [
+                    option.machine_id for option in task.machine_options
+                ]
+        
         # Build constraints
         await self._build_resource_constraints(problem, request, tasks, machines, operators)
         await self._build_temporal_constraints(problem, request, tasks)
@@ -535,6 +631,78 @@ class SchedulingOptimizationService:
                     
                     problem.resource_constraints.operator_availability_windows[operator_id] = updated_windows
     
+    async def _load_reference_schedule(self) -> Optional[Schedule]:
+        """Load the schedule currently in force: the active one, else the latest published."""
+        if self.schedule_repo is None:
+            return None
+        
+        active = await self.schedule_repo.get_active_schedule()
+        if active:
+            return active
+        
+        published = await self.schedule_repo.get_published_schedules()
+        if not published:
+            return None
+        return max(published, key=lambda schedule: schedule.updated_at)
+    
+    def _build_schedule_hint(
+        self,
+        problem: SchedulingProblem,
+        reference: Schedule,
+        tasks: List[Task],
+        affected_resource_ids: List[UUID],
+        disruption_start: datetime,
+        disruption_end: datetime,
+        neighborhood_hours: Optional[float]
+    ) -> ScheduleHint:
+        """Convert a reference schedule into hints and, optionally, a frozen set."""
+        hint = ScheduleHint()
+        
+        for task in tasks:
+            assignment = reference.get_assignment(task.id)
+            if assignment is None:
+                continue
+            hint.start_minutes[task.id] = int(
+                (assignment.start_time - problem.planning_horizon_start).total_seconds() // 60
+            )
+            hint.machine_assignments[task.id] = assignment.machine_id
+            hint.operator_assignments[task.id] = list(assignment.operator_ids)
+        
+        if neighborhood_hours is None:
+            return hint
+        
+        padding = timedelta(hours=neighborhood_hours)
+        window_start = disruption_start - padding
+        window_end = disruption_end + padding
+        affected = set(affected_resource_ids)
+        
+        free = set()
+        for task in tasks:
+            assignment = reference.get_assignment(task.id)
+            if (
+                assignment is None
+                or assignment.machine_id in affected
+                or affected.intersection(assignment.operator_ids)
+                or (assignment.start_time < window_end and assignment.end_time > window_start)
+            ):
+                free.add(task.id)
+        
+        # Successors of a moved task must be able to move with it
+        successors: Dict[UUID, List[UUID]] = {}
+        for task in tasks:
+            for predecessor_id in task.predecessor_ids:
+                successors.setdefault(predecessor_id, []).append(task.id)
+        
+        stack = list(free)
+        while stack:
+            for successor_id in successors.get(stack.pop(), []):
+                if successor_id not in free:
+                    free.add(successor_id)
+                    stack.append(successor_id)
+        
+        hint.frozen_task_ids = set(hint.start_minutes) - free
+        return hint
+    
     async def _apply_scenario_changes(
         self,
         request: SchedulingOptimizationRequest,
@@ -572,40 +740,24 @@ class SchedulingOptimizationService:
         machines: List[Machine],
         operators: List[Operator]
     ) -> OptimizationResult:
-        """Post-process and validate the optimization solution."""
+        """
+        Post-process the optimization solution.
         
-        # Create lookup maps for entities
-        task_map = {t.id: t for t in tasks}
-        machine_map = {m.id: m for m in machines}
-        operator_map = {o.id: o for o in operators}
+        Machines and operators are chosen by the solver among eligible,
+        skill-qualified resources, so assignments need no re-validation.
+        """
+        
+        task_ids = {t.id for t in tasks}
         
         # Enhance task assignments with domain information
         enhanced_assignments = []
         
         for assignment in result.task_assignments:
-            task = task_map.get(assignment.task_id)
-            if not task:
+            if assignment.task_id not in task_ids:
                 continue
             
-            # Calculate assignment quality score
-            score = 1.0
-            
-            # Machine compatibility score
-            if assignment.assigned_machine_id:
-                machine = machine_map.get(assignment.assigned_machine_id)
-                if machine:
-                    # Check if machine can handle this task type
-                    if hasattr(task, 'task_type') and hasattr(machine, 'can_perform_task_type'):
-                        if machine.can_perform_task_type(task.task_type.value):
-                            score *= 1.0
-                        else:
-                            score *= 0.5  # Penalty for incompatible assignment
-            
             # Operator skill match score already calculated
-            score *= assignment.skill_match_score
-            
-            # Update assignment with enhanced score
-            assignment.assignment_score = score
+            assignment.assignment_score = assignment.skill_match_score
             enhanced_assignments.append(assignment)
         
         result.task_assignments = enhanced_assignments
@@ -0,0 +1,318 @@
+"""
+Rolling-horizon decomposition for long scheduling windows.
+
+Splits the planning horizon into overlapping windows and solves them in time
+order with CPSATScheduler. Each window model holds only the tasks released
+before the window's look-ahead end, plus the earlier commitments that still
+occupy resources in the window, frozen in place. Tasks starting before the
+window's commit boundary are fixed; the rest roll into the next window.
+Memory and solve time are therefore bounded per window rather than by the
+full horizon.
+"""
+
+import heapq
+import time
+from typing import Dict, Optional, Set, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from .constraint_models import OptimizationObjective, TemporalConstraints
+from .cp_sat_scheduler import (
+    CPSATScheduler,
+    OptimizationResult,
+    ScheduleHint,
+    SchedulingProblem,
+    SolutionStatus,
+    TaskAssignment,
+)
+
+
+class RollingHorizonConfig(BaseModel):
+    """Window layout for rolling-horizon solving."""
+
+    window_minutes: int = Field(default=7 * 24 * 60, ge=1)  # Committed span per window
+    overlap_minutes: int = Field(default=24 * 60, ge=0)  # Look-ahead beyond the commit boundary
+    max_tasks_per_window: Optional[int] = Field(default=500, ge=1)
+    window_time_limit_seconds: Optional[float] = Field(default=None, ge=1.0)
+
+
+class RollingHorizonScheduler:
+    """
+    Solves a SchedulingProblem window by window and stitches the results.
+
+    Times inside the loop are in the scheduler's model units
+    (``time_granularity_minutes`` per unit), matching CPSATScheduler; window
+    problems are built in minutes like the source problem.
+    """
+
+    def __init__(
+        self,
+        scheduler: Optional[CPSATScheduler] = None,
+        config: Optional[RollingHorizonConfig] = None
+    ):
+        self.scheduler = scheduler or CPSATScheduler()
+        self.config = config or RollingHorizonConfig()
+        self.windows_solved = 0
+
+    def solve(self, problem: SchedulingProblem) -> OptimizationResult:
+        """Solve ``problem`` as a sequence of overlapping windows."""
+        start_time = time.time()
+        granularity = problem.time_granularity_minutes
+        window = max(1, self.config.window_minutes // granularity)
+        overlap = self.config.overlap_minutes // granularity
+
+        task_set = set(problem.task_ids)
+        predecessors: Dict[UUID, Set[UUID]] = {task_id: set() for task_id in problem.task_ids}
+        successors: Dict[UUID, Set[UUID]] = {task_id: set() for task_id in problem.task_ids}
+        for pred_id, succ_id in problem.temporal_constraints.precedence_constraints:
+            if pred_id in task_set and succ_id in task_set:
+                predecessors[succ_id].add(pred_id)
+                successors[pred_id].add(succ_id)
+
+        committed: Dict[UUID, TaskAssignment] = {}
+        committed_slots: Dict[UUID, Tuple[int, int]] = {}
+        remaining = set(problem.task_ids)
+        window_start = 0
+        iterations = 0
+        max_variables = 0
+        max_constraints = 0
+        self.windows_solved = 0
+
+        while remaining:
+            commit_end = window_start + window
+            selected, next_release = self._select_window_tasks(
+                problem, remaining, predecessors, successors,
+                committed_slots, commit_end + overlap
+            )
+
+            if not selected:
+                # Nothing is released before this window ends; skip ahead
+                window_start = max(commit_end, next_release)
+                continue
+
+            subproblem = self._build_window_problem(
+                problem, selected, predecessors, committed, committed_slots, window_start
+            )
+            result = self.scheduler.solve(subproblem)
+            self.windows_solved += 1
+
+            if not result.is_feasible:
+                return OptimizationResult(
+                    status=result.status,
+                    solution_time_seconds=time.time() - start_time,
+                    task_assignments=list(committed.values()),
+                    constraint_violations=result.constraint_violations,
+                    solver_iterations=iterations + result.solver_iterations,
+                    variables_count=max(max_variables, result.variables_count),
+                    constraints_count=max(max_constraints, result.constraints_count)
+                )
+
+            iterations += result.solver_iterations
+            max_variables = max(max_variables, result.variables_count)
+            max_constraints = max(max_constraints, result.constraints_count)
+
+            placed = []
+            for assignment in result.task_assignments:
+                if assignment.task_id in selected:
+                    placed.append((self._to_slots(problem, assignment), assignment))
+
+            to_commit = [item for item in placed if item[0][0] < commit_end]
+            if not to_commit:
+                # Guarantee progress: commit the earliest placed task
+                to_commit = [min(placed, key=lambda item: item[0][0])]
+
+            for slots, assignment in to_commit:
+                committed[assignment.task_id] = assignment
+                committed_slots[assignment.task_id] = slots
+                remaining.discard(assignment.task_id)
+
+            window_start = commit_end
+
+        return self._stitch(
+            problem, committed, time.time() - start_time,
+            iterations, max_variables, max_constraints
+        )
+
+    def _select_window_tasks(
+        self,
+        problem: SchedulingProblem,
+        remaining: Set[UUID],
+        predecessors: Dict[UUID, Set[UUID]],
+        successors: Dict[UUID, Set[UUID]],
+        committed_slots: Dict[UUID, Tuple[int, int]],
+        lookahead_end: int
+    ) -> Tuple[Set[UUID], int]:
+        """
+        Pick released tasks in precedence order, earliest release first.
+
+        Returns the selection and the earliest release among unselected ready
+        tasks (used to skip empty windows).
+        """
+        limit = self.config.max_tasks_per_window or len(remaining)
+        granularity = problem.time_granularity_minutes
+        earliest = problem.temporal_constraints.task_earliest_start
+
+        def release(task_id: UUID) -> int:
+            bound = -(-earliest.get(task_id, 0) // granularity)
+            for pred_id in predecessors[task_id]:
+                if pred_id in committed_slots:
+                    bound = max(bound, committed_slots[pred_id][1])
+            return bound
+
+        pending = {
+            task_id: sum(1 for p in predecessors[task_id] if p in remaining)
+            for task_id in remaining
+        }
+        ready = [(release(t), str(t), t) for t, count in pending.items() if count == 0]
+        heapq.heapify(ready)
+
+        selected: Set[UUID] = set()
+        next_release = problem.time_slots
+        while ready and len(selected) < limit:
+            task_release, _, task_id = heapq.heappop(ready)
+            if task_release >= lookahead_end:
+                next_release = task_release
+                break
+            selected.add(task_id)
+            for succ_id in successors[task_id]:
+                if succ_id in pending:
+                    pending[succ_id] -= 1
+                    if pending[succ_id] == 0:
+                        heapq.heappush(ready, (release(succ_id), str(succ_id), succ_id))
+
+        return selected, next_release
+
+    def _build_window_problem(
+        self,
+        problem: SchedulingProblem,
+        selected: Set[UUID],
+        predecessors: Dict[UUID, Set[UUID]],
+        committed: Dict[UUID, TaskAssignment],
+        committed_slots: Dict[UUID, Tuple[int, int]],
+        window_start: int
+    ) -> SchedulingProblem:
+        """Window model: selected tasks plus frozen commitments still running."""
+        granularity = problem.time_granularity_minutes
+        source = problem.temporal_constraints
+
+        # Earlier commitments that may still hold a resource in this window
+        carried = [
+            task_id for task_id, (_, end) in committed_slots.items()
+            if end > window_start
+        ]
+        task_ids = [t for t in problem.task_ids if t in selected] + carried
+
+        temporal = TemporalConstraints()
+        for task_id in selected:
+            bound = source.task_earliest_start.get(task_id)
+            for pred_id in predecessors[task_id]:
+                if pred_id in selected:
+                    temporal.add_precedence(pred_id, task_id)
+                elif pred_id in committed_slots:
+                    pred_end = committed_slots[pred_id][1] * granularity
+                    bound = pred_end if bound is None else max(bound, pred_end)
+            if bound is not None:
+                temporal.task_earliest_start[task_id] = bound
+            if task_id in source.task_latest_end:
+                temporal.task_latest_end[task_id] = source.task_latest_end[task_id]
+            if task_id in source.task_durations:
+                temporal.task_durations[task_id] = source.task_durations[task_id]
+
+        hint = ScheduleHint(frozen_task_ids=set(carried))
+        fixed_assignments = {
+            task_id: machine_id
+            for task_id, machine_id in problem.fixed_task_assignments.items()
+            if task_id in selected
+        }
+        for task_id in carried:
+            hint.start_minutes[task_id] = committed_slots[task_id][0] * granularity
+            if committed[task_id].assigned_machine_id:
+                fixed_assignments[task_id] = committed[task_id].assigned_machine_id
+                hint.machine_assignments[task_id] = committed[task_id].assigned_machine_id
+            hint.operator_assignments[task_id] = list(committed[task_id].assigned_operator_ids)
+
+        return SchedulingProblem(
+            problem_id=f"{problem.problem_id}_w{self.windows_solved}",
+            planning_horizon_start=problem.planning_horizon_start,
+            planning_horizon_end=problem.planning_horizon_end,
+            time_granularity_minutes=granularity,
+            task_ids=task_ids,
+            task_durations={t: problem.task_durations.get(t, 60) for t in task_ids},
+            task_priorities={
+                t: problem.task_priorities[t] for t in task_ids if t in problem.task_priorities
+            },
+            machine_ids=problem.machine_ids,
+            operator_ids=problem.operator_ids,
+            fixed_task_assignments=fixed_assignments,
+            task_eligible_machines={
+                t: problem.task_eligible_machines[t]
+                for t in selected if t in problem.task_eligible_machines
+            },
+            preferred_assignments={
+                t: problem.preferred_assignments[t]
+                for t in selected if t in problem.preferred_assignments
+            },
+            schedule_hint=hint,
+            resource_constraints=problem.resource_constraints,
+            temporal_constraints=temporal,
+            skill_constraints=problem.skill_constraints,
+            optimization_objective=problem.optimization_objective,
+            objective_weights=problem.objective_weights,
+            max_solution_time_seconds=(
+                self.config.window_time_limit_seconds or problem.max_solution_time_seconds
+            ),
+            solution_quality_tolerance=problem.solution_quality_tolerance
+        )
+
+    def _to_slots(
+        self, problem: SchedulingProblem, assignment: TaskAssignment
+    ) -> Tuple[int, int]:
+        granularity = problem.time_granularity_minutes
+        start = int((assignment.start_time - problem.planning_horizon_start).total_seconds() // 60)
+        end = int((assignment.end_time - problem.planning_horizon_start).total_seconds() // 60)
+        # Exact ends may fall inside a slot, which stays occupied
+        return start // granularity, -(-end // granularity)
+
+    def _stitch(
+        self,
+        problem: SchedulingProblem,
+        committed: Dict[UUID, TaskAssignment],
+        solution_time: float,
+        iterations: int,
+        max_variables: int,
+        max_constraints: int
+    ) -> OptimizationResult:
+        """Combine window commitments into one result over the full problem."""
+        assignments = [committed[t] for t in problem.task_ids if t in committed]
+        horizon_start = problem.planning_horizon_start
+
+        makespan_minutes = max(
+            ((a.end_time - horizon_start).total_seconds() / 60 for a in assignments),
+            default=0.0
+        )
+        total_delay = sum(a.delay_minutes for a in assignments)
+        objective_value = (
+            total_delay
+            if problem.optimization_objective == OptimizationObjective.MINIMIZE_TOTAL_DELAY
+            else makespan_minutes / problem.time_granularity_minutes
+        )
+        machine_map = {
+            a.task_id: a.assigned_machine_id for a in assignments if a.assigned_machine_id
+        }
+
+        return OptimizationResult(
+            status=SolutionStatus.FEASIBLE,
+            objective_value=objective_value,
+            solution_time_seconds=solution_time,
+            task_assignments=assignments,
+            makespan_hours=makespan_minutes / 60.0,
+            total_delay_hours=total_delay / 60.0,
+            resource_utilization=self.scheduler._calculate_resource_utilization(
+                problem, assignments, machine_map
+            ),
+            feasibility_score=1.0,
+            solver_iterations=iterations,
+            variables_count=max_variables,
+            constraints_count=max_constraints
+        )
@@ -13,9 +13,13 @@ from uuid import UUID
 
 try:
     from ortools.sat.python import cp_model  # type: ignore[import-not-found]
+
+    from ....core.solver_termination import TerminationPolicy, solve_with_policy
 except ImportError:
     # Fallback for environments without OR-Tools
     cp_model = None
+    TerminationPolicy = None
+    solve_with_policy = None
 
 from ...shared.exceptions import (
     NoFeasibleSolutionError,
@@ -46,6 +50,10 @@ class OptimizationParameters:
         enable_hierarchical_optimization: bool = True,
         primary_objective_weight: int = 2,
         cost_optimization_tolerance: float = 0.1,
+        warm_start_schedule: Schedule | None = None,
+        frozen_task_ids: set[UUID] | None = None,
+        time_quantum_minutes: int = 1,
+        termination: "TerminationPolicy | None" = None,
     ) -> None:
         self.max_time_seconds = max_time_seconds
         self.num_workers = num_workers
@@ -53,6 +61,16 @@ class OptimizationParameters:
         self.enable_hierarchical_optimization = enable_hierarchical_optimization
         self.primary_objective_weight = primary_objective_weight
         self.cost_optimization_tolerance = cost_optimization_tolerance
+        # Previous schedule used as solution hints; tasks in frozen_task_ids
+        # keep its start times
+        self.warm_start_schedule = warm_start_schedule
+        self.frozen_task_ids = frozen_task_ids or set()
+        # Model time unit; durations round up to whole quanta and solutions
+        # map back to exact minutes
+        self.time_quantum_minutes = time_quantum_minutes
+        # Early stop on gap, stagnation or slow improvement; None uses the
+        # default 1% relative gap
+        self.termination = termination
 
 
 class OptimizationResult:
@@ -68,6 +86,7 @@ class OptimizationResult:
         solve_time_seconds: float = 0.0,
         job_completions: dict[UUID, float] | None = None,
         violations: list[str] | None = None,
+        stop_reason: str | None = None,
     ) -> None:
         self.schedule = schedule
         self.makespan_minutes = makespan_minutes
@@ -77,6 +96,7 @@ class OptimizationResult:
         self.solve_time_seconds = solve_time_seconds
         self.job_completions = job_completions or {}
         self.violations = violations or []
+        self.stop_reason = stop_reason
 
 
 class OptimizationService:
@@ -150,6 +170,9 @@ class OptimizationService:
         """
         Optimize schedule for given jobs using OR-Tools CP-SAT solver.
 
+        Set ``parameters.warm_start_schedule`` to re-optimize from a previous
+        schedule instead of cold-starting the solver.
+
         Args:
             job_ids: Jobs to include in optimization
             start_time: Schedule start time
@@ -299,11 +322,17 @@ class OptimizationService:
             jobs, tasks, operators, machines, start_time, params
         )
 
-        # Constrain primary objective to be within tolerance of Phase 1
+        # Constrain primary objective to be within tolerance of Phase 1. The
+        # Phase 1 metrics are exact minutes while the model counts quanta, and
+        # rounding due dates down can add a quantum of tardiness per job
         primary_bound = int(
             (params.primary_objective_weight * max_tardiness + max_makespan)
             * (1.0 + params.cost_optimization_tolerance)
         )
+        if params.time_quantum_minutes > 1:
+            primary_bound = -(
+                -primary_bound // params.time_quantum_minutes
+            ) + params.primary_objective_weight * len(jobs)
         model.Add(variables["primary_objective"] <= primary_bound)
 
         # Minimize cost
@@ -323,10 +352,21 @@ class OptimizationService:
         start_time: datetime,
         params: OptimizationParameters,
     ) -> tuple[cp_model.CpModel, dict[str, Any]]:
-        """Create the OR-Tools CP-SAT model (adapted from solver.py)."""
+        """
+        Create the OR-Tools CP-SAT model (adapted from solver.py).
+
+        Model times are in units of ``params.time_quantum_minutes``;
+        ``task_durations`` keeps each option's exact minutes for mapping the
+        solution back.
+
+        Tasks are indexed by job and machines by task type up front, and each
+        task's variables and its precedence on the previous task of its job are
+        emitted in one pass, so building is linear in the number of tasks.
+        """
 
         model = cp_model.CpModel()
-        horizon = params.horizon_days * 24 * 60  # Total minutes
+        quantum = params.time_quantum_minutes
+        horizon = params.horizon_days * 24 * 60 // quantum  # Total quanta
 
         # Storage for variables
         variables = {
@@ -337,95 +377,34 @@ class OptimizationService:
             "task_operators": {},
             "operator_intervals": collections.defaultdict(list),
             "machine_intervals": collections.defaultdict(list),
+            "task_durations": {},  # (job, task, option) -> exact minutes
+            "task_start": {},  # (job, task) -> start of the selected option
+            "task_end": {},  # (job, task) -> end of the selected option
+            "task_options": {},  # (job, task) -> [(job, task, option)]
+            "job_tasks": self._index_tasks_by_job(tasks),
+            "start_time": start_time,
+            "time_quantum": quantum,
+            "horizon": horizon,
         }
+        machine_for_type = self._index_machines_by_task_type(tasks, machines)
 
-        print("Creating variables for jobs and tasks...")
+        print("Creating variables and precedence constraints for jobs and tasks...")
 
-        # Create variables for each job and task
         for job in jobs:
-            job_tasks = [t for t in tasks if t.job_id == job.id]
-            job_tasks.sort(key=lambda t: t.position_in_job)
-
-            for task in job_tasks:
-                task_options = self._get_task_routing_options(task)
-                num_options = len(task_options)
-
-                if num_options == 1:
-                    # Single routing option
-                    processing_time, setup_time = task_options[0]
-                    total_duration = processing_time + setup_time
-
-                    start_var = model.NewIntVar(
-                        0, horizon, f"start_j{job.id}_t{task.id}"
-                    )
-                    end_var = model.NewIntVar(0, horizon, f"end_j{job.id}_t{task.id}")
-
-                    interval_var = model.NewIntervalVar(
-                        start_var,
-                        total_duration,
-                        end_var,
-                        f"interval_j{job.id}_t{task.id}",
-                    )
-
-                    variables["task_starts"][(job.id, task.id, 0)] = start_var
-                    variables["task_ends"][(job.id, task.id, 0)] = end_var
-                    variables["task_intervals"][(job.id, task.id, 0)] = interval_var
-                    variables["task_presences"][(job.id, task.id, 0)] = (
-                        model.NewConstant(1)
-                    )
+            previous_end = None
+            for task in variables["job_tasks"].get(job.id, []):
+                task_start, task_end = self._add_task_variables(
+                    model, variables, job.id, task, machine_for_type, horizon, quantum
+                )
+                # Sequential precedence within jobs
+                if previous_end is not None:
+                    model.Add(task_start >= previous_end)
+                previous_end = task_end
 
-                    # Assign to machine
-                    machine_id = self._select_machine_for_task(task, machines)
-                    variables["machine_intervals"][machine_id].append(interval_var)
-
-                else:
-                    # Flexible routing
-                    option_presences = []
-
-                    for option_id, (processing_time, setup_time) in enumerate(
-                        task_options
-                    ):
-                        total_duration = processing_time + setup_time
-
-                        start_var = model.NewIntVar(
-                            0, horizon, f"start_j{job.id}_t{task.id}_o{option_id}"
-                        )
-                        end_var = model.NewIntVar(
-                            0, horizon, f"end_j{job.id}_t{task.id}_o{option_id}"
-                        )
-                        presence_var = model.NewBoolVar(
-                            f"presence_j{job.id}_t{task.id}_o{option_id}"
-                        )
-
-                        interval_var = model.NewOptionalIntervalVar(
-                            start_var,
-                            total_duration,
-                            end_var,
-                            presence_var,
-                            f"interval_j{job.id}_t{task.id}_o{option_id}",
-                        )
-
-                        variables["task_starts"][(job.id, task.id, option_id)] = (
-                            start_var
-                        )
-                        variables["task_ends"][(job.id, task.id, option_id)] = end_var
-                        variables["task_presences"][(job.id, task.id, option_id)] = (
-                            presence_var
-                        )
-                        variables["task_intervals"][(job.id, task.id, option_id)] = (
-                            interval_var
-                        )
-                        option_presences.append(presence_var)
-
-                        # Assign to different machines for different options
-                        machine_id = f"{task.id}_{option_id}"
-                        variables["machine_intervals"][machine_id].append(interval_var)
-
-                    # Exactly one option must be selected
-                    model.AddExactlyOne(option_presences)
+        if params.warm_start_schedule is not None:
+            self._add_schedule_hints(model, variables, params, start_time, horizon)
 
         # Add constraints
-        await self._add_precedence_constraints(model, variables, jobs, tasks)
         await self._add_resource_constraints(model, variables, machines, operators)
         await self._add_business_constraints(model, variables, tasks)
         await self._add_optimization_objectives(
@@ -434,6 +413,133 @@ class OptimizationService:
 
         return model, variables
 
+    def _add_task_variables(
+        self,
+        model: cp_model.CpModel,
+        variables: dict[str, Any],
+        job_id: UUID,
+        task: Task,
+        machine_for_type: dict[str, UUID],
+        horizon: int,
+        quantum: int,
+    ) -> tuple[cp_model.IntVar, cp_model.IntVar]:
+        """Create a task's variables; returns the start and end of its selected option."""
+        task_options = self._get_task_routing_options(task)
+        task_key = (job_id, task.id)
+        start_var = model.NewIntVar(0, horizon, f"start_j{job_id}_t{task.id}")
+        end_var = model.NewIntVar(0, horizon, f"end_j{job_id}_t{task.id}")
+        variables["task_start"][task_key] = start_var
+        variables["task_end"][task_key] = end_var
+        variables["task_options"][task_key] = [
+            (job_id, task.id, option_id) for option_id in range(len(task_options))
+        ]
+
+        if len(task_options) == 1:
+            # Single routing option
+            processing_time, setup_time = task_options[0]
+            total_duration = processing_time + setup_time
+            key = (job_id, task.id, 0)
+            variables["task_durations"][key] = total_duration
+
+            interval_var = model.NewIntervalVar(
+                start_var,
+                -(-total_duration // quantum),
+                end_var,
+                f"interval_j{job_id}_t{task.id}",
+            )
+
+            variables["task_starts"][key] = start_var
+            variables["task_ends"][key] = end_var
+            variables["task_intervals"][key] = interval_var
+            variables["task_presences"][key] = model.NewConstant(1)
+
+            # Assign to machine
+            machine_id = machine_for_type[task.task_type.value]
+            variables["machine_intervals"][machine_id].append(interval_var)
+            return start_var, end_var
+
+        # Flexible routing: the options share the task start, and the task
+        # end follows the selected option
+        option_presences = []
+
+        for option_id, (processing_time, setup_time) in enumerate(task_options):
+            total_duration = processing_time + setup_time
+            key = (job_id, task.id, option_id)
+            variables["task_durations"][key] = total_duration
+
+            option_end = model.NewIntVar(
+                0, horizon, f"end_j{job_id}_t{task.id}_o{option_id}"
+            )
+            presence_var = model.NewBoolVar(f"presence_j{job_id}_t{task.id}_o{option_id}")
+
+            interval_var = model.NewOptionalIntervalVar(
+                start_var,
+                -(-total_duration // quantum),
+                option_end,
+                presence_var,
+                f"interval_j{job_id}_t{task.id}_o{option_id}",
+            )
+            model.Add(end_var == option_end).OnlyEnforceIf(presence_var)
+
+            variables["task_starts"][key] = start_var
+            variables["task_ends"][key] = option_end
+            variables["task_presences"][key] = presence_var
+            variables["task_intervals"][key] = interval_var
+            option_presences.append(presence_var)
+
+            # Assign to different machines for different options
+            machine_id = f"{task.id}_{option_id}"
+            variables["machine_intervals"][machine_id].append(interval_var)
+
+        # Exactly one option must be selected
+        model.AddExactlyOne(option_presences)
+        return start_var, end_var
+
+    def _index_tasks_by_job(self, tasks: list[Task]) -> dict[UUID, list[Task]]:
+        """Tasks of each job, in job order."""
+        tasks_by_job: dict[UUID, list[Task]] = collections.defaultdict(list)
+        for task in tasks:
+            tasks_by_job[task.job_id].append(task)
+        for job_tasks in tasks_by_job.values():
+            job_tasks.sort(key=lambda t: t.position_in_job)
+        return dict(tasks_by_job)
+
+    def _index_machines_by_task_type(
+        self, tasks: list[Task], machines: list[Machine]
+    ) -> dict[str, UUID]:
+        """Machine selected for each task type, looked up once per type."""
+        machine_for_type: dict[str, UUID] = {}
+        for task in tasks:
+            task_type = task.task_type.value
+            if task_type not in machine_for_type:
+                machine_for_type[task_type] = self._select_machine_for_task(
+                    task, machines
+                )
+        return machine_for_type
+
+    def _add_schedule_hints(
+        self,
+        model: cp_model.CpModel,
+        variables: dict[str, Any],
+        params: OptimizationParameters,
+        start_time: datetime,
+        horizon: int,
+    ) -> None:
+        """Hint start times from the warm-start schedule and pin frozen tasks."""
+        schedule = params.warm_start_schedule
+
+        for (_, task_id), start_var in variables["task_start"].items():
+            assignment = schedule.get_assignment(task_id)
+            if assignment is None:
+                continue
+
+            offset = int((assignment.start_time - start_time).total_seconds() // 60)
+            offset = min(max(offset // params.time_quantum_minutes, 0), horizon)
+
+            if task_id in params.frozen_task_ids:
+                model.Add(start_var == offset)
+            model.AddHint(start_var, offset)
+
     async def _solve_model(
         self,
         model: cp_model.CpModel,
@@ -448,7 +554,7 @@ class OptimizationService:
         solver.parameters.log_search_progress = True
 
         start_time = time.time()
-        status = solver.Solve(model)
+        status, stop_reason = solve_with_policy(solver, model, params.termination)
         solve_time = time.time() - start_time
 
         status_name = solver.StatusName(status)
@@ -463,19 +569,18 @@ class OptimizationService:
         # Extract solution
         schedule = await self._extract_schedule_from_solution(solver, variables)
 
-        # Calculate metrics
-        makespan = solver.Value(variables.get("makespan", 0))
+        # Calculate metrics in exact minutes rather than model quanta
+        job_completions = {
+            job_id: self._exact_end_minutes(solver, variables, job_id, task_id)
+            for job_id, task_id in variables.get("job_last_tasks", {}).items()
+        }
+        makespan = max(job_completions.values(), default=0)
         total_tardiness = sum(
-            solver.Value(variables["tardiness"][j])
-            for j in variables.get("tardiness", {})
+            max(0, completion - variables["due_dates"][job_id])
+            for job_id, completion in job_completions.items()
         )
         total_cost = solver.Value(variables.get("operator_cost", 0))
 
-        job_completions = {
-            job_id: solver.Value(completion_var)
-            for job_id, completion_var in variables.get("job_completions", {}).items()
-        }
-
         return OptimizationResult(
             schedule=schedule,
             makespan_minutes=float(makespan),
@@ -484,14 +589,32 @@ class OptimizationService:
             status=status_name,
             solve_time_seconds=solve_time,
             job_completions=job_completions,
+            stop_reason=stop_reason.value,
         )
 
+    def _exact_end_minutes(
+        self,
+        solver: cp_model.CpSolver,
+        variables: dict[str, Any],
+        job_id: UUID,
+        task_id: UUID,
+    ) -> int:
+        """End minute of a solved task: quantized start plus exact duration."""
+        quantum = variables.get("time_quantum", 1)
+        for key in variables["task_options"].get((job_id, task_id), []):
+            if solver.Value(variables["task_presences"][key]) == 1:
+                start_minutes = solver.Value(variables["task_starts"][key]) * quantum
+                return start_minutes + variables["task_durations"][key]
+        return 0
+
     async def _extract_schedule_from_solution(
         self, solver: cp_model.CpSolver, variables: dict[str, Any]
     ) -> Schedule:
         """Extract schedule from solver solution."""
 
         schedule = Schedule(name=f"Optimized Schedule {datetime.now().isoformat()}")
+        base_time = variables.get("start_time") or datetime.now()
+        quantum = variables.get("time_quantum", 1)
 
         # Extract task assignments
         for key, start_var in variables["task_starts"].items():
@@ -502,13 +625,12 @@ class OptimizationService:
                 presence_var = variables["task_presences"][presence_key]
 
                 if solver.Value(presence_var) == 1:  # This option is selected
-                    start_minutes = solver.Value(start_var)
-                    end_var = variables["task_ends"][key]
-                    end_minutes = solver.Value(end_var)
+                    start_minutes = solver.Value(start_var) * quantum
+                    end_minutes = start_minutes + variables["task_durations"][key]
 
                     # Convert minutes to datetime (simplified)
-                    start_time = datetime.now() + timedelta(minutes=start_minutes)
-                    end_time = datetime.now() + timedelta(minutes=end_minutes)
+                    start_time = base_time + timedelta(minutes=start_minutes)
+                    end_time = base_time + timedelta(minutes=end_minutes)
 
                     # Get assigned resources (simplified)
                     machine_id = UUID(
@@ -555,49 +677,6 @@ class OptimizationService:
             machines[0].id if machines else UUID("00000000-0000-0000-0000-000000000000")
         )
 
-    async def _add_precedence_constraints(
-        self,
-        model: cp_model.CpModel,
-        variables: dict[str, Any],
-        jobs: list[Job],
-        tasks: list[Task],
-    ) -> None:
-        """Add precedence constraints between tasks."""
-        print("Adding precedence constraints...")
-
-        for job in jobs:
-            job_tasks = [t for t in tasks if t.job_id == job.id]
-            job_tasks.sort(key=lambda t: t.position_in_job)
-
-            # Sequential precedence within jobs
-            for i in range(len(job_tasks) - 1):
-                current_task = job_tasks[i]
-                next_task = job_tasks[i + 1]
-
-                # Handle different routing options
-                current_options = len(self._get_task_routing_options(current_task))
-                next_options = len(self._get_task_routing_options(next_task))
-
-                for curr_opt in range(current_options):
-                    for next_opt in range(next_options):
-                        current_end = variables["task_ends"][
-                            (job.id, current_task.id, curr_opt)
-                        ]
-                        next_start = variables["task_starts"][
-                            (job.id, next_task.id, next_opt)
-                        ]
-                        current_presence = variables["task_presences"][
-                            (job.id, current_task.id, curr_opt)
-                        ]
-                        next_presence = variables["task_presences"][
-                            (job.id, next_task.id, next_opt)
-                        ]
-
-                        # Next task starts after current task ends
-                        model.Add(next_start >= current_end).OnlyEnforceIf(
-                            [current_presence, next_presence]
-                        )
-
     async def _add_resource_constraints(
         self,
         model: cp_model.CpModel,
@@ -639,37 +718,38 @@ class OptimizationService:
         """Add optimization objective variables."""
         print("Setting up optimization objectives...")
 
-        horizon = self._parameters.horizon_days * 24 * 60
+        horizon = variables["horizon"]
+        quantum = variables["time_quantum"]
 
         # Job completion times and tardiness
         job_completions = {}
         tardiness_vars = {}
+        variables["job_last_tasks"] = {}
+        variables["due_dates"] = {}
 
         for job in jobs:
-            # Find last task for each job
-            job_tasks = [t for t in tasks if t.job_id == job.id]
+            job_tasks = variables["job_tasks"].get(job.id)
             if not job_tasks:
                 continue
 
-            last_task = max(job_tasks, key=lambda t: t.position_in_job)
-
-            # Job completion is end time of last task
-            completion_var = model.NewIntVar(0, horizon, f"completion_j{job.id}")
-
-            # Link to task end time (simplified - would handle multiple options)
-            last_task_end = variables["task_ends"].get((job.id, last_task.id, 0))
-            if last_task_end:
-                model.Add(completion_var == last_task_end)
+            # Job completion is the end of its last task's selected option
+            last_task = job_tasks[-1]
+            completion_var = variables["task_end"][(job.id, last_task.id)]
 
             job_completions[job.id] = completion_var
+            variables["job_last_tasks"][job.id] = last_task.id
 
             # Calculate tardiness
             due_date = 10 * 24 * 60  # 10 days in minutes (simplified)
             if job.due_date:
                 due_date = int((job.due_date - datetime.now()).total_seconds() / 60)
 
+            variables["due_dates"][job.id] = due_date
+
+            # Due dates round down, so a job on time in the model is on time
+            # in exact minutes
             tardiness = model.NewIntVar(0, horizon, f"tardiness_j{job.id}")
-            model.AddMaxEquality(tardiness, [completion_var - due_date, 0])
+            model.AddMaxEquality(tardiness, [completion_var - due_date // quantum, 0])
             tardiness_vars[job.id] = tardiness
 
         # Makespan
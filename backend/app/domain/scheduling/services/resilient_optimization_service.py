@@ -6,8 +6,10 @@ fallback strategies, circuit breaker patterns, and graceful degradation.
 """
 
 import asyncio
+import copy
 import time
-from datetime import datetime
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
 from uuid import UUID
 
 from ....core.circuit_breaker import (
@@ -28,6 +30,7 @@ from ....core.observability import (
     monitor_performance,
     trace_operation,
 )
+from ....core.solver_admission import SolveGrant, get_admission_controller
 from ....core.solver_management import (
     SolverConfiguration,
     SolverLimits,
@@ -35,10 +38,15 @@ from ....core.solver_management import (
     SolverStatus,
     create_resilient_solver_manager,
 )
+from ....infrastructure.cache.problem_fingerprint import (
+    ProblemFingerprint,
+    fingerprint_problem,
+)
 from ...shared.exceptions import (
     OptimizationError,
     OptimizationTimeoutError,
     RetryExhaustedError,
+    SolverCapacityExceededError,
     SolverCrashError,
     SolverError,
     SolverMemoryError,
@@ -53,10 +61,27 @@ from ..repositories.job_repository import JobRepository
 from ..repositories.machine_repository import MachineRepository
 from ..repositories.operator_repository import OperatorRepository
 from ..repositories.task_repository import TaskRepository
+from ..value_objects.duration import Duration
+
+try:
+    from ....infrastructure.cache.scheduling_cache import (
+        SchedulingCache,
+        get_scheduling_cache,
+    )
+
+    SOLVER_CACHE_AVAILABLE = True
+except ImportError:
+    SchedulingCache = None
+    get_scheduling_cache = None
+    SOLVER_CACHE_AVAILABLE = False
 
 try:
     from ortools.sat.python import cp_model  # type: ignore[import-not-found]
 
+    from ..optimization.constraint_models import TemporalConstraints
+    from ..optimization.cp_sat_scheduler import SchedulingProblem, SolutionStatus
+    from ..optimization.decomposition import DecomposedScheduler, DecompositionConfig
+
     ORTOOLS_AVAILABLE = True
 except ImportError:
     cp_model = None
@@ -81,6 +106,12 @@ class OptimizationParameters:
         memory_limit_mb: int = 4096,
         enable_circuit_breaker: bool = True,
         enable_partial_solutions: bool = True,
+        # Admission parameters
+        priority: int = 0,
+        deadline_seconds: float | None = None,
+        # Decomposition parameters
+        use_decomposition: bool = False,
+        decomposition_min_tasks: int = 200,
     ):
         # Original parameters
         self.max_time_seconds = max_time_seconds
@@ -98,6 +129,15 @@ class OptimizationParameters:
         self.enable_circuit_breaker = enable_circuit_breaker
         self.enable_partial_solutions = enable_partial_solutions
 
+        # Admission parameters
+        self.priority = priority
+        self.deadline_seconds = deadline_seconds
+
+        # Decomposition parameters: concurrent per-zone cluster solves in the
+        # solver pool, then a repair of the cross-cluster precedence edges
+        self.use_decomposition = use_decomposition
+        self.decomposition_min_tasks = decomposition_min_tasks
+
 
 class OptimizationResult:
     """Enhanced optimization result with resilience information."""
@@ -181,13 +221,20 @@ class ResilientOptimizationService:
         task_repository: TaskRepository,
         operator_repository: OperatorRepository,
         machine_repository: MachineRepository,
+        result_cache: "SchedulingCache | None" = None,
     ):
-        """Initialize the resilient optimization service."""
+        """
+        Initialize the resilient optimization service.
+
+        Solved results are cached under the problem fingerprint in
+        ``result_cache``, or the global scheduling cache when not given.
+        """
         self.logger = get_logger(__name__)
         self._job_repository = job_repository
         self._task_repository = task_repository
         self._operator_repository = operator_repository
         self._machine_repository = machine_repository
+        self._result_cache = result_cache
 
         # Initialize fallback orchestrator
         self._fallback_orchestrator = FallbackOrchestrator()
@@ -196,6 +243,7 @@ class ResilientOptimizationService:
         self._health_metrics = {
             "total_optimizations": 0,
             "successful_optimizations": 0,
+            "cache_hits": 0,
             "fallback_activations": 0,
             "circuit_breaker_trips": 0,
             "average_solve_time": 0.0,
@@ -223,7 +271,47 @@ class ResilientOptimizationService:
         implements retry logic, and falls back to simplified strategies
         when the primary solver fails.
         """
-        params = parameters or OptimizationParameters()
+        return await self._optimize(
+            job_ids,
+            start_time,
+            parameters or OptimizationParameters(),
+            lambda: self._load_optimization_data(job_ids),
+        )
+
+    @monitor_performance("resilient_problem_optimization")
+    async def optimize_problem(
+        self,
+        jobs: list[Job],
+        tasks: list[Task],
+        start_time: datetime,
+        parameters: OptimizationParameters | None = None,
+    ) -> OptimizationResult:
+        """
+        Optimize a schedule for jobs and tasks that only exist in memory.
+
+        Same resilience behaviour as ``optimize_schedule``, but the jobs and
+        tasks are taken as given instead of being loaded by id, so ad-hoc
+        problems need not be written to the repositories first. Machines and
+        operators are still read from their repositories.
+        """
+        return await self._optimize(
+            [job.id for job in jobs],
+            start_time,
+            parameters or OptimizationParameters(),
+            lambda: self._load_resources(jobs, tasks),
+        )
+
+    async def _optimize(
+        self,
+        job_ids: list[UUID],
+        start_time: datetime,
+        params: OptimizationParameters,
+        load_data: Callable[
+            [],
+            Awaitable[tuple[list[Job], list[Task], list[Operator], list[Machine]]],
+        ],
+    ) -> OptimizationResult:
+        """Run the resilient optimization over the data returned by ``load_data``."""
         optimization_start = time.time()
         retry_attempts = 0
 
@@ -249,9 +337,7 @@ class ResilientOptimizationService:
         ) as span:
             # Load data
             try:
-                jobs, tasks, operators, machines = await self._load_optimization_data(
-                    job_ids
-                )
+                jobs, tasks, operators, machines = await load_data()
                 span.set_attribute("tasks_count", len(tasks))
                 span.set_attribute("operators_count", len(operators))
                 span.set_attribute("machines_count", len(machines))
@@ -262,6 +348,36 @@ class ResilientOptimizationService:
                     e, job_ids, start_time, params
                 )
 
+            # Identical problems (under any job/task ids) reuse the solved result
+            fingerprint = fingerprint_problem(
+                jobs,
+                tasks,
+                machines,
+                operators,
+                start_time,
+                parameters=self._solver_parameters(params),
+            )
+            span.set_attribute("problem_fingerprint", fingerprint.digest[:16])
+
+            cached_result = await self._get_cached_result(fingerprint)
+            if cached_result:
+                total_time = time.time() - optimization_start
+                cached_result.performance_metrics["total_optimization_time"] = (
+                    total_time
+                )
+
+                self._health_metrics["successful_optimizations"] += 1
+                self._health_metrics["cache_hits"] += 1
+                self._update_average_solve_time(total_time)
+
+                self.logger.info(
+                    "Returning cached optimization result",
+                    fingerprint=fingerprint.digest[:16],
+                    status=cached_result.status,
+                )
+
+                return cached_result
+
             # Primary optimization attempt with circuit breaker and retry
             primary_result = await self._attempt_primary_optimization(
                 jobs, tasks, operators, machines, start_time, params, retry_attempts
@@ -273,6 +389,7 @@ class ResilientOptimizationService:
                 primary_result.performance_metrics["total_optimization_time"] = (
                     total_time
                 )
+                await self._cache_result(fingerprint, primary_result)
 
                 self._health_metrics["successful_optimizations"] += 1
                 self._update_average_solve_time(total_time)
@@ -329,6 +446,11 @@ class ResilientOptimizationService:
 
         retry_attempts = initial_retry_attempts
         last_error = None
+        deadline = (
+            time.monotonic() + params.deadline_seconds
+            if params.deadline_seconds is not None
+            else None
+        )
 
         while retry_attempts <= params.max_retry_attempts:
             try:
@@ -338,9 +460,28 @@ class ResilientOptimizationService:
                     self.logger.info(f"Retrying optimization after {delay}s delay")
                     await asyncio.sleep(delay)
 
-                return await self._execute_primary_optimization(
-                    jobs, tasks, operators, machines, start_time, params
-                )
+                # Admitted outside the circuit breaker: a busy solver is not a failing one
+                async with get_admission_controller().admit(
+                    workers=params.num_workers,
+                    memory_mb=params.memory_limit_mb,
+                    time_limit_seconds=params.max_time_seconds,
+                    priority=params.priority,
+                    deadline_seconds=(
+                        deadline - time.monotonic() if deadline is not None else None
+                    ),
+                ) as grant:
+                    return await self._execute_primary_optimization(
+                        jobs,
+                        tasks,
+                        operators,
+                        machines,
+                        start_time,
+                        self._granted_parameters(params, grant),
+                    )
+
+            except SolverCapacityExceededError:
+                # The client is told when to retry; fallbacks would only add load
+                raise
 
             except CircuitBreakerOpenError as e:
                 self.logger.warning(
@@ -420,6 +561,11 @@ class ResilientOptimizationService:
 
         self.logger.info("Executing primary optimization")
 
+        if params.use_decomposition:
+            return await self._execute_decomposed_optimization(
+                jobs, tasks, operators, machines, start_time, params
+            )
+
         # Create solver manager
         solver_limits = SolverLimits(
             max_time_seconds=params.max_time_seconds,
@@ -473,6 +619,109 @@ class ResilientOptimizationService:
             await solver_manager.emergency_shutdown(f"Optimization failed: {str(e)}")
             raise
 
+    async def _execute_decomposed_optimization(
+        self,
+        jobs: list[Job],
+        tasks: list[Task],
+        operators: list[Operator],
+        machines: list[Machine],
+        start_time: datetime,
+        params: OptimizationParameters,
+    ) -> OptimizationResult:
+        """Solve per production zone in the solver pool and repair the coupling edges."""
+
+        problem = self._build_scheduling_problem(
+            tasks, operators, machines, start_time, params
+        )
+        decomposed = DecomposedScheduler(
+            config=DecompositionConfig(
+                min_tasks=params.decomposition_min_tasks,
+                search_workers=params.num_workers,
+            )
+        )
+        # Machines of one production zone are always solved together
+        result = await decomposed.solve(
+            problem, {machine.id: machine.production_zone_id for machine in machines}
+        )
+
+        if not result.is_feasible:
+            raise SolverError(
+                "Decomposed solve found no feasible schedule",
+                solver_status=result.status.value,
+            )
+
+        schedule = Schedule(name=f"Optimized Schedule {datetime.now().isoformat()}")
+        for assignment in result.task_assignments:
+            if assignment.assigned_machine_id is None:
+                continue
+            schedule.assign_task(
+                task_id=assignment.task_id,
+                machine_id=assignment.assigned_machine_id,
+                operator_ids=list(assignment.assigned_operator_ids),
+                start_time=assignment.start_time,
+                end_time=assignment.end_time,
+                setup_duration=Duration.from_minutes(0),
+                processing_duration=Duration.from_minutes(assignment.duration_minutes),
+            )
+
+        return OptimizationResult(
+            schedule=schedule,
+            makespan_minutes=(result.makespan_hours or 0.0) * 60.0,
+            total_tardiness_minutes=(result.total_delay_hours or 0.0) * 60.0,
+            total_cost=0.0,  # Simplified
+            status=result.status.value,
+            solve_time_seconds=result.solution_time_seconds,
+            solver_stats={
+                "clusters": len(decomposed.clusters),
+                "coupling_edges": decomposed.coupling_edges,
+                "repaired_tasks": decomposed.repaired_tasks,
+                "used_fallback": decomposed.used_fallback,
+            },
+            quality_score=self._calculate_solution_quality(schedule, jobs, tasks),
+            warnings=[]
+            if result.status == SolutionStatus.OPTIMAL
+            else ["Solver did not reach optimality"],
+        )
+
+    def _build_scheduling_problem(
+        self,
+        tasks: list[Task],
+        operators: list[Operator],
+        machines: list[Machine],
+        start_time: datetime,
+        params: OptimizationParameters,
+    ) -> "SchedulingProblem":
+        """Scheduling problem over the loaded tasks and resources."""
+        task_ids = {task.id for task in tasks}
+        problem = SchedulingProblem(
+            problem_id=f"resilient_opt_{int(start_time.timestamp())}",
+            planning_horizon_start=start_time,
+            planning_horizon_end=start_time + timedelta(days=params.horizon_days),
+            max_solution_time_seconds=params.max_time_seconds,
+            machine_ids=[machine.id for machine in machines],
+            operator_ids=[operator.id for operator in operators],
+        )
+        temporal = TemporalConstraints()
+
+        for task in tasks:
+            duration = (
+                int(task.planned_duration.minutes) if task.planned_duration else 60
+            )
+            problem.task_ids.append(task.id)
+            problem.task_durations[task.id] = duration
+            problem.task_priorities[task.id] = 1.0
+            temporal.add_duration_constraint(task.id, duration_minutes=duration)
+            if task.machine_options:
+                problem.task_eligible_machines[task.id] = [
+                    option.machine_id for option in task.machine_options
+                ]
+            for predecessor_id in task.predecessor_ids:
+                if predecessor_id in task_ids:
+                    temporal.add_precedence(predecessor_id, task.id)
+
+        problem.temporal_constraints = temporal
+        return problem
+
     async def _execute_fallback_optimization(
         self,
         jobs: list[Job],
@@ -618,6 +867,147 @@ class ResilientOptimizationService:
 
         return base_quality
 
+    def _granted_parameters(
+        self, params: OptimizationParameters, grant: SolveGrant
+    ) -> OptimizationParameters:
+        """Parameters of one attempt, limited to the admitted workers and time."""
+        granted = copy.copy(params)
+        granted.num_workers = grant.workers
+        if grant.time_limit_seconds is not None:
+            granted.max_time_seconds = max(1, int(grant.time_limit_seconds))
+        return granted
+
+    def _solver_parameters(
+        self, params: OptimizationParameters
+    ) -> dict[str, int | float | bool]:
+        """Parameters that change the primary solution (resilience knobs do not)."""
+        return {
+            "max_time_seconds": params.max_time_seconds,
+            "num_workers": params.num_workers,
+            "horizon_days": params.horizon_days,
+            "enable_hierarchical_optimization": params.enable_hierarchical_optimization,
+            "primary_objective_weight": params.primary_objective_weight,
+            "cost_optimization_tolerance": params.cost_optimization_tolerance,
+            "use_decomposition": params.use_decomposition,
+            "decomposition_min_tasks": params.decomposition_min_tasks,
+        }
+
+    def _get_result_cache(self) -> "SchedulingCache | None":
+        if self._result_cache is not None:
+            return self._result_cache
+        if SOLVER_CACHE_AVAILABLE:
+            return get_scheduling_cache()
+        return None
+
+    async def _get_cached_result(
+        self, fingerprint: ProblemFingerprint
+    ) -> OptimizationResult | None:
+        """Rebuild a cached result for this problem's job and task ids."""
+        cache = self._get_result_cache()
+        if cache is None:
+            return None
+
+        try:
+            entry = await cache.get_solver_result(fingerprint)
+        except Exception as e:
+            self.logger.warning("Solver result cache lookup failed", error=str(e))
+            return None
+        if not entry:
+            return None
+
+        task_ids = fingerprint.task_ids_by_label
+        job_ids = fingerprint.job_ids_by_label
+
+        schedule = Schedule(name=entry["schedule_name"])
+        for label, machine_id, operator_ids, start, end, setup, processing in entry[
+            "assignments"
+        ]:
+            schedule.assign_task(
+                task_id=task_ids[label],
+                machine_id=machine_id,
+                operator_ids=operator_ids,
+                start_time=start,
+                end_time=end,
+                setup_duration=Duration.from_minutes(setup),
+                processing_duration=Duration.from_minutes(processing),
+            )
+
+        return OptimizationResult(
+            schedule=schedule,
+            makespan_minutes=entry["makespan_minutes"],
+            total_tardiness_minutes=entry["total_tardiness_minutes"],
+            total_cost=entry["total_cost"],
+            status=entry["status"],
+            solve_time_seconds=0.0,
+            job_completions={
+                job_ids[label]: value for label, value in entry["job_completions"].items()
+            },
+            violations=list(entry["violations"]),
+            solver_stats=dict(entry["solver_stats"]),
+            performance_metrics={
+                "cache_hit": True,
+                "cached_solve_time_seconds": entry["solve_time_seconds"],
+            },
+            quality_score=entry["quality_score"],
+            warnings=list(entry["warnings"]),
+        )
+
+    async def _cache_result(
+        self, fingerprint: ProblemFingerprint, result: OptimizationResult
+    ) -> None:
+        """
+        Cache a solved primary result keyed by fingerprint labels, not ids.
+
+        Results without a schedule and fallback results are not cached, so a
+        retry after a timeout still gets a fresh solve.
+        """
+        cache = self._get_result_cache()
+        if cache is None or result.schedule is None or result.fallback_used:
+            return
+
+        task_labels = fingerprint.task_labels
+        job_labels = fingerprint.job_labels
+        assignments = result.schedule.assignments
+        if any(task_id not in task_labels for task_id in assignments):
+            return
+
+        entry = {
+            "schedule_name": result.schedule.name,
+            "assignments": [
+                (
+                    task_labels[task_id],
+                    assignment.machine_id,
+                    list(assignment.operator_ids),
+                    assignment.start_time,
+                    assignment.end_time,
+                    assignment.setup_duration.minutes,
+                    assignment.processing_duration.minutes,
+                )
+                for task_id, assignment in assignments.items()
+            ],
+            "job_completions": {
+                job_labels[job_id]: value
+                for job_id, value in result.job_completions.items()
+                if job_id in job_labels
+            },
+            "makespan_minutes": result.makespan_minutes,
+            "total_tardiness_minutes": result.total_tardiness_minutes,
+            "total_cost": result.total_cost,
+            "status": result.status,
+            "solve_time_seconds": result.solve_time_seconds,
+            "violations": list(result.violations),
+            "solver_stats": dict(result.solver_stats),
+            "quality_score": result.quality_score,
+            "warnings": list(result.warnings),
+        }
+
+        try:
+            await cache.set_solver_result(
+                fingerprint, entry, computation_time_ms=result.solve_time_seconds * 1000
+            )
+        except Exception as e:
+            self.logger.warning("Failed to cache solver result", error=str(e))
+
     async def _load_optimization_data(
         self, job_ids: list[UUID]
     ) -> tuple[list[Job], list[Task], list[Operator], list[Machine]]:
@@ -638,14 +1028,20 @@ class ResilientOptimizationService:
             tasks = await self._task_repository.get_by_job_id(job_id)
             all_tasks.extend(tasks)
 
-        # Load resources
+        return await self._load_resources(jobs, all_tasks)
+
+    async def _load_resources(
+        self, jobs: list[Job], tasks: list[Task]
+    ) -> tuple[list[Job], list[Task], list[Operator], list[Machine]]:
+        """Load operators and machines for the given jobs and tasks."""
+
         operators = await self._operator_repository.get_all()
         machines = await self._machine_repository.get_all()
 
         # Validate data
         if not jobs:
             raise OptimizationError("No jobs found for optimization")
-        if not all_tasks:
+        if not tasks:
             raise OptimizationError("No tasks found for optimization")
         if not operators:
             raise OptimizationError("No operators available")
@@ -655,12 +1051,12 @@ class ResilientOptimizationService:
         self.logger.info(
             "Data loading completed",
             jobs=len(jobs),
-            tasks=len(all_tasks),
+            tasks=len(tasks),
             operators=len(operators),
             machines=len(machines),
         )
 
-        return jobs, all_tasks, operators, machines
+        return jobs, tasks, operators, machines
 
     async def _handle_data_loading_failure(
         self,
@@ -265,6 +265,25 @@ class ScheduleStatus(str, Enum):
         return target_status in valid_transitions.get(self, set())
 
 
+class SolveJobStatus(str, Enum):
+    """Asynchronous solve job status enumeration."""
+
+    QUEUED = "queued"  # Submitted, waiting for a solver worker
+    RUNNING = "running"  # Being solved by a worker
+    SUCCEEDED = "succeeded"  # Solved, result stored
+    FAILED = "failed"  # Solver or data error
+    CANCELLED = "cancelled"  # Stopped on request, best result so far kept
+
+    @property
+    def is_terminal(self) -> bool:
+        """Check if the job will not change status any more."""
+        return self in {
+            SolveJobStatus.SUCCEEDED,
+            SolveJobStatus.FAILED,
+            SolveJobStatus.CANCELLED,
+        }
+
+
 class SkillType(str, Enum):
     """Types of skills in the manufacturing system - matches DOMAIN.md specification."""
 
@@ -663,6 +663,22 @@ class MemoryExhaustionError(SystemResourceError):
         self.required_mb = required_mb
 
 
+class SolverCapacityExceededError(SystemResourceError):
+    """Raised when a solve cannot be admitted in time; retry after the given delay."""
+
+    def __init__(self, reason: str, retry_after_seconds: float) -> None:
+        message = f"Solver capacity exceeded: {reason}"
+        details = {
+            "reason": reason,
+            "retry_after_seconds": retry_after_seconds,
+            "resource_exhausted": "solver_capacity",
+        }
+
+        super().__init__(message, "solver_capacity", details)
+        self.reason = reason
+        self.retry_after_seconds = retry_after_seconds
+
+
 class DiskSpaceExhaustionError(SystemResourceError):
     """Raised when system runs out of disk space."""
 
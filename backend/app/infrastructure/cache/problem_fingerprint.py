@@ -0,0 +1,222 @@
+"""
+Canonical Fingerprints for Scheduling Problems
+
+Normalizes a scheduling problem into a deterministic document covering
+everything the solver sees: jobs, tasks, durations, precedence, machine
+options and skill requirements, resource state and calendars, the planning
+start and the solver parameters. Job and task ids are replaced by positional
+labels, so the same problem submitted under fresh ids (e.g. the temporary
+jobs created per /solve request) maps to the same fingerprint. Machine and
+operator ids name real resources and are kept as-is.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field, fields, is_dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.domain.scheduling.value_objects.common import Duration as CommonDuration
+from app.domain.scheduling.value_objects.duration import Duration
+
+# Attributes that define the problem; anything else (names, notes, audit
+# timestamps, previous solve output) does not change the solution
+JOB_FIELDS = (
+    "priority",
+    "status",
+    "quantity",
+    "release_date",
+    "due_date",
+    "current_operation_sequence",
+)
+TASK_FIELDS = (
+    "sequence_in_job",
+    "status",
+    "department",
+    "machine_options",
+    "skill_requirements",
+    "role_requirements",
+    "is_critical",
+    "planned_duration",
+    "planned_setup_duration",
+    "assigned_machine_id",
+    "actual_start_time",
+    "actual_end_time",
+)
+MACHINE_FIELDS = (
+    "id",
+    "automation_level",
+    "production_zone_id",
+    "status",
+    "efficiency_factor",
+    "capabilities",
+    "required_skills",
+    "maintenance_windows",
+)
+OPERATOR_FIELDS = (
+    "id",
+    "status",
+    "is_active",
+    "department",
+    "default_working_hours",
+    "skills",
+    "availability_overrides",
+)
+# Dropped from nested models (value objects and child entities)
+VOLATILE_FIELDS = {"created_at", "updated_at"}
+
+
+@dataclass
+class ProblemFingerprint:
+    """Fingerprint of a problem plus the labels used for its jobs and tasks."""
+
+    digest: str
+    document: Dict[str, Any]
+    job_labels: Dict[UUID, str] = field(default_factory=dict)
+    task_labels: Dict[UUID, str] = field(default_factory=dict)
+
+    @property
+    def task_ids_by_label(self) -> Dict[str, UUID]:
+        return {label: task_id for task_id, label in self.task_labels.items()}
+
+    @property
+    def job_ids_by_label(self) -> Dict[str, UUID]:
+        return {label: job_id for job_id, label in self.job_labels.items()}
+
+
+def canonical_value(value: Any) -> Any:
+    """Convert a value to a JSON-compatible form that is stable across runs."""
+    if isinstance(value, Enum):
+        return canonical_value(value.value)
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return round(value, 9)
+    if isinstance(value, Decimal):
+        return format(value.normalize(), "f")
+    if isinstance(value, (Duration, CommonDuration)):
+        return format(Decimal(value.minutes).normalize(), "f")
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, dict):
+        return {
+            _canonical_key(key): canonical_value(item)
+            for key, item in sorted(value.items(), key=lambda kv: _canonical_key(kv[0]))
+            if key not in VOLATILE_FIELDS
+        }
+    if isinstance(value, (set, frozenset)):
+        return sorted((canonical_value(item) for item in value), key=_dumps)
+    if isinstance(value, (list, tuple)):
+        return [canonical_value(item) for item in value]
+    if isinstance(value, BaseModel):
+        return canonical_value(
+            {name: getattr(value, name) for name in type(value).model_fields}
+        )
+    if is_dataclass(value):
+        return canonical_value({f.name: getattr(value, f.name) for f in fields(value)})
+    if hasattr(value, "__dict__"):
+        return canonical_value(
+            {k: v for k, v in vars(value).items() if not k.startswith("_")}
+        )
+    return str(value)
+
+
+def fingerprint_problem(
+    jobs: List[Any],
+    tasks: List[Any],
+    machines: List[Any],
+    operators: List[Any],
+    start_time: datetime,
+    parameters: Any = None,
+    calendar: Optional[Dict[str, Any]] = None,
+) -> ProblemFingerprint:
+    """
+    Build the canonical fingerprint of a scheduling problem.
+
+    Jobs are ordered by their own content (tasks included), tasks within a
+    job by sequence and content, so input order and entity ids do not affect
+    the digest. Precedence is expressed with the resulting labels.
+    """
+    job_by_id = {job.id: job for job in jobs}
+    tasks_by_job: Dict[UUID, List[Any]] = {job.id: [] for job in jobs}
+    for task in tasks:
+        tasks_by_job.setdefault(task.job_id, []).append(task)
+
+    # Content of each job without cross-references, used only for ordering
+    job_content = {}
+    task_content = {}
+    for job_id, job_tasks in tasks_by_job.items():
+        for task in job_tasks:
+            task_content[task.id] = _select(task, TASK_FIELDS)
+        job_tasks.sort(key=lambda t: (t.sequence_in_job, _dumps(task_content[t.id])))
+        job = job_by_id.get(job_id)
+        job_content[job_id] = {
+            "job": _select(job, JOB_FIELDS) if job is not None else None,
+            "tasks": [task_content[t.id] for t in job_tasks],
+        }
+
+    job_order = sorted(tasks_by_job, key=lambda job_id: _dumps(job_content[job_id]))
+    job_labels = {job_id: f"j{index}" for index, job_id in enumerate(job_order)}
+    task_labels = {
+        task.id: f"{job_labels[job_id]}.t{index}"
+        for job_id in job_order
+        for index, task in enumerate(tasks_by_job[job_id])
+    }
+
+    document_jobs = []
+    for job_id in job_order:
+        document_tasks = []
+        for task in tasks_by_job[job_id]:
+            entry = dict(task_content[task.id])
+            entry["predecessors"] = sorted(
+                task_labels.get(pred_id, str(pred_id)) for pred_id in task.predecessor_ids
+            )
+            document_tasks.append(entry)
+        document_jobs.append({**job_content[job_id], "tasks": document_tasks})
+
+    document = {
+        "start_time": canonical_value(start_time),
+        "jobs": document_jobs,
+        "machines": sorted(
+            (_select(machine, MACHINE_FIELDS) for machine in machines), key=_dumps
+        ),
+        "operators": sorted(
+            (_select(operator, OPERATOR_FIELDS) for operator in operators), key=_dumps
+        ),
+        "calendar": canonical_value(calendar),
+        "parameters": canonical_value(parameters),
+    }
+
+    return ProblemFingerprint(
+        digest=hashlib.sha256(_dumps(document).encode()).hexdigest(),
+        document=document,
+        job_labels=job_labels,
+        task_labels=task_labels,
+    )
+
+
+def digest_value(value: Any) -> str:
+    """SHA-256 of the canonical form of any value, e.g. a request document."""
+    return hashlib.sha256(_dumps(canonical_value(value)).encode()).hexdigest()
+
+
+def _select(entity: Any, names: tuple) -> Dict[str, Any]:
+    return {name: canonical_value(getattr(entity, name, None)) for name in names}
+
+
+def _canonical_key(key: Any) -> str:
+    value = canonical_value(key)
+    return value if isinstance(value, str) else _dumps(value)
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
@@ -6,8 +6,6 @@ including task dependencies, resource availability, and solver results.
 """
 
 import asyncio
-import hashlib
-import json
 import pickle
 import time
 from collections import OrderedDict, defaultdict
@@ -23,6 +21,8 @@ from aiocache.serializers import PickleSerializer
 
 from app.core.observability import get_logger
 
+from .problem_fingerprint import ProblemFingerprint
+
 # Initialize logger
 logger = get_logger(__name__)
 
@@ -188,16 +188,9 @@ class SchedulingCache:
         """Generate cache key from pattern."""
         return pattern.format(**kwargs)
     
-    def _hash_solver_input(self, jobs: List[Any], constraints: Dict) -> str:
-        """Generate hash for solver input to cache results."""
-        # Create deterministic hash of solver input
-        input_data = {
-            "jobs": [str(j.id) for j in jobs],
-            "constraints": constraints
-        }
-        
-        serialized = json.dumps(input_data, sort_keys=True)
-        return hashlib.sha256(serialized.encode()).hexdigest()[:16]
+    def _hash_solver_input(self, fingerprint: ProblemFingerprint) -> str:
+        """Cache key digest for a solver input (full canonical fingerprint)."""
+        return fingerprint.digest
     
     async def get_schedule(
         self,
@@ -342,11 +335,15 @@ class SchedulingCache:
     
     async def get_solver_result(
         self,
-        jobs: List[Any],
-        constraints: Dict
+        fingerprint: ProblemFingerprint
     ) -> Optional[Any]:
-        """Get cached solver result for given input."""
-        hash_key = self._hash_solver_input(jobs, constraints)
+        """
+        Get cached solver result for a problem fingerprint.
+        
+        The fingerprint covers the whole normalized problem, so any change
+        to tasks, durations, resources, calendars or parameters misses.
+        """
+        hash_key = self._hash_solver_input(fingerprint)
         key = self._generate_key(self.key_patterns["solver_result"], hash=hash_key)
         
         # Solver results are expensive, check all cache levels
@@ -354,14 +351,14 @@ class SchedulingCache:
             value = await self.l1_cache.get(key)
             if value:
                 self.stats["solver"]["hits"] += 1
-                logger.info(f"Solver cache hit: {hash_key}")
+                logger.info(f"Solver cache hit: {hash_key[:16]}")
                 return value
         
         if self.l2_cache:
             value = await self.l2_cache.get(key)
             if value:
                 self.stats["solver"]["hits"] += 1
-                logger.info(f"Solver L2 cache hit: {hash_key}")
+                logger.info(f"Solver L2 cache hit: {hash_key[:16]}")
                 # Promote to L1
                 if self.l1_cache:
                     await self.l1_cache.set(key, value, ttl_seconds=600)
@@ -372,17 +369,16 @@ class SchedulingCache:
     
     async def set_solver_result(
         self,
-        jobs: List[Any],
-        constraints: Dict,
+        fingerprint: ProblemFingerprint,
         result: Any,
         computation_time_ms: float,
         ttl_seconds: int = 1800
     ):
-        """Cache solver result."""
-        hash_key = self._hash_solver_input(jobs, constraints)
+        """Cache solver result under the problem fingerprint."""
+        hash_key = self._hash_solver_input(fingerprint)
         key = self._generate_key(self.key_patterns["solver_result"], hash=hash_key)
         
-        tags = {"solver", f"jobs:{len(jobs)}"}
+        tags = {"solver", f"jobs:{len(fingerprint.job_labels)}"}
         
         # Cache in both levels for expensive computations
         if self.l1_cache:
@@ -399,7 +395,7 @@ class SchedulingCache:
         
         self.stats["solver"]["saves"] += 1
         logger.info(
-            f"Cached solver result: {hash_key}, "
+            f"Cached solver result: {hash_key[:16]}, "
             f"computation_time: {computation_time_ms:.2f}ms"
         )
     
@@ -576,12 +572,16 @@ class CachingDecorator:
                     cache_key = f"{cache_type}:{func.__name__}:{str(args)}:{str(kwargs)}"
                 
                 # Try to get from cache
-                if cache_type == "solver":
-                    # Special handling for solver results
-                    if len(args) >= 2:
-                        result = await self.cache.get_solver_result(args[0], args[1])
-                        if result:
-                            return result
+                # Solver results are keyed by problem fingerprint (key_func)
+                solver_key = (
+                    cache_key
+                    if cache_type == "solver" and isinstance(cache_key, ProblemFingerprint)
+                    else None
+                )
+                if solver_key:
+                    result = await self.cache.get_solver_result(solver_key)
+                    if result:
+                        return result
                 
                 # Execute function and measure time
                 start_time = time.perf_counter()
@@ -589,10 +589,9 @@ class CachingDecorator:
                 computation_time_ms = (time.perf_counter() - start_time) * 1000
                 
                 # Cache result
-                if cache_type == "solver" and len(args) >= 2:
+                if solver_key:
                     await self.cache.set_solver_result(
-                        args[0],
-                        args[1],
+                        solver_key,
                         result,
                         computation_time_ms,
                         ttl_seconds
@@ -621,4 +620,11 @@ def init_scheduling_cache(
         enable_l2=enable_l2
     )
     logger.info("Scheduling cache initialized")
-    return scheduling_cache
\ No newline at end of file
+    return scheduling_cache
+
+
+def get_scheduling_cache() -> SchedulingCache:
+    """Get the global scheduling cache, creating an in-process one if needed."""
+    if scheduling_cache is None:
+        return init_scheduling_cache(enable_l2=False)
+    return scheduling_cache
@@ -7,9 +7,10 @@ API serialization and SQLAlchemy ORM models for database operations.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID, uuid4
 
+from sqlalchemy import JSON
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.domain.scheduling.value_objects.enums import (
@@ -20,6 +21,7 @@ from app.domain.scheduling.value_objects.enums import (
     OperatorStatus,
     PriorityLevel,
     SkillLevel,
+    SolveJobStatus,
     TaskStatus,
 )
 
@@ -708,3 +710,54 @@ class TaskModeResourceRequirementPublic(TaskModeResourceRequirementBase, Timesta
     mode_name: str | None = None
 
 
+# Asynchronous solve jobs
+class SolveJobBase(SQLModel):
+    """Base SolveJob model with shared fields."""
+
+    kind: str = Field(max_length=50, index=True)
+    status: SolveJobStatus = Field(default=SolveJobStatus.QUEUED, index=True)
+    parameters: dict[str, Any] = Field(default_factory=dict, sa_type=JSON)
+    # Canonical digest of ``parameters``; identical submissions join one job
+    parameters_digest: str | None = Field(None, max_length=64, index=True)
+
+    # Search progress, updated as the solver improves the incumbent
+    best_objective: float | None = None
+    best_bound: float | None = None
+    gap: float | None = None
+    solutions_found: int = 0
+    progress_message: str | None = Field(None, max_length=255)
+
+    # Where the finished solution is stored (see SolveJobResult)
+    result_location: str | None = Field(None, max_length=255)
+    error: str | None = None
+
+    worker_task_id: str | None = Field(None, max_length=255)
+    cancel_requested: bool = False
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    created_by: str | None = None
+
+
+class SolveJob(SolveJobBase, IdentifiedModel, table=True):
+    """Solve job table definition."""
+
+    __tablename__ = "solve_jobs"
+
+
+class SolveJobPublic(SolveJobBase, IdentifiedModel):
+    """Solve job public model for API responses."""
+
+    pass
+
+
+class SolveJobResult(TimestampedModel, table=True):
+    """
+    Solution of a finished solve job.
+
+    Kept out of ``solve_jobs`` so the frequently updated job rows stay small.
+    """
+
+    __tablename__ = "solve_job_results"
+
+    solve_job_id: UUID = Field(foreign_key="solve_jobs.id", primary_key=True)
+    solution: dict[str, Any] = Field(default_factory=dict, sa_type=JSON)
@@ -20,6 +20,7 @@ from app.core.observability import (
     set_correlation_id,
     set_user_id,
 )
+from app.core.solver_pool import shutdown_solver_pool
 
 # Initialize structured logger
 logger = get_logger(__name__)
@@ -149,6 +150,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     finally:
         # Shutdown
         logger.info("Shutting down application")
+        shutdown_solver_pool()
 
 
 # Initialize Sentry for error tracking
@@ -46,6 +46,25 @@ class OptimizationParameters(BaseModel):
         le=0.5,
         description="Tolerance for cost optimization phase (0-50%)",
     )
+    priority: PriorityLevel = Field(
+        default=PriorityLevel.NORMAL,
+        description="Queue priority while solver capacity is contended",
+    )
+    deadline_seconds: int | None = Field(
+        default=None,
+        ge=1,
+        le=3600,
+        description="Reject with Retry-After unless solving can start within this time",
+    )
+    use_decomposition: bool = Field(
+        default=False,
+        description="Solve production zones concurrently, then repair cross-zone links",
+    )
+    decomposition_min_tasks: int = Field(
+        default=200,
+        ge=1,
+        description="Problems with fewer tasks are solved as one model",
+    )
 
 
 class BusinessConstraints(BaseModel):
@@ -155,6 +174,11 @@ class SolveRequest(BaseModel):
         description="Business rules and working hours",
     )
 
+    persist: bool = Field(
+        default=False,
+        description="Save the jobs and tasks to the database (solved in memory otherwise)",
+    )
+
     @validator("jobs")
     def validate_unique_job_numbers(cls, v):
         """Job numbers must be unique within the problem."""
@@ -0,0 +1,318 @@
+"""
+Asynchronous Solve Jobs
+
+Solves submitted through the solve-job API run in Celery workers on the
+``optimization`` queue, never in the API process. Each job has a durable
+``solve_jobs`` row holding its status, best objective, bound and gap, and a
+``solve_job_results`` row with the solution once it finishes.
+
+Workers publish progress events on a per-job Redis channel, which the API
+relays to clients, and watch a per-job Redis flag to stop the search when a
+client cancels.
+"""
+
+import json
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import and_, or_, select, text
+from sqlalchemy.orm import Session
+
+from app.core.observability import get_logger
+from app.domain.scheduling.value_objects.enums import SolveJobStatus
+from app.infrastructure.cache.problem_fingerprint import digest_value
+from app.infrastructure.database.models import SolveJob, SolveJobResult
+
+logger = get_logger(__name__)
+
+# Cancel flags outlive any solve the worker would still be running
+CANCEL_FLAG_TTL_SECONDS = 86400
+
+# A job still queued this long after submission is presumed lost by the
+# broker; identical submissions start a new job instead of joining it
+QUEUED_JOIN_MAX_AGE_SECONDS = 600
+
+
+def solve_job_channel(job_id: UUID | str) -> str:
+    """Redis channel carrying a job's progress and status events."""
+    return f"solve_job:{job_id}:events"
+
+
+def solve_job_cancel_key(job_id: UUID | str) -> str:
+    """Redis key set when a client asks to cancel a job."""
+    return f"solve_job:{job_id}:cancel"
+
+
+def solve_job_event(job: SolveJob, event: str) -> dict[str, Any]:
+    """Event describing the job's current state, as published and streamed."""
+    return {
+        "event": event,
+        "job_id": str(job.id),
+        "status": job.status.value,
+        "best_objective": job.best_objective,
+        "best_bound": job.best_bound,
+        "gap": job.gap,
+        "solutions_found": job.solutions_found,
+        "message": job.progress_message,
+    }
+
+
+def relative_gap(objective: float | None, bound: float | None) -> float | None:
+    """Relative distance between the incumbent and the best bound."""
+    if objective is None or bound is None:
+        return None
+    return abs(objective - bound) / max(1.0, abs(objective))
+
+
+def _default_session_factory() -> AbstractContextManager[Session]:
+    from app.core.database import get_db_session
+
+    return get_db_session()
+
+
+class SolveJobStore:
+    """
+    Durable solve job records.
+
+    Used synchronously by Celery workers; the API calls it through
+    ``asyncio.to_thread`` so the event loop never waits on the database.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractContextManager[Session]] = _default_session_factory,
+    ):
+        self._session = session_factory
+
+    def create(
+        self, kind: str, parameters: dict[str, Any], created_by: str | None = None
+    ) -> SolveJob:
+        job = SolveJob(
+            kind=kind,
+            parameters=parameters,
+            parameters_digest=digest_value(parameters),
+            created_by=created_by,
+        )
+        with self._session() as session:
+            session.add(job)
+        return job
+
+    def get(self, job_id: UUID) -> SolveJob | None:
+        with self._session() as session:
+            return session.get(SolveJob, job_id)
+
+    def create_or_join(
+        self,
+        kind: str,
+        parameters: dict[str, Any],
+        created_by: str | None = None,
+        queued_max_age_seconds: float = QUEUED_JOIN_MAX_AGE_SECONDS,
+    ) -> tuple[SolveJob, bool]:
+        """
+        Queued or running job with the same parameters, else a new queued job.
+
+        Returns the job and whether it was created. Jobs that a client asked
+        to cancel, and jobs queued longer than ``queued_max_age_seconds``,
+        are not joined.
+        """
+        digest = digest_value(parameters)
+        queued_since = datetime.utcnow() - timedelta(seconds=queued_max_age_seconds)
+        with self._session() as session:
+            if session.get_bind().dialect.name == "postgresql":
+                # Serializes concurrent submissions of the same parameters
+                session.execute(
+                    text("SELECT pg_advisory_xact_lock(:key)"),
+                    {"key": int(digest[:15], 16)},
+                )
+            active = session.scalars(
+                select(SolveJob)
+                .where(
+                    SolveJob.parameters_digest == digest,
+                    SolveJob.kind == kind,
+                    or_(
+                        SolveJob.status == SolveJobStatus.RUNNING,
+                        and_(
+                            SolveJob.status == SolveJobStatus.QUEUED,
+                            SolveJob.created_at >= queued_since,
+                        ),
+                    ),
+                    SolveJob.cancel_requested.is_(False),
+                )
+                .order_by(SolveJob.created_at.desc())
+                .limit(1)
+            ).first()
+            if active is not None:
+                return active, False
+            job = SolveJob(
+                kind=kind,
+                parameters=parameters,
+                parameters_digest=digest,
+                created_by=created_by,
+            )
+            session.add(job)
+            return job, True
+
+    def get_result(self, job_id: UUID) -> dict[str, Any] | None:
+        with self._session() as session:
+            result = session.get(SolveJobResult, job_id)
+            return result.solution if result else None
+
+    def start(self, job_id: UUID, worker_task_id: str | None = None) -> SolveJob | None:
+        """Mark a queued job running; None when it was cancelled or already ran."""
+        with self._session() as session:
+            job = session.get(SolveJob, job_id, with_for_update=True)
+            if job is None or job.status != SolveJobStatus.QUEUED:
+                return None
+            job.status = SolveJobStatus.RUNNING
+            job.worker_task_id = worker_task_id
+            job.started_at = datetime.utcnow()
+            job.updated_at = job.started_at
+            job.progress_message = "Building model"
+            return job
+
+    def record_progress(
+        self,
+        job_id: UUID,
+        objective: float | None,
+        bound: float | None,
+        solutions_found: int,
+        message: str | None = None,
+    ) -> SolveJob | None:
+        with self._session() as session:
+            job = session.get(SolveJob, job_id)
+            if job is None:
+                return None
+            job.best_objective = objective
+            job.best_bound = bound
+            job.gap = relative_gap(objective, bound)
+            job.solutions_found = solutions_found
+            if message is not None:
+                job.progress_message = message
+            job.updated_at = datetime.utcnow()
+            return job
+
+    def request_cancel(self, job_id: UUID) -> SolveJob | None:
+        """
+        Flag a job for cancellation.
+
+        A queued job is cancelled at once; a running one is cancelled by its
+        worker, which keeps the best solution found so far.
+        """
+        with self._session() as session:
+            job = session.get(SolveJob, job_id, with_for_update=True)
+            if job is None or job.status.is_terminal:
+                return job
+            job.cancel_requested = True
+            job.updated_at = datetime.utcnow()
+            if job.status == SolveJobStatus.QUEUED:
+                job.status = SolveJobStatus.CANCELLED
+                job.finished_at = job.updated_at
+                job.progress_message = "Cancelled before start"
+            return job
+
+    def finish(
+        self,
+        job_id: UUID,
+        solution: dict[str, Any],
+        objective: float | None,
+        bound: float | None,
+        message: str | None = None,
+    ) -> SolveJob | None:
+        """Store the solution; cancelled jobs keep it as their partial result."""
+        with self._session() as session:
+            job = session.get(SolveJob, job_id, with_for_update=True)
+            if job is None:
+                return None
+            session.merge(SolveJobResult(solve_job_id=job_id, solution=solution))
+            job.status = (
+                SolveJobStatus.CANCELLED if job.cancel_requested else SolveJobStatus.SUCCEEDED
+            )
+            job.best_objective = objective
+            job.best_bound = bound
+            job.gap = relative_gap(objective, bound)
+            job.result_location = f"solve_job_results/{job_id}"
+            job.progress_message = message
+            job.finished_at = datetime.utcnow()
+            job.updated_at = job.finished_at
+            return job
+
+    def fail(self, job_id: UUID, error: str) -> SolveJob | None:
+        with self._session() as session:
+            job = session.get(SolveJob, job_id, with_for_update=True)
+            if job is None:
+                return None
+            job.status = SolveJobStatus.FAILED
+            job.error = error
+            job.finished_at = datetime.utcnow()
+            job.updated_at = job.finished_at
+            return job
+
+
+class SolveJobProgress:
+    """
+    Solution callback for a job running in a worker.
+
+    Publishes every improvement on the job's channel but writes the job row
+    at most once per ``min_interval_seconds``; ``flush`` writes the last one.
+    """
+
+    def __init__(
+        self,
+        store: SolveJobStore,
+        job_id: UUID,
+        redis_client: Any,
+        min_interval_seconds: float = 1.0,
+    ):
+        self.store = store
+        self.job_id = job_id
+        self.redis = redis_client
+        self.min_interval_seconds = min_interval_seconds
+        self.objective: float | None = None
+        self.bound: float | None = None
+        self.solutions_found = 0
+        self._written_at = 0.0
+        self._dirty = False
+
+    def __call__(self, objective: float, bound: float, wall_time: float) -> None:
+        self.objective = objective
+        self.bound = bound
+        self.solutions_found += 1
+        self._dirty = True
+        self.publish(
+            {
+                "event": "progress",
+                "job_id": str(self.job_id),
+                "status": SolveJobStatus.RUNNING.value,
+                "best_objective": objective,
+                "best_bound": bound,
+                "gap": relative_gap(objective, bound),
+                "solutions_found": self.solutions_found,
+                "wall_time_seconds": wall_time,
+            }
+        )
+        if time.monotonic() - self._written_at >= self.min_interval_seconds:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._dirty:
+            return
+        self.store.record_progress(
+            self.job_id, self.objective, self.bound, self.solutions_found, "Searching"
+        )
+        self._written_at = time.monotonic()
+        self._dirty = False
+
+    def publish(self, event: dict[str, Any]) -> None:
+        try:
+            self.redis.publish(solve_job_channel(self.job_id), json.dumps(event, default=str))
+        except Exception as e:
+            logger.warning("Solve job event not published", job_id=str(self.job_id), error=str(e))
+
+    def cancel_requested(self) -> bool:
+        """Polled by the solver's stop watcher."""
+        return bool(self.redis.exists(solve_job_cancel_key(self.job_id)))
+
@@ -5,9 +5,11 @@ This service integrates all the imported CSV data to create optimized production
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Set, Any
+from typing import Callable, Dict, List, Optional, Tuple, Set, Any
 from enum import Enum
 import logging
+import os
+import threading
 import psycopg2
 from psycopg2.extras import RealDictCursor
 from ortools.sat.python import cp_model
@@ -18,6 +20,7 @@ logger = logging.getLogger(__name__)
 
 class ScheduleStatus(str, Enum):
     """Status of the scheduling solution."""
+    PENDING = "pending"
     OPTIMAL = "optimal"
     FEASIBLE = "feasible"
     INFEASIBLE = "infeasible"
@@ -51,6 +54,20 @@ class SchedulingSolution(BaseModel):
     gap: Optional[float] = None
 
 
+class _SolutionProgress(cp_model.CpSolverSolutionCallback):
+    """Reports each improving solution's objective, bound and wall time."""
+    
+    def __init__(self, on_solution: Callable[[float, float, float], None]):
+        super().__init__()
+        self._on_solution = on_solution
+    
+    def on_solution_callback(self):
+        try:
+            self._on_solution(self.ObjectiveValue(), self.BestObjectiveBound(), self.WallTime())
+        except Exception as e:
+            logger.warning(f"Solution progress callback failed: {e}")
+
+
 class VulcanSchedulingService:
     """Main scheduling service using OR-Tools CP-SAT solver."""
     
@@ -62,6 +79,8 @@ class VulcanSchedulingService:
         self.task_vars = {}
         self.machine_assignments = {}
         self.operator_assignments = {}
+        # CP-SAT search threads; lower it when solves share the host
+        self.num_search_workers = min(8, os.cpu_count() or 1)
         
     def _get_connection(self):
         """Get database connection."""
@@ -352,17 +371,42 @@ class VulcanSchedulingService:
         # This is simplified - full implementation would block holiday periods
         pass
     
-    def solve(self, time_limit_seconds: int = 60) -> SchedulingSolution:
-        """Solve the scheduling problem."""
+    def solve(
+        self,
+        time_limit_seconds: int = 60,
+        on_solution: Optional[Callable[[float, float, float], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+        stop_poll_seconds: float = 1.0
+    ) -> SchedulingSolution:
+        """
+        Solve the scheduling problem.
+        
+        ``on_solution(objective, bound, wall_time)`` is called for every
+        improving solution. ``should_stop()`` is polled every
+        ``stop_poll_seconds`` from a helper thread; once it returns True the
+        search stops and the best solution found so far is returned.
+        """
         if not self.model:
             raise ValueError("Model not created. Call create_scheduling_model first.")
         
         self.solver = cp_model.CpSolver()
         self.solver.parameters.max_time_in_seconds = time_limit_seconds
-        self.solver.parameters.num_search_workers = 8
+        self.solver.parameters.num_search_workers = self.num_search_workers
+        
+        callback = _SolutionProgress(on_solution) if on_solution else None
+        finished = threading.Event()
+        if should_stop:
+            threading.Thread(
+                target=self._stop_when_requested,
+                args=(should_stop, finished, stop_poll_seconds),
+                daemon=True
+            ).start()
         
         # Solve
-        status = self.solver.Solve(self.model)
+        try:
+            status = self.solver.Solve(self.model, callback)
+        finally:
+            finished.set()
         
         # Extract solution
         if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
@@ -423,6 +467,22 @@ class VulcanSchedulingService:
                 solve_time_seconds=self.solver.WallTime()
             )
     
+    def _stop_when_requested(
+        self,
+        should_stop: Callable[[], bool],
+        finished: threading.Event,
+        poll_seconds: float
+    ):
+        """Stop the running search once ``should_stop`` returns True."""
+        while not finished.wait(poll_seconds):
+            try:
+                if should_stop():
+                    logger.info("Stopping search on request")
+                    self.solver.StopSearch()
+                    return
+            except Exception as e:
+                logger.warning(f"Stop check failed: {e}")
+    
     def _calculate_machine_utilization(self, tasks: List[TaskSchedule]) -> Dict[int, float]:
         """Calculate machine utilization percentages."""
         utilization = {}
@@ -236,6 +236,29 @@ class TestSolveEndpoint:
         assert response.status_code == 422  # Validation error
 
 
+class TestSolveProblemBuilding:
+    """The /solve problem is built in memory from the request payload."""
+
+    def test_jobs_and_tasks_built_without_repositories(self):
+        from app.api.routes.solve import _build_jobs_and_tasks_from_request
+        from app.models.scheduling import SolveRequest
+
+        request = SolveRequest(
+            jobs=[
+                {"job_number": "JOB001", "task_sequences": [10, 20, 30]},
+                {"job_number": "JOB002", "task_sequences": [15, 25]},
+            ],
+            schedule_start_time=datetime.utcnow() + timedelta(hours=1),
+        )
+
+        jobs, tasks = _build_jobs_and_tasks_from_request(request)
+
+        assert not request.persist
+        assert [job.job_number for job in jobs] == ["JOB001", "JOB002"]
+        assert [task.job_id for task in tasks] == [jobs[0].id] * 3 + [jobs[1].id] * 2
+        assert [task.sequence_in_job for task in tasks] == [1, 2, 3, 1, 2]
+
+
 @pytest.mark.integration
 class TestSolveEndpointIntegration:
     """Integration tests for the solve endpoint with database."""
@@ -244,7 +267,8 @@ class TestSolveEndpointIntegration:
         """
         Integration test that verifies the solve endpoint works with the database layer.
 
-        This test creates temporary jobs and tasks, runs optimization, and verifies cleanup.
+        This test runs optimization in memory and verifies nothing is written unless
+        the request sets ``persist``.
         """
         # This would require a test database setup
         # Skipping implementation details for now
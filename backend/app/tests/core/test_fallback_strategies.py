@@ -0,0 +1,165 @@
+"""
+Tests for the greedy list-scheduling fallback.
+
+Covers precedence, machine routing options, operator skills and capacity, and
+throughput on large instances.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.core.fallback_strategies import GreedySchedulingStrategy
+from app.domain.scheduling.value_objects.duration import Duration
+from app.domain.scheduling.value_objects.enums import PriorityLevel, SkillLevel
+
+START = datetime(2026, 1, 5, 7, 0)
+
+
+def _job(priority=PriorityLevel.NORMAL, due_hours=1000):
+    return SimpleNamespace(id=uuid4(), priority=priority, due_date=START + timedelta(hours=due_hours))
+
+
+def _machine():
+    return SimpleNamespace(id=uuid4())
+
+
+def _operator(**levels):
+    skills = {
+        code.upper(): SimpleNamespace(is_valid=True, proficiency_level=SkillLevel(str(level)))
+        for code, level in levels.items()
+    }
+    return SimpleNamespace(id=uuid4(), skills=skills)
+
+
+def _option(machine, setup, processing):
+    return SimpleNamespace(
+        machine_id=machine.id,
+        setup_duration=Duration.from_minutes(setup),
+        processing_duration=Duration.from_minutes(processing),
+        requires_operator_full_duration=True,
+        total_duration=lambda: Duration.from_minutes(setup + processing),
+    )
+
+
+def _task(job, sequence, options=(), roles=(), predecessors=(), minutes=None):
+    return SimpleNamespace(
+        id=uuid4(),
+        job_id=job.id,
+        sequence_in_job=sequence,
+        machine_options=list(options),
+        role_requirements=list(roles),
+        skill_requirements=[],
+        predecessor_ids=list(predecessors),
+        planned_duration=Duration.from_minutes(minutes) if minutes else None,
+        planned_setup_duration=None,
+        operator_required_duration_minutes=lambda option, role: int(
+            option.total_duration().minutes
+        ),
+    )
+
+
+def _role(skill, level=1, count=1):
+    return SimpleNamespace(skill_type=skill, minimum_level=level, count=count)
+
+
+def _run(jobs, tasks, operators, machines):
+    return asyncio.run(
+        GreedySchedulingStrategy().execute(jobs, tasks, operators, machines, START)
+    )
+
+
+def _assert_no_overlap(assignments, key):
+    by_resource = {}
+    for assignment in assignments:
+        for resource_id in key(assignment):
+            by_resource.setdefault(resource_id, []).append(assignment)
+    for placed in by_resource.values():
+        placed.sort(key=lambda a: a.start_time)
+        for earlier, later in zip(placed, placed[1:]):
+            assert later.start_time >= earlier.end_time
+
+
+def test_job_sequence_and_explicit_predecessors_are_respected():
+    machines = [_machine(), _machine()]
+    job_a, job_b = _job(), _job()
+    a1 = _task(job_a, 1, options=[_option(machines[0], 10, 50)])
+    a2 = _task(job_a, 2, options=[_option(machines[1], 0, 30)])
+    b1 = _task(job_b, 1, options=[_option(machines[1], 0, 20)], predecessors=[a2.id])
+
+    result = _run([job_a, job_b], [b1, a2, a1], [], machines)
+
+    schedule = result.schedule
+    assert result.tasks_scheduled == 3
+    assert schedule.get_assignment(a2.id).start_time >= schedule.get_assignment(a1.id).end_time
+    assert schedule.get_assignment(b1.id).start_time >= schedule.get_assignment(a2.id).end_time
+    assert schedule.get_assignment(a1.id).end_time == START + timedelta(minutes=60)
+    assert result.makespan_minutes == 110
+
+
+def test_fastest_machine_option_is_chosen():
+    slow, fast = _machine(), _machine()
+    job = _job()
+    task = _task(job, 1, options=[_option(slow, 0, 90), _option(fast, 0, 40)])
+
+    result = _run([job], [task], [], [slow, fast])
+
+    assignment = result.schedule.get_assignment(task.id)
+    assert assignment.machine_id == fast.id
+    assert assignment.end_time - assignment.start_time == timedelta(minutes=40)
+
+
+def test_operators_need_matching_skill_and_are_not_double_booked():
+    machines = [_machine() for _ in range(3)]
+    welder = _operator(welding=2)
+    novice = _operator(welding=1, machining=3)
+    jobs = [_job() for _ in range(3)]
+    tasks = [
+        _task(job, 1, options=[_option(machine, 0, 60)], roles=[_role("welding", level=2)])
+        for job, machine in zip(jobs, machines)
+    ]
+    missing = _task(_job(), 1, options=[_option(machines[0], 0, 10)], roles=[_role("inspection")])
+    jobs.append(SimpleNamespace(id=missing.job_id, priority=PriorityLevel.LOW, due_date=None))
+
+    result = _run(jobs, tasks + [missing], [welder, novice], machines)
+
+    assignments = [result.schedule.get_assignment(task.id) for task in tasks]
+    assert all(a.operator_ids == [welder.id] for a in assignments)
+    _assert_no_overlap(assignments, key=lambda a: a.operator_ids)
+    assert result.schedule.get_assignment(missing.id) is None
+    assert any(str(missing.id) in warning for warning in result.warnings)
+
+
+def test_critical_jobs_go_first():
+    machine = _machine()
+    normal, critical = _job(), _job(priority=PriorityLevel.CRITICAL)
+    normal_task = _task(normal, 1, minutes=30)
+    critical_task = _task(critical, 1, minutes=30)
+
+    result = _run([normal, critical], [normal_task, critical_task], [], [machine])
+
+    assert result.schedule.get_assignment(critical_task.id).start_time == START
+
+
+def test_large_instance_scales():
+    machines = [_machine() for _ in range(50)]
+    operators = [_operator(machining=3) for _ in range(100)]
+    jobs = [_job() for _ in range(5000)]
+    tasks = []
+    for index, job in enumerate(jobs):
+        for sequence in range(1, 11):
+            options = [
+                _option(machines[(index + sequence + k) % len(machines)], 5, 20 + k * 5)
+                for k in range(2)
+            ]
+            tasks.append(_task(job, sequence, options=options, roles=[_role("machining")]))
+
+    started = time.perf_counter()
+    result = _run(jobs, tasks, operators, machines)
+    elapsed = time.perf_counter() - started
+
+    assert result.tasks_scheduled == len(tasks)
+    assert elapsed < 10.0
+    _assert_no_overlap(result.schedule.assignments.values(), key=lambda a: [a.machine_id])
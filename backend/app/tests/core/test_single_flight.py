@@ -0,0 +1,210 @@
+"""
+Tests for single-flight solve coalescing.
+
+Covers sharing one run between coroutines of a process, progress fan-out,
+failure propagation, and coordination of two workers through Redis.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.single_flight import RemoteSolveError, SingleFlight
+
+
+class _FakeRedis:
+    """The async Redis subset SingleFlight uses, shared by simulated workers."""
+
+    def __init__(self):
+        self.values = {}
+        self.channels = {}
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def exists(self, key):
+        return int(key in self.values)
+
+    async def eval(self, script, numkeys, key, owner):
+        if self.values.get(key) == owner:
+            del self.values[key]
+            return 1
+        return 0
+
+    async def publish(self, channel, data):
+        for queue in self.channels.get(channel, []):
+            queue.put_nowait({"type": "message", "data": data})
+        return len(self.channels.get(channel, []))
+
+    def pubsub(self):
+        return _FakePubSub(self)
+
+
+class _FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.redis.channels.setdefault(channel, []).append(self.queue)
+
+    async def unsubscribe(self, channel):
+        self.redis.channels[channel].remove(self.queue)
+
+    async def get_message(self, ignore_subscribe_messages=True, timeout=None):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        pass
+
+
+class _HTTPError(Exception):
+    def __init__(self, status_code, detail):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def _counting_solve(calls, value, delay=0.2, fail=False):
+    async def solve(report):
+        calls.append(value)
+        await report({"stage": "solving"})
+        await asyncio.sleep(delay)
+        if isinstance(fail, Exception):
+            raise fail
+        if fail:
+            raise RuntimeError("solver crashed")
+        return value
+
+    return solve
+
+
+def test_identical_requests_share_one_run():
+    flight = SingleFlight()
+    calls = []
+    progress = []
+
+    async def listener(message):
+        progress.append(message)
+
+    async def run():
+        return await asyncio.gather(
+            flight.run("a", _counting_solve(calls, {"makespan": 10})),
+            flight.run("a", _counting_solve(calls, {"makespan": 99}), on_progress=listener),
+            flight.run("b", _counting_solve(calls, {"makespan": 20})),
+        )
+
+    results = asyncio.run(run())
+
+    assert results == [{"makespan": 10}, {"makespan": 10}, {"makespan": 20}]
+    assert sorted(c["makespan"] for c in calls) == [10, 20]
+    assert progress == [{"stage": "solving"}]
+    assert not flight.in_flight("a")
+
+
+def test_failure_reaches_every_caller_and_is_not_cached():
+    flight = SingleFlight()
+    calls = []
+
+    async def run():
+        results = await asyncio.gather(
+            flight.run("a", _counting_solve(calls, 1, fail=True)),
+            flight.run("a", _counting_solve(calls, 2)),
+            return_exceptions=True,
+        )
+        retry = await flight.run("a", _counting_solve(calls, 3))
+        return results, retry
+
+    results, retry = asyncio.run(run())
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert retry == 3
+    assert calls == [1, 3]
+
+
+def test_cancelled_caller_does_not_cancel_shared_run():
+    flight = SingleFlight()
+    calls = []
+
+    async def run():
+        first = asyncio.create_task(flight.run("a", _counting_solve(calls, 7)))
+        second = asyncio.create_task(flight.run("a", _counting_solve(calls, 8)))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == 7
+    assert calls == [7]
+
+
+def test_workers_coalesce_through_redis():
+    redis = _FakeRedis()
+    worker_a = SingleFlight(redis, poll_interval_seconds=0.05)
+    worker_b = SingleFlight(redis, poll_interval_seconds=0.05)
+    calls = []
+
+    async def run():
+        leader = asyncio.create_task(worker_a.run("a", _counting_solve(calls, [1, 2])))
+        await asyncio.sleep(0.01)
+        follower = await worker_b.run("a", _counting_solve(calls, [3]))
+        return await leader, follower
+
+    leader, follower = asyncio.run(run())
+
+    assert leader == follower == [1, 2]
+    assert calls == [[1, 2]]
+    assert not any(key.endswith(":lock") for key in redis.values)
+
+
+def test_remote_leader_failure_is_raised_in_followers():
+    redis = _FakeRedis()
+    worker_a = SingleFlight(redis, poll_interval_seconds=0.05)
+    worker_b = SingleFlight(redis, poll_interval_seconds=0.05)
+    calls = []
+
+    async def run():
+        leader = asyncio.create_task(
+            worker_a.run("a", _counting_solve(calls, 1, fail=_HTTPError(404, "No tasks")))
+        )
+        await asyncio.sleep(0.01)
+        with pytest.raises(RemoteSolveError) as follower_error:
+            await worker_b.run("a", _counting_solve(calls, 2))
+        with pytest.raises(_HTTPError):
+            await leader
+        return follower_error.value
+
+    error = asyncio.run(run())
+
+    assert (error.error_type, error.status_code, error.detail) == ("_HTTPError", 404, "No tasks")
+    # The follower did not solve again
+    assert calls == [1]
+
+
+def test_worker_takes_over_when_remote_lock_expires():
+    redis = _FakeRedis()
+    worker_a = SingleFlight(redis, poll_interval_seconds=0.05)
+    worker_b = SingleFlight(redis, poll_interval_seconds=0.05)
+    calls = []
+
+    async def run():
+        leader = asyncio.create_task(worker_a.run("a", _counting_solve(calls, 1, delay=1.0)))
+        await asyncio.sleep(0.01)
+        follower = asyncio.create_task(worker_b.run("a", _counting_solve(calls, 2)))
+        await asyncio.sleep(0.01)
+        # The leader's lock expires without a message, e.g. its worker died
+        del redis.values[worker_a._lock_key("a")]
+        result = await follower
+        leader.cancel()
+        return result
+
+    assert asyncio.run(run()) == 2
+    assert calls == [1, 2]
@@ -0,0 +1,182 @@
+"""
+Tests for asynchronous solve job records and worker progress reporting.
+"""
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+
+from app.domain.scheduling.value_objects.enums import SolveJobStatus
+from app.infrastructure.database.models import SolveJob, SolveJobResult
+from app.services.solve_jobs import (
+    SolveJobProgress,
+    SolveJobStore,
+    solve_job_cancel_key,
+    solve_job_channel,
+)
+
+
+@pytest.fixture
+def store():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(
+        engine, tables=[SolveJob.__table__, SolveJobResult.__table__]
+    )
+
+    @contextmanager
+    def session_factory():
+        with Session(engine, expire_on_commit=False) as session:
+            yield session
+            session.commit()
+
+    return SolveJobStore(session_factory)
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.published = []
+        self.keys = set()
+
+    def publish(self, channel, data):
+        self.published.append((channel, data))
+
+    def exists(self, key):
+        return int(key in self.keys)
+
+
+def test_job_lifecycle_records_progress_and_result(store):
+    job = store.create("vulcan_schedule", {"time_limit_seconds": 60})
+    assert store.get(job.id).status == SolveJobStatus.QUEUED
+
+    assert store.start(job.id, worker_task_id="task-1").status == SolveJobStatus.RUNNING
+    # A redelivered task does not run the job twice
+    assert store.start(job.id) is None
+
+    store.record_progress(job.id, objective=120.0, bound=90.0, solutions_found=3)
+    running = store.get(job.id)
+    assert running.gap == pytest.approx(0.25)
+    assert running.solutions_found == 3
+
+    store.finish(job.id, {"makespan_minutes": 100}, objective=100.0, bound=100.0)
+    done = store.get(job.id)
+    assert done.status == SolveJobStatus.SUCCEEDED
+    assert done.gap == 0.0
+    assert done.result_location == f"solve_job_results/{job.id}"
+    assert done.finished_at is not None
+    assert store.get_result(job.id) == {"makespan_minutes": 100}
+
+
+def test_cancelling_queued_job_prevents_start(store):
+    job = store.create("vulcan_schedule", {})
+
+    cancelled = store.request_cancel(job.id)
+
+    assert cancelled.status == SolveJobStatus.CANCELLED
+    assert store.start(job.id) is None
+    assert store.get_result(job.id) is None
+
+
+def test_cancelled_running_job_keeps_best_solution(store):
+    job = store.create("vulcan_schedule", {})
+    store.start(job.id)
+
+    assert store.request_cancel(job.id).status == SolveJobStatus.RUNNING
+    store.finish(job.id, {"makespan_minutes": 130}, objective=130.0, bound=100.0)
+
+    done = store.get(job.id)
+    assert done.status == SolveJobStatus.CANCELLED
+    assert store.get_result(job.id) == {"makespan_minutes": 130}
+
+
+def test_identical_parameters_join_active_job(store):
+    parameters = {"horizon_days": 14, "time_limit_seconds": 60}
+    first, created = store.create_or_join("vulcan_schedule", parameters)
+    assert created
+
+    # Key order does not matter; a running job is joined too
+    joined, created = store.create_or_join(
+        "vulcan_schedule", {"time_limit_seconds": 60, "horizon_days": 14}
+    )
+    assert not created
+    assert joined.id == first.id
+    store.start(first.id)
+    assert store.create_or_join("vulcan_schedule", parameters)[0].id == first.id
+
+    other, created = store.create_or_join("vulcan_schedule", {"horizon_days": 7})
+    assert created
+    assert other.id != first.id
+    assert other.parameters_digest != first.parameters_digest
+
+
+def test_finished_or_cancelling_jobs_are_not_joined(store):
+    parameters = {"horizon_days": 14}
+    finished, _ = store.create_or_join("vulcan_schedule", parameters)
+    store.start(finished.id)
+    store.finish(finished.id, {}, objective=None, bound=None)
+
+    running, created = store.create_or_join("vulcan_schedule", parameters)
+    assert created
+    store.start(running.id)
+    store.request_cancel(running.id)
+
+    fresh, created = store.create_or_join("vulcan_schedule", parameters)
+    assert created
+    assert fresh.id not in (finished.id, running.id)
+
+
+def test_stale_queued_or_failed_jobs_are_not_joined(store):
+    parameters = {"horizon_days": 14}
+    stale, _ = store.create_or_join("vulcan_schedule", parameters)
+
+    # Queued for longer than the join window: presumed lost by the broker
+    fresh, created = store.create_or_join(
+        "vulcan_schedule", parameters, queued_max_age_seconds=-1
+    )
+    assert created
+    assert fresh.id != stale.id
+
+    store.fail(fresh.id, "Could not enqueue solve job")
+    retried, created = store.create_or_join(
+        "vulcan_schedule", parameters, queued_max_age_seconds=-1
+    )
+    assert created
+    assert retried.id not in (stale.id, fresh.id)
+
+
+def test_failed_job_records_error(store):
+    job = store.create("vulcan_schedule", {})
+    store.start(job.id)
+
+    store.fail(job.id, "No tasks found to schedule")
+
+    failed = store.get(job.id)
+    assert failed.status == SolveJobStatus.FAILED
+    assert failed.status.is_terminal
+    assert failed.error == "No tasks found to schedule"
+
+
+def test_progress_publishes_every_solution_and_throttles_writes(store):
+    job = store.create("vulcan_schedule", {})
+    store.start(job.id)
+    redis = _FakeRedis()
+    progress = SolveJobProgress(store, job.id, redis, min_interval_seconds=3600)
+
+    progress(150.0, 80.0, 0.5)
+    progress(120.0, 90.0, 1.0)
+
+    assert [channel for channel, _ in redis.published] == [solve_job_channel(job.id)] * 2
+    # Only the first improvement was written within the interval
+    assert store.get(job.id).best_objective == 150.0
+    progress.flush()
+    assert store.get(job.id).best_objective == 120.0
+    assert store.get(job.id).solutions_found == 2
+
+    assert not progress.cancel_requested()
+    redis.keys.add(solve_job_cancel_key(job.id))
+    assert progress.cancel_requested()
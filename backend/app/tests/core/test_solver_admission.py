@@ -0,0 +1,129 @@
+"""
+Tests for solver admission control.
+
+Covers sharing cores under contention, priority ordering of the queue,
+early rejection when a deadline cannot be met, and releasing queued solves.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.solver_admission import AdmissionConfig, SolverAdmissionController
+from app.domain.shared.exceptions import SolverCapacityExceededError
+
+
+def _controller(**overrides):
+    config = dict(
+        cpu_cores=8,
+        memory_mb=8192,
+        max_concurrent_solves=2,
+        max_workers_per_solve=8,
+        max_queue_length=4,
+        min_solve_seconds=1.0,
+    )
+    config.update(overrides)
+    return SolverAdmissionController(AdmissionConfig(**config))
+
+
+def test_workers_shrink_under_contention():
+    controller = _controller(max_concurrent_solves=4)
+
+    async def run():
+        first = await controller.acquire(8, 1024, time_limit_seconds=60)
+        queued = [
+            asyncio.create_task(controller.acquire(8, 1024, time_limit_seconds=60))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.01)
+        # A lone solve gets every core it asks for; the others wait for cores
+        assert controller.queue_length == 2
+        controller.release(first)
+        return first, await asyncio.gather(*queued)
+
+    first, queued = asyncio.run(run())
+
+    assert first.workers == 8
+    assert [grant.workers for grant in queued] == [4, 4]
+    assert controller.cores_in_use == 8
+
+
+def test_queue_serves_higher_priority_first():
+    controller = _controller(max_concurrent_solves=1)
+    order = []
+
+    async def solve(name, priority):
+        async with controller.admit(4, 1024, time_limit_seconds=10, priority=priority):
+            order.append(name)
+            await asyncio.sleep(0.01)
+
+    async def run():
+        running = await controller.acquire(4, 1024, time_limit_seconds=10)
+        waiters = [
+            asyncio.create_task(solve("low", 0)),
+            asyncio.create_task(solve("high", 5)),
+            asyncio.create_task(solve("normal", 1)),
+        ]
+        await asyncio.sleep(0.01)
+        assert controller.queue_length == 3
+        controller.release(running)
+        await asyncio.gather(*waiters)
+
+    asyncio.run(run())
+
+    assert order == ["high", "normal", "low"]
+    assert controller.active_solves == 0
+    assert controller.cores_in_use == 0
+
+
+def test_unmeetable_deadline_is_rejected_with_retry_after():
+    controller = _controller(max_concurrent_solves=1)
+
+    async def run():
+        await controller.acquire(4, 1024, time_limit_seconds=120)
+        with pytest.raises(SolverCapacityExceededError) as excinfo:
+            await controller.acquire(4, 1024, time_limit_seconds=60, deadline_seconds=30)
+        return excinfo.value
+
+    error = asyncio.run(run())
+
+    assert 110 <= error.retry_after_seconds <= 121
+    assert error.details["reason"] == error.reason
+    assert controller.queue_length == 0
+
+
+def test_full_queue_is_rejected():
+    controller = _controller(max_concurrent_solves=1, max_queue_length=1)
+
+    async def run():
+        await controller.acquire(4, 1024, time_limit_seconds=30)
+        queued = asyncio.create_task(controller.acquire(4, 1024, time_limit_seconds=30))
+        await asyncio.sleep(0.01)
+        with pytest.raises(SolverCapacityExceededError):
+            await controller.acquire(4, 1024)
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+    asyncio.run(run())
+
+    assert controller.queue_length == 0
+
+
+def test_memory_budget_queues_and_deadline_shortens_time_limit():
+    controller = _controller(max_concurrent_solves=4, memory_mb=4096)
+
+    async def run():
+        first = await controller.acquire(2, 3072, time_limit_seconds=0.05)
+        waiting = asyncio.create_task(
+            controller.acquire(2, 3072, time_limit_seconds=600, deadline_seconds=20)
+        )
+        await asyncio.sleep(0.01)
+        assert controller.queue_length == 1
+        controller.release(first)
+        return await waiting
+
+    grant = asyncio.run(run())
+
+    assert grant.time_limit_seconds <= 20
+    assert grant.queued_seconds > 0
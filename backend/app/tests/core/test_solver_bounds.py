@@ -0,0 +1,119 @@
+"""
+Tests for CPM and resource time bounds.
+
+Covers earliest starts and latest ends along precedence chains, makespan
+lower bounds from the critical path and resource load, and the domains the
+HFFS and CP-SAT schedulers build from them.
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from ortools.sat.python import cp_model
+
+from app.core.solver import HFFSScheduler
+from app.core.solver_bounds import ResourceLoad, compute_time_bounds
+from app.domain.scheduling.optimization.cp_sat_scheduler import (
+    CPSATScheduler,
+    SchedulingProblem,
+    SolutionStatus,
+)
+
+
+def test_cpm_passes_follow_chains_releases_and_deadlines():
+    durations = {"a": 3, "b": 2, "c": 4, "d": 1}
+    # a -> b -> d and c -> d, c released at 2, d due by 12
+    bounds = compute_time_bounds(
+        durations,
+        [("a", "b"), ("b", "d"), ("c", "d")],
+        horizon=20,
+        release_dates={"c": 2},
+        deadlines={"d": 12},
+    )
+
+    assert bounds.earliest_start == {"a": 0, "b": 3, "c": 2, "d": 6}
+    assert bounds.latest_end == {"a": 9, "b": 11, "c": 11, "d": 12}
+    assert bounds.latest_start("a") == 6
+    assert bounds.critical_path == 7
+    assert bounds.infeasible_tasks == []
+
+    late = compute_time_bounds(durations, [("a", "b"), ("b", "d")], 20, deadlines={"d": 5})
+    assert late.infeasible_tasks == ["a", "b", "d"]
+
+
+def test_resource_load_raises_makespan_bound():
+    durations = {task: 5 for task in "abcdef"}
+    single_machine = ResourceLoad(1, [(task, 5, 1) for task in "abcd"])
+    shared_pair = ResourceLoad(2, [(task, 5, 1) for task in "abcdef"])
+
+    bounds = compute_time_bounds(
+        durations, [("e", "f")], 100, resources=[single_machine, shared_pair]
+    )
+
+    assert bounds.critical_path == 10
+    assert bounds.resource_bound == 20
+    assert bounds.makespan_lower_bound == 20
+
+
+def test_hffs_domains_are_narrowed_to_bounds():
+    scheduler = HFFSScheduler()
+    scheduler.num_jobs = 2
+    scheduler.num_tasks = 12
+    scheduler.horizon_days = 14
+    scheduler.horizon = 14 * 24 * 60
+    scheduler.due_dates = {0: 5 * 24 * 60, 1: 6 * 24 * 60}
+    scheduler.critical_sequences = [(2, 4)]
+    scheduler.wip_zones = []
+
+    model, objective, starts, *_ = scheduler.create_model()
+    bounds = scheduler.last_time_bounds
+
+    # Job 1 enters the critical sequence after job 0 leaves it
+    assert bounds.earliest_start[(1, 2)] >= bounds.earliest_start[(0, 4)] + 70
+    last_start = list(model.Proto().variables[starts[(0, 11, 0)].Index()].domain)
+    assert last_start[0] >= bounds.earliest_start[(0, 11)] >= 11 * 70
+    assert last_start[-1] <= bounds.latest_start((0, 11))
+    # Every job uses the machine of task 0
+    assert bounds.resource_bound >= 2 * 70
+
+    model.Minimize(objective)
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = 30
+    assert solver.Solve(model) in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+
+
+def _chain_problem(deadline_minutes=None):
+    start = datetime(2026, 1, 5, 7, 0)
+    problem = SchedulingProblem(
+        planning_horizon_start=start,
+        planning_horizon_end=start + timedelta(hours=24),
+        time_granularity_minutes=5,
+        max_solution_time_seconds=10.0,
+    )
+    problem.machine_ids = [uuid4()]
+    problem.resource_constraints.add_machine_constraint(problem.machine_ids[0], capacity=1)
+    previous = None
+    for _ in range(4):
+        task_id = uuid4()
+        problem.task_ids.append(task_id)
+        problem.task_durations[task_id] = 60
+        if previous is not None:
+            problem.temporal_constraints.add_precedence(previous, task_id)
+        previous = task_id
+    if deadline_minutes is not None:
+        problem.temporal_constraints.task_latest_end[previous] = deadline_minutes
+    return problem
+
+
+def test_cp_sat_uses_bounds_and_rejects_unmeetable_deadlines_early():
+    scheduler = CPSATScheduler()
+    result = scheduler.solve(_chain_problem())
+
+    assert result.status == SolutionStatus.OPTIMAL
+    assert scheduler.time_bounds.makespan_lower_bound == 48  # Four hours of 5 minute slots
+    assert result.makespan_hours == 4.0
+
+    infeasible = CPSATScheduler().solve(_chain_problem(deadline_minutes=180))
+
+    assert infeasible.status == SolutionStatus.INFEASIBLE
+    assert len(infeasible.constraint_violations[-1].affected_entities) == 4
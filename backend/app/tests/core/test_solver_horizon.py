@@ -0,0 +1,94 @@
+"""
+Tests for automatic horizon sizing.
+
+Covers the constructive makespans the HFFS and CP-SAT schedulers size their
+horizons from, and widening the horizon when a narrowed one is infeasible.
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from app.core.solver import HFFSScheduler
+from app.domain.scheduling.optimization.cp_sat_scheduler import (
+    CPSATScheduler,
+    SchedulingProblem,
+    SolutionStatus,
+)
+
+
+def _small_hffs() -> HFFSScheduler:
+    scheduler = HFFSScheduler()
+    scheduler.num_jobs = 2
+    scheduler.num_tasks = 12
+    scheduler.due_dates = {0: 5 * 24 * 60, 1: 6 * 24 * 60}
+    scheduler.critical_sequences = [(2, 4)]
+    scheduler.wip_zones = []
+    scheduler.time_limit_seconds = 10
+    return scheduler
+
+
+def test_hffs_horizon_covers_constructive_makespan_with_slack():
+    scheduler = _small_hffs()
+    makespan = scheduler.constructive_makespan()
+
+    # Twelve tasks of at least 70 minutes per job, in working hours only
+    assert makespan >= 12 * 70
+    assert scheduler.size_horizon() * 24 * 60 >= makespan * 1.25
+    assert scheduler.horizon == scheduler.horizon_days * 24 * 60
+
+    scheduler.max_horizon_days = 1
+    assert scheduler.constructive_makespan() is None
+
+
+def test_hffs_widens_a_horizon_too_short_to_be_feasible():
+    scheduler = _small_hffs()
+    scheduler.constructive_makespan = lambda: 60
+
+    solution = scheduler.solve()
+
+    assert solution is not None
+    assert solution["horizon_days"] > 1
+    assert solution["makespan"] <= solution["horizon_days"] * 24 * 60
+
+
+def _one_machine_problem(num_tasks: int, horizon_slack=0.25) -> SchedulingProblem:
+    start = datetime(2026, 1, 5, 7, 0)
+    problem = SchedulingProblem(
+        planning_horizon_start=start,
+        planning_horizon_end=start + timedelta(hours=24),
+        time_granularity_minutes=5,
+        max_solution_time_seconds=10.0,
+        horizon_slack=horizon_slack,
+    )
+    problem.machine_ids = [uuid4()]
+    problem.resource_constraints.add_machine_constraint(problem.machine_ids[0], capacity=1)
+    for _ in range(num_tasks):
+        task_id = uuid4()
+        problem.task_ids.append(task_id)
+        problem.task_durations[task_id] = 60
+    return problem
+
+
+def test_cp_sat_models_constructive_makespan_plus_slack():
+    scheduler = CPSATScheduler()
+    result = scheduler.solve(_one_machine_problem(4))
+
+    assert result.status == SolutionStatus.OPTIMAL
+    assert result.makespan_hours == 4.0
+    # Four hours of 5 minute slots plus a quarter
+    assert scheduler.model_horizon == 60
+
+    scheduler.solve(_one_machine_problem(4, horizon_slack=None))
+    assert scheduler.model_horizon == 288
+
+
+def test_cp_sat_widens_an_infeasible_horizon():
+    scheduler = CPSATScheduler()
+    # Too short for two one-hour tasks on one machine
+    scheduler._constructive_makespan = lambda problem: 10
+
+    result = scheduler.solve(_one_machine_problem(2))
+
+    assert result.status == SolutionStatus.OPTIMAL
+    assert result.makespan_hours == 2.0
+    assert scheduler.model_horizon == 26
@@ -0,0 +1,118 @@
+"""
+Tests for the solver process pool.
+
+Covers solving in worker processes, hard cancellation on timeout and caller
+cancellation, worker recycling and pool metrics.
+"""
+
+import asyncio
+import random
+
+import psutil
+import pytest
+from ortools.sat.python import cp_model
+
+from app.core.solver_pool import SolveCancelledError, SolverPoolConfig, SolverProcessPool
+
+
+def _small_model() -> tuple[cp_model.CpModel, cp_model.IntVar]:
+    model = cp_model.CpModel()
+    x = model.NewIntVar(0, 10, "x")
+    y = model.NewIntVar(0, 10, "y")
+    model.Add(x + y <= 12)
+    model.Maximize(2 * x + y)
+    return model, x
+
+
+def _hard_model(n: int = 300, m: int = 40) -> cp_model.CpModel:
+    """A multi-dimensional knapsack CP-SAT cannot prove optimal in seconds."""
+    rnd = random.Random(7)
+    model = cp_model.CpModel()
+    x = [model.NewBoolVar(f"x_{i}") for i in range(n)]
+    for _ in range(m):
+        weights = [rnd.randint(1, 1000) for _ in range(n)]
+        model.Add(sum(w * xi for w, xi in zip(weights, x)) <= sum(weights) // 2)
+    model.Maximize(sum(rnd.randint(1, 1000) * xi for xi in x))
+    return model
+
+
+@pytest.fixture
+def pool():
+    pool = SolverProcessPool(
+        SolverPoolConfig(max_workers=2, max_solves_per_worker=2, hard_kill_grace_seconds=0.5)
+    )
+    yield pool
+    pool.shutdown()
+
+
+def test_solve_returns_solution_from_worker(pool):
+    model, x = _small_model()
+
+    result = asyncio.run(pool.solve(model, {"num_search_workers": 1}, 10))
+
+    assert result.status == cp_model.OPTIMAL
+    assert result.value(x) == 10
+    assert result.objective_value == 22
+    assert result.worker_pid != psutil.Process().pid
+
+
+def test_worker_is_recycled_after_max_solves(pool):
+    async def run():
+        pids = []
+        for _ in range(3):
+            model, _ = _small_model()
+            result = await pool.solve(model, {"num_search_workers": 1}, 10)
+            pids.append(result.worker_pid)
+        return pids
+
+    pids = asyncio.run(run())
+
+    assert pids[0] == pids[1]
+    assert pids[2] != pids[0]
+    assert not psutil.pid_exists(pids[0]) or psutil.Process(pids[0]).status() == psutil.STATUS_ZOMBIE
+
+
+def test_cancelling_caller_kills_worker(pool):
+    async def run():
+        task = asyncio.create_task(pool.solve(_hard_model(), {"num_search_workers": 2}, 60))
+        while pool.running == 0:
+            await asyncio.sleep(0.05)
+        await asyncio.sleep(0.5)
+        pid = pool.stats()["worker_pids"][0]
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return pid
+
+    pid = asyncio.run(run())
+
+    assert pool.running == 0
+    assert not psutil.pid_exists(pid) or psutil.Process(pid).status() == psutil.STATUS_ZOMBIE
+
+
+def test_hard_timeout_kills_worker_that_ignores_time_limit(pool):
+    async def run():
+        # A zero grace period with a sub-second limit forces the hard-kill path
+        pool.config.hard_kill_grace_seconds = 0.0
+        return await pool.solve(_hard_model(), {"num_search_workers": 1}, 0.01)
+
+    with pytest.raises(SolveCancelledError):
+        asyncio.run(run())
+    assert pool.stats()["running_solves"] == 0
+
+
+def test_queue_depth_is_tracked_when_pool_is_saturated(pool):
+    async def run():
+        tasks = [
+            asyncio.create_task(pool.solve(_hard_model(), {"num_search_workers": 1}, 60))
+            for _ in range(3)
+        ]
+        while pool.running < 2:
+            await asyncio.sleep(0.05)
+        depth = pool.queue_depth
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return depth
+
+    assert asyncio.run(run()) == 1
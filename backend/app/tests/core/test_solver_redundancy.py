@@ -0,0 +1,96 @@
+"""
+Tests for redundant resource group constraints.
+
+Covers the cumulative and energy bound posted per resource group, and the
+groups the HFFS and CP-SAT schedulers build from machines and operators.
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from ortools.sat.python import cp_model
+
+from app.core.solver import HFFSScheduler
+from app.core.solver_redundancy import add_resource_group
+from app.domain.scheduling.optimization.constraint_models import CPSATConstraintBuilder
+from app.domain.scheduling.optimization.cp_sat_scheduler import (
+    CPSATScheduler,
+    SchedulingProblem,
+    SolutionStatus,
+)
+
+
+def _cumulatives(model: cp_model.CpModel) -> int:
+    return sum(1 for c in model.Proto().constraints if c.has_cumulative())
+
+
+def test_group_cumulative_and_energy_bound_the_span():
+    model = cp_model.CpModel()
+    intervals = []
+    for index in range(3):
+        start = model.NewIntVar(0, 20, f"start_{index}")
+        intervals.append(model.NewIntervalVar(start, 4, start + 4, f"task_{index}"))
+
+    # Two units cover two of the tasks but not all three
+    assert not add_resource_group(model, intervals[:2], [1, 1], 2, 20, "pair")
+    assert add_resource_group(model, intervals, [1, 1, 1], 2, 20, "group")
+    assert _cumulatives(model) == 1
+
+    makespan = model.NewIntVar(0, 20, "makespan")
+    model.AddMaxEquality(makespan, [interval.EndExpr() for interval in intervals])
+    model.Minimize(makespan)
+    solver = cp_model.CpSolver()
+    assert solver.Solve(model) == cp_model.OPTIMAL
+    assert solver.Value(makespan) == 8
+
+
+def test_hffs_posts_routing_and_skill_pool_groups():
+    def model_for(redundant: bool) -> cp_model.CpModel:
+        scheduler = HFFSScheduler()
+        scheduler.num_jobs = 3
+        scheduler.num_tasks = 20
+        scheduler.horizon_days = 14
+        scheduler.horizon = 14 * 24 * 60
+        scheduler.critical_sequences = []
+        scheduler.wip_zones = []
+        scheduler.redundant_resource_groups = redundant
+        return scheduler.create_model()[0]
+
+    plain, strengthened = model_for(False), model_for(True)
+
+    # Routing machines of tasks 9 and 19, and one pool per skill requirement
+    # with more demand than qualified operators at once
+    added = _cumulatives(strengthened) - _cumulatives(plain)
+    assert added >= 2
+    for model in (plain, strengthened):
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = 30
+        assert solver.Solve(model) in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+
+
+def test_cp_sat_groups_interchangeable_machines_and_operators():
+    start = datetime(2026, 1, 5, 7, 0)
+    problem = SchedulingProblem(
+        planning_horizon_start=start,
+        planning_horizon_end=start + timedelta(hours=12),
+        time_granularity_minutes=5,
+        max_solution_time_seconds=10.0,
+    )
+    problem.machine_ids = [uuid4() for _ in range(3)]
+    for machine_id in problem.machine_ids:
+        problem.resource_constraints.add_machine_constraint(machine_id, capacity=1)
+    for _ in range(7):
+        task_id = uuid4()
+        problem.task_ids.append(task_id)
+        problem.task_durations[task_id] = 60
+        problem.task_eligible_machines[task_id] = problem.machine_ids[:2]
+
+    builder = CPSATConstraintBuilder(cp_model.CpModel())
+    task_vars = builder.create_task_variables(problem.task_ids, 144, {t: 12 for t in problem.task_ids})
+    eligible = {t: problem.eligible_machines(t) for t in problem.task_ids}
+    assert builder.add_resource_groups(task_vars, eligible, {}, "machines") == 1
+
+    result = CPSATScheduler().solve(problem)
+    assert result.status == SolutionStatus.OPTIMAL
+    # Seven one-hour tasks on a group of two machines
+    assert result.makespan_hours == 4.0
@@ -0,0 +1,103 @@
+"""
+Tests for the solver termination policy.
+
+Covers the gap and progress rules, stopping a live CP-SAT search early, and
+reporting the stop reason from pooled workers.
+"""
+
+import asyncio
+import random
+import time
+
+from ortools.sat.python import cp_model
+
+from app.core.solver_pool import SolverPoolConfig, SolverProcessPool
+from app.core.solver_termination import StopReason, TerminationPolicy, solve_with_policy
+
+
+def _hard_model(n: int = 300, m: int = 40) -> cp_model.CpModel:
+    """A multi-dimensional knapsack CP-SAT cannot prove optimal in seconds."""
+    rnd = random.Random(7)
+    model = cp_model.CpModel()
+    x = [model.NewBoolVar(f"x_{i}") for i in range(n)]
+    for _ in range(m):
+        weights = [rnd.randint(1, 1000) for _ in range(n)]
+        model.Add(sum(w * xi for w, xi in zip(weights, x)) <= sum(weights) // 2)
+    model.Maximize(sum(rnd.randint(1, 1000) * xi for xi in x))
+    return model
+
+
+def test_gap_rules():
+    policy = TerminationPolicy(relative_gap=0.01, absolute_gap=5)
+
+    assert policy.gap_reason(1000, 996) == StopReason.ABSOLUTE_GAP
+    assert policy.gap_reason(1000, 992) == StopReason.RELATIVE_GAP
+    assert policy.gap_reason(1000, 900) is None
+
+
+def test_progress_rules():
+    stagnation = TerminationPolicy(stagnation_seconds=10, min_search_seconds=5)
+    history = [(1.0, 500.0), (2.0, 400.0)]
+
+    assert stagnation.progress_reason(history, 4.0) is None  # Before min_search_seconds
+    assert stagnation.progress_reason(history, 11.0) is None
+    assert stagnation.progress_reason(history, 12.0) == StopReason.STAGNATION
+    assert stagnation.progress_reason([], 60.0) is None
+
+    slow = TerminationPolicy(min_improvement_rate=0.01, improvement_window_seconds=10)
+    improving = [(1.0, 500.0), (10.0, 400.0), (18.0, 300.0)]
+
+    assert slow.progress_reason(improving, 8.0) is None  # Window not covered yet
+    # 400 -> 300 over the last 10s is 2.5%/s
+    assert slow.progress_reason(improving, 20.0) is None
+    # No improvement since 300 at 18s
+    assert slow.progress_reason(improving, 29.0) == StopReason.SLOW_IMPROVEMENT
+
+
+def test_stagnating_search_stops_before_time_limit():
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = 60
+    solver.parameters.num_search_workers = 2
+    policy = TerminationPolicy(relative_gap=None, stagnation_seconds=1.0, poll_seconds=0.1)
+
+    started = time.monotonic()
+    status, reason = solve_with_policy(solver, _hard_model(), policy)
+
+    assert status == cp_model.FEASIBLE
+    assert reason == StopReason.STAGNATION
+    assert time.monotonic() - started < 30
+
+
+def test_optimal_and_time_limit_reasons():
+    model = cp_model.CpModel()
+    x = model.NewIntVar(0, 10, "x")
+    model.Maximize(x)
+    solver = cp_model.CpSolver()
+
+    assert solve_with_policy(solver, model, None) == (cp_model.OPTIMAL, StopReason.OPTIMAL)
+
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = 0.5
+    solver.parameters.num_search_workers = 1
+    status, reason = solve_with_policy(solver, _hard_model(), TerminationPolicy(relative_gap=None))
+
+    assert status == cp_model.FEASIBLE
+    assert reason == StopReason.TIME_LIMIT
+
+
+def test_pooled_solve_reports_stop_reason():
+    pool = SolverProcessPool(SolverPoolConfig(max_workers=1))
+    try:
+        result = asyncio.run(
+            pool.solve(
+                _hard_model(),
+                {"num_search_workers": 1},
+                timeout_seconds=60,
+                termination=TerminationPolicy(relative_gap=0.5),
+            )
+        )
+    finally:
+        pool.shutdown()
+
+    assert result.stop_reason == StopReason.RELATIVE_GAP.value
+    assert result.wall_time < 30
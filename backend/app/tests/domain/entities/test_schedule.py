@@ -0,0 +1,123 @@
+"""
+Unit Tests for Schedule Aggregate Resource Indexes
+
+Tests that the per-machine, per-operator and global timelines stay consistent
+with assignments across assign, reassign and unassign, and that window queries
+and conflict validation use them correctly.
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.domain.scheduling.entities.schedule import Schedule
+from app.domain.scheduling.value_objects.duration import Duration
+
+BASE = datetime(2024, 1, 10, 8, 0)
+
+
+def _assign(schedule, machine_id, operator_ids, start_minutes, length_minutes):
+    task_id = uuid4()
+    schedule.assign_task(
+        task_id=task_id,
+        machine_id=machine_id,
+        operator_ids=operator_ids,
+        start_time=BASE + timedelta(minutes=start_minutes),
+        end_time=BASE + timedelta(minutes=start_minutes + length_minutes),
+        setup_duration=Duration(minutes=0),
+        processing_duration=Duration(minutes=length_minutes),
+    )
+    return task_id
+
+
+@pytest.fixture
+def schedule():
+    return Schedule(name="Index test")
+
+
+class TestScheduleResourceIndexes:
+    """Resource lookups served from the time-ordered indexes."""
+
+    def test_machine_assignments_sorted_by_start(self, schedule):
+        machine = uuid4()
+        late = _assign(schedule, machine, [], 120, 30)
+        early = _assign(schedule, machine, [], 0, 30)
+        _assign(schedule, uuid4(), [], 60, 30)
+
+        result = schedule.get_assignments_for_machine(machine)
+
+        assert [a.task_id for a in result] == [early, late]
+
+    def test_operator_assignments_follow_reassignment(self, schedule):
+        operator = uuid4()
+        task_id = _assign(schedule, uuid4(), [operator], 0, 30)
+
+        schedule.assign_task(
+            task_id=task_id,
+            machine_id=uuid4(),
+            operator_ids=[],
+            start_time=BASE,
+            end_time=BASE + timedelta(minutes=30),
+            setup_duration=Duration(minutes=0),
+            processing_duration=Duration(minutes=30),
+        )
+
+        assert schedule.get_assignments_for_operator(operator) == []
+        assert len(schedule.get_assignments_in_time_window(BASE, BASE + timedelta(hours=1))) == 1
+
+    def test_unassign_removes_from_all_indexes(self, schedule):
+        machine, operator = uuid4(), uuid4()
+        task_id = _assign(schedule, machine, [operator], 0, 30)
+
+        schedule.unassign_task(task_id)
+
+        assert schedule.get_assignments_for_machine(machine) == []
+        assert schedule.get_assignments_for_operator(operator) == []
+        assert schedule.get_assignments_in_time_window(BASE, BASE + timedelta(days=1)) == []
+
+    def test_time_window_includes_long_assignment_started_earlier(self, schedule):
+        machine = uuid4()
+        long_task = _assign(schedule, machine, [], 0, 600)
+        _assign(schedule, machine, [], 700, 10)
+
+        window = schedule.get_assignments_in_time_window(
+            BASE + timedelta(minutes=300), BASE + timedelta(minutes=310)
+        )
+
+        assert [a.task_id for a in window] == [long_task]
+
+    def test_window_query_matches_linear_scan(self, schedule):
+        machines = [uuid4() for _ in range(5)]
+        for i in range(500):
+            _assign(schedule, machines[i % 5], [], (i * 37) % 5000, 5 + i % 90)
+
+        for start in range(0, 5000, 250):
+            window_start = BASE + timedelta(minutes=start)
+            window_end = window_start + timedelta(minutes=120)
+            expected = {
+                a.task_id
+                for a in schedule.assignments.values()
+                if a.start_time < window_end and a.end_time > window_start
+            }
+            got = schedule.get_assignments_in_time_window(window_start, window_end)
+            assert {a.task_id for a in got} == expected
+
+            per_machine = schedule.get_machine_assignments_in_time_window(
+                machines[0], window_start, window_end
+            )
+            assert {a.task_id for a in per_machine} == {
+                a.task_id
+                for a in schedule.assignments.values()
+                if a.machine_id == machines[0] and a.task_id in expected
+            }
+
+    def test_validate_constraints_reports_double_booking(self, schedule):
+        machine, operator = uuid4(), uuid4()
+        _assign(schedule, machine, [operator], 60, 60)
+        _assign(schedule, machine, [operator], 90, 30)
+
+        violations = schedule.validate_constraints()
+
+        assert sum("Machine" in v for v in violations) == 1
+        assert sum("Operator" in v for v in violations) == 1
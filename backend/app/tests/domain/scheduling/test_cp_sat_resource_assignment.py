@@ -0,0 +1,104 @@
+"""
+CP-SAT Resource Assignment Tests
+
+Tests that the solver chooses machines among each task's eligible machines
+and operators among skill-qualified ones, without overlapping either.
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from app.domain.scheduling.optimization.cp_sat_scheduler import (
+    CPSATScheduler,
+    ScheduleHint,
+    SchedulingProblem,
+    SolutionStatus,
+)
+
+
+def _problem(num_tasks: int, num_machines: int = 2) -> SchedulingProblem:
+    start = datetime(2026, 1, 5, 7, 0)
+    problem = SchedulingProblem(
+        planning_horizon_start=start,
+        planning_horizon_end=start + timedelta(hours=12),
+        time_granularity_minutes=5,
+        max_solution_time_seconds=10.0,
+    )
+    problem.machine_ids = [uuid4() for _ in range(num_machines)]
+    for machine_id in problem.machine_ids:
+        problem.resource_constraints.add_machine_constraint(machine_id, capacity=1)
+    for _ in range(num_tasks):
+        task_id = uuid4()
+        problem.task_ids.append(task_id)
+        problem.task_durations[task_id] = 60
+    return problem
+
+
+def _assert_no_overlap(result, resource_of):
+    by_resource = {}
+    for assignment in result.task_assignments:
+        for resource_id in resource_of(assignment):
+            by_resource.setdefault(resource_id, []).append(assignment)
+    for assignments in by_resource.values():
+        assignments.sort(key=lambda a: a.start_time)
+        for earlier, later in zip(assignments, assignments[1:]):
+            assert later.start_time >= earlier.end_time
+
+
+def test_solver_balances_tasks_over_eligible_machines():
+    problem = _problem(num_tasks=6, num_machines=3)
+    only_first = problem.task_ids[:2]
+    for task_id in only_first:
+        problem.task_eligible_machines[task_id] = [problem.machine_ids[0]]
+
+    result = CPSATScheduler().solve(problem)
+
+    assert result.status == SolutionStatus.OPTIMAL
+    assert all(
+        result.get_task_assignment(t).assigned_machine_id == problem.machine_ids[0]
+        for t in only_first
+    )
+    # Six one-hour tasks on three machines finish in two hours
+    assert result.makespan_hours == 2.0
+    _assert_no_overlap(result, lambda a: [a.assigned_machine_id])
+
+
+def test_operators_are_skill_qualified_and_never_double_booked():
+    problem = _problem(num_tasks=4, num_machines=4)
+    welder, fitter = uuid4(), uuid4()
+    problem.operator_ids = [welder, fitter]
+    for operator_id in problem.operator_ids:
+        problem.resource_constraints.add_operator_constraint(operator_id, capacity=1)
+    problem.skill_constraints.add_operator_skills(welder, {"welding": 3})
+    problem.skill_constraints.add_operator_skills(fitter, {"fitting": 2})
+    welding = problem.task_ids[:3]
+    for task_id in welding:
+        problem.skill_constraints.add_task_skill_requirement(task_id, [("welding", 2)])
+
+    result = CPSATScheduler().solve(problem)
+
+    assert result.is_feasible
+    assert not result.constraint_violations
+    for task_id in welding:
+        assert result.get_task_assignment(task_id).assigned_operator_ids == [welder]
+    # One welder for three welding tasks serializes them despite free machines
+    assert result.makespan_hours == 3.0
+    _assert_no_overlap(result, lambda a: a.assigned_operator_ids)
+
+
+def test_frozen_tasks_keep_hinted_machine_and_missing_eligibility_is_invalid():
+    problem = _problem(num_tasks=2)
+    frozen = problem.task_ids[0]
+    target = problem.machine_ids[1]
+    problem.schedule_hint = ScheduleHint(
+        start_minutes={frozen: 0},
+        machine_assignments={frozen: target},
+        frozen_task_ids={frozen},
+    )
+
+    assert problem.eligible_machines(frozen) == [target]
+    result = CPSATScheduler().solve(problem)
+    assert result.get_task_assignment(frozen).assigned_machine_id == target
+
+    problem.task_eligible_machines[problem.task_ids[1]] = [uuid4()]
+    assert CPSATScheduler().solve(problem).status == SolutionStatus.MODEL_INVALID
@@ -0,0 +1,85 @@
+"""
+CP-SAT Time Granularity Tests
+
+Tests that coarse model slots keep schedules feasible in exact minutes.
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from app.domain.scheduling.optimization.cp_sat_scheduler import (
+    CPSATScheduler,
+    SchedulingProblem,
+)
+from app.domain.scheduling.optimization.rolling_horizon import (
+    RollingHorizonConfig,
+    RollingHorizonScheduler,
+)
+
+
+def _problem(granularity: int, durations, days: int = 2) -> SchedulingProblem:
+    start = datetime(2026, 1, 5, 7, 0)
+    problem = SchedulingProblem(
+        planning_horizon_start=start,
+        planning_horizon_end=start + timedelta(days=days),
+        time_granularity_minutes=granularity,
+        max_solution_time_seconds=10.0,
+    )
+    problem.machine_ids = [uuid4()]
+    problem.resource_constraints.add_machine_constraint(problem.machine_ids[0], capacity=1)
+    previous = None
+    for duration in durations:
+        task_id = uuid4()
+        problem.task_ids.append(task_id)
+        problem.task_durations[task_id] = duration
+        if previous is not None:
+            problem.temporal_constraints.add_precedence(previous, task_id)
+        previous = task_id
+    return problem
+
+
+def _assert_exact(problem, assignments):
+    by_task = {a.task_id: a for a in assignments}
+    for task_id in problem.task_ids:
+        assignment = by_task[task_id]
+        offset = (assignment.start_time - problem.planning_horizon_start).total_seconds() / 60
+        assert offset % problem.time_granularity_minutes == 0
+        assert assignment.duration_minutes == problem.task_durations[task_id]
+        assert assignment.end_time - assignment.start_time == timedelta(
+            minutes=problem.task_durations[task_id]
+        )
+    for pred_id, succ_id in problem.temporal_constraints.precedence_constraints:
+        assert by_task[succ_id].start_time >= by_task[pred_id].end_time
+
+
+def test_durations_round_up_and_map_back_to_minutes():
+    problem = _problem(15, [20, 7, 45])
+    last = problem.task_ids[-1]
+    problem.temporal_constraints.task_earliest_start[problem.task_ids[0]] = 10
+    problem.temporal_constraints.task_latest_end[last] = 130
+
+    result = CPSATScheduler().solve(problem)
+
+    assert result.is_feasible
+    _assert_exact(problem, result.task_assignments)
+    first = result.get_task_assignment(problem.task_ids[0])
+    assert first.start_time == problem.planning_horizon_start + timedelta(minutes=15)
+    # 15 + 30 + 15 slot minutes for the first two tasks, then 45 exact minutes
+    assert result.get_task_assignment(last).end_time == (
+        problem.planning_horizon_start + timedelta(minutes=105)
+    )
+
+
+def test_rolling_horizon_with_coarse_slots():
+    problem = _problem(15, [50] * 12, days=3)
+    scheduler = RollingHorizonScheduler(
+        config=RollingHorizonConfig(
+            window_minutes=4 * 60, overlap_minutes=60, max_tasks_per_window=4
+        )
+    )
+
+    result = scheduler.solve(problem)
+
+    assert result.is_feasible
+    assert scheduler.windows_solved > 1
+    _assert_exact(problem, result.task_assignments)
@@ -0,0 +1,148 @@
+"""
+CP-SAT Warm Start Tests
+
+Tests schedule hints and neighborhood freezing used by disruption repair solves.
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.domain.scheduling.optimization.cp_sat_scheduler import (
+    CPSATScheduler,
+    ScheduleHint,
+    SchedulingProblem,
+)
+from app.domain.scheduling.optimization.optimization_service import (
+    SchedulingOptimizationService,
+)
+
+
+def _problem(num_tasks: int = 4) -> SchedulingProblem:
+    start = datetime(2026, 1, 5, 7, 0)
+    problem = SchedulingProblem(
+        planning_horizon_start=start,
+        planning_horizon_end=start + timedelta(hours=8),
+        time_granularity_minutes=1,
+        max_solution_time_seconds=10.0,
+    )
+    problem.machine_ids = [uuid4(), uuid4()]
+    for machine_id in problem.machine_ids:
+        problem.resource_constraints.add_machine_constraint(machine_id, capacity=1)
+    for _ in range(num_tasks):
+        task_id = uuid4()
+        problem.task_ids.append(task_id)
+        problem.task_durations[task_id] = 30
+    return problem
+
+
+def test_frozen_tasks_keep_hinted_start():
+    problem = _problem()
+    frozen, free = problem.task_ids[0], problem.task_ids[1]
+    problem.schedule_hint = ScheduleHint(
+        start_minutes={frozen: 120, free: 200},
+        frozen_task_ids={frozen},
+    )
+
+    result = CPSATScheduler().solve(problem)
+
+    assert result.is_feasible
+    frozen_assignment = result.get_task_assignment(frozen)
+    assert frozen_assignment.start_time == problem.planning_horizon_start + timedelta(
+        minutes=120
+    )
+    assert problem.schedule_hint.free_task_ids == {free}
+
+
+def test_misaligned_frozen_start_rounds_up_to_the_grid():
+    problem = _problem()
+    problem.time_granularity_minutes = 15
+    frozen = problem.task_ids[0]
+    problem.schedule_hint = ScheduleHint(start_minutes={frozen: 20}, frozen_task_ids={frozen})
+
+    result = CPSATScheduler().solve(problem)
+
+    assert result.is_feasible
+    assert result.get_task_assignment(frozen).start_time == (
+        problem.planning_horizon_start + timedelta(minutes=30)
+    )
+
+
+def test_frozen_task_running_at_horizon_start_blocks_its_machine():
+    problem = _problem(num_tasks=2)
+    problem.time_granularity_minutes = 5
+    running, waiting = problem.task_ids
+    machine_id = problem.machine_ids[0]
+    problem.fixed_task_assignments = {running: machine_id, waiting: machine_id}
+    problem.schedule_hint = ScheduleHint(
+        start_minutes={running: -20},
+        machine_assignments={running: machine_id},
+        frozen_task_ids={running},
+    )
+
+    result = CPSATScheduler().solve(problem)
+
+    assert result.is_feasible
+    start = problem.planning_horizon_start
+    running_assignment = result.get_task_assignment(running)
+    # Keeps its published times; the machine is busy for its last 10 minutes
+    assert running_assignment.start_time == start - timedelta(minutes=20)
+    assert running_assignment.end_time == start + timedelta(minutes=10)
+    assert result.get_task_assignment(waiting).start_time >= running_assignment.end_time
+
+
+def test_hinted_machines_are_reused():
+    problem = _problem()
+    target = problem.machine_ids[1]
+    problem.schedule_hint = ScheduleHint(
+        machine_assignments={task_id: target for task_id in problem.task_ids}
+    )
+
+    assignments = CPSATScheduler().build_resource_assignments(problem)
+
+    assert set(assignments.values()) == {target}
+
+
+def test_neighborhood_frees_affected_tasks_and_successors():
+    problem = _problem(num_tasks=4)
+    start = problem.planning_horizon_start
+    broken, healthy = problem.machine_ids
+    a, b, c, d = problem.task_ids
+
+    def assignment(offset_hours, machine_id):
+        begin = start + timedelta(hours=offset_hours)
+        return SimpleNamespace(
+            start_time=begin,
+            end_time=begin + timedelta(minutes=30),
+            machine_id=machine_id,
+            operator_ids=[],
+        )
+
+    reference_assignments = {
+        a: assignment(0, broken),
+        b: assignment(1, healthy),
+        c: assignment(6, healthy),
+        d: assignment(7, healthy),
+    }
+    reference = SimpleNamespace(get_assignment=reference_assignments.get)
+    tasks = [
+        SimpleNamespace(id=a, predecessor_ids=[]),
+        SimpleNamespace(id=b, predecessor_ids=[a]),
+        SimpleNamespace(id=c, predecessor_ids=[]),
+        SimpleNamespace(id=d, predecessor_ids=[]),
+    ]
+
+    service = SchedulingOptimizationService.__new__(SchedulingOptimizationService)
+    hint = service._build_schedule_hint(
+        problem,
+        reference,
+        tasks,
+        [broken],
+        disruption_start=start + timedelta(hours=6, minutes=50),
+        disruption_end=start + timedelta(hours=7, minutes=10),
+        neighborhood_hours=0.0,
+    )
+
+    # a runs on the broken machine, b follows a, d overlaps the window
+    assert hint.frozen_task_ids == {c}
+    assert hint.start_minutes[d] == 7 * 60
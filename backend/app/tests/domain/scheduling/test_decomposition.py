@@ -0,0 +1,194 @@
+"""
+Decomposed Solve Tests
+
+Tests resource cluster detection, concurrent cluster solves in the solver
+process pool and repair of cross-cluster precedence edges.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.core.solver_pool import SolverPoolConfig, SolverProcessPool
+from app.domain.scheduling.optimization.cp_sat_scheduler import (
+    CPSATScheduler,
+    SchedulingProblem,
+)
+from app.domain.scheduling.optimization.decomposition import (
+    DecomposedScheduler,
+    DecompositionConfig,
+)
+from app.tests.utils.schedules import assert_feasible_schedule
+
+
+def _two_department_problem():
+    """
+    Two departments with two machines and three four-task chains each.
+
+    The only link between them is one edge from the end of a chain in the
+    first department to the start of a chain in the second.
+    """
+    start = datetime(2026, 1, 5, 7, 0)
+    problem = SchedulingProblem(
+        planning_horizon_start=start,
+        planning_horizon_end=start + timedelta(days=2),
+        time_granularity_minutes=5,
+        max_solution_time_seconds=10.0,
+    )
+    partitions = {}
+    chains = []
+    for department in ("assembly", "finishing"):
+        machines = [uuid4(), uuid4()]
+        for machine_id in machines:
+            problem.machine_ids.append(machine_id)
+            problem.resource_constraints.add_machine_constraint(machine_id, capacity=1)
+            partitions[machine_id] = department
+        for chain in range(3):
+            previous = None
+            tasks = []
+            for step in range(4):
+                task_id = uuid4()
+                problem.task_ids.append(task_id)
+                problem.task_durations[task_id] = 30 + 10 * ((chain + step) % 3)
+                problem.fixed_task_assignments[task_id] = machines[step % 2]
+                if previous is not None:
+                    problem.temporal_constraints.add_precedence(previous, task_id)
+                previous = task_id
+                tasks.append(task_id)
+            chains.append(tasks)
+    problem.temporal_constraints.add_precedence(chains[0][-1], chains[3][0])
+    return problem, partitions
+
+
+@pytest.fixture
+def pool():
+    pool = SolverProcessPool(SolverPoolConfig(max_workers=2))
+    yield pool
+    pool.shutdown()
+
+
+def test_clusters_follow_partitions_and_precedence_coupling():
+    problem, partitions = _two_department_problem()
+    scheduler = DecomposedScheduler(config=DecompositionConfig(coupling_threshold=0.5))
+    helper = CPSATScheduler()
+    machines = helper.build_resource_assignments(problem)
+    _, temporal = helper.to_slot_units(problem)
+
+    by_label = scheduler.find_clusters(problem, machines, temporal, partitions, 4)
+    # Without labels the chains alternating between two machines still bind them
+    by_coupling = scheduler.find_clusters(problem, machines, temporal, {}, 4)
+
+    expected = sorted([set(problem.task_ids[:12]), set(problem.task_ids[12:])], key=len)
+    assert sorted(map(set, by_label), key=len) == expected
+    assert sorted(map(set, by_coupling), key=len) == expected
+    assert len(scheduler.find_clusters(problem, machines, temporal, partitions, 1)) == 1
+
+
+def test_decomposed_solve_repairs_cross_cluster_edges(pool):
+    problem, partitions = _two_department_problem()
+    scheduler = DecomposedScheduler(
+        pool, DecompositionConfig(min_tasks=1, search_workers=2)
+    )
+
+    result = asyncio.run(scheduler.solve(problem, partitions))
+
+    assert result.is_feasible
+    assert_feasible_schedule(problem, result)
+    assert len(scheduler.clusters) == 2
+    assert scheduler.coupling_edges == 1
+    assert scheduler.repaired_tasks > 0
+    assert not scheduler.used_fallback
+
+
+def test_infeasible_cluster_falls_back_to_whole_solve(pool):
+    start = datetime(2026, 1, 5, 7, 0)
+    problem = SchedulingProblem(
+        planning_horizon_start=start,
+        planning_horizon_end=start + timedelta(hours=8),
+        time_granularity_minutes=5,
+        max_solution_time_seconds=10.0,
+    )
+    partitions = {}
+    for department in ("assembly", "finishing"):
+        first, second = uuid4(), uuid4()
+        problem.machine_ids += [first, second]
+        partitions.update({first: department, second: department})
+        flexible, pinned = uuid4(), uuid4()
+        problem.task_ids += [flexible, pinned]
+        # The least-loaded heuristic puts both on the first machine, which
+        # cannot finish both by their deadline
+        problem.task_eligible_machines[flexible] = [first, second]
+        problem.task_eligible_machines[pinned] = [first]
+        for task_id in (flexible, pinned):
+            problem.task_durations[task_id] = 60
+            problem.temporal_constraints.task_latest_end[task_id] = 60
+    for machine_id in problem.machine_ids:
+        problem.resource_constraints.add_machine_constraint(machine_id, capacity=1)
+    scheduler = DecomposedScheduler(
+        pool, DecompositionConfig(min_tasks=1, search_workers=2)
+    )
+
+    result = asyncio.run(scheduler.solve(problem, partitions))
+
+    assert result.is_feasible
+    assert_feasible_schedule(problem, result)
+    assert len(scheduler.clusters) == 2
+    assert scheduler.used_fallback
+
+
+def test_small_problems_are_solved_whole(pool):
+    problem, partitions = _two_department_problem()
+    scheduler = DecomposedScheduler(pool, DecompositionConfig(search_workers=2))
+
+    result = asyncio.run(scheduler.solve(problem, partitions))
+
+    assert result.is_feasible
+    assert_feasible_schedule(problem, result)
+    assert scheduler.clusters == [problem.task_ids]
+    assert scheduler.repaired_tasks == 0
+
+
+def test_shared_operator_keeps_departments_together(pool):
+    problem, partitions = _two_department_problem()
+    operator_id = uuid4()
+    problem.operator_ids = [operator_id]
+    problem.resource_constraints.add_operator_constraint(operator_id, capacity=1)
+    scheduler = DecomposedScheduler(
+        pool, DecompositionConfig(min_tasks=1, search_workers=2)
+    )
+
+    result = asyncio.run(scheduler.solve(problem, partitions))
+
+    assert result.is_feasible
+    assert_feasible_schedule(problem, result)
+    assert len(scheduler.clusters) == 1
+    assert all(a.assigned_operator_ids == [operator_id] for a in result.task_assignments)
+
+
+def test_department_operators_stay_in_their_cluster(pool):
+    problem, partitions = _two_department_problem()
+    skills = problem.skill_constraints
+    for department, tasks in (("assembly", problem.task_ids[:12]),
+                              ("finishing", problem.task_ids[12:])):
+        operator_id = uuid4()
+        problem.operator_ids.append(operator_id)
+        problem.resource_constraints.add_operator_constraint(operator_id, capacity=1)
+        skills.add_operator_skills(operator_id, {department: 1})
+        for task_id in tasks:
+            skills.add_task_skill_requirement(task_id, department, 1)
+    scheduler = DecomposedScheduler(
+        pool, DecompositionConfig(min_tasks=1, search_workers=2)
+    )
+
+    result = asyncio.run(scheduler.solve(problem, partitions))
+
+    assert result.is_feasible
+    assert_feasible_schedule(problem, result)
+    assert len(scheduler.clusters) == 2
+    for assignment in result.task_assignments:
+        assert len(assignment.assigned_operator_ids) == 1
+        assert skills.can_operator_perform_task(
+            assignment.assigned_operator_ids[0], assignment.task_id
+        )
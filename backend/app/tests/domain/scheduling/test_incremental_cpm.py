@@ -0,0 +1,104 @@
+"""
+Unit Tests for Incremental CPM
+
+Every incremental update is checked against a from-scratch sparse CPM run on
+the same graph, and cone-limited propagation is verified on a wide graph.
+"""
+
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.domain.scheduling.algorithms.incremental_cpm import IncrementalCPM
+from app.domain.scheduling.algorithms.sparse_cpm import SparseTaskGraph
+
+
+def _random_dag(n, m, seed):
+    rng = np.random.default_rng(seed)
+    a, b = rng.integers(0, n, m), rng.integers(0, n, m)
+    keep = a != b
+    src, dst = np.minimum(a, b)[keep], np.maximum(a, b)[keep]
+    durations = rng.integers(1, 100, n).astype(float)
+    return durations, src, dst
+
+
+def _assert_matches_full_recompute(cpm: IncrementalCPM):
+    src = [u for u, succs in enumerate(cpm.successors) for _ in succs]
+    dst = [v for succs in cpm.successors for v in succs]
+    full = SparseTaskGraph(cpm.durations, np.array(src), np.array(dst)).compute()
+
+    assert cpm.makespan == pytest.approx(full.makespan)
+    np.testing.assert_allclose(cpm.earliest_start, full.earliest_start)
+    np.testing.assert_allclose(cpm.latest_start, full.latest_start)
+    np.testing.assert_array_equal(cpm.critical_mask, full.critical_mask)
+
+
+class TestIncrementalCPM:
+    """Incremental updates agree with full recomputation."""
+
+    def test_random_update_sequence_matches_full_recompute(self):
+        durations, src, dst = _random_dag(200, 600, 3)
+        cpm = IncrementalCPM(SparseTaskGraph(durations, src, dst))
+        rng = np.random.default_rng(42)
+
+        for step in range(150):
+            action = step % 3
+            if action == 0:
+                cpm.update_duration(int(rng.integers(200)), float(rng.integers(1, 150)))
+            elif action == 1:
+                u, v = sorted(rng.choice(200, 2, replace=False).tolist())
+                # Insert against the original numbering half of the time
+                if rng.random() < 0.5:
+                    u, v = v, u
+                try:
+                    cpm.add_edge(u, v)
+                except ValueError:
+                    pass
+            else:
+                u = int(rng.integers(200))
+                if cpm.successors[u]:
+                    cpm.remove_edge(u, next(iter(cpm.successors[u])))
+            _assert_matches_full_recompute(cpm)
+
+    def test_reports_critical_set_change(self):
+        a, b, c = uuid4(), uuid4(), uuid4()
+        cpm = IncrementalCPM.from_dependencies(
+            [a, b, c], [10.0, 30.0, 20.0], {b: {a}, c: {a}}
+        )
+        assert set(cpm.critical_tasks()) == {a, b}
+
+        change = cpm.update_duration(c, 50.0)
+
+        assert change.added == [c]
+        assert change.removed == [b]
+        assert change.makespan_before == 40.0
+        assert change.makespan_after == 60.0
+        assert change.changed
+
+    def test_cycle_is_rejected_without_corrupting_state(self):
+        cpm = IncrementalCPM(SparseTaskGraph(np.ones(3), np.array([0, 1]), np.array([1, 2])))
+
+        with pytest.raises(ValueError):
+            cpm.add_edge(2, 0)
+
+        assert cpm.successors[2] == set()
+        _assert_matches_full_recompute(cpm)
+
+    def test_update_touches_only_the_affected_cone(self):
+        # 1000 independent chains of 10 tasks
+        chains = np.arange(10_000).reshape(1_000, 10)
+        graph = SparseTaskGraph(
+            np.full(10_000, 5.0), chains[:, :-1].ravel(), chains[:, 1:].ravel()
+        )
+        cpm = IncrementalCPM(graph)
+
+        change = cpm.update_duration(int(chains[7, 4]), 100.0)
+
+        assert change.tasks_repropagated <= 20
+        assert change.makespan_after == 145.0
+        # Every chain was critical; now only the lengthened one is
+        assert change.added == []
+        assert len(change.removed) == 9_990
+        assert set(cpm.critical_tasks()) == set(chains[7].tolist())
+        _assert_matches_full_recompute(cpm)
@@ -0,0 +1,191 @@
+"""
+Large Neighborhood Search Tests
+
+Tests destroy-and-repair improvement of heuristic schedules with CP-SAT.
+"""
+
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+from app.domain.scheduling.optimization.cp_sat_scheduler import SchedulingProblem
+from app.domain.scheduling.optimization.lns import (
+    NEIGHBORHOODS,
+    LargeNeighborhoodSearch,
+    LNSConfig,
+)
+from app.tests.utils.schedules import assert_feasible_schedule
+
+
+def _bottleneck_problem() -> SchedulingProblem:
+    """
+    Two tasks share machine A; only the second feeds a long task on B.
+
+    List scheduling takes them in id order, so the feeder runs second and
+    the schedule ends at 240 minutes instead of 180.
+    """
+    start = datetime(2026, 1, 5, 7, 0)
+    problem = SchedulingProblem(
+        planning_horizon_start=start,
+        planning_horizon_end=start + timedelta(hours=12),
+        time_granularity_minutes=5,
+        max_solution_time_seconds=10.0,
+    )
+    machine_a, machine_b = uuid4(), uuid4()
+    problem.machine_ids = [machine_a, machine_b]
+    for machine_id in problem.machine_ids:
+        problem.resource_constraints.add_machine_constraint(machine_id, capacity=1)
+
+    other, feeder, tail = UUID(int=1), UUID(int=2), UUID(int=3)
+    problem.task_ids = [other, feeder, tail]
+    problem.task_durations = {other: 60, feeder: 60, tail: 120}
+    problem.fixed_task_assignments = {other: machine_a, feeder: machine_a, tail: machine_b}
+    problem.temporal_constraints.add_precedence(feeder, tail)
+    return problem
+
+
+def _shared_operator_problem() -> SchedulingProblem:
+    """
+    Two machines and three operators, one of whom alone can weld.
+
+    Three welding tasks on different machines must queue for the welder;
+    the fitting task may take any operator.
+    """
+    start = datetime(2026, 1, 5, 7, 0)
+    problem = SchedulingProblem(
+        planning_horizon_start=start,
+        planning_horizon_end=start + timedelta(hours=12),
+        time_granularity_minutes=5,
+        max_solution_time_seconds=10.0,
+    )
+    machine_a, machine_b = uuid4(), uuid4()
+    problem.machine_ids = [machine_a, machine_b]
+    for machine_id in problem.machine_ids:
+        problem.resource_constraints.add_machine_constraint(machine_id, capacity=1)
+
+    welder, fitter, helper = UUID(int=101), UUID(int=102), UUID(int=103)
+    problem.operator_ids = [welder, fitter, helper]
+    for operator_id in problem.operator_ids:
+        problem.resource_constraints.add_operator_constraint(operator_id, capacity=1)
+    problem.skill_constraints.add_operator_skills(welder, {"welding": 3, "fitting": 3})
+    problem.skill_constraints.add_operator_skills(fitter, {"fitting": 2})
+    problem.skill_constraints.add_operator_skills(helper, {"fitting": 1})
+
+    weld_a, weld_b, weld_c, fit = UUID(int=1), UUID(int=2), UUID(int=3), UUID(int=4)
+    problem.task_ids = [weld_a, weld_b, weld_c, fit]
+    problem.task_durations = {weld_a: 60, weld_b: 60, weld_c: 30, fit: 90}
+    problem.fixed_task_assignments = {
+        weld_a: machine_a, weld_b: machine_b, weld_c: machine_a, fit: machine_b
+    }
+    for task_id in (weld_a, weld_b, weld_c):
+        problem.skill_constraints.add_task_skill_requirement(task_id, "welding", 2)
+    problem.skill_constraints.add_task_skill_requirement(fit, "fitting", 1)
+    return problem
+
+
+def test_lns_improves_heuristic_incumbent():
+    problem = _bottleneck_problem()
+    lns = LargeNeighborhoodSearch(
+        config=LNSConfig(time_limit_seconds=20.0, stagnation_iterations=8, seed=3)
+    )
+
+    result = lns.solve(problem)
+
+    assert result.is_feasible
+    assert_feasible_schedule(problem, result)
+    assert result.makespan_hours == 3.0
+    assert set(lns.neighborhood_stats) == set(NEIGHBORHOODS)
+    assert sum(stats.improvements for stats in lns.neighborhood_stats.values()) >= 1
+
+
+def test_lns_stops_on_stagnation_budget():
+    problem = _bottleneck_problem()
+    lns = LargeNeighborhoodSearch(
+        config=LNSConfig(time_limit_seconds=300.0, stagnation_iterations=3)
+    )
+
+    result = lns.solve(problem)
+
+    assert result.is_feasible
+    assert result.solution_time_seconds < 60.0
+    improvements = sum(stats.improvements for stats in lns.neighborhood_stats.values())
+    assert lns.iterations <= 3 * (improvements + 1)
+
+
+def test_lns_falls_back_to_cp_sat_when_heuristic_misses_deadline():
+    problem = _bottleneck_problem()
+    feeder = problem.task_ids[1]
+    problem.temporal_constraints.task_latest_end[feeder] = 60
+
+    result = LargeNeighborhoodSearch(
+        config=LNSConfig(time_limit_seconds=10.0, stagnation_iterations=2)
+    ).solve(problem)
+
+    assert result.is_feasible
+    by_task = assert_feasible_schedule(problem, result)
+    assert by_task[feeder].end_time <= problem.planning_horizon_start + timedelta(minutes=60)
+
+
+def test_lns_never_double_books_a_single_operator():
+    problem = _bottleneck_problem()
+    operator_id = uuid4()
+    problem.operator_ids = [operator_id]
+    problem.resource_constraints.add_operator_constraint(operator_id, capacity=1)
+    problem.task_ids = problem.task_ids[:2]
+    machine_a, machine_b = problem.machine_ids
+    problem.fixed_task_assignments = {
+        problem.task_ids[0]: machine_a, problem.task_ids[1]: machine_b
+    }
+    problem.temporal_constraints.precedence_constraints = []
+
+    result = LargeNeighborhoodSearch(
+        config=LNSConfig(time_limit_seconds=10.0, stagnation_iterations=4)
+    ).solve(problem)
+
+    assert result.is_feasible
+    by_task = assert_feasible_schedule(problem, result)
+    assert all(a.assigned_operator_ids == [operator_id] for a in by_task.values())
+    assert result.makespan_hours == 2.0
+
+
+def test_lns_keeps_operator_commitments_outside_the_neighborhood():
+    problem = _shared_operator_problem()
+    welder = problem.operator_ids[0]
+    lns = LargeNeighborhoodSearch(
+        config=LNSConfig(
+            time_limit_seconds=20.0, stagnation_iterations=10, max_free_tasks=2, seed=1
+        )
+    )
+
+    result = lns.solve(problem)
+
+    assert result.is_feasible
+    by_task = assert_feasible_schedule(problem, result)
+    assert lns.iterations >= 1
+    skills = problem.skill_constraints
+    for task_id, assignment in by_task.items():
+        assert len(assignment.assigned_operator_ids) == 1
+        assert skills.can_operator_perform_task(assignment.assigned_operator_ids[0], task_id)
+    assert all(by_task[t].assigned_operator_ids == [welder] for t in problem.task_ids[:3])
+    # Never worse than the list-scheduling incumbent
+    assert result.makespan_hours <= 3.5
+
+
+def test_lns_moves_tasks_to_another_eligible_machine():
+    problem = _bottleneck_problem()
+    machine_a, machine_b = problem.machine_ids
+    flexible, pinned = problem.task_ids[:2]
+    problem.task_ids = [flexible, pinned]
+    problem.fixed_task_assignments = {}
+    problem.temporal_constraints.precedence_constraints = []
+    # Least-loaded assignment puts both on A; only a machine swap helps
+    problem.task_eligible_machines = {flexible: [machine_a, machine_b], pinned: [machine_a]}
+
+    result = LargeNeighborhoodSearch(
+        config=LNSConfig(time_limit_seconds=10.0, stagnation_iterations=6)
+    ).solve(problem)
+
+    assert result.is_feasible
+    by_task = assert_feasible_schedule(problem, result)
+    assert by_task[flexible].assigned_machine_id == machine_b
+    assert by_task[pinned].assigned_machine_id == machine_a
+    assert result.makespan_hours == 1.0
@@ -0,0 +1,72 @@
+"""
+Rolling Horizon Tests
+
+Tests window-by-window solving and stitching of long scheduling horizons.
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from app.domain.scheduling.optimization.cp_sat_scheduler import SchedulingProblem
+from app.domain.scheduling.optimization.rolling_horizon import (
+    RollingHorizonConfig,
+    RollingHorizonScheduler,
+)
+from app.tests.utils.schedules import assert_feasible_schedule
+
+
+def _chain_problem(num_chains: int, chain_length: int, days: int) -> SchedulingProblem:
+    start = datetime(2026, 1, 5)
+    problem = SchedulingProblem(
+        planning_horizon_start=start,
+        planning_horizon_end=start + timedelta(days=days),
+        time_granularity_minutes=1,
+        max_solution_time_seconds=10.0,
+    )
+    problem.machine_ids = [uuid4(), uuid4()]
+    for machine_id in problem.machine_ids:
+        problem.resource_constraints.add_machine_constraint(machine_id, capacity=1)
+
+    for chain in range(num_chains):
+        previous = None
+        for _ in range(chain_length):
+            task_id = uuid4()
+            problem.task_ids.append(task_id)
+            problem.task_durations[task_id] = 120
+            if previous is None:
+                # Stagger chain releases across the horizon
+                problem.temporal_constraints.task_earliest_start[task_id] = chain * 24 * 60
+            else:
+                problem.temporal_constraints.add_precedence(previous, task_id)
+            previous = task_id
+    return problem
+
+
+def test_rolling_horizon_stitches_feasible_schedule():
+    problem = _chain_problem(num_chains=6, chain_length=4, days=10)
+    scheduler = RollingHorizonScheduler(
+        config=RollingHorizonConfig(
+            window_minutes=24 * 60, overlap_minutes=6 * 60, max_tasks_per_window=8
+        )
+    )
+
+    result = scheduler.solve(problem)
+
+    assert result.is_feasible
+    assert scheduler.windows_solved > 1
+    assert_feasible_schedule(problem, result)
+
+
+def test_window_task_cap_bounds_model_size():
+    problem = _chain_problem(num_chains=4, chain_length=5, days=10)
+    scheduler = RollingHorizonScheduler(
+        config=RollingHorizonConfig(
+            window_minutes=10 * 24 * 60, overlap_minutes=0, max_tasks_per_window=5
+        )
+    )
+
+    result = scheduler.solve(problem)
+
+    assert result.is_feasible
+    assert scheduler.windows_solved >= 4
+    assert_feasible_schedule(problem, result)
@@ -0,0 +1,147 @@
+"""
+Unit Tests for the Sparse CPM Engine
+
+Validates CSR construction, the level-synchronous topological sweep and the
+vectorized forward/backward passes against a straightforward reference CPM.
+"""
+
+import time
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.domain.scheduling.algorithms.sparse_cpm import SparseTaskGraph
+
+
+def _reference_cpm(durations, edges):
+    """Plain-Python CPM used as an oracle."""
+    n = len(durations)
+    preds = [[] for _ in range(n)]
+    succs = [[] for _ in range(n)]
+    for u, v in edges:
+        preds[v].append(u)
+        succs[u].append(v)
+
+    order, in_degree = [], [len(p) for p in preds]
+    ready = [i for i in range(n) if in_degree[i] == 0]
+    while ready:
+        u = ready.pop()
+        order.append(u)
+        for v in succs[u]:
+            in_degree[v] -= 1
+            if in_degree[v] == 0:
+                ready.append(v)
+
+    es, ef = [0.0] * n, [0.0] * n
+    for u in order:
+        es[u] = max((ef[p] for p in preds[u]), default=0.0)
+        ef[u] = es[u] + durations[u]
+    makespan = max(ef)
+    lf, ls = [makespan] * n, [0.0] * n
+    for u in reversed(order):
+        lf[u] = min((ls[s] for s in succs[u]), default=makespan)
+        ls[u] = lf[u] - durations[u]
+    return es, ls, makespan
+
+
+def _random_dag(n, m, seed):
+    rng = np.random.default_rng(seed)
+    a, b = rng.integers(0, n, m), rng.integers(0, n, m)
+    keep = a != b
+    src, dst = np.minimum(a, b)[keep], np.maximum(a, b)[keep]
+    durations = rng.integers(1, 100, n).astype(float)
+    return durations, src, dst
+
+
+class TestSparseTaskGraph:
+    """Correctness of the sparse CPM passes."""
+
+    def test_chain_with_parallel_branch(self):
+        """Critical path follows the longer branch of a diamond."""
+        #   0 -> 1 -> 3
+        #   0 -> 2 -> 3
+        graph = SparseTaskGraph(
+            np.array([10.0, 30.0, 5.0, 20.0]),
+            np.array([0, 0, 1, 2]),
+            np.array([1, 2, 3, 3]),
+        )
+
+        result = graph.compute()
+
+        assert result.makespan == 60.0
+        assert result.critical_path == [0, 1, 3]
+        assert result.total_float[2] == 25.0
+        assert graph.num_levels == 3
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_reference_cpm(self, seed):
+        """Earliest and latest starts agree with the reference implementation."""
+        durations, src, dst = _random_dag(300, 1200, seed)
+
+        result = SparseTaskGraph(durations, src, dst).compute()
+        es, ls, makespan = _reference_cpm(list(durations), zip(src, dst))
+
+        assert result.makespan == makespan
+        np.testing.assert_allclose(result.earliest_start, es)
+        np.testing.assert_allclose(result.latest_start, ls)
+
+    def test_critical_path_is_tight_and_spans_makespan(self):
+        """Consecutive critical path tasks touch and the path covers the makespan."""
+        durations, src, dst = _random_dag(500, 2000, 11)
+
+        result = SparseTaskGraph(durations, src, dst).compute()
+        path = result.critical_path
+
+        assert result.earliest_start[path[0]] == 0.0
+        assert result.earliest_finish[path[-1]] == result.makespan
+        for u, v in zip(path, path[1:]):
+            assert result.earliest_finish[u] == result.earliest_start[v]
+
+    def test_release_times_shift_earliest_starts(self):
+        """Release times act as lower bounds on earliest start."""
+        graph = SparseTaskGraph(np.array([10.0, 10.0]), np.array([0]), np.array([1]))
+
+        earliest_start, _ = graph.forward_pass(np.array([0.0, 50.0]))
+
+        assert earliest_start.tolist() == [0.0, 50.0]
+
+    def test_cycle_is_rejected(self):
+        """Cyclic precedence raises ValueError."""
+        with pytest.raises(ValueError):
+            SparseTaskGraph(np.ones(3), np.array([0, 1, 2]), np.array([1, 2, 0]))
+
+    def test_from_dependencies_ignores_unknown_predecessors(self):
+        """Dependencies on tasks outside the graph are dropped."""
+        a, b, outside = uuid4(), uuid4(), uuid4()
+
+        graph = SparseTaskGraph.from_dependencies(
+            [a, b], [15.0, 5.0], {b: {a, outside}}
+        )
+
+        assert graph.num_edges == 1
+        assert graph.compute().makespan == 20.0
+
+    @pytest.mark.performance
+    def test_large_graph_scales_linearly(self):
+        """Ten times the tasks and edges costs roughly ten times the time."""
+
+        def timed_compute(num_tasks, seed):
+            num_jobs = num_tasks // 20
+            durations, src, dst = _random_dag(num_tasks, num_tasks * 26 // 5, seed)
+            jobs = np.arange(num_tasks).reshape(num_jobs, 20)
+            src = np.concatenate([src, jobs[:, :-1].ravel()])
+            dst = np.concatenate([dst, jobs[:, 1:].ravel()])
+
+            start = time.perf_counter()
+            result = SparseTaskGraph(durations, src, dst).compute()
+            return result, time.perf_counter() - start
+
+        # Warm up numpy so the small run is not dominated by first-call costs
+        timed_compute(1_000, 5)
+        _, small_elapsed = timed_compute(10_000, 5)
+        result, large_elapsed = timed_compute(100_000, 5)
+
+        assert result.makespan > 0
+        # A quadratic sweep would take about a hundred times longer
+        assert large_elapsed < small_elapsed * 25
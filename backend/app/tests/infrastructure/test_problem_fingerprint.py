@@ -0,0 +1,87 @@
+"""
+Tests for canonical scheduling problem fingerprints.
+
+Identical problems must match regardless of entity ids and input order;
+any change the solver would see must produce a different fingerprint.
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.domain.scheduling.entities.task import Task
+from app.domain.scheduling.value_objects.common import Duration
+from app.domain.scheduling.value_objects.enums import PriorityLevel
+from app.infrastructure.cache.problem_fingerprint import fingerprint_problem
+
+START = datetime(2026, 1, 5, 7, 0)
+MACHINES = [SimpleNamespace(id=uuid4(), status="available") for _ in range(2)]
+OPERATORS = [SimpleNamespace(id=uuid4(), status="available", skills={}) for _ in range(2)]
+PARAMETERS = {"max_time_seconds": 60, "num_workers": 4}
+
+
+def _problem(durations=((60, 30), (45,)), priority=PriorityLevel.NORMAL):
+    jobs, tasks = [], []
+    for index, job_durations in enumerate(durations):
+        job = SimpleNamespace(
+            id=uuid4(),
+            job_number=f"TEMP_{uuid4().hex[:8]}_J{index}",
+            priority=priority,
+            quantity=1,
+            due_date=START + timedelta(days=30 + index),
+        )
+        jobs.append(job)
+        for sequence, minutes in enumerate(job_durations, 1):
+            tasks.append(
+                Task.create(
+                    job_id=job.id,
+                    operation_id=uuid4(),
+                    sequence_in_job=sequence,
+                    planned_duration_minutes=minutes,
+                    setup_duration_minutes=10,
+                )
+            )
+    return jobs, tasks
+
+
+def _fingerprint(jobs, tasks, machines=MACHINES, parameters=PARAMETERS):
+    return fingerprint_problem(jobs, tasks, machines, OPERATORS, START, parameters)
+
+
+def test_same_problem_under_fresh_ids_matches():
+    first = _fingerprint(*_problem())
+    jobs, tasks = _problem()
+
+    second = _fingerprint(list(reversed(jobs)), list(reversed(tasks)))
+
+    assert first.digest == second.digest
+    assert set(second.task_labels) == {task.id for task in tasks}
+    assert set(first.task_labels.values()) == set(second.task_labels.values())
+
+
+def test_labels_map_results_across_ids():
+    jobs_a, tasks_a = _problem()
+    jobs_b, tasks_b = _problem()
+    first, second = _fingerprint(jobs_a, tasks_a), _fingerprint(jobs_b, tasks_b)
+
+    by_label = second.task_ids_by_label
+    mapped = {by_label[first.task_labels[task.id]] for task in tasks_a}
+
+    assert mapped == {task.id for task in tasks_b}
+
+
+def test_solver_visible_changes_miss():
+    base = _fingerprint(*_problem()).digest
+
+    assert _fingerprint(*_problem(durations=((60, 35), (45,)))).digest != base
+    assert _fingerprint(*_problem(priority=PriorityLevel.HIGH)).digest != base
+    assert _fingerprint(*_problem(), machines=MACHINES[:1]).digest != base
+    assert _fingerprint(*_problem(), parameters={**PARAMETERS, "num_workers": 8}).digest != base
+
+    jobs, tasks = _problem()
+    tasks[2].predecessor_ids.append(tasks[0].id)
+    assert _fingerprint(jobs, tasks).digest != base
+
+    jobs, tasks = _problem()
+    tasks[0].planned_setup_duration = Duration(minutes=15)
+    assert _fingerprint(jobs, tasks).digest != base
@@ -103,6 +103,184 @@ class TestSolverConstraintGeneration:
             model = scheduler.create_model()
             assert model is not None
 
+    @pytest.fixture
+    def small_scheduler(self, scheduler):
+        """Scheduler reduced to 2 jobs of 20 tasks for real model builds."""
+        scheduler.num_jobs = 2
+        scheduler.num_tasks = 20
+        scheduler.critical_sequences = [(5, 8)]
+        scheduler.wip_zones = [(0, 9, 2), (10, 19, 3)]
+        return scheduler
+
+    def test_flexible_options_share_master_variables(self, small_scheduler):
+        """Test routing options of a task are anchored on one start/end."""
+        scheduler = small_scheduler
+        _, _, starts, ends, presences, _, _, _, _ = scheduler.create_model()
+
+        flexible_task = 9
+        assert len(scheduler.get_task_duration_and_setup(flexible_task)) == 2
+        assert starts[(0, flexible_task, 0)] is starts[(0, flexible_task, 1)]
+        assert ends[(0, flexible_task, 0)] is ends[(0, flexible_task, 1)]
+        assert presences[(0, flexible_task, 0)] is not presences[(0, flexible_task, 1)]
+
+    def test_operator_literals_per_task(self, small_scheduler):
+        """Test one assignment literal per eligible operator per task."""
+        scheduler = small_scheduler
+        scheduler.pool_operators = False
+        _, _, _, _, _, operators, _, _, _ = scheduler.create_model()
+
+        for task_id in range(scheduler.num_tasks):
+            eligible = scheduler.get_eligible_operators(task_id)
+            keys = {key for key in operators if key[:2] == (0, task_id)}
+            assert keys == {(0, task_id, op_id) for op_id in eligible}
+
+    def test_operator_classes_group_interchangeable_operators(self, scheduler):
+        """Test operators with the same qualifications and rate share a class."""
+        classes = scheduler.operator_classes()
+
+        assert sorted(op for members in classes for op in members) == sorted(
+            scheduler.operator_skills
+        )
+        assert sorted(classes) == [[0, 6], [1], [2, 7], [3, 5, 8], [4, 9]]
+        for members in classes:
+            for task_id in range(scheduler.num_tasks):
+                eligible = set(scheduler.get_eligible_operators(task_id))
+                assert len({op in eligible for op in members}) == 1
+
+    def test_pooled_operators_named_after_solve(self, small_scheduler):
+        """Test class shares become concrete, non-overlapping operators."""
+        scheduler = small_scheduler
+        scheduler.num_jobs = 3
+        scheduler.due_dates = {0: 3 * 24 * 60, 1: 4 * 24 * 60, 2: 5 * 24 * 60}
+        scheduler.two_operator_tasks = {4, 14}
+        model, objective, starts, _, presences, operators, _, _, _ = (
+            scheduler.create_model()
+        )
+        assert {key[2] for key in operators} <= set(range(len(scheduler.operator_classes())))
+
+        model.Minimize(objective)
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = 20.0
+        assert solver.Solve(model) in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+
+        assigned = scheduler.assign_operators(solver, starts, presences, operators)
+        busy = {}
+        for job_id in range(scheduler.num_jobs):
+            for task_id in range(scheduler.num_tasks):
+                ops = assigned[(job_id, task_id)]
+                needed = 2 if task_id in scheduler.two_operator_tasks else 1
+                assert len(set(ops)) == needed
+                assert set(ops) <= set(scheduler.get_eligible_operators(task_id))
+
+                start, end = scheduler.task_times(solver, starts, presences, job_id, task_id)
+                if not scheduler.is_attended_machine(task_id):
+                    option = next(
+                        o for o in range(len(scheduler.get_task_duration_and_setup(task_id)))
+                        if solver.Value(presences[(job_id, task_id, o)]) == 1
+                    )
+                    end = start + scheduler.get_task_duration_and_setup(task_id)[option][1]
+                for op_id in ops:
+                    busy.setdefault(op_id, []).append((start, end))
+        for intervals in busy.values():
+            intervals.sort()
+            for (_, earlier_end), (later_start, _) in zip(intervals, intervals[1:]):
+                assert later_start >= earlier_end
+
+    def test_precedence_posted_once_per_edge(self, small_scheduler):
+        """Test model size no longer grows with option pairs."""
+        scheduler = small_scheduler
+        scheduler.num_jobs = 1
+        scheduler.critical_sequences = []
+        scheduler.wip_zones = []
+
+        model = scheduler.create_model()[0]
+        enforced = [
+            c
+            for c in model.Proto().constraints
+            if len(c.enforcement_literal) > 0 and len(c.linear.vars) > 0
+        ]
+
+        # Only option duration/setup links are reified
+        flexible_links = sum(
+            len(scheduler.get_task_duration_and_setup(t)) * 2
+            for t in range(scheduler.num_tasks)
+            if len(scheduler.get_task_duration_and_setup(t)) > 1
+        )
+        assert len(enforced) == flexible_links
+
+    def test_calendar_compiled_once(self, small_scheduler):
+        """Test the calendar adds fixed intervals, not per-task constraints."""
+        scheduler = small_scheduler
+        model = scheduler.create_model()[0]
+        proto = model.Proto()
+
+        blocked = [c for c in proto.constraints if c.name.startswith("blocked_")]
+        assert len(blocked) == len(scheduler.calendar_blocked_periods())
+        assert all(len(c.interval.start.vars) == 0 for c in blocked)
+        assert not any(
+            len(c.int_div.exprs) or len(c.int_mod.exprs) for c in proto.constraints
+        )
+
+    def test_attended_tasks_stay_in_working_windows(self, scheduler):
+        """Test solved attended tasks avoid nights, lunch and holidays."""
+        scheduler.num_jobs = 1
+        scheduler.num_tasks = 10
+        scheduler.horizon_days = 7
+        scheduler.horizon = 7 * 24 * 60
+        scheduler.holidays = {1}
+        scheduler.due_dates = {0: 5 * 24 * 60}
+        scheduler.critical_sequences = []
+        scheduler.wip_zones = []
+
+        model, objective, starts, ends, presences, _, _, _, _ = scheduler.create_model()
+        model.Minimize(objective)
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = 10.0
+        assert solver.Solve(model) in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+
+        windows = scheduler.working_windows()
+        for task_id in range(scheduler.num_tasks):
+            if not scheduler.is_attended_machine(task_id):
+                continue
+            start = solver.Value(starts[(0, task_id, 0)])
+            end = solver.Value(ends[(0, task_id, 0)])
+            assert any(lo <= start and end <= hi for lo, hi in windows)
+            assert start // scheduler.minutes_per_day not in scheduler.holidays
+
+    def test_time_quantum_maps_back_to_exact_minutes(self, scheduler):
+        """Test a coarse quantum keeps the exact-minute schedule feasible."""
+        scheduler.num_jobs = 1
+        scheduler.num_tasks = 10
+        scheduler.horizon_days = 7
+        scheduler.horizon = 7 * 24 * 60
+        scheduler.due_dates = {0: 5 * 24 * 60}
+        scheduler.critical_sequences = []
+        scheduler.wip_zones = []
+        scheduler.lunch_start = 12 * 60 + 10  # Off the 15-minute grid
+        scheduler.time_quantum = 15
+
+        model, objective, starts, _, presences, _, _, _, _ = scheduler.create_model()
+        proto = model.Proto()
+        start_var = next(v for v in proto.variables if v.name == "start_j0_t0")
+        assert max(start_var.domain) < scheduler.horizon // 15
+
+        model.Minimize(objective)
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = 10.0
+        assert solver.Solve(model) in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+
+        windows = scheduler.working_windows()
+        previous_end = 0
+        for task_id in range(scheduler.num_tasks):
+            start, end = scheduler.task_times(solver, starts, presences, 0, task_id)
+            options = scheduler.get_task_duration_and_setup(task_id)
+            assert start % 15 == 0
+            assert end - start in {processing + setup for processing, setup in options}
+            assert start >= previous_end
+            if scheduler.is_attended_machine(task_id):
+                assert any(lo <= start and end <= hi for lo, hi in windows)
+            previous_end = end
+
     def test_variable_creation(self, scheduler):
         """Test creation of decision variables."""
         # This would test the actual variable creation logic
@@ -225,6 +403,25 @@ class TestSolverOptimization:
             assert solution["solve_time"] < 10.0  # Should solve quickly
             assert len(solution["assignments"]) > 0
 
+    def test_phase_two_reuses_phase_one_model(self, scheduler):
+        """Test the cost phase is warm-started on the makespan phase model."""
+        scheduler.num_jobs = 2
+        scheduler.num_tasks = 10
+        scheduler.horizon_days = 7
+        scheduler.horizon = 7 * 24 * 60
+        scheduler.due_dates = {0: 3 * 24 * 60, 1: 5 * 24 * 60}
+        scheduler.critical_sequences = [(2, 4)]
+        scheduler.wip_zones = [(0, 9, 2)]
+
+        with patch.object(
+            scheduler, "create_model", wraps=scheduler.create_model
+        ) as create_model:
+            solution = scheduler.solve()
+
+        assert create_model.call_count == 1
+        assert solution["status"] in ("OPTIMAL", "FEASIBLE")
+        assert set(solution["phase_times"]) == {"build", "phase1", "phase2"}
+
     def test_feasibility_checking(self, scheduler):
         """Test that generated solutions are feasible."""
         # Mock solution for feasibility testing
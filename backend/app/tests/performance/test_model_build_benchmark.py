@@ -0,0 +1,98 @@
+"""
+Model Build Benchmark
+
+Times building the OptimizationService CP-SAT model separately from the
+search on it, at 200 jobs / 4,000 tasks and 2,000 jobs / 40,000 tasks, to
+check that building stays linear in the number of tasks and small next to
+the search. Run with -s to see the table.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from ortools.sat.python import cp_model
+
+from app.domain.scheduling.services.optimization_service import (
+    OptimizationParameters,
+    OptimizationService,
+)
+
+TASKS_PER_JOB = 20
+TASK_TYPES = 10
+SIZES = (200, 2000)
+SEARCH_SECONDS = 60.0
+
+
+def _machine(task_type: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(), can_perform_task_type=lambda value: value == task_type
+    )
+
+
+def _problem(num_jobs: int):
+    """Jobs of TASKS_PER_JOB tasks cycling over one machine per task type."""
+    now = datetime.now()
+    jobs, tasks = [], []
+    for job_index in range(num_jobs):
+        job = SimpleNamespace(id=uuid4(), due_date=now + timedelta(days=30))
+        jobs.append(job)
+        for position in range(TASKS_PER_JOB):
+            tasks.append(
+                SimpleNamespace(
+                    id=uuid4(),
+                    job_id=job.id,
+                    position_in_job=position,
+                    task_type=SimpleNamespace(
+                        value=f"type_{(job_index + position) % TASK_TYPES}"
+                    ),
+                )
+            )
+    # Tasks arrive in no particular job order, as from a repository
+    tasks.reverse()
+    machines = [_machine(f"type_{i}") for i in range(TASK_TYPES)]
+    return jobs, tasks, machines
+
+
+def _build_and_search(num_jobs: int) -> tuple[int, float, float, str]:
+    jobs, tasks, machines = _problem(num_jobs)
+    service = OptimizationService(None, None, None, None)
+    # Long enough for every machine to run its share of tasks back to back
+    horizon_days = num_jobs * TASKS_PER_JOB * 80 // TASK_TYPES // (24 * 60) + 7
+    params = OptimizationParameters(horizon_days=horizon_days)
+
+    started = time.perf_counter()
+    model, variables = asyncio.run(
+        service._create_scheduling_model(
+            jobs, tasks, [], machines, datetime.now(), params
+        )
+    )
+    model.Minimize(variables["primary_objective"])
+    build_seconds = time.perf_counter() - started
+
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = SEARCH_SECONDS
+    solver.parameters.num_search_workers = 8
+    started = time.perf_counter()
+    status = solver.Solve(model)
+    search_seconds = time.perf_counter() - started
+
+    return len(tasks), build_seconds, search_seconds, solver.StatusName(status)
+
+
+@pytest.mark.performance
+def test_model_build_is_linear_and_small_next_to_search():
+    rows = [_build_and_search(num_jobs) for num_jobs in SIZES]
+
+    print("\nOptimizationService model build vs search")
+    print(f"  {'tasks':>7} {'build s':>8} {'search s':>9}  status")
+    for tasks, build_seconds, search_seconds, status in rows:
+        print(f"  {tasks:>7} {build_seconds:>8.2f} {search_seconds:>9.2f}  {status}")
+
+    (_, small_build, _, _), (_, large_build, large_search, _) = rows
+    # Ten times the tasks; a quadratic build would take about a hundred times longer
+    assert large_build < small_build * 25
+    assert large_build < large_search * 0.25
@@ -0,0 +1,79 @@
+"""
+Operator Pooling Benchmark
+
+Compares HFFS model size and solve time with one assignment literal per
+operator against one cumulative resource per class of interchangeable
+operators, as the workforce grows. Run with -s to see the table.
+"""
+
+import time
+
+import pytest
+from ortools.sat.python import cp_model
+
+from app.core.solver import HFFSScheduler
+
+WORKFORCES = (12, 30)
+
+
+def _scheduler(num_operators: int, pool_operators: bool) -> HFFSScheduler:
+    scheduler = HFFSScheduler()
+    scheduler.num_jobs = 3
+    scheduler.num_tasks = 40
+    scheduler.horizon_days = 14
+    scheduler.horizon = 14 * 24 * 60
+    scheduler.holidays = {5}
+    scheduler.due_dates = {0: 6 * 24 * 60, 1: 7 * 24 * 60, 2: 8 * 24 * 60}
+    scheduler.critical_sequences = [(5, 8), (20, 24)]
+    scheduler.wip_zones = []
+    scheduler.time_quantum = 5
+    # Three skill profiles repeated across the workforce
+    profiles = [dict(scheduler.operator_skills[op_id]) for op_id in (1, 3, 6)]
+    scheduler.operator_skills = {
+        op_id: dict(profiles[op_id % len(profiles)]) for op_id in range(num_operators)
+    }
+    scheduler.operator_costs = {
+        op_id: 2 * max(skills.values()) for op_id, skills in scheduler.operator_skills.items()
+    }
+    scheduler.num_operators = num_operators
+    scheduler.pool_operators = pool_operators
+    return scheduler
+
+
+@pytest.mark.performance
+def test_operator_pooling_tradeoff():
+    rows = []
+    for num_operators in WORKFORCES:
+        for pool_operators in (False, True):
+            scheduler = _scheduler(num_operators, pool_operators)
+            model, objective, starts, _, presences, _, _, _, _ = scheduler.create_model()
+            model.Minimize(objective)
+            solver = cp_model.CpSolver()
+            solver.parameters.max_time_in_seconds = 60.0
+            solver.parameters.num_search_workers = 8
+            started = time.time()
+            status = solver.Solve(model)
+            elapsed = time.time() - started
+
+            assert status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+            completions = scheduler.job_completions_minutes(solver, starts, presences)
+            rows.append(
+                (num_operators, "pooled" if pool_operators else "per-operator",
+                 len(model.Proto().variables), elapsed, max(completions.values()),
+                 solver.StatusName(status))
+            )
+
+    print("\nHFFSScheduler operator pooling")
+    print(f"  {'operators':>9} {'model':>12} {'variables':>9} {'seconds':>8} {'makespan':>9}  status")
+    for operators, mode, variables, seconds, makespan, status in rows:
+        print(
+            f"  {operators:>9} {mode:>12} {variables:>9} {seconds:>8.2f} {makespan:>9.0f}  {status}"
+        )
+
+    # Pooled model size does not grow with interchangeable operators
+    pooled = [row for row in rows if row[1] == "pooled"]
+    assert pooled[0][2] == pooled[-1][2]
+    for per_operator, pooled_row in zip(rows[::2], rows[1::2]):
+        assert pooled_row[2] < per_operator[2]
+        if per_operator[5] == pooled_row[5] == "OPTIMAL":
+            assert pooled_row[4] == per_operator[4]
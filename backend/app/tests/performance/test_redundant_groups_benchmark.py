@@ -0,0 +1,118 @@
+"""
+Redundant Resource Groups Benchmark
+
+Compares CP-SAT effort with and without the redundant cumulative and energy
+bound per resource group, on a CPSATScheduler problem with groups of
+identical parallel machines and skill pools and on the HFFS plant. Effort is
+CP-SAT's deterministic time, which a loaded host does not skew like wall
+time. Run with -s to see the table.
+"""
+
+import contextlib
+import io
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from ortools.sat.python import cp_model
+
+from app.core.solver import HFFSScheduler
+from app.domain.scheduling.optimization.cp_sat_scheduler import (
+    CPSATScheduler,
+    SchedulingProblem,
+)
+
+SEEDS = (0, 1)
+SEARCH_SECONDS = 120.0
+
+
+def _cp_sat_model(redundant: bool) -> cp_model.CpModel:
+    """Twenty chains of six tasks over three groups of four identical machines."""
+    start = datetime(2026, 1, 5, 7, 0)
+    problem = SchedulingProblem(
+        planning_horizon_start=start,
+        planning_horizon_end=start + timedelta(days=5),
+        time_granularity_minutes=5,
+        redundant_resource_groups=redundant,
+    )
+    groups = [[uuid4() for _ in range(4)] for _ in range(3)]
+    problem.machine_ids = [machine_id for group in groups for machine_id in group]
+    for machine_id in problem.machine_ids:
+        problem.resource_constraints.add_machine_constraint(machine_id, capacity=1)
+    problem.operator_ids = [uuid4() for _ in range(8)]
+    for index, operator_id in enumerate(problem.operator_ids):
+        problem.resource_constraints.add_operator_constraint(operator_id, capacity=1)
+        problem.skill_constraints.add_operator_skills(
+            operator_id, {"welding" if index < 4 else "assembly": 2}
+        )
+    for chain in range(20):
+        previous = None
+        for step in range(6):
+            task_id = uuid4()
+            problem.task_ids.append(task_id)
+            problem.task_durations[task_id] = 20 + 10 * ((chain * 7 + step * 3) % 6)
+            problem.task_eligible_machines[task_id] = groups[(chain + step) % 3]
+            skill = "welding" if (chain + step) % 2 == 0 else "assembly"
+            problem.skill_constraints.add_task_skill_requirement(task_id, [(skill, 1)])
+            if previous is not None:
+                problem.temporal_constraints.add_precedence(previous, task_id)
+            previous = task_id
+
+    scheduler = CPSATScheduler()
+    scheduler._build_next_model(problem, scheduler._model_horizons(problem))
+    return scheduler.model
+
+
+def _hffs_model(redundant: bool) -> cp_model.CpModel:
+    scheduler = HFFSScheduler()
+    scheduler.num_jobs = 4
+    scheduler.num_tasks = 40
+    scheduler.holidays = {5}
+    scheduler.due_dates = {job_id: (6 + job_id) * 24 * 60 for job_id in range(4)}
+    scheduler.critical_sequences = [(5, 8), (20, 24)]
+    scheduler.wip_zones = []
+    scheduler.time_quantum = 5
+    scheduler.redundant_resource_groups = redundant
+    scheduler.size_horizon()
+    with contextlib.redirect_stdout(io.StringIO()):
+        model, objective, *_ = scheduler.create_model()
+    model.Minimize(objective)
+    return model
+
+
+def _solve(model: cp_model.CpModel, seed: int) -> tuple[str, float, float]:
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = SEARCH_SECONDS
+    solver.parameters.num_search_workers = 8
+    solver.parameters.random_seed = seed
+    status = solver.Solve(model)
+    return (
+        solver.StatusName(status),
+        solver.ResponseProto().deterministic_time,
+        solver.ObjectiveValue(),
+    )
+
+
+@pytest.mark.performance
+def test_redundant_groups_effort():
+    rows = []
+    for name, build in (("CPSATScheduler", _cp_sat_model), ("HFFSScheduler", _hffs_model)):
+        for seed in SEEDS:
+            for redundant in (False, True):
+                status, effort, objective = _solve(build(redundant), seed)
+                rows.append((name, seed, redundant, status, effort, objective))
+
+    print("\nRedundant resource groups")
+    print(f"  {'scheduler':>14} {'seed':>4} {'groups':>6} {'det. time':>9} {'objective':>9}  status")
+    for name, seed, redundant, status, effort, objective in rows:
+        print(
+            f"  {name:>14} {seed:>4} {'on' if redundant else 'off':>6} "
+            f"{effort:>9.2f} {objective:>9.0f}  {status}"
+        )
+
+    # Redundant constraints never cut off the optimum
+    for plain, grouped in zip(rows[::2], rows[1::2]):
+        if plain[3] == grouped[3] == "OPTIMAL":
+            assert grouped[5] == plain[5]
+    cp_sat = [row for row in rows if row[0] == "CPSATScheduler"]
+    assert sum(row[4] for row in cp_sat if row[2]) < sum(row[4] for row in cp_sat if not row[2])
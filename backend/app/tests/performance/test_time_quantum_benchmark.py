@@ -0,0 +1,119 @@
+"""
+Time Quantum Benchmark
+
+Compares model size, solve time and exact-minute solution quality of the
+HFFS and CP-SAT schedulers at 1, 5 and 15 minute time quanta. Run with -s to
+see the trade-off table.
+"""
+
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from ortools.sat.python import cp_model
+
+from app.core.solver import HFFSScheduler
+from app.domain.scheduling.optimization.cp_sat_scheduler import (
+    CPSATScheduler,
+    SchedulingProblem,
+)
+
+QUANTA = (1, 5, 15)
+
+
+def _hffs(quantum: int) -> HFFSScheduler:
+    scheduler = HFFSScheduler()
+    scheduler.num_jobs = 3
+    scheduler.num_tasks = 40
+    scheduler.horizon_days = 14
+    scheduler.horizon = 14 * 24 * 60
+    scheduler.holidays = {5}
+    scheduler.due_dates = {0: 6 * 24 * 60, 1: 7 * 24 * 60, 2: 8 * 24 * 60}
+    scheduler.critical_sequences = [(5, 8), (20, 24)]
+    scheduler.wip_zones = []
+    scheduler.time_quantum = quantum
+    return scheduler
+
+
+def _cp_sat_problem(quantum: int) -> SchedulingProblem:
+    start = datetime(2026, 1, 5, 7, 0)
+    problem = SchedulingProblem(
+        planning_horizon_start=start,
+        planning_horizon_end=start + timedelta(days=14),
+        time_granularity_minutes=quantum,
+        max_solution_time_seconds=20.0,
+    )
+    problem.machine_ids = [uuid4() for _ in range(3)]
+    for machine_id in problem.machine_ids:
+        problem.resource_constraints.add_machine_constraint(machine_id, capacity=1)
+    for chain in range(8):
+        previous = None
+        for step in range(6):
+            task_id = uuid4()
+            problem.task_ids.append(task_id)
+            # Durations off the 5/15 minute grid to expose rounding losses
+            problem.task_durations[task_id] = 23 + 7 * ((chain + step) % 5)
+            if previous is not None:
+                problem.temporal_constraints.add_precedence(previous, task_id)
+            previous = task_id
+    return problem
+
+
+def _domain_size(model: cp_model.CpModel) -> int:
+    total = 0
+    for variable in model.Proto().variables:
+        bounds = list(variable.domain)
+        total += sum(hi - lo + 1 for lo, hi in zip(bounds[::2], bounds[1::2]))
+    return total
+
+
+@pytest.mark.performance
+def test_hffs_time_quantum_tradeoff():
+    rows = []
+    for quantum in QUANTA:
+        scheduler = _hffs(quantum)
+        started = time.time()
+        model, objective, starts, _, presences, _, _, _, _ = scheduler.create_model()
+        model.Minimize(objective)
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = 30.0
+        solver.parameters.num_search_workers = 8
+        status = solver.Solve(model)
+        elapsed = time.time() - started
+
+        assert status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+        completions = scheduler.job_completions_minutes(solver, starts, presences)
+        rows.append(
+            (quantum, _domain_size(model), elapsed, max(completions.values()),
+             solver.StatusName(status))
+        )
+
+    _print_table("HFFSScheduler", rows)
+    # A coarser grid can only lose quality against the exact-minute optimum
+    if rows[0][4] == "OPTIMAL":
+        assert all(row[3] >= rows[0][3] for row in rows)
+    assert rows[-1][1] < rows[0][1]
+
+
+@pytest.mark.performance
+def test_cp_sat_time_quantum_tradeoff():
+    rows = []
+    for quantum in QUANTA:
+        problem = _cp_sat_problem(quantum)
+        result = CPSATScheduler().solve(problem)
+
+        assert result.is_feasible
+        rows.append(
+            (quantum, problem.time_slots, result.solution_time_seconds,
+             result.makespan_hours * 60, result.status.value)
+        )
+
+    _print_table("CPSATScheduler", rows, size_label="slots")
+
+
+def _print_table(name, rows, size_label="domain"):
+    print(f"\n{name} time quantum trade-off")
+    print(f"  {'quantum':>7} {size_label:>12} {'seconds':>8} {'makespan':>9}  status")
+    for quantum, size, seconds, makespan, status in rows:
+        print(f"  {quantum:>7} {size:>12} {seconds:>8.2f} {makespan:>9.0f}  {status}")
@@ -0,0 +1,54 @@
+from datetime import timedelta
+from uuid import UUID
+
+from app.domain.scheduling.optimization.cp_sat_scheduler import (
+    OptimizationResult,
+    SchedulingProblem,
+    TaskAssignment,
+)
+
+
+def assert_feasible_schedule(
+    problem: SchedulingProblem, result: OptimizationResult
+) -> dict[UUID, TaskAssignment]:
+    """
+    Check that ``result`` schedules every task of ``problem`` feasibly.
+
+    Covers precedence, release dates and machine and operator capacity
+    (no overlap for single-capacity resources). Returns the assignments by
+    task id.
+    """
+    by_task = {a.task_id: a for a in result.task_assignments}
+    assert set(by_task) == set(problem.task_ids)
+
+    temporal = problem.temporal_constraints
+    for pred_id, succ_id in temporal.precedence_constraints:
+        assert by_task[succ_id].start_time >= by_task[pred_id].end_time
+
+    for task_id, earliest in temporal.task_earliest_start.items():
+        release = problem.planning_horizon_start + timedelta(minutes=earliest)
+        assert by_task[task_id].start_time >= release
+
+    capacities = problem.resource_constraints
+    on_resource = [
+        (machine_id, capacities.machine_capacities.get(machine_id, 1),
+         lambda a: [a.assigned_machine_id])
+        for machine_id in problem.machine_ids
+    ] + [
+        (operator_id, capacities.operator_capacities.get(operator_id, 1),
+         lambda a: a.assigned_operator_ids)
+        for operator_id in problem.operator_ids
+    ]
+    for resource_id, capacity, resources_of in on_resource:
+        # Ends sort before starts at the same instant: back-to-back is fine
+        events = sorted(
+            event
+            for a in by_task.values() if resource_id in resources_of(a)
+            for event in ((a.start_time, 1), (a.end_time, -1))
+        )
+        running = 0
+        for _, change in events:
+            running += change
+            assert running <= capacity, f"Resource {resource_id} is overbooked"
+
+    return by_task